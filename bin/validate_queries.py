@@ -0,0 +1,119 @@
+"""
+Validates the queries of client bundles against a schema before deploying it.
+
+Queries are read from JSON files containing a list of queries (such as the
+ones dumped by `Engine.snapshot_query_cache`), from `.graphql` & `.gql` files
+(one query per file) or from directories containing such files. The result of
+each query is printed as a JSON line and the exit status is 1 when at least
+one query is invalid:
+
+    python bin/validate_queries.py schema.graphql --queries bundles/
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from tartiflette.execution.bulk_validation import validate_queries
+from tartiflette.execution.persisted_queries import compute_query_hash
+
+_QUERY_FILE_EXTENSIONS = (".graphql", ".gql")
+
+
+def _read_sources(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                yield from _read_sources(
+                    os.path.join(dirpath, filename)
+                    for filename in sorted(filenames)
+                    if filename.endswith(_QUERY_FILE_EXTENSIONS + (".json",))
+                )
+        elif path.endswith(".json"):
+            with open(path, encoding="UTF-8") as queries_file:
+                for index, query in enumerate(json.load(queries_file)):
+                    yield f"{path}[{index}]", query
+        else:
+            with open(path, encoding="UTF-8") as query_file:
+                yield path, query_file.read()
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Validates GraphQL queries against a schema."
+    )
+    parser.add_argument(
+        "sdl", nargs="+", help="SDL file or directory (repeatable)"
+    )
+    parser.add_argument(
+        "--queries",
+        nargs="+",
+        required=True,
+        help="JSON list of queries, .graphql / .gql file or directory",
+    )
+    parser.add_argument(
+        "--module",
+        action="append",
+        dest="modules",
+        help="module to import while cooking the engine (repeatable)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="number of worker processes (defaults to the number of CPUs, "
+        "0 to validate the queries in the current process)",
+    )
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument(
+        "--dump-dir",
+        help="directory where the valid queries (<sha256>.graphql) & their "
+        "serialised documents (<sha256>.bin) are written, to be loaded "
+        "with `Engine.load_query`",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    sources = list(_read_sources(args.queries))
+    queries = [query for _, query in sources]
+
+    if args.dump_dir:
+        os.makedirs(args.dump_dir, exist_ok=True)
+
+    invalid = 0
+    for result in validate_queries(
+        queries,
+        args.sdl,
+        modules=args.modules,
+        processes=args.processes,
+        chunksize=args.chunksize,
+        dump_documents=bool(args.dump_dir),
+    ):
+        invalid += not result.valid
+        sys.stdout.write(
+            json.dumps(
+                {
+                    "source": sources[result.index][0],
+                    "valid": result.valid,
+                    "errors": result.errors,
+                }
+            )
+            + "\n"
+        )
+        if result.document is not None:
+            query = queries[result.index]
+            path = os.path.join(args.dump_dir, compute_query_hash(query))
+            with open(f"{path}.graphql", "w", encoding="UTF-8") as query_file:
+                query_file.write(query)
+            with open(f"{path}.bin", "wb") as document_file:
+                document_file.write(result.document)
+
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
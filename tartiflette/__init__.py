@@ -34,6 +34,7 @@ async def create_engine(
     json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
     custom_default_arguments_coercer: Optional[Callable] = None,
     coerce_list_concurrently: Optional[bool] = None,
+    **engine_options: Any,
 ) -> "Engine":
     """
     Create an engine by analyzing the SDL and connecting it with the imported
@@ -53,13 +54,17 @@ async def create_engine(
     the engine to import, usually this modules contains your Resolvers,
     Directives, Scalar or Subscription code
     :param query_cache_decorator: callable that will replace the tartiflette
-    default lru_cache decorator to cache query parsing
+    default QueryCache decorator to cache query parsing
     :param json_loader: A callable that will replace default python
-    json module.loads for ast_json loading
+    json module.loads for ast_json loading (queries are transformed from
+    the libgraphqlparser C AST without any JSON when not provided)
     :param custom_default_arguments_coercer: callable that will replace the
     :param coerce_list_concurrently: whether or not list will be coerced
     concurrently
     tartiflette `default_arguments_coercer
+    :param engine_options: the other parameters of `Engine.cook` (e.g.
+    `coerce_list_max_concurrency`, `jit`, `execution_strategy`,
+    `query_limits`, `query_cost`...)
     :type sdl: Union[str, List[str]]
     :type schema_name: str
     :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
@@ -70,6 +75,7 @@ async def create_engine(
     :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
     :type custom_default_arguments_coercer: Optional[Callable]
     :type coerce_list_concurrently: Optional[bool]
+    :type engine_options: Any
     :return: a Cooked Engine instance
     :rtype: Engine
 
@@ -95,6 +101,7 @@ async def create_engine(
         json_loader=json_loader,
         custom_default_arguments_coercer=custom_default_arguments_coercer,
         coerce_list_concurrently=coerce_list_concurrently,
+        **engine_options,
     )
 
     return e
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any, Callable, Dict, List
 
 from tartiflette.execution.collect import collect_subfields
@@ -81,6 +82,9 @@ async def complete_value_catching_error(
         return handle_field_error(
             raw_exception, field_nodes, path, return_type, execution_context
         )
+    finally:
+        if execution_context.scheduler is not None:
+            execution_context.scheduler.settle(path)
 
 
 async def complete_object_value(
@@ -108,11 +112,80 @@ async def complete_object_value(
     :return: the computed value
     :rtype: Dict[str, Any]
     """
+    if execution_context.scheduler is not None:
+        return await execution_context.scheduler.defer(
+            path,
+            partial(
+                execute_object_fields,
+                result,
+                info,
+                execution_context,
+                field_nodes,
+                path,
+                return_type,
+            ),
+        )
+
+    return await execute_object_fields(
+        result, info, execution_context, field_nodes, path, return_type
+    )
+
+
+async def execute_object_fields(
+    result: Any,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    return_type: "GraphQLOutputType",
+) -> Dict[str, Any]:
+    """
+    Executes the sub-selections of an Object value.
+    :param result: result to treat
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the coerced field
+    :param path: the path traveled until this coercer
+    :param return_type: the GraphQLObjectType instance of the object
+    :type result: Any
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type return_type: GraphQLOutputType
+    :return: the computed value
+    :rtype: Dict[str, Any]
+    """
+    if execution_context.incremental is None:
+        return await execute_fields(
+            execution_context,
+            return_type,
+            result,
+            path,
+            await collect_subfields(
+                execution_context, return_type, field_nodes
+            ),
+            info.is_introspection,
+        )
+
+    deferred_fragments = []
+    fields = await collect_subfields(
+        execution_context, return_type, field_nodes, deferred_fragments
+    )
+    if deferred_fragments:
+        execution_context.incremental.defer_fragments(
+            execution_context,
+            return_type,
+            result,
+            path,
+            deferred_fragments,
+            info.is_introspection,
+        )
     return await execute_fields(
         execution_context,
         return_type,
         result,
         path,
-        await collect_subfields(execution_context, return_type, field_nodes),
+        fields,
         info.is_introspection,
     )
@@ -1,53 +1,134 @@
 from functools import partial
-from typing import Callable
+from typing import Callable, Optional
 
+from tartiflette.coercers.outputs.enum_coercer import enum_coercer_sync
 from tartiflette.coercers.outputs.list_coercer import (
     list_coercer_concurrently,
+    list_coercer_leaves,
     list_coercer_sequentially,
 )
-from tartiflette.coercers.outputs.non_null_coercer import non_null_coercer
+from tartiflette.coercers.outputs.non_null_coercer import (
+    non_null_coercer,
+    non_null_coercer_sync,
+)
+from tartiflette.coercers.outputs.scalar_coercer import scalar_coercer_sync
 
-__all__ = ("get_output_coercer",)
+__all__ = (
+    "get_output_coercer",
+    "get_sync_output_coercer",
+    "get_list_leaves_coercer",
+)
 
 
 def get_output_coercer(
-    graphql_type: "GraphQLType", concurrently: bool
+    graphql_type: "GraphQLType",
+    concurrently: bool,
+    max_concurrency: Optional[int] = None,
 ) -> Callable:
     """
     Computes and returns the output coercer to use for the filled in schema
     type.
     :param graphql_type: the schema type for which compute the coercer
     :param concurrently: whether list should be coerced concurrently
+    :param max_concurrency: maximum number of list items coerced at the same
+    time when coerced concurrently
     :type graphql_type: GraphQLType
     :type concurrently: bool
+    :type max_concurrency: Optional[int]
     :return: the computed coercer wrap with directives if defined
     :rtype: Callable
     """
     inner_type = graphql_type
     wrapper_coercers = []
+    coercer = None
     while inner_type.is_wrapping_type:
         wrapped_type = inner_type.wrapped_type
         if inner_type.is_list_type:
+            coercer = get_list_leaves_coercer(inner_type)
+            if coercer is not None:
+                break
+
             wrapper_coercers.append(
                 partial(
-                    list_coercer_concurrently
-                    if concurrently
-                    else list_coercer_sequentially,
+                    list_coercer_concurrently,
                     item_type=wrapped_type,
+                    max_concurrency=max_concurrency,
                 )
+                if concurrently
+                else partial(list_coercer_sequentially, item_type=wrapped_type)
             )
         elif inner_type.is_non_null_type:
             wrapper_coercers.append(non_null_coercer)
         inner_type = wrapped_type
 
-    try:
-        coercer = inner_type.output_coercer
-    except AttributeError:
-        # This case should never happen and raise an exception at schema
-        # validation time.
-        coercer = lambda *args, **kwargs: None
+    if coercer is None:
+        try:
+            coercer = inner_type.output_coercer
+        except AttributeError:
+            # This case should never happen and raise an exception at schema
+            # validation time.
+            coercer = lambda *args, **kwargs: None
 
     for wrapper_coercer in reversed(wrapper_coercers):
         coercer = partial(wrapper_coercer, inner_coercer=coercer)
 
     return coercer
+
+
+def get_sync_output_coercer(graphql_type: "GraphQLType") -> Optional[Callable]:
+    """
+    Computes and returns the synchronous output coercer to use for the filled
+    in schema type. Only leaf types (scalars & enums) which don't implement
+    any directive can be coerced synchronously.
+    :param graphql_type: the schema type for which compute the coercer
+    :type graphql_type: GraphQLType
+    :return: the computed synchronous coercer if the type can be coerced
+    synchronously
+    :rtype: Optional[Callable]
+    """
+    inner_type = (
+        graphql_type.wrapped_type
+        if graphql_type.is_non_null_type
+        else graphql_type
+    )
+
+    if inner_type.is_wrapping_type or getattr(inner_type, "directives", None):
+        return None
+
+    if inner_type.kind == "SCALAR":
+        coercer = partial(scalar_coercer_sync, scalar_type=inner_type)
+    elif inner_type.kind == "ENUM" and not any(
+        enum_value.directives for enum_value in inner_type.values
+    ):
+        coercer = partial(enum_coercer_sync, enum_type=inner_type)
+    else:
+        return None
+
+    if graphql_type.is_non_null_type:
+        coercer = partial(non_null_coercer_sync, inner_coercer=coercer)
+    return coercer
+
+
+def get_list_leaves_coercer(list_type: "GraphQLList") -> Optional[Callable]:
+    """
+    Computes and returns the coercer to use for a list whose items are leaf
+    values which can be coerced synchronously, in a single loop.
+    :param list_type: the list type for which compute the coercer
+    :type list_type: GraphQLList
+    :return: the computed coercer if the items can be coerced synchronously
+    :rtype: Optional[Callable]
+    """
+    item_type = list_type.wrapped_type
+    item_coercer = get_sync_output_coercer(item_type)
+    if item_coercer is None:
+        return None
+
+    leaf_type = (
+        item_type.wrapped_type if item_type.is_non_null_type else item_type
+    )
+    return partial(
+        list_coercer_leaves,
+        item_type=item_type,
+        item_coercer=item_coercer,
+        coerce_many=getattr(leaf_type, "coerce_output_many", None),
+    )
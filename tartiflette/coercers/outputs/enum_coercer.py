@@ -4,7 +4,7 @@ from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("enum_coercer",)
+__all__ = ("enum_coercer", "enum_coercer_sync")
 
 
 @null_coercer_wrapper
@@ -50,3 +50,40 @@ async def enum_coercer(
             f"Expected value of type {enum_type} but received {type(result)}."
         )
     return coerced_result
+
+
+def enum_coercer_sync(
+    result: Any,
+    parent_type: "GraphQLObjectType",
+    field_name: str,
+    enum_type: "GraphQLEnumType",
+) -> Any:
+    """
+    Computes synchronously the value of an enum type which values don't
+    implement any directive.
+    :param result: resolved value
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param field_name: name of the resolved field
+    :param enum_type: the GraphQLType instance of the enum
+    :type result: Any
+    :type parent_type: GraphQLObjectType
+    :type field_name: str
+    :type enum_type: GraphQLEnumType
+    :return: the computed value
+    :rtype: Any
+    """
+    # pylint: disable=unused-argument
+    if result is None:
+        return None
+
+    try:
+        enum_type.get_value(result)
+        coerced_result = result
+    except KeyError:
+        coerced_result = UNDEFINED_VALUE
+
+    if is_invalid_value(coerced_result):
+        raise ValueError(
+            f"Expected value of type {enum_type} but received {type(result)}."
+        )
+    return coerced_result
@@ -1,13 +1,97 @@
-import asyncio
-
-from typing import Any, Callable, List
+from array import array
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, List, Optional
 
 from tartiflette.coercers.common import Path
+from tartiflette.coercers.outputs.common import handle_field_error
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
+from tartiflette.execution.batch import gather_units
+from tartiflette.execution.incremental import stream_list_items
 from tartiflette.resolver.factory import complete_value_catching_error
 from tartiflette.utils.errors import extract_exceptions_from_results
 
-__all__ = ("list_coercer_sequentially", "list_coercer_concurrently")
+__all__ = (
+    "list_coercer_sequentially",
+    "list_coercer_concurrently",
+    "list_coercer_leaves",
+)
+
+# Iterable types which can't be used as the value of a list field
+_NON_LIST_TYPES = (str, bytes, bytearray, Mapping)
+
+# Buffer types whose items can be converted at once into Python values
+_BUFFER_TYPES = (array, memoryview)
+
+# Maximum number of items read from an async iterable before completing them
+_ASYNC_ITERABLE_BUFFER_SIZE = 100
+
+
+def _check_is_iterable(result: Any, info: "ResolveInfo") -> None:
+    """
+    Ensures that the resolved value of a list field is either a sequence or
+    a sync or async iterable.
+    :param result: resolved value
+    :param info: information related to the execution and the resolved field
+    :type result: Any
+    :type info: ResolveInfo
+    :raises TypeError: if the resolved value isn't iterable
+    """
+    if isinstance(result, _NON_LIST_TYPES) or not isinstance(
+        result, (Iterable, AsyncIterable)
+    ):
+        raise TypeError(
+            "Expected Iterable, but did not find one for field "
+            f"{info.parent_type.name}.{info.field_name}."
+        )
+
+
+async def _iterate_items(result: Any) -> AsyncIterator[Any]:
+    """
+    Iterates over the items of a sync or async iterable.
+    :param result: the iterable to iterate over
+    :type result: Any
+    :return: an async iterator over the items
+    :rtype: AsyncIterator[Any]
+    """
+    if isinstance(result, AsyncIterable):
+        async for item in result:
+            yield item
+    else:
+        for item in result:
+            yield item
+
+
+async def _iterate_chunks(
+    result: Any, chunk_size: int
+) -> AsyncIterator[List[Any]]:
+    """
+    Iterates over the items of a sync or async iterable chunk by chunk, so
+    that at most `chunk_size` items are read ahead.
+    :param result: the iterable to iterate over
+    :param chunk_size: maximum number of items of a chunk
+    :type result: Any
+    :type chunk_size: int
+    :return: an async iterator over the chunks of items
+    :rtype: AsyncIterator[List[Any]]
+    """
+    if isinstance(result, AsyncIterable):
+        chunk = []
+        async for item in result:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+
+    iterator = iter(result)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
 
 
 @null_coercer_wrapper
@@ -39,22 +123,41 @@ async def list_coercer_sequentially(
     :return: the computed value
     :rtype: List[Any]
     """
-    # pylint: disable=too-many-locals
-    if not isinstance(result, list):
-        raise TypeError(
-            "Expected Iterable, but did not find one for field "
-            f"{info.parent_type.name}.{info.field_name}."
+    # pylint: disable=too-many-arguments
+    _check_is_iterable(result, info)
+
+    if execution_context.incremental is not None:
+        result = await stream_list_items(
+            result,
+            execution_context,
+            field_nodes,
+            path,
+            partial(
+                complete_value_catching_error,
+                info=info,
+                field_nodes=field_nodes,
+                return_type=item_type,
+                output_coercer=inner_coercer,
+            ),
         )
 
     results = []
-    for index, item in enumerate(result):
+    index = 0
+    async for item in _iterate_items(result):
+        item_path = Path(path, index)
+        index += 1
+        if execution_context.scheduler is not None:
+            # Items are completed one at a time, even level by level
+            execution_context.scheduler.start((item_path,))
+            execution_context.scheduler.settle(path)
+
         try:
             value = await complete_value_catching_error(
                 item,
                 info,
                 execution_context,
                 field_nodes,
-                Path(path, index),
+                item_path,
                 item_type,
                 inner_coercer,
             )
@@ -69,6 +172,63 @@ async def list_coercer_sequentially(
     return results
 
 
+async def _complete_items_concurrently(
+    items: Sequence,
+    first_index: int,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    inner_coercer: Callable,
+) -> List[Any]:
+    """
+    Completes concurrently a slice of the items of a list.
+    :param items: the items to complete
+    :param first_index: index of the first item in the list
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param inner_coercer: the pre-computed coercer to use on the items
+    :type items: Sequence
+    :type first_index: int
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type inner_coercer: Callable
+    :return: the completed items or the exceptions raised while completing
+    them
+    :rtype: List[Any]
+    """
+    # pylint: disable=too-many-arguments
+    item_paths = [
+        Path(path, index)
+        for index in range(first_index, first_index + len(items))
+    ]
+    if execution_context.scheduler is not None:
+        execution_context.scheduler.start(item_paths)
+        execution_context.scheduler.settle(path)
+
+    item_completions = [
+        complete_value_catching_error(
+            item,
+            info,
+            execution_context,
+            field_nodes,
+            item_path,
+            item_type,
+            inner_coercer,
+        )
+        for item, item_path in zip(items, item_paths)
+    ]
+
+    return await gather_units(execution_context, item_completions)
+
+
 @null_coercer_wrapper
 async def list_coercer_concurrently(
     result: Any,
@@ -78,6 +238,7 @@ async def list_coercer_concurrently(
     path: "Path",
     item_type: "GraphQLOutputType",
     inner_coercer: Callable,
+    max_concurrency: Optional[int] = None,
 ) -> List[Any]:
     """
     Computes the value of a list.
@@ -88,6 +249,9 @@ async def list_coercer_concurrently(
     :param path: the path traveled until this resolver
     :param item_type: GraphQLType of list items
     :param inner_coercer: the pre-computed coercer to use on the result
+    :param max_concurrency: maximum number of items completed at the same
+    time, items are then completed chunk by chunk (the items of async
+    iterables are always read & completed chunk by chunk)
     :type result: Any
     :type info: ResolveInfo
     :type execution_context: ExecutionContext
@@ -95,34 +259,249 @@ async def list_coercer_concurrently(
     :type path: Path
     :type item_type: GraphQLOutputType
     :type inner_coercer: Callable
+    :type max_concurrency: Optional[int]
     :return: the computed value
     :rtype: List[Any]
     """
-    # pylint: disable=too-many-locals
-    if not isinstance(result, list):
-        raise TypeError(
-            "Expected Iterable, but did not find one for field "
-            f"{info.parent_type.name}.{info.field_name}."
+    # pylint: disable=too-many-arguments
+    _check_is_iterable(result, info)
+
+    if execution_context.incremental is not None:
+        result = await stream_list_items(
+            result,
+            execution_context,
+            field_nodes,
+            path,
+            partial(
+                complete_value_catching_error,
+                info=info,
+                field_nodes=field_nodes,
+                return_type=item_type,
+                output_coercer=inner_coercer,
+            ),
         )
 
-    results = await asyncio.gather(
-        *[
-            complete_value_catching_error(
-                item,
-                info,
-                execution_context,
-                field_nodes,
-                Path(path, index),
-                item_type,
-                inner_coercer,
+    if isinstance(result, AsyncIterable):
+        # Async iterables are consumed incrementally
+        max_concurrency = max_concurrency or _ASYNC_ITERABLE_BUFFER_SIZE
+    elif not isinstance(result, Sequence) and not max_concurrency:
+        result = list(result)
+
+    if isinstance(result, Sequence) and (
+        not max_concurrency or len(result) <= max_concurrency
+    ):
+        results = await _complete_items_concurrently(
+            result,
+            0,
+            info,
+            execution_context,
+            field_nodes,
+            path,
+            item_type,
+            inner_coercer,
+        )
+    else:
+        results = []
+        async for items in _iterate_chunks(result, max_concurrency):
+            results.extend(
+                await _complete_items_concurrently(
+                    items,
+                    len(results),
+                    info,
+                    execution_context,
+                    field_nodes,
+                    path,
+                    item_type,
+                    inner_coercer,
+                )
             )
-            for index, item in enumerate(result)
-        ],
-        return_exceptions=True,
-    )
 
     exceptions = extract_exceptions_from_results(results)
     if exceptions:
         raise exceptions
 
     return results
+
+
+async def _complete_leaf_item(
+    item: Any,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    item_coercer: Callable,
+) -> Any:
+    """
+    Computes the value of a single item of a list of leaf values.
+    :param item: resolved value of the item
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path of the item
+    :param item_type: GraphQLType of list items
+    :param item_coercer: the pre-computed synchronous coercer to use on the
+    item
+    :type item: Any
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type item_coercer: Callable
+    :return: the computed value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        return item_coercer(item, info.parent_type, info.field_name)
+    except Exception as e:  # pylint: disable=broad-except
+        return handle_field_error(
+            e, field_nodes, path, item_type, execution_context
+        )
+
+
+async def _collect_leaf_items(result: Any) -> Sequence:
+    """
+    Returns the items of a list of leaf values as a sequence.
+    :param result: resolved value
+    :type result: Any
+    :return: the items of the list
+    :rtype: Sequence
+    """
+    if isinstance(result, _BUFFER_TYPES):
+        return result.tolist()
+    if isinstance(result, AsyncIterable):
+        return [item async for item in result]
+    if not isinstance(result, Sequence):
+        return list(result)
+    return result
+
+
+def _coerce_leaf_items(
+    items: Sequence,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    item_coercer: Callable,
+) -> List[Any]:
+    """
+    Coerces the items of a list of leaf values one by one, in a single loop.
+    :param items: the items of the list
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param item_coercer: the pre-computed synchronous coercer to use on each
+    item
+    :type items: Sequence
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type item_coercer: Callable
+    :return: the computed value
+    :rtype: List[Any]
+    """
+    # pylint: disable=too-many-arguments
+    parent_type = info.parent_type
+    field_name = info.field_name
+    results = []
+    has_errors = False
+    for index, item in enumerate(items):
+        try:
+            results.append(item_coercer(item, parent_type, field_name))
+        except Exception as raw_exception:  # pylint: disable=broad-except
+            try:
+                handle_field_error(
+                    raw_exception,
+                    field_nodes,
+                    Path(path, index),
+                    item_type,
+                    execution_context,
+                )
+                results.append(None)
+            except Exception as e:  # pylint: disable=broad-except
+                has_errors = True
+                results.append(e)
+
+    if has_errors:
+        raise extract_exceptions_from_results(results)
+
+    return results
+
+
+@null_coercer_wrapper
+async def list_coercer_leaves(
+    result: Any,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    item_coercer: Callable,
+    coerce_many: Optional[Callable] = None,
+) -> List[Any]:
+    """
+    Computes the value of a list of leaf values (scalars & enums) which can be
+    coerced synchronously, in a single loop.
+    :param result: resolved value
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param item_coercer: the pre-computed synchronous coercer to use on each
+    item
+    :param coerce_many: the `coerce_output_many` hook of the scalar items, to
+    use to coerce all the items at once when none of them is null
+    :type result: Any
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type item_coercer: Callable
+    :type coerce_many: Optional[Callable]
+    :return: the computed value
+    :rtype: List[Any]
+    """
+    # pylint: disable=too-many-arguments
+    _check_is_iterable(result, info)
+
+    if execution_context.incremental is not None:
+        result = await stream_list_items(
+            result,
+            execution_context,
+            field_nodes,
+            path,
+            partial(
+                _complete_leaf_item,
+                info=info,
+                field_nodes=field_nodes,
+                item_type=item_type,
+                item_coercer=item_coercer,
+            ),
+        )
+
+    result = await _collect_leaf_items(result)
+    if coerce_many is not None and None not in result:
+        try:
+            return coerce_many(result)
+        except Exception:  # pylint: disable=broad-except
+            # Items are coerced one by one to locate the invalid ones
+            pass
+
+    return _coerce_leaf_items(
+        result,
+        info,
+        execution_context,
+        field_nodes,
+        path,
+        item_type,
+        item_coercer,
+    )
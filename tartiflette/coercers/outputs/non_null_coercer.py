@@ -1,6 +1,6 @@
 from typing import Any, Callable, List
 
-__all__ = ("non_null_coercer",)
+__all__ = ("non_null_coercer", "non_null_coercer_sync")
 
 
 async def non_null_coercer(
@@ -38,3 +38,33 @@ async def non_null_coercer(
             f"{info.parent_type.name}.{info.field_name}."
         )
     return coerced_output
+
+
+def non_null_coercer_sync(
+    result: Any,
+    parent_type: "GraphQLObjectType",
+    field_name: str,
+    inner_coercer: Callable,
+) -> Any:
+    """
+    Checks synchronously if the result is None and will raise an error if its
+    the case or will returns the coerced result.
+    :param result: resolved value
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param field_name: name of the resolved field
+    :param inner_coercer: the pre-computed synchronous coercer to use on the
+    result
+    :type result: Any
+    :type parent_type: GraphQLObjectType
+    :type field_name: str
+    :type inner_coercer: Callable
+    :return: the computed value
+    :rtype: Any
+    """
+    coerced_output = inner_coercer(result, parent_type, field_name)
+    if coerced_output is None:
+        raise ValueError(
+            "Cannot return null for non-nullable field "
+            f"{parent_type.name}.{field_name}."
+        )
+    return coerced_output
@@ -3,7 +3,7 @@ from typing import Any, List
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("scalar_coercer",)
+__all__ = ("scalar_coercer", "scalar_coercer_sync")
 
 
 @null_coercer_wrapper
@@ -39,3 +39,34 @@ async def scalar_coercer(
             f"Expected value of type {scalar_type} but received {type(result)}."
         )
     return coerced_result
+
+
+def scalar_coercer_sync(
+    result: Any,
+    parent_type: "GraphQLObjectType",
+    field_name: str,
+    scalar_type: "GraphQLScalar",
+) -> Any:
+    """
+    Computes synchronously the value of a scalar type.
+    :param result: resolved value
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param field_name: name of the resolved field
+    :param scalar_type: the GraphQLType instance of the scalar
+    :type result: Any
+    :type parent_type: GraphQLObjectType
+    :type field_name: str
+    :type scalar_type: GraphQLScalar
+    :return: the computed value
+    :rtype: Any
+    """
+    # pylint: disable=unused-argument
+    if result is None:
+        return None
+
+    coerced_result = scalar_type.coerce_output(result)
+    if is_invalid_value(coerced_result):
+        raise ValueError(
+            f"Expected value of type {scalar_type} but received {type(result)}."
+        )
+    return coerced_result
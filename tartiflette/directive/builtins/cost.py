@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, Optional
+
+from tartiflette import Directive
+
+
+class CostDirective:
+    """
+    Built-in directive to declare the weight & the multiplier arguments of a
+    field, used by the static cost analysis of the queries.
+    """
+
+    async def on_post_bake(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        element: "GraphQLField",
+    ) -> "GraphQLField":
+        """
+        Attaches the weight & the multiplier arguments to the baked field.
+        :param directive_args: arguments passed to the directive
+        :param next_directive: next directive to call
+        :param element: current baked field
+        :type directive_args: Dict[str, Any]
+        :type next_directive: Callable
+        :type element: GraphQLField
+        :return: the baked field
+        :rtype: GraphQLField
+        """
+        element = await next_directive(element)
+        element.cost = (
+            directive_args.get("weight"),
+            directive_args.get("multipliers"),
+        )
+        return element
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("cost", schema_name=schema_name)(CostDirective())
+    return '''
+    """Declares the weight & the multiplier arguments of a field for the static cost analysis of the queries."""
+    directive @cost(
+        """Weight of the field, the default weight of the engine being used when undefined."""
+        weight: Int
+
+        """Names of the arguments whose values (or lengths for lists) are summed to multiply the cost of the field & of its selection set."""
+        multipliers: [String!]
+    ) on FIELD_DEFINITION
+    '''
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Optional
+
+from tartiflette import Directive
+
+
+class DeferDirective:
+    """
+    Built-in directive which allows for the deferred delivery of fragment
+    spreads and inline fragments by `Engine.execute_incremental`. The
+    directive is handled by the executor itself and the fragments are
+    executed with the rest of the selection set by `Engine.execute`.
+    """
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("defer", schema_name=schema_name)(DeferDirective())
+    return '''
+    """Directs the executor to defer this fragment when the `if` argument is true or undefined."""
+    directive @defer(
+      """Deferred when true or undefined."""
+      if: Boolean! = true
+
+      """Unique name"""
+      label: String
+    ) on FRAGMENT_SPREAD | INLINE_FRAGMENT
+    '''
@@ -0,0 +1,40 @@
+from typing import Any, Dict, Optional
+
+from tartiflette import Directive
+
+
+class StreamDirective:
+    """
+    Built-in directive which allows for the incremental delivery of the items
+    of list fields by `Engine.execute_incremental`. The directive is handled
+    by the executor itself and the whole list is returned at once by
+    `Engine.execute`.
+    """
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("stream", schema_name=schema_name)(StreamDirective())
+    return '''
+    """Directs the executor to stream plural fields when the `if` argument is true or undefined."""
+    directive @stream(
+      """Stream when true or undefined."""
+      if: Boolean! = true
+
+      """Unique name"""
+      label: String
+
+      """Number of items to return immediately"""
+      initialCount: Int = 0
+    ) on FIELD
+    '''
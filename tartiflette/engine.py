@@ -1,12 +1,15 @@
+import asyncio
 import json as default_json_module
 import logging
 
-from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from importlib import import_module, invalidate_caches
 from inspect import isawaitable
 from typing import (
     Any,
     AsyncIterable,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -16,15 +19,37 @@ from typing import (
 )
 
 from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.breadth_first import execute_breadth_first
 from tartiflette.execution.collect import parse_and_validate_query
 from tartiflette.execution.execute import create_source_event_stream, execute
-from tartiflette.execution.response import build_response
+from tartiflette.execution.incremental import (
+    IncrementalPublisher,
+    execute_incremental,
+)
+from tartiflette.execution.jit import execute_jit_operation
+from tartiflette.execution.persisted_queries import (
+    InMemoryPersistedQueryStore,
+    compute_query_hash,
+    parse_and_validate_persisted_query,
+)
+from tartiflette.execution.query_cache import CachedQueryFunction, QueryCache
+from tartiflette.execution.response import (
+    build_response,
+    encode_response,
+    iterencode_response,
+)
+from tartiflette.language.serialization import dump_document, load_document
+from tartiflette.language.validators import ValidationRules
+from tartiflette.language.validators.query import RULE_SET
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
+    DocumentSerializationError,
     ImproperlyConfigured,
+    MultipleException,
     NonCallable,
     NonCoroutine,
+    PersistedQueryError,
     TartifletteError,
 )
 from tartiflette.utils.callables import is_valid_coroutine
@@ -51,6 +76,18 @@ _BUILTINS_MODULES = (
     "tartiflette.schema.builtins.introspection",
 )
 
+_INCREMENTAL_DELIVERY_MODULES = (
+    "tartiflette.directive.builtins.defer",
+    "tartiflette.directive.builtins.stream",
+)
+
+_QUERY_COST_MODULES = ("tartiflette.directive.builtins.cost",)
+
+_DEFAULT_JIT_THRESHOLD = 10
+
+_DEFAULT_EXECUTION_STRATEGY = "depth_first"
+_EXECUTION_STRATEGIES = ("depth_first", "breadth_first")
+
 
 async def _bake_module(
     module: object, schema_name: str, config: Optional[Dict[str, Any]] = None
@@ -72,8 +109,34 @@ async def _bake_module(
     return msdl or ""
 
 
+def _get_builtins_modules(
+    incremental_delivery: bool, query_cost: Optional["QueryCost"]
+) -> Tuple[str, ...]:
+    """
+    Returns the names of the built-ins modules to import according to the
+    optional features enabled on the engine.
+    :param incremental_delivery: whether or not the @defer & @stream
+    directives should be added to the schema
+    :param query_cost: static cost analysis of the queries, which adds the
+    @cost directive to the schema
+    :type incremental_delivery: bool
+    :type query_cost: Optional[QueryCost]
+    :return: the names of the built-ins modules to import
+    :rtype: Tuple[str, ...]
+    """
+    builtins_modules = _BUILTINS_MODULES
+    if incremental_delivery:
+        builtins_modules += _INCREMENTAL_DELIVERY_MODULES
+    if query_cost is not None:
+        builtins_modules += _QUERY_COST_MODULES
+    return builtins_modules
+
+
 async def _import_builtins(
-    imported_modules: List[object], sdl: str, schema_name: str
+    imported_modules: List[object],
+    sdl: str,
+    schema_name: str,
+    builtins_modules: Tuple[str, ...] = _BUILTINS_MODULES,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes built-ins directives and scalars if not already
@@ -81,13 +144,15 @@ async def _import_builtins(
     :param imported_modules: list of already imported modules
     :param sdl: SDL with complementary content from already baked modules
     :param schema_name: schema name to link with
+    :param builtins_modules: names of the built-ins modules to import
     :type imported_modules: List[object]
     :type sdl: str
     :type schema_name: str
+    :type builtins_modules: Tuple[str, ...]
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
-    for module in _BUILTINS_MODULES:
+    for module in builtins_modules:
         try:
             module = import_module(module)
             sdl = "{sdl}\n{msdl}".format(
@@ -101,15 +166,19 @@ async def _import_builtins(
 
 
 async def _import_modules(
-    module_definitions: List[Union[str, Dict[str, Any]]], schema_name: str
+    module_definitions: List[Union[str, Dict[str, Any]]],
+    schema_name: str,
+    builtins_modules: Tuple[str, ...] = _BUILTINS_MODULES,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes the list of modules filled at engine initialisation
     before importing & baking built-ins modules.
     :param module_definitions: list of modules filled at engine initialisation
     :param schema_name: schema name to link with
+    :param builtins_modules: names of the built-ins modules to import
     :type module_definitions: List[Union[str, Dict[str, Any]]]
     :type schema_name: str
+    :type builtins_modules: Tuple[str, ...]
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
@@ -132,7 +201,36 @@ async def _import_modules(
             )
         imported_modules.append(module)
 
-    return await _import_builtins(imported_modules, sdl, schema_name)
+    return await _import_builtins(
+        imported_modules, sdl, schema_name, builtins_modules
+    )
+
+
+def _hashable_query(
+    query: Union[str, bytes, bytearray, memoryview]
+) -> Union[str, bytes]:
+    """
+    Returns the query as an immutable instance which can be used as a query
+    cache key. `str` & `bytes` instances are returned as-is (their hash being
+    computed once) as well as the `bytes` instance wholly viewed by a
+    memoryview. Mutable buffers are copied once into `bytes` since they could
+    be modified after being cached.
+    :param query: the GraphQL request / query
+    :type query: Union[str, bytes, bytearray, memoryview]
+    :return: the query as a `str` or `bytes` instance
+    :rtype: Union[str, bytes]
+    """
+    if isinstance(query, (str, bytes)):
+        return query
+
+    if (
+        isinstance(query, memoryview)
+        and isinstance(query.obj, bytes)
+        and query.contiguous
+        and query.nbytes == len(query.obj)
+    ):
+        return query.obj
+    return bytes(query)
 
 
 class Engine:
@@ -154,11 +252,28 @@ class Engine:
         json_loader=None,
         custom_default_arguments_coercer=None,
         coerce_list_concurrently=None,
+        coerce_list_max_concurrency=None,
+        jit=False,
+        jit_threshold=None,
+        execution_strategy=None,
+        breadth_first_max_concurrency=None,
+        json_dumper=None,
+        parse_in_executor_threshold=None,
+        parse_executor=None,
+        persisted_query_store=UNDEFINED_VALUE,
+        warm_queries=None,
+        warm_queries_concurrently=None,
+        compact_ast=False,
+        query_limits=None,
+        disabled_validation_rules=None,
+        time_validation_rules=False,
+        query_cost=None,
+        incremental_delivery=False,
     ) -> None:
         """
         Creates an uncooked Engine instance.
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments,too-many-locals
         self._schema = None
         self._schema_name = schema_name
         self._error_coercer = error_coercer
@@ -168,19 +283,43 @@ class Engine:
             custom_default_arguments_coercer
         )
         self._coerce_list_concurrently = coerce_list_concurrently
+        self._coerce_list_max_concurrency = coerce_list_max_concurrency
+        self._jit = jit
+        self._jit_threshold = jit_threshold
+        self._execution_strategy = execution_strategy
+        self._breadth_first_max_concurrency = breadth_first_max_concurrency
         self._modules = modules
         self._query_cache_decorator = (
             query_cache_decorator
             if query_cache_decorator is not UNDEFINED_VALUE
-            else lru_cache(maxsize=512)
+            else QueryCache(maxsize=512)
         )
         self._sdl = sdl
         self._cooked = False
         self._build_response = None
         self._query_executor = None
         self._subscription_executor = None
+        self._incremental_query_executor = None
+        self._operation_executor = None
         self._cached_parse_and_validate_query = None
         self._json_loader = json_loader or default_json_module.loads
+        self._json_dumper = json_dumper
+        self._parse_in_executor_threshold = parse_in_executor_threshold
+        self._parse_executor = parse_executor
+        self._persisted_query_store = (
+            persisted_query_store
+            if persisted_query_store is not UNDEFINED_VALUE
+            else InMemoryPersistedQueryStore()
+        )
+        self._cached_parse_and_validate_persisted_query = None
+        self._warm_queries = warm_queries
+        self._warm_queries_concurrently = warm_queries_concurrently
+        self._compact_ast = compact_ast
+        self._query_limits = query_limits
+        self._disabled_validation_rules = disabled_validation_rules
+        self._time_validation_rules = time_validation_rules
+        self._query_cost = query_cost
+        self._incremental_delivery = incremental_delivery
 
     async def cook(
         self,
@@ -195,7 +334,28 @@ class Engine:
         json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
+        coerce_list_max_concurrency: Optional[int] = None,
         schema_name: Optional[str] = None,
+        jit: Optional[bool] = None,
+        jit_threshold: Optional[int] = None,
+        execution_strategy: Optional[str] = None,
+        breadth_first_max_concurrency: Optional[int] = None,
+        json_dumper: Optional[
+            Callable[[Dict[str, Any]], Union[str, bytes]]
+        ] = None,
+        parse_in_executor_threshold: Optional[int] = None,
+        parse_executor: Optional["Executor"] = None,
+        persisted_query_store: Optional[
+            "PersistedQueryStore"
+        ] = UNDEFINED_VALUE,
+        warm_queries: Optional[Union[str, List[Union[str, bytes]]]] = None,
+        warm_queries_concurrently: Optional[bool] = None,
+        compact_ast: Optional[bool] = None,
+        query_limits: Optional["QueryLimits"] = None,
+        disabled_validation_rules: Optional[List[str]] = None,
+        time_validation_rules: Optional[bool] = None,
+        query_cost: Optional["QueryCost"] = None,
+        incremental_delivery: Optional[bool] = None,
     ) -> None:
         """
         Cook the tartiflette, basically prepare the engine by binding it to
@@ -214,14 +374,53 @@ class Engine:
         want the engine to import, usually this modules contains your
         Resolvers, Directives, Scalar or Subscription code
         :param query_cache_decorator: callable that will replace the
-        tartiflette default lru_cache decorator to cache query parsing
+        tartiflette default QueryCache decorator to cache query parsing
         :param json_loader: A callable that will replace default python
-        json module.loads for ast_json loading
+        json module.loads for ast_json loading (queries are transformed from
+        the libgraphqlparser C AST without any JSON when not provided)
         :param custom_default_arguments_coercer: callable that will replace the
         tartiflette `default_arguments_coercer`
         :param coerce_list_concurrently: whether or not list will be coerced
         concurrently
+        :param coerce_list_max_concurrency: maximum number of list items
+        coerced at the same time
         :param schema_name: name of the SDL
+        :param jit: whether or not hot query operations should be compiled to
+        specialised Python code instead of being interpreted
+        :param jit_threshold: number of executions after which a query
+        operation is considered as hot and compiled
+        :param execution_strategy: strategy to use to execute operations,
+        either "depth_first" or "breadth_first"
+        :param breadth_first_max_concurrency: maximum number of selection
+        sets of a depth executed at the same time by the "breadth_first"
+        execution strategy
+        :param json_dumper: A callable that will replace the built-in JSON
+        encoder used to serialise responses into bytes
+        :param parse_in_executor_threshold: length of the queries above which
+        they are parsed & validated in an executor instead of the event loop
+        :param parse_executor: executor in which large queries are parsed &
+        validated (the default executor of the event loop when not provided)
+        :param persisted_query_store: store of the automatic persisted queries
+        (an in-memory LRU store by default, None to disable persisted queries)
+        :param warm_queries: queries (or path to a JSON file containing a list
+        of queries) to parse, validate & cache while cooking the engine
+        :param warm_queries_concurrently: whether or not the warm queries
+        should be parsed & validated concurrently in the `parse_executor`
+        :param compact_ast: whether or not parsed queries should be built as
+        compact documents (interned names, packed locations & shared empty
+        tuples) to reduce the memory used by the query cache
+        :param query_limits: limits (size, tokens, depth, fields & aliases)
+        enforced on the queries before & while they're parsed
+        :param disabled_validation_rules: names of the query validation rules
+        (e.g. "overlapping-fields-can-be-merged") which shouldn't be run
+        :param time_validation_rules: whether or not the number of calls & the
+        time spent in each query validation rule should be recorded
+        :param query_cost: static cost analysis of the queries, rejecting
+        the operations exceeding a maximum cost before any resolver is
+        executed
+        :param incremental_delivery: whether or not the @defer & @stream
+        directives should be added to the schema, for the incremental
+        delivery of the responses by `execute_incremental`
         :type sdl: Union[str, List[str]]
         :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
         :type custom_default_resolver: Optional[Callable]
@@ -231,9 +430,26 @@ class Engine:
         :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
+        :type coerce_list_max_concurrency: Optional[int]
         :type schema_name: Optional[str]
+        :type jit: Optional[bool]
+        :type jit_threshold: Optional[int]
+        :type execution_strategy: Optional[str]
+        :type breadth_first_max_concurrency: Optional[int]
+        :type json_dumper: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]]
+        :type parse_in_executor_threshold: Optional[int]
+        :type parse_executor: Optional[Executor]
+        :type persisted_query_store: Optional[PersistedQueryStore]
+        :type warm_queries: Optional[Union[str, List[Union[str, bytes]]]]
+        :type warm_queries_concurrently: Optional[bool]
+        :type compact_ast: Optional[bool]
+        :type query_limits: Optional[QueryLimits]
+        :type disabled_validation_rules: Optional[List[str]]
+        :type time_validation_rules: Optional[bool]
+        :type query_cost: Optional[QueryCost]
+        :type incremental_delivery: Optional[bool]
         """
-        # pylint: disable=too-many-arguments,too-many-locals
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
         if self._cooked:
             return
 
@@ -293,8 +509,16 @@ class Engine:
             custom_error_coercer or default_error_coercer
         )
 
+        self._incremental_delivery = bool(
+            incremental_delivery
+            if incremental_delivery is not None
+            else self._incremental_delivery
+        )
+        query_cost = query_cost or self._query_cost
         self._modules, modules_sdl = await _import_modules(
-            modules, schema_name
+            modules,
+            schema_name,
+            _get_builtins_modules(self._incremental_delivery, query_cost),
         )
 
         SchemaRegistry.register_sdl(schema_name, sdl, modules_sdl)
@@ -308,20 +532,165 @@ class Engine:
                 if coerce_list_concurrently is not None
                 else self._coerce_list_concurrently
             ),
+            (
+                coerce_list_max_concurrency
+                if coerce_list_max_concurrency is not None
+                else self._coerce_list_max_concurrency
+            ),
         )
         self._build_response = partial(
             build_response, error_coercer=self._error_coercer
         )
 
+        self._operation_executor = self._get_operation_executor(
+            jit if jit is not None else self._jit,
+            jit_threshold or self._jit_threshold,
+            execution_strategy or self._execution_strategy,
+            breadth_first_max_concurrency
+            if breadth_first_max_concurrency is not None
+            else self._breadth_first_max_concurrency,
+        )
+
         (
             self._query_executor,
             self._subscription_executor,
         ) = self._schema.bake_execute(
             self._perform_query, self._perform_subscription
         )
+        self._incremental_query_executor, _ = self._schema.bake_execute(
+            self._perform_incremental_query, self._perform_subscription
+        )
 
-        if query_cache_decorator is UNDEFINED_VALUE:
-            query_cache_decorator = self._query_cache_decorator
+        self._set_query_parsers(
+            query_cache_decorator
+            if query_cache_decorator is not UNDEFINED_VALUE
+            else self._query_cache_decorator,
+            persisted_query_store
+            if persisted_query_store is not UNDEFINED_VALUE
+            else self._persisted_query_store,
+            parse_in_executor_threshold
+            if parse_in_executor_threshold is not None
+            else self._parse_in_executor_threshold,
+            parse_executor or self._parse_executor,
+        )
+
+        self._schema.json_loader = json_loader or self._json_loader
+        self._schema.json_dumper = json_dumper or self._json_dumper
+        self._schema.compact_ast = bool(
+            compact_ast if compact_ast is not None else self._compact_ast
+        )
+        self._schema.query_limits = query_limits or self._query_limits
+        self._schema.validation_rules = ValidationRules(
+            RULE_SET,
+            disabled_validation_rules or self._disabled_validation_rules,
+            bool(
+                time_validation_rules
+                if time_validation_rules is not None
+                else self._time_validation_rules
+            ),
+        )
+        self._schema.query_cost = query_cost
+
+        warm_queries = warm_queries or self._warm_queries
+        if warm_queries:
+            await self._warm_up_query_cache(
+                warm_queries,
+                warm_queries_concurrently
+                if warm_queries_concurrently is not None
+                else bool(self._warm_queries_concurrently),
+            )
+
+        self._cooked = True
+
+    @staticmethod
+    def _get_operation_executor(
+        jit: bool,
+        jit_threshold: Optional[int],
+        execution_strategy: Optional[str],
+        breadth_first_max_concurrency: Optional[int],
+    ) -> Optional[Callable]:
+        """
+        Returns the callable executing the operations according to the
+        execution strategy & to whether or not the JIT is enabled.
+        :param jit: whether or not hot query operations should be compiled to
+        specialised Python code instead of being interpreted
+        :param jit_threshold: number of executions after which a query
+        operation is considered as hot and compiled
+        :param execution_strategy: strategy to use to execute operations,
+        either "depth_first" or "breadth_first"
+        :param breadth_first_max_concurrency: maximum number of selection
+        sets of a depth executed at the same time by the "breadth_first"
+        execution strategy
+        :type jit: bool
+        :type jit_threshold: Optional[int]
+        :type execution_strategy: Optional[str]
+        :type breadth_first_max_concurrency: Optional[int]
+        :return: the operation executor, None for the default one
+        :rtype: Optional[Callable]
+        """
+        execution_strategy = execution_strategy or _DEFAULT_EXECUTION_STRATEGY
+        if execution_strategy not in _EXECUTION_STRATEGIES:
+            raise ImproperlyConfigured(
+                f"Unknown execution strategy < {execution_strategy} >, "
+                "expected one of: "
+                + ", ".join(f"< {name} >" for name in _EXECUTION_STRATEGIES)
+                + "."
+            )
+
+        if execution_strategy == "breadth_first":
+            if jit:
+                raise ImproperlyConfigured(
+                    "The < jit > executor can't be used with the "
+                    "< breadth_first > execution strategy."
+                )
+            if (
+                breadth_first_max_concurrency is not None
+                and breadth_first_max_concurrency < 1
+            ):
+                raise ImproperlyConfigured(
+                    "< breadth_first_max_concurrency > has to be greater "
+                    "than 0."
+                )
+            return partial(
+                execute_breadth_first,
+                max_concurrency=breadth_first_max_concurrency,
+            )
+
+        if jit:
+            return partial(
+                execute_jit_operation,
+                threshold=jit_threshold or _DEFAULT_JIT_THRESHOLD,
+            )
+        return None
+
+    def _set_query_parsers(
+        self,
+        query_cache_decorator: Optional[Callable],
+        persisted_query_store: Optional["PersistedQueryStore"],
+        parse_in_executor_threshold: Optional[int],
+        parse_executor: Optional["Executor"],
+    ) -> None:
+        """
+        Sets up the (cached) callables parsing & validating the queries and
+        the persisted queries.
+        :param query_cache_decorator: callable caching query parsing
+        :param persisted_query_store: store of the automatic persisted queries
+        :param parse_in_executor_threshold: length of the queries above which
+        they are parsed & validated in an executor instead of the event loop
+        :param parse_executor: executor in which large queries are parsed &
+        validated
+        :type query_cache_decorator: Optional[Callable]
+        :type persisted_query_store: Optional[PersistedQueryStore]
+        :type parse_in_executor_threshold: Optional[int]
+        :type parse_executor: Optional[Executor]
+        """
+        if isinstance(parse_executor, ProcessPoolExecutor):
+            raise ImproperlyConfigured(
+                "The < parse_executor > can't be a < ProcessPoolExecutor > "
+                "since parsed queries are bound to the schema."
+            )
+        self._parse_executor = parse_executor
+        self._parse_in_executor_threshold = parse_in_executor_threshold
 
         self._cached_parse_and_validate_query = (
             query_cache_decorator(parse_and_validate_query)
@@ -329,8 +698,335 @@ class Engine:
             else parse_and_validate_query
         )
 
-        self._schema.json_loader = json_loader or self._json_loader
-        self._cooked = True
+        self._persisted_query_store = persisted_query_store
+        if persisted_query_store is not None:
+            # persisted queries are cached under their hash so that they can
+            # be executed without being loaded, hashed nor parsed
+            parse_and_validate_stored_query = partial(
+                parse_and_validate_persisted_query,
+                persisted_query_store,
+                parse_and_validate_query,
+            )
+            self._cached_parse_and_validate_persisted_query = (
+                query_cache_decorator(parse_and_validate_stored_query)
+                if callable(query_cache_decorator)
+                else parse_and_validate_stored_query
+            )
+
+    async def _parse_and_validate_persisted_query(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]],
+        persisted_query: Dict[str, Any],
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates a query following the automatic persisted queries
+        protocol: the query is registered under its hash when provided (and
+        valid), otherwise the query registered under the hash is executed.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :param persisted_query: the `persistedQuery` request extension
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type persisted_query: Dict[str, Any]
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        if self._persisted_query_store is None:
+            return (
+                None,
+                [
+                    PersistedQueryError(
+                        "PersistedQueryNotSupported",
+                        extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+                    )
+                ],
+            )
+
+        sha256_hash = (
+            persisted_query.get("sha256Hash")
+            if isinstance(persisted_query, dict)
+            else None
+        )
+        if not isinstance(sha256_hash, str):
+            return (
+                None,
+                [
+                    PersistedQueryError(
+                        "Invalid persisted query: < sha256Hash > should be a "
+                        "string."
+                    )
+                ],
+            )
+
+        if persisted_query.get("version", 1) != 1:
+            return (
+                None,
+                [PersistedQueryError("Unsupported persisted query version.")],
+            )
+
+        if query is not None:
+            query = _hashable_query(query)
+            if compute_query_hash(query) != sha256_hash:
+                return (
+                    None,
+                    [
+                        PersistedQueryError(
+                            "Provided sha256Hash does not match query.",
+                            extensions={
+                                "code": "PERSISTED_QUERY_HASH_MISMATCH"
+                            },
+                        )
+                    ],
+                )
+            return await self._register_persisted_query(sha256_hash, query)
+
+        cached_parse = self._cached_parse_and_validate_persisted_query
+        try:
+            if isinstance(cached_parse, CachedQueryFunction):
+                return await cached_parse.call_async(sha256_hash, self._schema)
+            return cached_parse(sha256_hash, self._schema)
+        except PersistedQueryError as e:
+            return None, [e]
+
+    async def _register_persisted_query(
+        self, sha256_hash: str, query: Union[str, bytes]
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates a query sent along with its hash and registers it
+        into the persisted query store once checked against the query limits,
+        parsed & validated, so that clients can't fill the store with
+        oversized or invalid queries.
+        :param sha256_hash: the hash of the query
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        bytes
+        :type sha256_hash: str
+        :type query: Union[str, bytes]
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        result = await self._parse_and_validate_query(query)
+        if result[1]:
+            return result
+
+        try:
+            query = query if isinstance(query, str) else str(query, "UTF-8")
+        except UnicodeDecodeError:
+            return (
+                None,
+                [
+                    PersistedQueryError(
+                        "Invalid persisted query: the query should be UTF-8 "
+                        "encoded."
+                    )
+                ],
+            )
+
+        self._persisted_query_store.set(sha256_hash, query)
+        if isinstance(
+            self._cached_parse_and_validate_persisted_query,
+            CachedQueryFunction,
+        ):
+            self._cached_parse_and_validate_persisted_query.cache_set(
+                sha256_hash, self._schema, result
+            )
+        return result
+
+    async def _parse_and_validate_query(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]],
+        extensions: Optional[Dict[str, Any]] = None,
+        in_executor: Optional[bool] = None,
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query through the query cache. Queries longer
+        than the `parse_in_executor_threshold` are parsed & validated in the
+        `parse_executor` so that they don't block the event loop.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :param extensions: the extensions provided in the GraphQL request
+        :param in_executor: whether or not the query should be parsed &
+        validated in the `parse_executor` (determined from the length of the
+        query when None)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type extensions: Optional[Dict[str, Any]]
+        :type in_executor: Optional[bool]
+        :return: a DocumentNode representing the query or the errors
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        persisted_query = (
+            extensions.get("persistedQuery") if extensions else None
+        )
+        if persisted_query is not None:
+            return await self._parse_and_validate_persisted_query(
+                query, persisted_query
+            )
+
+        if query is None:
+            return None, [TartifletteError("Must provide query string.")]
+
+        query = _hashable_query(query)
+
+        if in_executor is None:
+            in_executor = (
+                self._parse_in_executor_threshold is not None
+                and len(query) > self._parse_in_executor_threshold
+            )
+
+        runner = None
+        if in_executor:
+            runner = partial(
+                asyncio.get_running_loop().run_in_executor,
+                self._parse_executor,
+            )
+
+        if isinstance(
+            self._cached_parse_and_validate_query, CachedQueryFunction
+        ):
+            # concurrent misses on a same query wait for a single parsing
+            return await self._cached_parse_and_validate_query.call_async(
+                query, self._schema, runner=runner
+            )
+
+        if runner is not None:
+            return await runner(
+                self._cached_parse_and_validate_query, query, self._schema
+            )
+        return self._cached_parse_and_validate_query(query, self._schema)
+
+    async def _warm_up_query_cache(
+        self,
+        warm_queries: Union[str, List[Union[str, bytes]]],
+        concurrently: bool,
+    ) -> None:
+        """
+        Parses, validates & caches a list of queries so that they don't have
+        to be parsed on their first execution.
+        :param warm_queries: queries or path to a JSON file containing a list
+        of queries
+        :param concurrently: whether or not the queries should be parsed &
+        validated concurrently in the `parse_executor`
+        :type warm_queries: Union[str, List[Union[str, bytes]]]
+        :type concurrently: bool
+        """
+        if isinstance(warm_queries, str):
+            with open(warm_queries, encoding="UTF-8") as warm_queries_file:
+                warm_queries = default_json_module.load(warm_queries_file)
+
+        if concurrently:
+            await asyncio.gather(
+                *[
+                    self._parse_and_validate_query(query, in_executor=True)
+                    for query in warm_queries
+                ]
+            )
+            return
+
+        for query in warm_queries:
+            await self._parse_and_validate_query(query)
+
+    def snapshot_query_cache(self, path: Optional[str] = None) -> List[str]:
+        """
+        Returns the queries currently cached by the engine, from the least to
+        the most recently used, which can be given as `warm_queries` to
+        another engine. Queries which couldn't be parsed or validated, or
+        which aren't UTF-8 encoded, are excluded.
+        :param path: path of a JSON file into which dump the queries
+        :type path: Optional[str]
+        :return: the cached queries
+        :rtype: List[str]
+        """
+        if not isinstance(
+            self._cached_parse_and_validate_query, CachedQueryFunction
+        ):
+            raise ImproperlyConfigured(
+                "The query cache can only be snapshotted when the "
+                "< query_cache_decorator > is a < QueryCache > instance."
+            )
+
+        queries = []
+        for query in self._cached_parse_and_validate_query.queries():
+            try:
+                queries.append(
+                    query if isinstance(query, str) else str(query, "UTF-8")
+                )
+            except UnicodeDecodeError:
+                continue
+        if path is not None:
+            with open(path, "w", encoding="UTF-8") as snapshot_file:
+                default_json_module.dump(queries, snapshot_file)
+        return queries
+
+    def validation_rules_timings(
+        self, reset: bool = False
+    ) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Returns the number of calls (`calls`) & the total time in seconds
+        (`time`) spent in each query validation rule, recorded when the
+        engine has been created with `time_validation_rules=True`.
+        :param reset: whether or not the timings should be reset
+        :type reset: bool
+        :return: the number of calls & the time spent by rule name
+        :rtype: Dict[str, Dict[str, Union[int, float]]]
+        """
+        if not self._schema.validation_rules.timed:
+            raise ImproperlyConfigured(
+                "Validation rules are only timed when the engine is created "
+                "with < time_validation_rules=True >."
+            )
+        return self._schema.validation_rules.timings(reset=reset)
+
+    async def dump_query(
+        self, query: Union[str, bytes, bytearray, memoryview]
+    ) -> bytes:
+        """
+        Parses & validates a query (through the query cache) and returns its
+        document serialised into a compact binary format, which can be
+        loaded by `load_query` (e.g. by other processes sharing the same
+        schema) without parsing nor validating the query again.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :type query: Union[str, bytes, bytearray, memoryview]
+        :return: the serialised document of the query
+        :rtype: bytes
+        :raises DocumentSerializationError: when the query isn't valid
+        """
+        query = _hashable_query(query)
+        document, errors = await self._parse_and_validate_query(query)
+        if errors:
+            raise DocumentSerializationError(
+                "Only valid queries can be serialised.",
+                original_error=MultipleException(errors),
+            )
+        return dump_document(document, self._schema, query)
+
+    def load_query(
+        self, query: Union[str, bytes, bytearray, memoryview], data: bytes
+    ) -> None:
+        """
+        Loads a document serialised by `dump_query` into the query cache, so
+        that executing the query doesn't parse nor validate it.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer from which the document has been serialised
+        :param data: the serialised document of the query
+        :type query: Union[str, bytes, bytearray, memoryview]
+        :type data: bytes
+        :raises DocumentSerializationError: when the document has been
+        serialised with another format, for another schema or from another
+        query
+        """
+        if not isinstance(
+            self._cached_parse_and_validate_query, CachedQueryFunction
+        ):
+            raise ImproperlyConfigured(
+                "Documents can only be loaded when the "
+                "< query_cache_decorator > is a < QueryCache > instance."
+            )
+
+        query = _hashable_query(query)
+        self._cached_parse_and_validate_query.cache_set(
+            query,
+            self._schema,
+            (load_document(data, self._schema, query), None),
+        )
 
     async def _perform_subscription(
         self,
@@ -370,6 +1066,7 @@ class Engine:
                 context,
                 variables,
                 operation_name,
+                operation_executor=self._operation_executor,
             )
 
     async def _perform_query(
@@ -393,35 +1090,67 @@ class Engine:
             context,
             variables,
             operation_name,
+            operation_executor=self._operation_executor,
+        )
+
+    async def _perform_incremental_query(
+        self,
+        schema: "GraphQLSchema",
+        document: "DocumentNode",
+        request_parsing_errors: Optional[List["TartifletteError"]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        publisher: Optional["IncrementalPublisher"] = None,
+    ):
+        # pylint: disable=too-many-arguments
+        if request_parsing_errors:
+            return await self._build_response(errors=request_parsing_errors)
+
+        return await execute_incremental(
+            schema,
+            document,
+            self._build_response,
+            publisher,
+            initial_value,
+            context,
+            variables,
+            operation_name,
         )
 
     async def execute(
         self,
-        query: Union[str, bytes],
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Any] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        extensions: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Parses and executes a GraphQL query/mutation request.
-        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
         :param operation_name: the operation name to execute
         :param context: value that can contain everything you need and that
         will be accessible from the resolvers
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param extensions: the extensions provided in the GraphQL request
+        (e.g. the `persistedQuery` extension)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type extensions: Optional[Dict[str, Any]]
         :return: computed response corresponding to the request
         :rtype: Dict[str, Any]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
+        document, errors = await self._parse_and_validate_query(
+            query, extensions
         )
 
         # Goes through potential schema directives and finish in self._perform_query
@@ -446,33 +1175,221 @@ class Engine:
                 )
             return await self._build_response(errors=[e])
 
+    async def execute_bytes(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        buffer: Optional[Any] = None,
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[bytes]:
+        """
+        Parses and executes a GraphQL query/mutation request and serialises
+        the response into UTF-8 encoded JSON bytes.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param buffer: a binary stream (or `bytearray`) into which write the
+        response chunk by chunk instead of returning it
+        :param extensions: the extensions provided in the GraphQL request
+        (e.g. the `persistedQuery` extension)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type buffer: Optional[Any]
+        :type extensions: Optional[Dict[str, Any]]
+        :return: the serialised response, or `None` if written into the
+        buffer
+        :rtype: Optional[bytes]
+        """
+        # pylint: disable=too-many-arguments
+        response = await self.execute(
+            query,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            extensions=extensions,
+        )
+        if buffer is None:
+            return encode_response(response, self._schema.json_dumper)
+
+        write = getattr(buffer, "write", None) or buffer.extend
+        for chunk in iterencode_response(response, self._schema.json_dumper):
+            write(chunk)
+        return None
+
+    async def execute_stream(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        chunk_size: Optional[int] = None,
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Parses and executes a GraphQL query/mutation request and serialises
+        the response into chunks of UTF-8 encoded JSON bytes, which can be
+        written as they come without holding the whole serialised response.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param chunk_size: approximate size of the chunks in bytes
+        :param extensions: the extensions provided in the GraphQL request
+        (e.g. the `persistedQuery` extension)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type chunk_size: Optional[int]
+        :type extensions: Optional[Dict[str, Any]]
+        :return: the chunks of the serialised response
+        :rtype: AsyncIterator[bytes]
+        """
+        # pylint: disable=too-many-arguments
+        response = await self.execute(
+            query,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            extensions=extensions,
+        )
+        for chunk in iterencode_response(
+            response, self._schema.json_dumper, chunk_size
+        ):
+            yield chunk
+
+    async def execute_incremental(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parses and executes a GraphQL query/mutation request, delivering the
+        fragments using the @defer directive and the list items streamed by
+        the @stream directive in subsequent payloads.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param extensions: the extensions provided in the GraphQL request
+        (e.g. the `persistedQuery` extension)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type extensions: Optional[Dict[str, Any]]
+        :return: the initial payload followed by the subsequent payloads
+        :rtype: AsyncIterator[Dict[str, Any]]
+        """
+        if not self._incremental_delivery:
+            # The @defer & @stream directives aren't part of the schema
+            yield await self.execute(
+                query,
+                operation_name,
+                context,
+                variables,
+                initial_value,
+                extensions,
+            )
+            return
+
+        document, errors = await self._parse_and_validate_query(
+            query, extensions
+        )
+
+        publisher = IncrementalPublisher(self._build_response)
+        try:
+            # Goes through potential schema directives and finish in self._perform_incremental_query
+            try:
+                response = await self._incremental_query_executor(
+                    self._schema,
+                    document,
+                    errors,
+                    operation_name,
+                    context,
+                    variables,
+                    initial_value,
+                    context_coercer=context,
+                    publisher=publisher,
+                )
+            # pylint: disable=broad-except
+            except Exception as e:
+                if not isinstance(e, TartifletteError):
+                    e = TartifletteError(
+                        message=str(e),
+                        path=[self._schema.query_operation_name],
+                        original_error=e,
+                    )
+                response = await self._build_response(errors=[e])
+
+            yield response
+            if response.get("hasNext"):
+                async for payload in publisher.subsequent_payloads():
+                    yield payload
+        finally:
+            # The consumer may stop before the subsequent payloads
+            publisher.cancel()
+
     async def subscribe(
         self,
-        query: Union[str, bytes],
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Any] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        extensions: Optional[Dict[str, Any]] = None,
     ) -> AsyncIterable[Dict[str, Any]]:
         """
         Parses and executes a GraphQL subscription request.
-        :param query: the GraphQL request / query as UTF8-encoded string
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        buffer
         :param operation_name: the operation name to execute
         :param context: value that can contain everything you need and that
         will be accessible from the resolvers
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param extensions: the extensions provided in the GraphQL request
+        (e.g. the `persistedQuery` extension)
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type extensions: Optional[Dict[str, Any]]
         :return: computed response corresponding to the request
         :rtype: AsyncIterable[Dict[str, Any]]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
+        document, errors = await self._parse_and_validate_query(
+            query, extensions
         )
 
         # Goes through potential schema directives and finish in self._perform_subscription
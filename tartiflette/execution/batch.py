@@ -0,0 +1,269 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+__all__ = ("BatchScope", "gather_units", "resolve_batched_field")
+
+
+class _Batch:
+    """
+    Pending call of a batch resolver for the parents which reached a field.
+    """
+
+    __slots__ = ("resolver", "arguments", "info", "sources", "futures")
+
+    def __init__(
+        self,
+        resolver: Callable,
+        arguments: Dict[str, Any],
+        info: "ResolveInfo",
+    ) -> None:
+        """
+        :param resolver: callable to use to resolve the field
+        :param arguments: the coerced field arguments
+        :param info: information related to the execution and the field
+        :type resolver: Callable
+        :type arguments: Dict[str, Any]
+        :type info: ResolveInfo
+        """
+        self.resolver = resolver
+        self.arguments = arguments
+        self.info = info
+        self.sources: List[Any] = []
+        self.futures: List["asyncio.Future"] = []
+
+
+class BatchScope:
+    """
+    Collects the parents reaching the batch fields of an execution and calls
+    each batch resolver once per field & depth.
+
+    The scope counts the units of work of the execution which are running:
+    the execution of the operation, the tasks completing the fields of an
+    object or the items of a list concurrently and the calls of the batch
+    resolvers. A unit waiting for a batch to be resolved isn't running. Once
+    no unit is running anymore, no other parent can reach the pending
+    batches: the ones of the shallowest depth are resolved, which makes the
+    units waiting for them run again.
+    """
+
+    __slots__ = ("execution_context", "running", "batches")
+
+    def __init__(self, execution_context: "ExecutionContext") -> None:
+        """
+        :param execution_context: instance of the query execution context
+        :type execution_context: ExecutionContext
+        """
+        self.execution_context = execution_context
+        # The execution of the operation is running
+        self.running = 1
+        self.batches: Dict[Tuple[int, int, int], "_Batch"] = {}
+
+    def arrive(
+        self,
+        field_definition: "GraphQLField",
+        source: Any,
+        resolver: Callable,
+        arguments: Dict[str, Any],
+        info: "ResolveInfo",
+    ) -> "asyncio.Future":
+        """
+        Registers a parent reaching a batch field and returns the future
+        which will hold its resolved value. Parents are batched by depth &
+        field definition, and by AST node so that the aliases of a field
+        with different arguments are resolved separately.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param source: field parent value
+        :param resolver: callable to use to resolve the field
+        :param arguments: the coerced field arguments
+        :param info: information related to the execution and the field
+        :type field_definition: GraphQLField
+        :type source: Any
+        :type resolver: Callable
+        :type arguments: Dict[str, Any]
+        :type info: ResolveInfo
+        :return: the future which will hold the resolved value
+        :rtype: asyncio.Future
+        """
+        # pylint: disable=too-many-arguments
+        depth = 0
+        path = info.path
+        while path is not None:
+            depth += 1
+            path = path.prev
+
+        key = (depth, id(field_definition), id(info.field_nodes[0]))
+        batch = self.batches.get(key)
+        if batch is None:
+            batch = self.batches[key] = _Batch(resolver, arguments, info)
+
+        future = asyncio.get_event_loop().create_future()
+        batch.sources.append(source)
+        batch.futures.append(future)
+        self.suspend()
+        return future
+
+    def resume(self, count: int = 1) -> None:
+        """
+        Registers units which started or went back to running.
+        :param count: number of units
+        :type count: int
+        """
+        self.running += count
+
+    def suspend(self) -> None:
+        """
+        Registers a unit which stopped running, and resolves the pending
+        batches of the shallowest depth if it was the last running one.
+        """
+        self.running -= 1
+        if self.running or not self.batches:
+            return
+
+        depth = min(key[0] for key in self.batches)
+        for key in [key for key in self.batches if key[0] == depth]:
+            self.running += 1
+            asyncio.ensure_future(self._resolve_batch(self.batches.pop(key)))
+
+    async def gather(self, awaitables: List[Awaitable]) -> List[Any]:
+        """
+        Runs concurrently awaitables as units of work of their own, the unit
+        awaiting them not running until they're all done.
+        :param awaitables: the awaitables to run
+        :type awaitables: List[Awaitable]
+        :return: the results of the awaitables or the exceptions they raised
+        :rtype: List[Any]
+        """
+        pending = len(awaitables)
+        if not pending:
+            return []
+
+        async def run_unit(awaitable: Awaitable) -> Any:
+            nonlocal pending
+            try:
+                return await awaitable
+            finally:
+                pending -= 1
+                # The last unit hands over to the awaiting unit
+                if pending:
+                    self.suspend()
+
+        self.running += pending - 1
+        return await asyncio.gather(
+            *[run_unit(awaitable) for awaitable in awaitables],
+            return_exceptions=True,
+        )
+
+    async def _resolve_batch(self, batch: "_Batch") -> None:
+        """
+        Calls the batch resolver and dispatches its results to the parents.
+        :param batch: the batch to resolve
+        :type batch: _Batch
+        """
+        try:
+            results = await _call_batch_resolver(
+                self.execution_context,
+                batch.resolver,
+                batch.sources,
+                batch.arguments,
+                batch.info,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            results = [e] * len(batch.futures)
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                self.running += 1
+                future.set_result(result)
+        self.suspend()
+
+
+async def _call_batch_resolver(
+    execution_context: "ExecutionContext",
+    resolver: Callable,
+    sources: List[Any],
+    arguments: Dict[str, Any],
+    info: "ResolveInfo",
+) -> List[Any]:
+    """
+    Calls a batch resolver and ensures it returned one result per parent.
+    :param execution_context: instance of the query execution context
+    :param resolver: callable to use to resolve the field
+    :param sources: the parents for which resolve the field
+    :param arguments: the coerced field arguments
+    :param info: information related to the execution and the field
+    :type execution_context: ExecutionContext
+    :type resolver: Callable
+    :type sources: List[Any]
+    :type arguments: Dict[str, Any]
+    :type info: ResolveInfo
+    :return: the resolved values, in the order of the parents
+    :rtype: List[Any]
+    """
+    # pylint: disable=too-many-arguments
+    results = await resolver(
+        sources,
+        arguments,
+        execution_context.context,
+        info,
+        context_coercer=execution_context.context,
+    )
+
+    if not isinstance(results, list) or len(results) != len(sources):
+        raise ValueError(
+            f"Batch resolver < {info.parent_type.name}.{info.field_name} > "
+            "has to return a list with one result per parent, expected "
+            f"{len(sources)} results."
+        )
+    return results
+
+
+async def resolve_batched_field(
+    execution_context: "ExecutionContext",
+    field_definition: "GraphQLField",
+    resolver: Callable,
+    source: Any,
+    arguments: Dict[str, Any],
+    info: "ResolveInfo",
+) -> Any:
+    """
+    Resolves the value of a batch field for a parent. The parents reaching
+    the field at the same depth are resolved through a single resolver call.
+    :param execution_context: instance of the query execution context
+    :param field_definition: GraphQLField instance of the resolved field
+    :param resolver: callable to use to resolve the field
+    :param source: field parent value
+    :param arguments: the coerced field arguments
+    :param info: information related to the execution and the field
+    :type execution_context: ExecutionContext
+    :type field_definition: GraphQLField
+    :type resolver: Callable
+    :type source: Any
+    :type arguments: Dict[str, Any]
+    :type info: ResolveInfo
+    :return: the resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    return await execution_context.batch_scope.arrive(
+        field_definition, source, resolver, arguments, info
+    )
+
+
+def gather_units(
+    execution_context: "ExecutionContext", awaitables: List[Awaitable]
+) -> Awaitable[List[Any]]:
+    """
+    Runs concurrently the awaitables completing the fields of an object or
+    the items of a list, as units of work of the batch scope if any.
+    :param execution_context: instance of the query execution context
+    :param awaitables: the awaitables to run
+    :type execution_context: ExecutionContext
+    :type awaitables: List[Awaitable]
+    :return: an awaitable returning the results of the awaitables or the
+    exceptions they raised
+    :rtype: Awaitable[List[Any]]
+    """
+    if execution_context.batch_scope is not None:
+        return execution_context.batch_scope.gather(awaitables)
+    return asyncio.gather(*awaitables, return_exceptions=True)
@@ -0,0 +1,163 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from tartiflette.execution.execute import execute_operation
+
+__all__ = ("BreadthFirstScheduler", "execute_breadth_first")
+
+
+class BreadthFirstScheduler:
+    """
+    Schedules the execution of an operation level by level: the selection
+    sets of the objects returned at a depth are only executed once every
+    field of this depth has been resolved.
+
+    The work of the current depth is tracked through "units" identified by
+    their path: a field being resolved, a list item being completed or an
+    object whose fields are about to be resolved. A unit is settled once it
+    has been completed, has been split into other units (the items of a
+    list, the fields of an object) or has deferred the execution of its
+    selection set. When every unit is settled, the deferred selection sets
+    are executed concurrently, forming the next depth. When a maximum
+    concurrency is set, they're executed by chunks of that size, each chunk
+    being settled before the next one is started.
+
+    Units waiting for their selection set to be executed don't run, which
+    lets the batch scope of the execution resolve the batch fields of the
+    current depth (or chunk) once all the other units wait for them.
+    """
+
+    __slots__ = (
+        "_batch_scope",
+        "_max_concurrency",
+        "_pending_units",
+        "_deferred",
+        "_queued",
+    )
+
+    def __init__(
+        self,
+        batch_scope: Optional["BatchScope"] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        :param batch_scope: the batch scope of the execution
+        :param max_concurrency: maximum number of selection sets of a depth
+        executed at the same time
+        :type batch_scope: Optional[BatchScope]
+        :type max_concurrency: Optional[int]
+        """
+        self._batch_scope = batch_scope
+        self._max_concurrency = max_concurrency
+        self._pending_units = set()
+        self._deferred: List[tuple] = []
+        self._queued: List[tuple] = []
+
+    def start(self, paths: Iterable["Path"]) -> None:
+        """
+        Registers units of work of the current depth.
+        :param paths: paths of the units to register
+        :type paths: Iterable[Path]
+        """
+        self._pending_units.update(paths)
+
+    def settle(self, path: Optional["Path"]) -> None:
+        """
+        Marks a unit of work as settled and starts the next chunk or depth
+        if it was the last pending unit of the current one.
+        :param path: path of the settled unit
+        :type path: Optional[Path]
+        """
+        self._pending_units.discard(path)
+        if self._pending_units:
+            return
+
+        if self._queued:
+            self._start_next_chunk()
+        elif self._deferred:
+            self._queued, self._deferred = self._deferred, []
+            self._start_next_chunk()
+
+    def defer(
+        self, path: "Path", execute_selection_set: Callable[[], Awaitable]
+    ) -> "asyncio.Future":
+        """
+        Defers the execution of a selection set to the next depth.
+        :param path: path of the object whose selection set is deferred
+        :param execute_selection_set: callable executing the selection set
+        :type path: Path
+        :type execute_selection_set: Callable[[], Awaitable]
+        :return: a future which will hold the computed selection set
+        :rtype: asyncio.Future
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._deferred.append((path, execute_selection_set, future))
+        if self._batch_scope is not None:
+            self._batch_scope.suspend()
+        self.settle(path)
+        return future
+
+    def _start_next_chunk(self) -> None:
+        """
+        Executes concurrently the next queued selection sets, up to the
+        maximum concurrency.
+        """
+        chunk = self._queued[: self._max_concurrency]
+        del self._queued[: len(chunk)]
+        self.start(path for path, _, _ in chunk)
+        if self._batch_scope is not None:
+            self._batch_scope.resume(len(chunk))
+        for path, execute_selection_set, future in chunk:
+            asyncio.ensure_future(
+                self._execute_deferred(path, execute_selection_set, future)
+            )
+
+    async def _execute_deferred(
+        self,
+        path: "Path",
+        execute_selection_set: Callable[[], Awaitable],
+        future: "asyncio.Future",
+    ) -> None:
+        """
+        Executes a deferred selection set and sets its result on the future
+        awaited by the coercer of the object.
+        :param path: path of the object whose selection set is executed
+        :param execute_selection_set: callable executing the selection set
+        :param future: the future awaited by the coercer of the object
+        :type path: Path
+        :type execute_selection_set: Callable[[], Awaitable]
+        :type future: asyncio.Future
+        """
+        try:
+            future.set_result(await execute_selection_set())
+        except Exception as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+        finally:
+            self.settle(path)
+
+
+async def execute_breadth_first(
+    execution_context: "ExecutionContext",
+    operation: "OperationDefinitionNode",
+    root_value: Optional[Any],
+    max_concurrency: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Executes the operation level by level instead of depth-first.
+    :param execution_context: instance of the query execution context
+    :param operation: AST operation definition node to execute
+    :param root_value: default value for root fields
+    :param max_concurrency: maximum number of selection sets of a depth
+    executed at the same time
+    :type execution_context: ExecutionContext
+    :type operation: OperationDefinitionNode
+    :type root_value: Optional[Any]
+    :type max_concurrency: Optional[int]
+    :return: the computed value
+    :rtype: Optional[Dict[str, Any]]
+    """
+    execution_context.scheduler = BreadthFirstScheduler(
+        execution_context.batch_scope, max_concurrency
+    )
+    return await execute_operation(execution_context, operation, root_value)
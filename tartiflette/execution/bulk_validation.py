@@ -0,0 +1,410 @@
+import asyncio
+import multiprocessing
+import os
+import uuid
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.language.serialization import dump_document
+from tartiflette.schema.registry import SchemaRegistry
+
+__all__ = (
+    "QueryValidationResult",
+    "validate_queries",
+    "validate_queries_async",
+)
+
+# Schema against which the queries are validated in a worker process: given
+# by the parent process when the workers are forked (so that they share its
+# baked schema) or baked by each worker otherwise
+_SCHEMA: Optional["GraphQLSchema"] = None
+
+
+class QueryValidationResult:
+    """
+    Result of the validation of a query by `validate_queries`.
+    """
+
+    __slots__ = ("index", "errors", "document")
+
+    def __init__(
+        self,
+        index: int,
+        errors: List[Dict[str, Any]],
+        document: Optional[bytes] = None,
+    ) -> None:
+        """
+        :param index: the index of the query in the validated queries
+        :param errors: the GraphQL errors of the query (empty when valid)
+        :param document: the document of the query serialised by
+        `dump_document` when requested & valid
+        :type index: int
+        :type errors: List[Dict[str, Any]]
+        :type document: Optional[bytes]
+        """
+        self.index = index
+        self.errors = errors
+        self.document = document
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns whether or not the query is valid.
+        :return: whether or not the query is valid
+        :rtype: bool
+        """
+        return not self.errors
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryValidationResult instance.
+        :return: the representation of a QueryValidationResult instance
+        :rtype: str
+        """
+        return "QueryValidationResult(index=%r, errors=%r)" % (
+            self.index,
+            self.errors,
+        )
+
+
+async def _bake_schema(
+    sdl: Union[str, List[str]],
+    modules: Optional[Union[str, List[str], List[Dict[str, Any]]]],
+    engine_options: Dict[str, Any],
+) -> "GraphQLSchema":
+    """
+    Cooks an engine without query cache under a private schema name, unique
+    to each call, and returns its baked schema.
+    :param sdl: path or list of path to the files / directories containing
+    the SDL
+    :param modules: modules to import while cooking the engine
+    :param engine_options: other parameters of `create_engine`
+    :type sdl: Union[str, List[str]]
+    :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type engine_options: Dict[str, Any]
+    :return: the baked schema
+    :rtype: GraphQLSchema
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from tartiflette import create_engine
+
+    schema_name = f"__bulk_validation_{uuid.uuid4().hex}"
+    try:
+        engine = await create_engine(
+            sdl,
+            schema_name=schema_name,
+            modules=modules,
+            query_cache_decorator=None,
+            **engine_options,
+        )
+    finally:
+        SchemaRegistry.unregister(schema_name)
+    return engine._schema  # pylint: disable=protected-access
+
+
+def _init_worker(
+    schema: Optional["GraphQLSchema"],
+    sdl: Union[str, List[str]],
+    modules: Optional[Union[str, List[str], List[Dict[str, Any]]]],
+    engine_options: Dict[str, Any],
+) -> None:
+    """
+    Sets the schema of a worker process, which is baked by the worker unless
+    it has been forked from the parent process and shares its baked schema.
+    :param schema: the schema baked by the parent process when the worker is
+    forked
+    :param sdl: path or list of path to the files / directories containing
+    the SDL
+    :param modules: modules to import while cooking the engine
+    :param engine_options: other parameters of `create_engine`
+    :type schema: Optional[GraphQLSchema]
+    :type sdl: Union[str, List[str]]
+    :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type engine_options: Dict[str, Any]
+    """
+    global _SCHEMA  # pylint: disable=global-statement
+    _SCHEMA = schema or asyncio.run(_bake_schema(sdl, modules, engine_options))
+
+
+def _validate_chunk(
+    chunk: List[Tuple[int, Union[str, bytes]]],
+    dump_documents: bool,
+    schema: Optional["GraphQLSchema"] = None,
+) -> List["QueryValidationResult"]:
+    """
+    Parses & validates a chunk of queries against the schema of the process.
+    :param chunk: the queries to validate along with their index
+    :param dump_documents: whether or not the documents of the valid queries
+    should be serialised
+    :param schema: the schema against which validate the queries (the one of
+    the process when not provided)
+    :type chunk: List[Tuple[int, Union[str, bytes]]]
+    :type dump_documents: bool
+    :type schema: Optional[GraphQLSchema]
+    :return: the results of the validation of the queries
+    :rtype: List[QueryValidationResult]
+    """
+    schema = schema or _SCHEMA
+    results = []
+    for index, query in chunk:
+        document, errors = parse_and_validate_query(query, schema)
+        results.append(
+            QueryValidationResult(
+                index,
+                [error.coerce_value() for error in errors or []],
+                dump_document(document, schema, query)
+                if dump_documents and document is not None
+                else None,
+            )
+        )
+    return results
+
+
+def _chunks(
+    queries: Iterable[Union[str, bytes]], chunksize: int
+) -> Iterator[List[Tuple[int, Union[str, bytes]]]]:
+    """
+    Splits the queries into chunks of queries along with their index.
+    :param queries: the queries to split
+    :param chunksize: the number of queries of a chunk
+    :type queries: Iterable[Union[str, bytes]]
+    :type chunksize: int
+    :return: the chunks of queries
+    :rtype: Iterator[List[Tuple[int, Union[str, bytes]]]]
+    """
+    chunk = []
+    for index, query in enumerate(queries):
+        chunk.append((index, query))
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@contextmanager
+def _process_pool(
+    schema: "GraphQLSchema",
+    processes: int,
+    mp_context: Optional[multiprocessing.context.BaseContext],
+    sdl: Union[str, List[str]],
+    modules: Optional[Union[str, List[str], List[Dict[str, Any]]]],
+    engine_options: Dict[str, Any],
+) -> Iterator[ProcessPoolExecutor]:
+    """
+    Starts the pool of worker processes validating the queries. Forked
+    workers (the default start method where available) share the schema
+    baked by the current process, the other ones baking their own schema.
+    :param schema: the schema baked by the current process
+    :param processes: number of worker processes
+    :param mp_context: multiprocessing context used to start the workers
+    :param sdl: path or list of path to the files / directories containing
+    the SDL
+    :param modules: modules to import while cooking the engine
+    :param engine_options: other parameters of `create_engine`
+    :type schema: GraphQLSchema
+    :type processes: int
+    :type mp_context: Optional[multiprocessing.context.BaseContext]
+    :type sdl: Union[str, List[str]]
+    :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type engine_options: Dict[str, Any]
+    :return: the pool of worker processes
+    :rtype: Iterator[ProcessPoolExecutor]
+    """
+    # pylint: disable=too-many-arguments
+    if (
+        mp_context is None
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        mp_context = multiprocessing.get_context("fork")
+
+    # The initializer arguments are only pickled when the workers aren't
+    # forked
+    forked = (
+        mp_context or multiprocessing.get_context()
+    ).get_start_method() == "fork"
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(schema if forked else None, sdl, modules, engine_options),
+    ) as executor:
+        yield executor
+
+
+def validate_queries(
+    queries: Iterable[Union[str, bytes]],
+    sdl: Union[str, List[str]],
+    modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+    dump_documents: bool = False,
+    mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    **engine_options,
+) -> Iterator["QueryValidationResult"]:
+    """
+    Parses & validates many queries against a schema in a pool of processes
+    and yields the result of each query, in the order of the queries, as soon
+    as it (and the results of the previous queries) is available.
+
+    The schema is baked once in the current process, under a private schema
+    name, and shared with the workers when they're forked (the default start
+    method where available), each worker baking its own schema otherwise.
+    Queries are consumed lazily, at most two chunks of queries per worker
+    being validated at once. The schema is baked in an event loop of its own:
+    use `validate_queries_async` from a coroutine.
+    :param queries: the queries to validate
+    :param sdl: path or list of path to the files / directories containing
+    the SDL
+    :param modules: modules to import while cooking the engine (e.g. to
+    provide the SDL & implementation of custom scalars & directives through
+    their `bake` function)
+    :param processes: number of worker processes (the number of CPUs when
+    not provided, the queries being validated in the current process when 0)
+    :param chunksize: number of queries sent at once to a worker
+    :param dump_documents: whether or not the documents of the valid queries
+    should be serialised by `dump_document`, so that they can be loaded into
+    the query cache of an engine with `Engine.load_query`
+    :param mp_context: multiprocessing context used to start the workers
+    :param engine_options: other parameters of `create_engine` (e.g.
+    `query_limits` or `disabled_validation_rules`), which have to be
+    picklable unless the workers are forked
+    :type queries: Iterable[Union[str, bytes]]
+    :type sdl: Union[str, List[str]]
+    :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type processes: Optional[int]
+    :type chunksize: int
+    :type dump_documents: bool
+    :type mp_context: Optional[multiprocessing.context.BaseContext]
+    :return: the results of the validation of the queries
+    :rtype: Iterator[QueryValidationResult]
+
+    :Example:
+
+    >>> from tartiflette.execution.bulk_validation import validate_queries
+    >>>
+    >>>
+    >>> for result in validate_queries(queries, "my_sdl.graphql"):
+    >>>     if not result.valid:
+    >>>         print(queries[result.index], result.errors)
+    """
+    # pylint: disable=too-many-arguments
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    schema = asyncio.run(_bake_schema(sdl, modules, engine_options))
+
+    if processes == 0:
+        for chunk in _chunks(queries, chunksize):
+            yield from _validate_chunk(chunk, dump_documents, schema)
+        return
+
+    with _process_pool(
+        schema, processes, mp_context, sdl, modules, engine_options
+    ) as executor:
+        pending = deque()
+        for chunk in _chunks(queries, chunksize):
+            pending.append(
+                executor.submit(_validate_chunk, chunk, dump_documents)
+            )
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+async def validate_queries_async(
+    queries: Iterable[Union[str, bytes]],
+    sdl: Union[str, List[str]],
+    modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+    dump_documents: bool = False,
+    mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    **engine_options,
+) -> AsyncIterator["QueryValidationResult"]:
+    """
+    Asynchronous version of `validate_queries`, baking the schema in the
+    running event loop and awaiting the results of the workers without
+    blocking it.
+    :param queries: the queries to validate
+    :param sdl: path or list of path to the files / directories containing
+    the SDL
+    :param modules: modules to import while cooking the engine (e.g. to
+    provide the SDL & implementation of custom scalars & directives through
+    their `bake` function)
+    :param processes: number of worker processes (the number of CPUs when
+    not provided, the queries being validated in the current process when 0)
+    :param chunksize: number of queries sent at once to a worker
+    :param dump_documents: whether or not the documents of the valid queries
+    should be serialised by `dump_document`, so that they can be loaded into
+    the query cache of an engine with `Engine.load_query`
+    :param mp_context: multiprocessing context used to start the workers
+    :param engine_options: other parameters of `create_engine` (e.g.
+    `query_limits` or `disabled_validation_rules`), which have to be
+    picklable unless the workers are forked
+    :type queries: Iterable[Union[str, bytes]]
+    :type sdl: Union[str, List[str]]
+    :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
+    :type processes: Optional[int]
+    :type chunksize: int
+    :type dump_documents: bool
+    :type mp_context: Optional[multiprocessing.context.BaseContext]
+    :return: the results of the validation of the queries
+    :rtype: AsyncIterator[QueryValidationResult]
+
+    :Example:
+
+    >>> from tartiflette.execution.bulk_validation import (
+    >>>     validate_queries_async,
+    >>> )
+    >>>
+    >>>
+    >>> async for result in validate_queries_async(queries, "my_sdl.graphql"):
+    >>>     if not result.valid:
+    >>>         print(queries[result.index], result.errors)
+    """
+    # pylint: disable=too-many-arguments
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    schema = await _bake_schema(sdl, modules, engine_options)
+
+    if processes == 0:
+        for chunk in _chunks(queries, chunksize):
+            for result in _validate_chunk(chunk, dump_documents, schema):
+                yield result
+        return
+
+    with _process_pool(
+        schema, processes, mp_context, sdl, modules, engine_options
+    ) as executor:
+        pending = deque()
+        for chunk in _chunks(queries, chunksize):
+            pending.append(
+                asyncio.wrap_future(
+                    executor.submit(_validate_chunk, chunk, dump_documents)
+                )
+            )
+            if len(pending) >= 2 * processes:
+                for result in await pending.popleft():
+                    yield result
+
+        while pending:
+            for result in await pending.popleft():
+                yield result
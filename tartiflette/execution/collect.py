@@ -1,14 +1,17 @@
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from tartiflette.coercers.arguments import coerce_arguments
 from tartiflette.execution.nodes.variable_definition import (
     variable_definition_node_to_executable,
 )
+from tartiflette.execution.plan import build_execution_plan
 from tartiflette.language.ast import (
     FieldNode,
     FragmentSpreadNode,
     InlineFragmentNode,
 )
 from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import validate_document
 from tartiflette.types.exceptions.tartiflette import (
     SkipCollection,
     TartifletteError,
@@ -23,8 +26,10 @@ from tartiflette.utils.type_from_ast import schema_type_from_ast
 __all__ = (
     "parse_and_validate_query",
     "collect_executable_variable_definitions",
+    "get_directive_values",
     "collect_fields",
     "collect_subfields",
+    "collect_operation_fields",
 )
 
 
@@ -32,7 +37,8 @@ def parse_and_validate_query(
     query: Union[str, bytes], schema: "GraphQLSchema"
 ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
     """
-    Analyzes & validates a query by converting it to a DocumentNode.
+    Analyzes & validates a query by converting it to a DocumentNode and
+    attaches to it its execution plan.
     :param query: the GraphQL request / query as UTF8-encoded string
     :type query: Union[str, bytes]
     :param schema: the GraphQLSchema instance linked to the engine
@@ -41,7 +47,10 @@ def parse_and_validate_query(
     :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
     """
     try:
+        if schema.query_limits is not None:
+            schema.query_limits.check_query(query)
         document: "DocumentNode" = parse_to_document(query, schema)
+        errors = validate_document(document, schema)
     except TartifletteError as e:
         return None, [e]
     except Exception as e:  # pylint: disable=broad-except
@@ -50,9 +59,10 @@ def parse_and_validate_query(
             [to_graphql_error(e, message="Server encountered an error.")],
         )
 
-    if document.validators.errors:
-        return None, document.validators.errors
+    if errors:
+        return None, errors
 
+    document.plan = build_execution_plan(document, schema)
     return document, None
 
 
@@ -132,6 +142,60 @@ async def should_include_node(
     return True
 
 
+async def get_directive_values(
+    execution_context: "ExecutionContext",
+    directive_name: str,
+    node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"],
+) -> Optional[Dict[str, Any]]:
+    """
+    Returns the coerced arguments of a directive used on a selection node.
+    :param execution_context: instance of the query execution context
+    :param directive_name: name of the directive
+    :param node: the selection node using the directive
+    :type execution_context: ExecutionContext
+    :type directive_name: str
+    :type node: Union[FragmentSpreadNode, FieldNode, InlineFragmentNode]
+    :return: the coerced arguments if the directive is used on the node
+    :rtype: Optional[Dict[str, Any]]
+    """
+    for directive_node in node.directives or []:
+        if directive_node.name.value == directive_name:
+            directive_definition = execution_context.schema.find_directive(
+                directive_name
+            )
+            return await coerce_arguments(
+                directive_definition.arguments,
+                directive_node,
+                execution_context.variable_values,
+                execution_context.context,
+                coercer=directive_definition.arguments_coercer,
+            )
+    return None
+
+
+async def get_defer_label(
+    execution_context: "ExecutionContext",
+    node: Union["FragmentSpreadNode", "InlineFragmentNode"],
+) -> Tuple[bool, Optional[str]]:
+    """
+    Determines whether or not a fragment should be deferred based on the
+    @defer directive.
+    :param execution_context: instance of the query execution context
+    :param node: the fragment node to collect or defer
+    :type execution_context: ExecutionContext
+    :type node: Union[FragmentSpreadNode, InlineFragmentNode]
+    :return: whether or not the fragment should be deferred and its label
+    :rtype: Tuple[bool, Optional[str]]
+    """
+    if not node.directives:
+        return False, None
+
+    defer = await get_directive_values(execution_context, "defer", node)
+    if defer is None or not defer["if"]:
+        return False, None
+    return True, defer.get("label")
+
+
 def get_field_entry_key(node: "FieldNode") -> str:
     """
     Implements the logic to compute the key of a given field's entry.
@@ -181,6 +245,9 @@ async def collect_fields(
     selection_set: "SelectionSetNode",
     fields: Optional[Dict[str, List["FieldNode"]]] = None,
     visited_fragment_names: Optional[Set[str]] = None,
+    deferred_fragments: Optional[
+        List[Tuple[Optional[str], "SelectionSetNode"]]
+    ] = None,
 ) -> Dict[str, List["FieldNode"]]:
     """
     Given a SelectionSet, adds all of the fields in that selection to
@@ -194,15 +261,19 @@ async def collect_fields(
     :param selection_set: selection set node to parse
     :param fields: dictionary of collected fields
     :param visited_fragment_names: the set of fragment names already visited
+    :param deferred_fragments: list to which add the label & selection set of
+    the fragments using the @defer directive instead of collecting their
+    fields, they are collected as any fragment if not provided
     :type execution_context: ExecutionContext
     :type runtime_type: GraphQLObjectType
     :type selection_set: SelectionSetNode
     :type fields: Optional[Dict[str, List[FieldNode]]]
     :type visited_fragment_names: Optional[Set[str]]
+    :type deferred_fragments: Optional[List[Tuple[Optional[str], SelectionSetNode]]]
     :return: the dictionary of collected fields
     :rtype: Dict[str, List[FieldNode]]
     """
-    # pylint: disable=too-complex
+    # pylint: disable=too-complex,too-many-branches
     if fields is None:
         fields: Dict[str, "FieldNode"] = {}
 
@@ -224,12 +295,21 @@ async def collect_fields(
             ):
                 continue
 
+            if deferred_fragments is not None:
+                is_deferred, label = await get_defer_label(
+                    execution_context, selection
+                )
+                if is_deferred:
+                    deferred_fragments.append((label, selection.selection_set))
+                    continue
+
             await collect_fields(
                 execution_context,
                 runtime_type,
                 selection.selection_set,
                 fields,
                 visited_fragment_names,
+                deferred_fragments,
             )
         elif isinstance(selection, FragmentSpreadNode):
             fragment_name = selection.name.value
@@ -239,7 +319,13 @@ async def collect_fields(
             ):
                 continue
 
-            visited_fragment_names.add(fragment_name)
+            is_deferred, label = (
+                await get_defer_label(execution_context, selection)
+                if deferred_fragments is not None
+                else (False, None)
+            )
+            if not is_deferred:
+                visited_fragment_names.add(fragment_name)
 
             fragment_definition = execution_context.fragments[fragment_name]
             if not fragment_definition or not does_fragment_condition_match(
@@ -247,12 +333,19 @@ async def collect_fields(
             ):
                 continue
 
+            if is_deferred:
+                deferred_fragments.append(
+                    (label, fragment_definition.selection_set)
+                )
+                continue
+
             await collect_fields(
                 execution_context,
                 runtime_type,
                 fragment_definition.selection_set,
                 fields,
                 visited_fragment_names,
+                deferred_fragments,
             )
     return fields
 
@@ -261,18 +354,30 @@ async def collect_subfields(
     execution_context: "ExecutionContext",
     return_type: "GraphQLOutputType",
     field_nodes: List["FieldNode"],
+    deferred_fragments: Optional[
+        List[Tuple[Optional[str], "SelectionSetNode"]]
+    ] = None,
 ) -> Dict[str, List["FieldNode"]]:
     """
     Collects the fields of each field nodes.
     :param execution_context: instance of the query execution context
     :param return_type: GraphQLOutputType of the parent field
     :param field_nodes: AST nodes related to the parent field
+    :param deferred_fragments: list to which add the label & selection set of
+    the deferred fragments
     :type execution_context: ExecutionContext
     :type return_type: GraphQLOutputType
     :type field_nodes: List[FieldNode]
+    :type deferred_fragments: Optional[List[Tuple[Optional[str], SelectionSetNode]]]
     :return: the dictionary of collected fields
     :rtype: Dict[str, List[FieldNode]]
     """
+    plan = execution_context.plan
+    if plan is not None:
+        subfield_nodes = plan.get_collected_fields(return_type, field_nodes)
+        if subfield_nodes is not None:
+            return subfield_nodes
+
     subfield_nodes: Dict[str, List["FieldNode"]] = {}
     visited_fragment_names: Set[str] = set()
     for field_node in field_nodes:
@@ -284,5 +389,49 @@ async def collect_subfields(
                 selection_set,
                 subfield_nodes,
                 visited_fragment_names,
+                deferred_fragments,
             )
+
+    if plan is not None:
+        plan.set_collected_fields(return_type, field_nodes, subfield_nodes)
     return subfield_nodes
+
+
+async def collect_operation_fields(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    operation: "OperationDefinitionNode",
+    deferred_fragments: Optional[
+        List[Tuple[Optional[str], "SelectionSetNode"]]
+    ] = None,
+) -> Dict[str, List["FieldNode"]]:
+    """
+    Collects the root fields of an operation.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: the root type of the operation
+    :param operation: the AST operation definition node to execute
+    :param deferred_fragments: list to which add the label & selection set of
+    the deferred fragments
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type operation: OperationDefinitionNode
+    :type deferred_fragments: Optional[List[Tuple[Optional[str], SelectionSetNode]]]
+    :return: the dictionary of collected fields
+    :rtype: Dict[str, List[FieldNode]]
+    """
+    plan = execution_context.plan
+    if plan is not None:
+        fields = plan.get_collected_fields(runtime_type, [operation])
+        if fields is not None:
+            return fields
+
+    fields = await collect_fields(
+        execution_context,
+        runtime_type,
+        operation.selection_set,
+        deferred_fragments=deferred_fragments,
+    )
+
+    if plan is not None:
+        plan.set_collected_fields(runtime_type, [operation], fields)
+    return fields
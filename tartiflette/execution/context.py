@@ -1,17 +1,16 @@
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from tartiflette.coercers.variables import coerce_variables
-from tartiflette.execution.collect import (
-    collect_executable_variable_definitions,
-)
-from tartiflette.language.ast import OperationDefinitionNode
+from tartiflette.execution.batch import BatchScope
+from tartiflette.execution.plan import build_execution_plan
 from tartiflette.types.exceptions.tartiflette import (
     MultipleException,
+    QueryCostError,
     TartifletteError,
 )
 from tartiflette.utils.errors import is_coercible_exception
 
-__all__ = ("build_execution_context",)
+__all__ = ("build_execution_context", "get_response_extensions")
 
 
 class ExecutionContext:
@@ -28,6 +27,12 @@ class ExecutionContext:
         "root_value",
         "variable_values",
         "errors",
+        "plan",
+        "batch_scope",
+        "scheduler",
+        "incremental",
+        "incremental_record",
+        "cost",
     )
 
     def __init__(
@@ -38,6 +43,7 @@ class ExecutionContext:
         context: Optional[Any],
         root_value: Optional[Any],
         variable_values: Optional[Dict[str, Any]],
+        plan: Optional["ExecutionPlan"] = None,
     ) -> None:
         """
         :param schema: the GraphQLSchema instance linked to the engine
@@ -49,12 +55,14 @@ class ExecutionContext:
         :param root_value: an initial value corresponding to the root type
         being executed
         :param variable_values: the variables provided in the GraphQL request
+        :param plan: the execution plan of the executed document
         :type schema: GraphQLSchema
         :type fragments: Dict[str, FragmentDefinitionNode]
         :type operation: OperationDefinitionNode
         :type context: Optional[Any]
         :type root_value: Optional[Any]
         :type variable_values: Optional[Dict[str, Any]]
+        :type plan: Optional[ExecutionPlan]
         """
         # pylint: disable=too-many-arguments,too-many-locals
         self.schema = schema
@@ -64,6 +72,14 @@ class ExecutionContext:
         self.root_value = root_value
         self.variable_values = variable_values
         self.errors: List["TartifletteError"] = []
+        self.plan = plan
+        self.batch_scope: Optional["BatchScope"] = (
+            BatchScope(self) if schema.has_batch_resolvers else None
+        )
+        self.scheduler: Optional["BreadthFirstScheduler"] = None
+        self.incremental: Optional["IncrementalPublisher"] = None
+        self.incremental_record: Optional["IncrementalRecord"] = None
+        self.cost: Optional[int] = None
 
     def add_error(
         self,
@@ -129,22 +145,8 @@ async def build_execution_context(
     """
     # pylint: disable=too-many-arguments,too-many-locals,too-complex
     errors: List["TartifletteError"] = []
-    operation: Optional["OperationDefinitionNode"] = None
-    fragments: Dict[str, "FragmentDefinitionNode"] = {}
-    operations: Dict[Optional[str], "OperationDefinitionNode"] = {}
-
-    for definition in document.definitions:
-        if isinstance(definition, OperationDefinitionNode):
-            operations[
-                definition.name.value if definition.name else None
-            ] = definition
-        else:
-            fragments[definition.name.value] = definition
-
-    if operation_name:
-        operation = operations.get(operation_name)
-    elif len(operations) == 1:
-        _, operation = operations.popitem()
+    plan = document.plan or build_execution_plan(document, schema)
+    operation = plan.get_operation(operation_name)
 
     if not operation:
         errors.append(
@@ -158,7 +160,7 @@ async def build_execution_context(
     variable_values: Dict[str, Any] = {}
     if operation:
         executable_variable_definitions = (
-            collect_executable_variable_definitions(schema, operation)
+            plan.get_executable_variable_definitions(operation)
         )
 
         variable_values, variable_errors = await coerce_variables(
@@ -171,14 +173,43 @@ async def build_execution_context(
     if errors:
         return None, errors
 
-    return (
-        ExecutionContext(
-            schema=schema,
-            fragments=fragments,
-            operation=operation,
-            context=context,
-            root_value=root_value,
-            variable_values=variable_values,
-        ),
-        None,
+    execution_context = ExecutionContext(
+        schema=schema,
+        fragments=plan.fragments,
+        operation=operation,
+        context=context,
+        root_value=root_value,
+        variable_values=variable_values,
+        plan=plan,
     )
+
+    # Operations exceeding the maximum cost are rejected before any resolver
+    # is executed
+    if schema.query_cost is not None:
+        execution_context.cost = plan.get_operation_cost(
+            operation, variable_values
+        )
+        try:
+            schema.query_cost.check(execution_context.cost)
+        except QueryCostError as e:
+            return None, [e]
+
+    return execution_context, None
+
+
+def get_response_extensions(
+    execution_context: "ExecutionContext",
+) -> Optional[Dict[str, Any]]:
+    """
+    Returns the extensions of the response of an executed operation, which
+    expose the cost of the operation when the static cost analysis of the
+    queries is enabled & exposed.
+    :param execution_context: instance of the query execution context
+    :type execution_context: ExecutionContext
+    :return: the extensions of the response
+    :rtype: Optional[Dict[str, Any]]
+    """
+    query_cost = execution_context.schema.query_cost
+    if query_cost is None or not query_cost.expose:
+        return None
+    return {"cost": execution_context.cost}
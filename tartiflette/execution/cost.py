@@ -0,0 +1,368 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentSpreadNode,
+    IntValueNode,
+    ListValueNode,
+    VariableNode,
+)
+from tartiflette.types.exceptions.tartiflette import QueryCostError
+from tartiflette.types.helpers.reduce_type import reduce_type
+
+__all__ = ("QueryCost",)
+
+
+class _CostFrame:
+    """
+    Selection set being walked by the cost analysis along with the cost of
+    the selections walked so far.
+    """
+
+    __slots__ = ("selections", "type_name", "cost", "weight", "multiplier")
+
+    def __init__(
+        self,
+        selection_set: "SelectionSetNode",
+        type_name: Optional[str],
+        weight: int = 0,
+        multiplier: int = 1,
+    ) -> None:
+        """
+        :param selection_set: the selection set to walk
+        :param type_name: the name of the parent type of the selections
+        :param weight: the weight of the field owning the selection set
+        :param multiplier: the multiplier of the field owning the selection
+        set
+        :type selection_set: SelectionSetNode
+        :type type_name: Optional[str]
+        :type weight: int
+        :type multiplier: int
+        """
+        self.selections = iter(selection_set.selections)
+        self.type_name = type_name
+        self.cost = 0
+        self.weight = weight
+        self.multiplier = multiplier
+
+
+def _pop_frame(
+    stack: List[Tuple["_CostFrame", Optional[str]]],
+    fragment_costs: Dict[str, int],
+) -> None:
+    """
+    Pops the frame of a walked selection set and adds its cost to the frame
+    of the parent selection set, storing it when it's the one of a fragment.
+    :param stack: the frames being walked along with their fragment name
+    :param fragment_costs: the computed costs of the fragments by name
+    :type stack: List[Tuple[_CostFrame, Optional[str]]]
+    :type fragment_costs: Dict[str, int]
+    """
+    frame, fragment_name = stack.pop()
+    cost = (frame.weight + frame.cost) * frame.multiplier
+    if fragment_name is not None:
+        fragment_costs[fragment_name] = cost
+    if stack:
+        stack[-1][0].cost += cost
+
+
+def _push_fragment_spread(
+    stack: List[Tuple["_CostFrame", Optional[str]]],
+    frame: "_CostFrame",
+    fragment_spread: "FragmentSpreadNode",
+    fragments: Dict[str, "FragmentDefinitionNode"],
+    fragment_costs: Dict[str, int],
+) -> None:
+    """
+    Adds the cost of a spread fragment to the frame when already computed,
+    pushes the frame of the fragment selection set otherwise.
+    :param stack: the frames being walked along with their fragment name
+    :param frame: the frame of the selection set holding the fragment spread
+    :param fragment_spread: the fragment spread AST node
+    :param fragments: the fragment definition AST nodes of the document
+    indexed by name
+    :param fragment_costs: the computed costs of the fragments by name
+    :type stack: List[Tuple[_CostFrame, Optional[str]]]
+    :type frame: _CostFrame
+    :type fragment_spread: FragmentSpreadNode
+    :type fragments: Dict[str, FragmentDefinitionNode]
+    :type fragment_costs: Dict[str, int]
+    """
+    name = fragment_spread.name.value
+    if name in fragment_costs:
+        frame.cost += fragment_costs[name]
+        return
+
+    fragment = fragments.get(name)
+    if fragment is not None:
+        stack.append(
+            (
+                _CostFrame(
+                    fragment.selection_set,
+                    fragment.type_condition.name.value,
+                ),
+                name,
+            )
+        )
+
+
+def _push_inline_fragment(
+    stack: List[Tuple["_CostFrame", Optional[str]]],
+    frame: "_CostFrame",
+    inline_fragment: "InlineFragmentNode",
+) -> None:
+    """
+    Pushes the frame of the selection set of an inline fragment.
+    :param stack: the frames being walked along with their fragment name
+    :param frame: the frame of the selection set holding the inline fragment
+    :param inline_fragment: the inline fragment AST node
+    :type stack: List[Tuple[_CostFrame, Optional[str]]]
+    :type frame: _CostFrame
+    :type inline_fragment: InlineFragmentNode
+    """
+    stack.append(
+        (
+            _CostFrame(
+                inline_fragment.selection_set,
+                inline_fragment.type_condition.name.value
+                if inline_fragment.type_condition
+                else frame.type_name,
+            ),
+            None,
+        )
+    )
+
+
+class QueryCost:
+    """
+    Static cost analysis of the queries, run before any resolver is executed.
+    The cost of a field is its weight plus the cost of its selection set,
+    multiplied by the sum of the values of its multiplier arguments (e.g. the
+    `first` argument of a paginated field, the length of a list value being
+    used), so that nested pagination explodes the cost of a query as it
+    would explode its execution.
+
+    Weights & multipliers are declared on the field definitions of the SDL
+    with the `@cost(weight: Int, multipliers: [String!])` directive, or with
+    the `field_costs` parameter (which takes precedence) mapping
+    `"Type.field"` coordinates to a weight or to a dict with the `weight` and
+    / or `multipliers` keys.
+    """
+
+    __slots__ = ("max_cost", "default_weight", "field_costs", "expose")
+
+    def __init__(
+        self,
+        max_cost: Optional[int] = None,
+        default_weight: int = 1,
+        field_costs: Optional[Dict[str, Union[int, Dict[str, Any]]]] = None,
+        expose: bool = True,
+    ) -> None:
+        """
+        :param max_cost: maximum cost of an operation, operations exceeding it
+        being rejected before any resolver is executed
+        :param default_weight: weight of the fields without a defined weight
+        :param field_costs: weights & multipliers of the fields by coordinates
+        (`"Type.field"`), overriding the ones of the `@cost` directive
+        :param expose: whether or not the cost of the executed operation
+        should be exposed in the `extensions` of the response
+        :type max_cost: Optional[int]
+        :type default_weight: int
+        :type field_costs: Optional[Dict[str, Union[int, Dict[str, Any]]]]
+        :type expose: bool
+        """
+        self.max_cost = max_cost
+        self.default_weight = default_weight
+        self.field_costs = field_costs or {}
+        self.expose = expose
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryCost instance.
+        :return: the representation of a QueryCost instance
+        :rtype: str
+        """
+        return (
+            "QueryCost(max_cost=%r, default_weight=%r, field_costs=%r, "
+            "expose=%r)"
+            % (
+                self.max_cost,
+                self.default_weight,
+                self.field_costs,
+                self.expose,
+            )
+        )
+
+    def get_field_cost(
+        self, type_name: str, field: "GraphQLField"
+    ) -> Tuple[int, List[str]]:
+        """
+        Returns the weight & the names of the multiplier arguments of a field.
+        :param type_name: the name of the parent type of the field
+        :param field: the field definition
+        :type type_name: str
+        :type field: GraphQLField
+        :return: the weight & the names of the multiplier arguments
+        :rtype: Tuple[int, List[str]]
+        """
+        weight, multipliers = field.cost or (None, None)
+        field_cost = self.field_costs.get(f"{type_name}.{field.name}")
+        if isinstance(field_cost, dict):
+            weight = field_cost.get("weight", weight)
+            multipliers = field_cost.get("multipliers", multipliers)
+        elif field_cost is not None:
+            weight = field_cost
+        return (
+            self.default_weight if weight is None else weight,
+            multipliers or [],
+        )
+
+    @staticmethod
+    def _get_multiplier(
+        field: "GraphQLField",
+        field_node: "FieldNode",
+        multipliers: List[str],
+        variable_values: Optional[Dict[str, Any]],
+    ) -> Tuple[int, bool]:
+        """
+        Returns the multiplier of a selected field, which is the sum of the
+        values of its multiplier arguments (1 when none of them is provided).
+        :param field: the field definition
+        :param field_node: the AST node of the selected field
+        :param multipliers: the names of the multiplier arguments
+        :param variable_values: the coerced variables of the request
+        :type field: GraphQLField
+        :type field_node: FieldNode
+        :type multipliers: List[str]
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the multiplier and whether or not it depends on variables
+        :rtype: Tuple[int, bool]
+        """
+        if not multipliers:
+            return 1, False
+
+        argument_nodes = {
+            argument.name.value: argument.value
+            for argument in field_node.arguments or []
+        }
+
+        total = None
+        uses_variables = False
+        for name in multipliers:
+            value = argument_nodes.get(name)
+            if value is None:
+                argument = field.arguments.get(name)
+                value = argument.default_value if argument else None
+
+            if isinstance(value, VariableNode):
+                uses_variables = True
+                value = (variable_values or {}).get(value.name.value)
+            elif isinstance(value, IntValueNode):
+                value = int(value.value)
+            elif isinstance(value, ListValueNode):
+                value = value.values
+
+            if isinstance(value, (list, tuple)):
+                value = len(value)
+            if isinstance(value, int) and not isinstance(value, bool):
+                total = (total or 0) + max(value, 0)
+
+        return (1 if total is None else total), uses_variables
+
+    def compute(
+        self,
+        schema: "GraphQLSchema",
+        operation: "OperationDefinitionNode",
+        fragments: Dict[str, "FragmentDefinitionNode"],
+        variable_values: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, bool]:
+        """
+        Computes the cost of an operation. The document is walked without
+        recursion and the cost of each fragment is only computed once.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param operation: the operation definition AST node
+        :param fragments: the fragment definition AST nodes of the document
+        indexed by name
+        :param variable_values: the coerced variables of the request
+        :type schema: GraphQLSchema
+        :type operation: OperationDefinitionNode
+        :type fragments: Dict[str, FragmentDefinitionNode]
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the cost of the operation and whether or not it depends on
+        the variables of the request
+        :rtype: Tuple[int, bool]
+        """
+        # pylint: disable=too-many-locals
+        type_definitions = schema.type_definitions
+        fragment_costs: Dict[str, int] = {}
+        uses_variables = False
+
+        root = _CostFrame(
+            operation.selection_set,
+            schema.get_operation_root_type(operation).name,
+        )
+        stack: List[Tuple[_CostFrame, Optional[str]]] = [(root, None)]
+        while stack:
+            frame = stack[-1][0]
+            selection = next(frame.selections, None)
+
+            if selection is None:
+                _pop_frame(stack, fragment_costs)
+                continue
+
+            if isinstance(selection, FieldNode):
+                field_name = selection.name.value
+                if field_name == "__typename":
+                    continue
+
+                try:
+                    field = type_definitions[frame.type_name].find_field(
+                        field_name
+                    )
+                except (AttributeError, KeyError):
+                    continue
+
+                weight, multipliers = self.get_field_cost(
+                    frame.type_name, field
+                )
+                multiplier, field_uses_variables = self._get_multiplier(
+                    field, selection, multipliers, variable_values
+                )
+                uses_variables = uses_variables or field_uses_variables
+
+                if selection.selection_set is None:
+                    frame.cost += weight * multiplier
+                else:
+                    stack.append(
+                        (
+                            _CostFrame(
+                                selection.selection_set,
+                                reduce_type(field.gql_type),
+                                weight,
+                                multiplier,
+                            ),
+                            None,
+                        )
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                _push_fragment_spread(
+                    stack, frame, selection, fragments, fragment_costs
+                )
+            else:
+                _push_inline_fragment(stack, frame, selection)
+
+        return root.cost, uses_variables
+
+    def check(self, cost: int) -> None:
+        """
+        Checks the cost of an operation against the maximum cost.
+        :param cost: the cost of the operation
+        :type cost: int
+        :raises QueryCostError: when the cost exceeds the maximum cost
+        """
+        if self.max_cost is not None and cost > self.max_cost:
+            raise QueryCostError(
+                f"Query cost of < {cost} > exceeds the maximum cost of "
+                f"< {self.max_cost} >.",
+                extensions={"cost": cost, "maxCost": self.max_cost},
+            )
@@ -1,12 +1,14 @@
-import asyncio
-
 from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
 from tartiflette.coercers.common import Path
 from tartiflette.constants import UNDEFINED_VALUE
-from tartiflette.execution.collect import collect_fields
-from tartiflette.execution.context import build_execution_context
+from tartiflette.execution.batch import gather_units
+from tartiflette.execution.collect import collect_operation_fields
+from tartiflette.execution.context import (
+    build_execution_context,
+    get_response_extensions,
+)
 from tartiflette.execution.helpers import get_field_definition
 from tartiflette.execution.types import build_resolve_info
 from tartiflette.utils.errors import extract_exceptions_from_results
@@ -132,28 +134,74 @@ async def execute_fields(
     :return: the computed fields value
     :rtype: Dict[str, Any]
     """
-    results = await asyncio.gather(
-        *[
-            resolve_field(
-                execution_context,
-                parent_type,
-                source_value,
-                field_nodes,
-                Path(path, entry_key),
-                is_introspection_context,
+    # pylint: disable=too-many-locals
+    results: Dict[str, Any] = {}
+    coroutines = []
+    field_paths = []
+    for entry_key, field_nodes in fields.items():
+        field_definition = get_field_definition(
+            execution_context.schema, parent_type, field_nodes[0].name.value
+        )
+        if field_definition is None:
+            continue
+
+        # Default-resolved leaf fields are resolved inline
+        if (
+            field_definition.sync_resolver is not None
+            and not is_introspection_context
+            and not any(field_node.directives for field_node in field_nodes)
+        ):
+            try:
+                results[entry_key] = field_definition.sync_resolver(
+                    execution_context,
+                    parent_type,
+                    source_value,
+                    field_nodes,
+                    Path(path, entry_key),
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                results[entry_key] = e
+            continue
+
+        results[entry_key] = UNDEFINED_VALUE
+        field_path = Path(path, entry_key)
+        field_paths.append(field_path)
+        coroutines.append(
+            (
+                entry_key,
+                field_definition.resolver(
+                    execution_context,
+                    parent_type,
+                    source_value,
+                    field_nodes,
+                    field_path,
+                    is_introspection_context,
+                ),
             )
-            for entry_key, field_nodes in fields.items()
-        ],
-        return_exceptions=True,
-    )
+        )
 
-    exceptions = extract_exceptions_from_results(results)
+    if execution_context.scheduler is not None:
+        execution_context.scheduler.start(field_paths)
+        execution_context.scheduler.settle(path)
+
+    if coroutines:
+        results.update(
+            zip(
+                [entry_key for entry_key, _ in coroutines],
+                await gather_units(
+                    execution_context,
+                    [coroutine for _, coroutine in coroutines],
+                ),
+            )
+        )
+
+    exceptions = extract_exceptions_from_results(results.values())
     if exceptions:
         raise exceptions
 
     return {
         entry_key: result
-        for entry_key, result in zip(fields, results)
+        for entry_key, result in results.items()
         if not is_invalid_value(result)
     }
 
@@ -178,9 +226,24 @@ async def execute_operation(
         operation
     )
 
-    fields = await collect_fields(
-        execution_context, operation_root_type, operation.selection_set
+    # Root fields of mutations are executed serially, thus never deferred
+    deferred_fragments = (
+        []
+        if execution_context.incremental is not None
+        and operation.operation_type != "mutation"
+        else None
+    )
+    fields = await collect_operation_fields(
+        execution_context, operation_root_type, operation, deferred_fragments
     )
+    if deferred_fragments:
+        execution_context.incremental.defer_fragments(
+            execution_context,
+            operation_root_type,
+            root_value,
+            None,
+            deferred_fragments,
+        )
 
     try:
         return await (
@@ -213,6 +276,7 @@ async def execute(
     context: Optional[Any],
     variables: Optional[Dict[str, Any]],
     operation_name: Optional[str],
+    operation_executor: Optional[Callable] = None,
 ) -> Dict[str, Any]:
     """
     Runs the execution of the executable operation.
@@ -226,6 +290,8 @@ async def execute(
     accessible from the resolvers
     :param variables: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
+    :param operation_executor: callable to use instead of the interpreter to
+    execute the operation
     :type schema: GraphQLSchema
     :type document: DocumentNode
     :type response_builder: Callable
@@ -233,6 +299,7 @@ async def execute(
     :type context: Optional[Any]
     :type variables: Optional[Dict[str, Any]]
     :type operation_name: str
+    :type operation_executor: Optional[Callable]
     :return: the GraphQL response linked to the operation execution
     :rtype: Dict[str, Any]
     """
@@ -243,10 +310,14 @@ async def execute(
     if errors:
         return await response_builder(errors=errors)
 
-    data = await execute_operation(
+    data = await (operation_executor or execute_operation)(
         execution_context, execution_context.operation, root_value
     )
-    return await response_builder(data=data, errors=execution_context.errors)
+    return await response_builder(
+        data=data,
+        errors=execution_context.errors,
+        extensions=get_response_extensions(execution_context),
+    )
 
 
 async def create_source_event_stream(
@@ -292,10 +363,8 @@ async def create_source_event_stream(
         execution_context.operation
     )
 
-    fields = await collect_fields(
-        execution_context,
-        operation_root_type,
-        execution_context.operation.selection_set,
+    fields = await collect_operation_fields(
+        execution_context, operation_root_type, execution_context.operation
     )
 
     response_name = list(fields.keys())[0]
@@ -15,8 +15,9 @@ def get_field_definition(
     :return: the GraphQLField instance
     :rtype: GraphQLField
     """
+    # pylint: disable=unused-argument
     try:
-        return schema.get_field_by_name(f"{parent_type}.{field_name}")
-    except Exception:  # pylint: disable=broad-except
+        return parent_type.find_field(field_name)
+    except (AttributeError, KeyError):
         pass
     return None
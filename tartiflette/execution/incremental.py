@@ -0,0 +1,758 @@
+import asyncio
+
+from collections.abc import AsyncIterable
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tartiflette.coercers.common import Path
+from tartiflette.execution.collect import collect_fields, get_directive_values
+from tartiflette.execution.context import (
+    ExecutionContext,
+    build_execution_context,
+    get_response_extensions,
+)
+from tartiflette.execution.execute import execute_fields, execute_operation
+from tartiflette.utils.errors import located_error
+
+__all__ = (
+    "IncrementalPublisher",
+    "IncrementalRecord",
+    "execute_incremental",
+    "stream_list_items",
+)
+
+_PENDING = 0
+_COMPLETED = 1
+_PUBLISHED = 2
+_DROPPED = 3
+
+
+class IncrementalRecord:
+    """
+    A part of the response delivered incrementally: the initial payload, a
+    deferred fragment or a streamed list item.
+    """
+
+    __slots__ = (
+        "parent",
+        "blocker",
+        "path",
+        "anchor_path",
+        "label",
+        "value",
+        "payload",
+        "state",
+        "stops_stream",
+        "dependents",
+    )
+
+    def __init__(
+        self,
+        parent: Optional["IncrementalRecord"],
+        blocker: Optional["IncrementalRecord"],
+        path: List[Union[str, int]],
+        anchor_path: List[Union[str, int]],
+        label: Optional[str],
+    ) -> None:
+        """
+        :param parent: the record whose data contains the anchor of this one
+        :param blocker: the record which has to be published before this one
+        :param path: path of the data of the record
+        :param anchor_path: path which has to be non null in the data of the
+        parent record for the record to be published
+        :param label: the label of the @defer/@stream directive
+        :type parent: Optional[IncrementalRecord]
+        :type blocker: Optional[IncrementalRecord]
+        :type path: List[Union[str, int]]
+        :type anchor_path: List[Union[str, int]]
+        :type label: Optional[str]
+        """
+        # pylint: disable=too-many-arguments
+        self.parent = parent
+        self.blocker = blocker
+        self.path = path
+        self.anchor_path = anchor_path
+        self.label = label
+        self.value: Any = None
+        self.payload: Optional[Dict[str, Any]] = None
+        self.state = _PENDING
+        self.stops_stream = False
+        self.dependents: List["IncrementalRecord"] = []
+
+
+def _is_reachable(
+    parent: "IncrementalRecord", anchor_path: List[Union[str, int]]
+) -> bool:
+    """
+    Determines whether or not the value at the anchor path is non null in the
+    data of the parent record, which isn't the case when a null value has
+    been propagated above it.
+    :param parent: the record whose data contains the anchor path
+    :param anchor_path: the path to look for
+    :type parent: IncrementalRecord
+    :type anchor_path: List[Union[str, int]]
+    :return: whether or not the value at the anchor path is non null
+    :rtype: bool
+    """
+    value = parent.value
+    for key in anchor_path[len(parent.path) :]:
+        if value is None:
+            return False
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return False
+    return value is not None
+
+
+async def _iterate(items: Union[Iterator, AsyncIterator]) -> AsyncIterator:
+    """
+    Iterates over the items of a sync or async iterator.
+    :param items: the iterator to iterate over
+    :type items: Union[Iterator, AsyncIterator]
+    :return: an async iterator over the items
+    :rtype: AsyncIterator
+    """
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class IncrementalPublisher:
+    """
+    Executes the deferred fragments & streamed list items of an operation and
+    publishes their payloads once they're completed. A payload is only
+    published after the payload of its parent (and, for streamed items,
+    after the one of the previous item) and is dropped if a null value has
+    been propagated above its path.
+    """
+
+    __slots__ = (
+        "_response_builder",
+        "_initial_record",
+        "_pending",
+        "_producers",
+        "_outgoing",
+        "_event",
+        "_tasks",
+    )
+
+    def __init__(self, response_builder: Callable) -> None:
+        """
+        :param response_builder: callable in charge of returning the
+        formatted GraphQL response
+        :type response_builder: Callable
+        """
+        self._response_builder = response_builder
+        self._initial_record = IncrementalRecord(None, None, [], [], None)
+        self._pending = 0
+        self._producers = 0
+        self._outgoing: List[Dict[str, Any]] = []
+        self._event = asyncio.Event()
+        self._tasks = set()
+
+    @property
+    def has_next(self) -> bool:
+        """
+        Determines whether or not payloads are still to be published.
+        :return: whether or not payloads are still to be published
+        :rtype: bool
+        """
+        return bool(self._pending or self._producers or self._outgoing)
+
+    def _spawn(self, coroutine: Any) -> None:
+        """
+        Runs a coroutine in a task which is cancelled if the publication is
+        interrupted.
+        :param coroutine: the coroutine to run
+        :type coroutine: Any
+        """
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _add_record(
+        self,
+        execution_context: "ExecutionContext",
+        blocker: Optional["IncrementalRecord"],
+        path: List[Union[str, int]],
+        anchor_path: List[Union[str, int]],
+        label: Optional[str],
+    ) -> "IncrementalRecord":
+        """
+        Registers a new record under the record being computed by the
+        execution context.
+        :param execution_context: instance of the query execution context
+        :param blocker: the record which has to be published before the new
+        one, defaults to its parent record
+        :param path: path of the data of the record
+        :param anchor_path: path which has to be non null in the data of the
+        parent record
+        :param label: the label of the @defer/@stream directive
+        :type execution_context: ExecutionContext
+        :type blocker: Optional[IncrementalRecord]
+        :type path: List[Union[str, int]]
+        :type anchor_path: List[Union[str, int]]
+        :type label: Optional[str]
+        :return: the new record
+        :rtype: IncrementalRecord
+        """
+        # pylint: disable=too-many-arguments
+        parent = execution_context.incremental_record or self._initial_record
+        record = IncrementalRecord(
+            parent, blocker or parent, path, anchor_path, label
+        )
+        self._pending += 1
+        if record.blocker.state == _DROPPED or record.blocker.stops_stream:
+            self._drop(record)
+        else:
+            record.blocker.dependents.append(record)
+        return record
+
+    def _fork(
+        self,
+        execution_context: "ExecutionContext",
+        record: "IncrementalRecord",
+    ) -> "ExecutionContext":
+        """
+        Creates the execution context computing a record, so that the errors
+        encountered are reported in its payload.
+        :param execution_context: the execution context to fork
+        :param record: the record to compute
+        :type execution_context: ExecutionContext
+        :type record: IncrementalRecord
+        :return: the execution context of the record
+        :rtype: ExecutionContext
+        """
+        # pylint: disable=no-self-use
+        forked_context = ExecutionContext(
+            schema=execution_context.schema,
+            fragments=execution_context.fragments,
+            operation=execution_context.operation,
+            context=execution_context.context,
+            root_value=execution_context.root_value,
+            variable_values=execution_context.variable_values,
+            plan=execution_context.plan,
+        )
+        forked_context.incremental = self
+        forked_context.incremental_record = record
+        return forked_context
+
+    def _complete(
+        self,
+        record: "IncrementalRecord",
+        value: Any,
+        payload: Dict[str, Any],
+    ) -> None:
+        """
+        Marks a record as completed and publishes it if its blocker has
+        already been published.
+        :param record: the completed record
+        :param value: the data of the record
+        :param payload: the payload to publish
+        :type record: IncrementalRecord
+        :type value: Any
+        :type payload: Dict[str, Any]
+        """
+        if record.state == _DROPPED:
+            return
+
+        record.value = value
+        record.payload = payload
+        record.state = _COMPLETED
+        if record.blocker.state == _PUBLISHED:
+            self._publish(record)
+
+    def _publish(self, record: "IncrementalRecord") -> None:
+        """
+        Publishes a completed record whose blocker has been published, then
+        the completed records which were waiting for it.
+        :param record: the record to publish
+        :type record: IncrementalRecord
+        """
+        if record.blocker.stops_stream or not _is_reachable(
+            record.parent, record.anchor_path
+        ):
+            self._drop(record)
+            return
+
+        record.state = _PUBLISHED
+        self._pending -= 1
+        self._outgoing.append(record.payload)
+        self._event.set()
+        for dependent in record.dependents:
+            if dependent.state == _COMPLETED:
+                self._publish(dependent)
+            elif dependent.state == _PENDING and record.stops_stream:
+                self._drop(dependent)
+
+    def _drop(self, record: "IncrementalRecord") -> None:
+        """
+        Drops a record and the records waiting for it.
+        :param record: the record to drop
+        :type record: IncrementalRecord
+        """
+        if record.state in (_PUBLISHED, _DROPPED):
+            return
+
+        record.state = _DROPPED
+        self._pending -= 1
+        self._event.set()
+        for dependent in record.dependents:
+            self._drop(dependent)
+
+    def publish_initial(self, data: Optional[Dict[str, Any]]) -> None:
+        """
+        Marks the initial payload as published.
+        :param data: the data of the initial payload
+        :type data: Optional[Dict[str, Any]]
+        """
+        record = self._initial_record
+        record.value = data
+        record.state = _PUBLISHED
+        for dependent in record.dependents:
+            if dependent.state == _COMPLETED:
+                self._publish(dependent)
+
+    def defer_fragments(
+        self,
+        execution_context: "ExecutionContext",
+        runtime_type: "GraphQLObjectType",
+        source: Any,
+        path: Optional["Path"],
+        deferred_fragments: List[Tuple[Optional[str], "SelectionSetNode"]],
+        is_introspection_context: bool = False,
+    ) -> None:
+        """
+        Starts the execution of the deferred fragments of an object.
+        :param execution_context: instance of the query execution context
+        :param runtime_type: GraphQLObjectType of the object
+        :param source: the resolved value of the object
+        :param path: the path of the object
+        :param deferred_fragments: the label & selection set of the deferred
+        fragments
+        :param is_introspection_context: determines whether or not the
+        fragments are executed in a context of an introspection query
+        :type execution_context: ExecutionContext
+        :type runtime_type: GraphQLObjectType
+        :type source: Any
+        :type path: Optional[Path]
+        :type deferred_fragments: List[Tuple[Optional[str], SelectionSetNode]]
+        :type is_introspection_context: bool
+        """
+        # pylint: disable=too-many-arguments
+        path_list = path.as_list() if path else []
+        for label, selection_set in deferred_fragments:
+            record = self._add_record(
+                execution_context, None, path_list, path_list, label
+            )
+            if record.state == _PENDING:
+                self._spawn(
+                    self._execute_deferred_fragment(
+                        record,
+                        self._fork(execution_context, record),
+                        runtime_type,
+                        source,
+                        path,
+                        selection_set,
+                        is_introspection_context,
+                    )
+                )
+
+    async def _execute_deferred_fragment(
+        self,
+        record: "IncrementalRecord",
+        execution_context: "ExecutionContext",
+        runtime_type: "GraphQLObjectType",
+        source: Any,
+        path: Optional["Path"],
+        selection_set: "SelectionSetNode",
+        is_introspection_context: bool,
+    ) -> None:
+        """
+        Executes a deferred fragment and completes its record.
+        :param record: the record of the deferred fragment
+        :param execution_context: the execution context of the record
+        :param runtime_type: GraphQLObjectType of the object
+        :param source: the resolved value of the object
+        :param path: the path of the object
+        :param selection_set: the selection set of the deferred fragment
+        :param is_introspection_context: determines whether or not the
+        fragment is executed in a context of an introspection query
+        :type record: IncrementalRecord
+        :type execution_context: ExecutionContext
+        :type runtime_type: GraphQLObjectType
+        :type source: Any
+        :type path: Optional[Path]
+        :type selection_set: SelectionSetNode
+        :type is_introspection_context: bool
+        """
+        # pylint: disable=too-many-arguments
+        try:
+            deferred_fragments = []
+            fields = await collect_fields(
+                execution_context,
+                runtime_type,
+                selection_set,
+                deferred_fragments=deferred_fragments,
+            )
+            if deferred_fragments:
+                self.defer_fragments(
+                    execution_context,
+                    runtime_type,
+                    source,
+                    path,
+                    deferred_fragments,
+                    is_introspection_context,
+                )
+            data = await execute_fields(
+                execution_context,
+                runtime_type,
+                source,
+                path,
+                fields,
+                is_introspection_context,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            execution_context.add_error(e)
+            data = None
+
+        payload = await self._response_builder(
+            data=data, errors=execution_context.errors
+        )
+        payload["path"] = record.path
+        if record.label is not None:
+            payload["label"] = record.label
+        self._complete(record, data, payload)
+
+    def stream_items(
+        self,
+        execution_context: "ExecutionContext",
+        items: Union[Iterator, AsyncIterator],
+        first_index: int,
+        path: "Path",
+        label: Optional[str],
+        complete_item: Callable,
+    ) -> None:
+        """
+        Starts the completion of the streamed items of a list.
+        :param execution_context: instance of the query execution context
+        :param items: iterator over the items to stream
+        :param first_index: index of the first streamed item
+        :param path: the path of the list
+        :param label: the label of the @stream directive
+        :param complete_item: callable completing an item
+        :type execution_context: ExecutionContext
+        :type items: Union[Iterator, AsyncIterator]
+        :type first_index: int
+        :type path: Path
+        :type label: Optional[str]
+        :type complete_item: Callable
+        """
+        # pylint: disable=too-many-arguments
+        self._producers += 1
+        self._spawn(
+            self._produce_items(
+                execution_context,
+                items,
+                first_index,
+                path,
+                label,
+                complete_item,
+            )
+        )
+
+    async def _produce_items(
+        self,
+        execution_context: "ExecutionContext",
+        items: Union[Iterator, AsyncIterator],
+        first_index: int,
+        path: "Path",
+        label: Optional[str],
+        complete_item: Callable,
+    ) -> None:
+        """
+        Reads the streamed items of a list and starts their completion.
+        :param execution_context: instance of the query execution context
+        :param items: iterator over the items to stream
+        :param first_index: index of the first streamed item
+        :param path: the path of the list
+        :param label: the label of the @stream directive
+        :param complete_item: callable completing an item
+        :type execution_context: ExecutionContext
+        :type items: Union[Iterator, AsyncIterator]
+        :type first_index: int
+        :type path: Path
+        :type label: Optional[str]
+        :type complete_item: Callable
+        """
+        # pylint: disable=too-many-arguments
+        path_list = path.as_list()
+        previous_record = None
+        index = first_index
+        try:
+            async for item in _iterate(items):
+                record = self._add_record(
+                    execution_context,
+                    previous_record,
+                    path_list + [index],
+                    path_list,
+                    label,
+                )
+                if record.state == _DROPPED:
+                    break
+
+                self._spawn(
+                    self._complete_item(
+                        record,
+                        self._fork(execution_context, record),
+                        item,
+                        Path(path, index),
+                        complete_item,
+                    )
+                )
+                previous_record = record
+                index += 1
+        except Exception as e:  # pylint: disable=broad-except
+            record = self._add_record(
+                execution_context,
+                previous_record,
+                path_list + [index],
+                path_list,
+                label,
+            )
+            record_context = self._fork(execution_context, record)
+            record_context.add_error(
+                located_error(e, execution_context.operation, path_list)
+            )
+            await self._complete_failed_item(record, record_context)
+        finally:
+            self._producers -= 1
+            self._event.set()
+
+    async def _complete_item(
+        self,
+        record: "IncrementalRecord",
+        execution_context: "ExecutionContext",
+        item: Any,
+        path: "Path",
+        complete_item: Callable,
+    ) -> None:
+        """
+        Completes a streamed item and its record.
+        :param record: the record of the streamed item
+        :param execution_context: the execution context of the record
+        :param item: the item to complete
+        :param path: the path of the item
+        :param complete_item: callable completing an item
+        :type record: IncrementalRecord
+        :type execution_context: ExecutionContext
+        :type item: Any
+        :type path: Path
+        :type complete_item: Callable
+        """
+        # pylint: disable=too-many-arguments
+        try:
+            value = await complete_item(
+                item, execution_context=execution_context, path=path
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            execution_context.add_error(e)
+            await self._complete_failed_item(record, execution_context)
+            return
+
+        payload = await self._response_builder(
+            data=[value], errors=execution_context.errors
+        )
+        payload["items"] = payload.pop("data")
+        payload["path"] = record.path
+        if record.label is not None:
+            payload["label"] = record.label
+        self._complete(record, value, payload)
+
+    async def _complete_failed_item(
+        self,
+        record: "IncrementalRecord",
+        execution_context: "ExecutionContext",
+    ) -> None:
+        """
+        Completes the record of a streamed item which couldn't be completed,
+        which ends the stream.
+        :param record: the record of the streamed item
+        :param execution_context: the execution context of the record
+        :type record: IncrementalRecord
+        :type execution_context: ExecutionContext
+        """
+        payload = await self._response_builder(
+            data=None, errors=execution_context.errors
+        )
+        payload["items"] = payload.pop("data")
+        payload["path"] = record.path
+        if record.label is not None:
+            payload["label"] = record.label
+        record.stops_stream = True
+        self._complete(record, None, payload)
+
+    async def subsequent_payloads(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the subsequent payloads as the records are published.
+        :return: an async iterator over the subsequent payloads
+        :rtype: AsyncIterator[Dict[str, Any]]
+        """
+        try:
+            while self.has_next:
+                await self._event.wait()
+                self._event.clear()
+                if not self._outgoing and self.has_next:
+                    continue
+
+                payload = {}
+                if self._outgoing:
+                    payload["incremental"] = self._outgoing
+                    self._outgoing = []
+                payload["hasNext"] = self.has_next
+                yield payload
+        finally:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """
+        Cancels the executions of the deferred fragments & streamed list
+        items which are still running, e.g. when the client stopped consuming
+        the payloads.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+
+
+async def stream_list_items(
+    result: Any,
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    complete_item: Callable,
+) -> Any:
+    """
+    Starts streaming the items of a list field using the @stream directive
+    beyond its `initialCount` and returns the items to complete right away.
+    :param result: the resolved list
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the list field
+    :param path: the path of the list
+    :param complete_item: callable completing an item
+    :type result: Any
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type complete_item: Callable
+    :return: the items to complete right away
+    :rtype: Any
+    """
+    # Only the outermost list of a field is streamed
+    if not isinstance(path.key, str) or not field_nodes[0].directives:
+        return result
+
+    stream = await get_directive_values(
+        execution_context, "stream", field_nodes[0]
+    )
+    if stream is None or not stream["if"]:
+        return result
+
+    initial_count = stream["initialCount"]
+    if initial_count is None or initial_count < 0:
+        raise ValueError("initialCount must be a positive integer.")
+
+    if isinstance(result, AsyncIterable):
+        items = result.__aiter__()
+        initial_items = []
+        try:
+            while len(initial_items) < initial_count:
+                initial_items.append(await items.__anext__())
+        except StopAsyncIteration:
+            return initial_items
+    else:
+        items = iter(result)
+        initial_items = list(islice(items, initial_count))
+
+    execution_context.incremental.stream_items(
+        execution_context,
+        items,
+        len(initial_items),
+        path,
+        stream.get("label"),
+        complete_item,
+    )
+    return initial_items
+
+
+async def execute_incremental(
+    schema: "GraphQLSchema",
+    document: "DocumentNode",
+    response_builder: Callable,
+    publisher: "IncrementalPublisher",
+    root_value: Optional[Any],
+    context: Optional[Any],
+    variables: Optional[Dict[str, Any]],
+    operation_name: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Runs the execution of the executable operation, deferring the fragments
+    using the @defer directive and streaming the list items beyond the
+    `initialCount` of the fields using the @stream directive.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param response_builder: callable in charge of returning the formatted
+    GraphQL response
+    :param publisher: the publisher of the subsequent payloads
+    :param root_value: an initial value corresponding to the root type being
+    executed
+    :param context: value that can contain everything you need and that will be
+    accessible from the resolvers
+    :param variables: the variables provided in the GraphQL request
+    :param operation_name: the operation name to execute
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :type response_builder: Callable
+    :type publisher: IncrementalPublisher
+    :type root_value: Optional[Any]
+    :type context: Optional[Any]
+    :type variables: Optional[Dict[str, Any]]
+    :type operation_name: str
+    :return: the initial payload of the GraphQL response
+    :rtype: Dict[str, Any]
+    """
+    # pylint: disable=too-many-arguments
+    execution_context, errors = await build_execution_context(
+        schema, document, root_value, context, variables, operation_name
+    )
+
+    if errors:
+        return await response_builder(errors=errors)
+
+    execution_context.incremental = publisher
+    data = await execute_operation(
+        execution_context, execution_context.operation, root_value
+    )
+    publisher.publish_initial(data)
+
+    response = await response_builder(
+        data=data,
+        errors=execution_context.errors,
+        extensions=get_response_extensions(execution_context),
+    )
+    if publisher.has_next:
+        response["hasNext"] = True
+    return response
@@ -0,0 +1,745 @@
+import asyncio
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tartiflette.coercers.common import Path
+from tartiflette.coercers.outputs.common import handle_field_error
+from tartiflette.coercers.outputs.compute import (
+    get_list_leaves_coercer,
+    get_output_coercer,
+)
+from tartiflette.execution.batch import gather_units
+from tartiflette.execution.collect import (
+    collect_operation_fields,
+    collect_subfields,
+)
+from tartiflette.execution.execute import (
+    execute_operation,
+    resolve_field as interpreted_field,
+)
+from tartiflette.execution.types import ResolveInfo
+from tartiflette.resolver.factory import resolve_field
+from tartiflette.utils.errors import extract_exceptions_from_results
+from tartiflette.utils.values import is_invalid_value
+
+__all__ = ("CompiledOperation", "compile_operation", "execute_jit_operation")
+
+
+class CompiledOperation:
+    """
+    Operation compiled to specialised Python source code by the JIT executor.
+    """
+
+    __slots__ = ("source", "executor", "_field_resolvers")
+
+    def __init__(
+        self,
+        source: str,
+        executor: Callable,
+        field_resolvers: List[Tuple["GraphQLField", Callable]],
+    ) -> None:
+        """
+        :param source: the generated Python source code
+        :param executor: the compiled callable executing the operation
+        :param field_resolvers: the specialised field definitions with the
+        baked resolver inlined in the generated code
+        :type source: str
+        :type executor: Callable
+        :type field_resolvers: List[Tuple[GraphQLField, Callable]]
+        """
+        self.source = source
+        self.executor = executor
+        self._field_resolvers = field_resolvers
+
+    def is_valid(self) -> bool:
+        """
+        Determines whether or not the compiled code is still in line with the
+        schema, which isn't the case anymore when it has been re-baked.
+        :return: whether or not the compiled code is still valid
+        :rtype: bool
+        """
+        return all(
+            field_definition.resolver is resolver
+            for field_definition, resolver in self._field_resolvers
+        )
+
+
+class _OperationCompiler:
+    """
+    Generates the Python source code of an operation. Each field is turned
+    into a coroutine function in which the resolver call, the `ResolveInfo`
+    & `Path` building and the output coercion are inlined. Every part of the
+    operation which can't be specialised is delegated to the interpreter.
+    """
+
+    __slots__ = (
+        "_execution_context",
+        "_lines",
+        "_namespace",
+        "_constants",
+        "_field_resolvers",
+        "_counter",
+    )
+
+    def __init__(self, execution_context: "ExecutionContext") -> None:
+        """
+        :param execution_context: instance of the query execution context
+        :type execution_context: ExecutionContext
+        """
+        self._execution_context = execution_context
+        self._lines: List[str] = []
+        self._namespace: Dict[str, Any] = {
+            "Path": Path,
+            "ResolveInfo": ResolveInfo,
+            "gather": asyncio.gather,
+            "gather_units": gather_units,
+            "handle_field_error": handle_field_error,
+            "interpreted_field": interpreted_field,
+            "extract_exceptions_from_results": extract_exceptions_from_results,
+            "is_invalid_value": is_invalid_value,
+        }
+        self._constants: Dict[int, str] = {}
+        self._field_resolvers: List[Tuple["GraphQLField", Callable]] = []
+        self._counter = 0
+
+    def _constant(self, value: Any) -> str:
+        """
+        Registers a value in the namespace of the generated code and returns
+        the name under which it can be referenced.
+        :param value: value to register
+        :type value: Any
+        :return: the name of the value in the generated code
+        :rtype: str
+        """
+        try:
+            return self._constants[id(value)]
+        except KeyError:
+            pass
+
+        name = f"_c{len(self._constants)}"
+        self._constants[id(value)] = name
+        self._namespace[name] = value
+        return name
+
+    def _function_name(self, prefix: str) -> str:
+        """
+        Returns a unique function name for the generated code.
+        :param prefix: prefix of the function name
+        :type prefix: str
+        :return: a unique function name
+        :rtype: str
+        """
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def _emit(self, lines: List[str]) -> None:
+        """
+        Appends a function definition to the generated code.
+        :param lines: lines of the function definition
+        :type lines: List[str]
+        """
+        self._lines.extend(lines)
+        self._lines.append("")
+
+    def _is_static(self, nodes: List["Node"]) -> bool:
+        """
+        Determines whether or not the selection sets of the nodes can be
+        collected once for all.
+        :param nodes: the nodes owning the selection sets
+        :type nodes: List[Node]
+        :return: whether or not the selection sets are static
+        :rtype: bool
+        """
+        plan = self._execution_context.plan
+        return all(
+            plan.is_static_selection_set(node.selection_set) for node in nodes
+        )
+
+    async def compile_operation(
+        self, operation: "OperationDefinitionNode"
+    ) -> Optional["CompiledOperation"]:
+        """
+        Generates and compiles the code of the operation.
+        :param operation: the AST operation definition node to compile
+        :type operation: OperationDefinitionNode
+        :return: the compiled operation if it can be specialised
+        :rtype: Optional[CompiledOperation]
+        """
+        # Mutations & subscriptions are rarely hot enough to worth it
+        if operation.operation_type != "query" or not self._is_static(
+            [operation]
+        ):
+            return None
+
+        root_type = self._execution_context.schema.get_operation_root_type(
+            operation
+        )
+        selection_set_function = await self._compile_selection_set(
+            root_type,
+            await collect_operation_fields(
+                self._execution_context, root_type, operation
+            ),
+        )
+
+        self._emit(
+            [
+                "async def execute_operation(ec, root_value):",
+                "    try:",
+                f"        return await {selection_set_function}("
+                "ec, root_value, None)",
+                "    except Exception as e:  # pylint: disable=broad-except",
+                "        ec.add_error(e)",
+                "        return None",
+            ]
+        )
+
+        operation_name = (
+            operation.name.value if operation.name else "anonymous"
+        )
+        source = "\n".join(self._lines)
+        exec(  # pylint: disable=exec-used
+            compile(source, f"<tartiflette-jit {operation_name}>", "exec"),
+            self._namespace,
+        )
+        return CompiledOperation(
+            source, self._namespace["execute_operation"], self._field_resolvers
+        )
+
+    async def _compile_selection_set(
+        self,
+        parent_type: "GraphQLObjectType",
+        fields: Dict[str, List["FieldNode"]],
+    ) -> str:
+        """
+        Generates the function executing the collected fields.
+        :param parent_type: GraphQLObjectType of the fields' parent
+        :param fields: dictionary of collected fields
+        :type parent_type: GraphQLObjectType
+        :type fields: Dict[str, List[FieldNode]]
+        :return: the name of the generated function
+        :rtype: str
+        """
+        statements = []
+        calls = []
+        has_interpreted_field = False
+        for index, (entry_key, field_nodes) in enumerate(fields.items()):
+            path = f"Path(path, {entry_key!r})"
+            field_definition = self._get_field_definition(
+                parent_type, field_nodes
+            )
+
+            # Default-resolved leaf fields are resolved inline
+            if (
+                field_definition is not None
+                and field_definition.sync_resolver is not None
+            ):
+                self._field_resolvers.append(
+                    (field_definition, field_definition.resolver)
+                )
+                statements.extend(
+                    [
+                        "    try:",
+                        f"        r{index} = "
+                        f"{self._constant(field_definition.sync_resolver)}("
+                        f"ec, {self._constant(parent_type)}, source, "
+                        f"{self._constant(field_nodes)}, {path})",
+                        "    except Exception as e:  "
+                        "# pylint: disable=broad-except",
+                        f"        r{index} = e",
+                    ]
+                )
+                continue
+
+            field_function = (
+                await self._compile_field(
+                    field_definition, parent_type, field_nodes
+                )
+                if field_definition is not None
+                else None
+            )
+            if field_function is None:
+                has_interpreted_field = True
+                calls.append(
+                    (
+                        index,
+                        "interpreted_field(ec, "
+                        f"{self._constant(parent_type)}, source, "
+                        f"{self._constant(field_nodes)}, {path})",
+                    )
+                )
+            else:
+                calls.append((index, f"{field_function}(ec, source, {path})"))
+
+        if calls and self._execution_context.schema.has_batch_resolvers:
+            statements.extend(
+                [
+                    "    ("
+                    + "".join(f"r{index}, " for index, _ in calls)
+                    + ") = await gather_units(",
+                    "        ec,",
+                    "        [",
+                    *[f"            {call}," for _, call in calls],
+                    "        ],",
+                    "    )",
+                ]
+            )
+        elif calls:
+            statements.extend(
+                [
+                    "    ("
+                    + "".join(f"r{index}, " for index, _ in calls)
+                    + ") = await gather(",
+                    *[f"        {call}," for _, call in calls],
+                    "        return_exceptions=True,",
+                    "    )",
+                ]
+            )
+
+        results = (
+            "(" + "".join(f"r{index}, " for index in range(len(fields))) + ")"
+        )
+        function_name = self._function_name("selection_set")
+        lines = [
+            f"async def {function_name}(ec, source, path):",
+            *statements,
+            f"    exceptions = extract_exceptions_from_results({results})",
+            "    if exceptions:",
+            "        raise exceptions",
+        ]
+
+        if has_interpreted_field:
+            lines.extend(
+                [
+                    "    return {",
+                    "        entry_key: result",
+                    f"        for entry_key, result in zip({list(fields)!r}, "
+                    f"{results})",
+                    "        if not is_invalid_value(result)",
+                    "    }",
+                ]
+            )
+        else:
+            lines.append(
+                "    return {"
+                + ", ".join(
+                    f"{entry_key!r}: r{index}"
+                    for index, entry_key in enumerate(fields)
+                )
+                + "}"
+            )
+
+        self._emit(lines)
+        return function_name
+
+    @staticmethod
+    def _get_field_definition(
+        parent_type: "GraphQLObjectType", field_nodes: List["FieldNode"]
+    ) -> Optional["GraphQLField"]:
+        """
+        Returns the definition of the field if it can be specialised.
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_nodes: AST nodes related to the resolved field
+        :type parent_type: GraphQLObjectType
+        :type field_nodes: List[FieldNode]
+        :return: the GraphQLField instance if it can be specialised
+        :rtype: Optional[GraphQLField]
+        """
+        field_name = field_nodes[0].name.value
+        if field_name.startswith("__"):
+            return None
+
+        try:
+            field_definition = parent_type.find_field(field_name)
+        except (AttributeError, KeyError):
+            return None
+
+        baked_resolver = field_definition.resolver
+        if (
+            field_definition.batch
+            or not isinstance(baked_resolver, partial)
+            or baked_resolver.func is not resolve_field
+        ):
+            return None
+        return field_definition
+
+    async def _compile_field(
+        self,
+        field_definition: "GraphQLField",
+        parent_type: "GraphQLObjectType",
+        field_nodes: List["FieldNode"],
+    ) -> Optional[str]:
+        """
+        Generates the function resolving & completing a field.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_nodes: AST nodes related to the resolved field
+        :type field_definition: GraphQLField
+        :type parent_type: GraphQLObjectType
+        :type field_nodes: List[FieldNode]
+        :return: the name of the generated function if the field can be
+        specialised
+        :rtype: Optional[str]
+        """
+        baked_resolver = field_definition.resolver
+        completion = await self._compile_completion(
+            field_definition.graphql_type,
+            field_definition,
+            parent_type,
+            field_nodes,
+        )
+        if completion is None:
+            return None
+
+        self._field_resolvers.append((field_definition, baked_resolver))
+
+        arguments = (
+            "await ec.plan.coerce_arguments("
+            f"{self._constant(field_definition)}, "
+            f"{self._constant(field_nodes[0])}, "
+            "ec.variable_values, ec.context)"
+            if field_definition.arguments
+            else "{}"
+        )
+
+        function_name = self._function_name("field")
+        self._emit(
+            [
+                f"async def {function_name}(ec, source, path):",
+                "    info = ResolveInfo(",
+                f"        {field_definition.name!r},",
+                f"        {self._constant(field_nodes)},",
+                f"        {self._constant(field_definition.graphql_type)},",
+                f"        {self._constant(parent_type)},",
+                "        path,",
+                "        ec.schema,",
+                "        ec.fragments,",
+                "        ec.root_value,",
+                "        ec.operation,",
+                "        ec.variable_values,",
+                "        False,",
+                "    )",
+                "    try:",
+                f"        arguments = {arguments}",
+                "        result = await "
+                f"{self._constant(baked_resolver.keywords['resolver'])}("
+                "source, arguments, ec.context, info, "
+                "context_coercer=ec.context)",
+                *[f"        {line}" for line in completion],
+                "        return result",
+                "    except Exception as e:  # pylint: disable=broad-except",
+                "        return handle_field_error(",
+                f"            e, {self._constant(field_nodes)}, path, "
+                f"{self._constant(field_definition.graphql_type)}, ec",
+                "        )",
+            ]
+        )
+        return function_name
+
+    async def _compile_completion(
+        self,
+        graphql_type: "GraphQLOutputType",
+        field_definition: "GraphQLField",
+        parent_type: "GraphQLObjectType",
+        field_nodes: List["FieldNode"],
+    ) -> Optional[List[str]]:
+        """
+        Generates the statements completing the `result` variable of the
+        generated code according to its type.
+        :param graphql_type: the type of the value to complete
+        :param field_definition: GraphQLField instance of the resolved field
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_nodes: AST nodes related to the resolved field
+        :type graphql_type: GraphQLOutputType
+        :type field_definition: GraphQLField
+        :type parent_type: GraphQLObjectType
+        :type field_nodes: List[FieldNode]
+        :return: the generated statements if the type can be specialised
+        :rtype: Optional[List[str]]
+        """
+        # pylint: disable=too-many-return-statements
+        if graphql_type.is_non_null_type:
+            inner_completion = await self._compile_completion(
+                graphql_type.wrapped_type,
+                field_definition,
+                parent_type,
+                field_nodes,
+            )
+            if inner_completion is None:
+                return None
+            return [
+                *inner_completion,
+                "if result is None:",
+                "    raise ValueError(",
+                "        "
+                + repr(
+                    "Cannot return null for non-nullable field "
+                    f"{parent_type.name}.{field_definition.name}."
+                ),
+                "    )",
+            ]
+
+        if graphql_type.is_list_type:
+            return await self._compile_list_completion(
+                graphql_type, field_definition, parent_type, field_nodes
+            )
+
+        # Types with directives keep their generic coercer
+        if getattr(graphql_type, "directives", None):
+            return [
+                f"result = await {self._constant(graphql_type.output_coercer)}"
+                f"(result, info, ec, {self._constant(field_nodes)}, path)"
+            ]
+
+        if graphql_type.kind == "SCALAR":
+            return [
+                "if result is not None:",
+                f"    coerced = {self._constant(graphql_type.coerce_output)}"
+                "(result)",
+                "    if is_invalid_value(coerced):",
+                "        raise ValueError(",
+                '            f"Expected value of type '
+                f"{{{self._constant(graphql_type)}}} but received "
+                '{type(result)}."',
+                "        )",
+                "    result = coerced",
+            ]
+
+        if graphql_type.kind == "OBJECT":
+            if not self._is_static(field_nodes):
+                return None
+            selection_set_function = await self._compile_selection_set(
+                graphql_type,
+                await collect_subfields(
+                    self._execution_context, graphql_type, field_nodes
+                ),
+            )
+            return [
+                "if result is not None:",
+                f"    result = await {selection_set_function}("
+                "ec, result, path)",
+            ]
+
+        # Enums & abstract types keep their generic coercer
+        return [
+            f"result = await {self._constant(graphql_type.output_coercer)}"
+            f"(result, info, ec, {self._constant(field_nodes)}, path)"
+        ]
+
+    async def _compile_list_completion(
+        self,
+        graphql_type: "GraphQLList",
+        field_definition: "GraphQLField",
+        parent_type: "GraphQLObjectType",
+        field_nodes: List["FieldNode"],
+    ) -> Optional[List[str]]:
+        """
+        Generates the statements completing the `result` variable of the
+        generated code when its type is a list.
+        :param graphql_type: the list type of the value to complete
+        :param field_definition: GraphQLField instance of the resolved field
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_nodes: AST nodes related to the resolved field
+        :type graphql_type: GraphQLList
+        :type field_definition: GraphQLField
+        :type parent_type: GraphQLObjectType
+        :type field_nodes: List[FieldNode]
+        :return: the generated statements if the type can be specialised
+        :rtype: Optional[List[str]]
+        """
+        leaves_coercer = get_list_leaves_coercer(graphql_type)
+        if leaves_coercer is not None:
+            return [
+                f"result = await {self._constant(leaves_coercer)}"
+                f"(result, info, ec, {self._constant(field_nodes)}, path)"
+            ]
+
+        # Lists completed chunk by chunk keep their generic coercer
+        if field_definition.concurrently and field_definition.max_concurrency:
+            return None
+
+        item_function = await self._compile_list_item(
+            graphql_type.wrapped_type,
+            field_definition,
+            parent_type,
+            field_nodes,
+        )
+        if item_function is None:
+            return None
+
+        # Values which aren't lists (other sequences, iterables...) are
+        # completed by the generic coercer
+        lines = [
+            "if result.__class__ is not list:",
+            "    result = await "
+            + self._constant(
+                get_output_coercer(
+                    graphql_type,
+                    field_definition.concurrently,
+                    field_definition.max_concurrency,
+                )
+            )
+            + f"(result, info, ec, {self._constant(field_nodes)}, path)",
+            "else:",
+        ]
+        if (
+            field_definition.concurrently
+            and self._execution_context.schema.has_batch_resolvers
+        ):
+            lines.extend(
+                [
+                    "    results = await gather_units(",
+                    "        ec,",
+                    f"        [{item_function}(ec, item, info, "
+                    "Path(path, index))",
+                    "         for index, item in enumerate(result)],",
+                    "    )",
+                ]
+            )
+        elif field_definition.concurrently:
+            lines.extend(
+                [
+                    "    results = await gather(",
+                    f"        *[{item_function}(ec, item, info, "
+                    "Path(path, index))",
+                    "          for index, item in enumerate(result)],",
+                    "        return_exceptions=True,",
+                    "    )",
+                ]
+            )
+        else:
+            lines.extend(
+                [
+                    "    results = []",
+                    "    for index, item in enumerate(result):",
+                    "        try:",
+                    f"            item = await {item_function}("
+                    "ec, item, info, Path(path, index))",
+                    "        except Exception as e:  "
+                    "# pylint: disable=broad-except",
+                    "            item = e",
+                    "        results.append(item)",
+                ]
+            )
+        return [
+            *lines,
+            "    exceptions = extract_exceptions_from_results(results)",
+            "    if exceptions:",
+            "        raise exceptions",
+            "    result = results",
+        ]
+
+    async def _compile_list_item(
+        self,
+        item_type: "GraphQLOutputType",
+        field_definition: "GraphQLField",
+        parent_type: "GraphQLObjectType",
+        field_nodes: List["FieldNode"],
+    ) -> Optional[str]:
+        """
+        Generates the function completing an item of a list.
+        :param item_type: GraphQLType of list items
+        :param field_definition: GraphQLField instance of the resolved field
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_nodes: AST nodes related to the resolved field
+        :type item_type: GraphQLOutputType
+        :type field_definition: GraphQLField
+        :type parent_type: GraphQLObjectType
+        :type field_nodes: List[FieldNode]
+        :return: the name of the generated function if the item type can be
+        specialised
+        :rtype: Optional[str]
+        """
+        completion = await self._compile_completion(
+            item_type, field_definition, parent_type, field_nodes
+        )
+        if completion is None:
+            return None
+
+        function_name = self._function_name("list_item")
+        self._emit(
+            [
+                f"async def {function_name}(ec, result, info, path):",
+                "    try:",
+                *[f"        {line}" for line in completion],
+                "        return result",
+                "    except Exception as e:  # pylint: disable=broad-except",
+                "        return handle_field_error(",
+                f"            e, {self._constant(field_nodes)}, path, "
+                f"{self._constant(item_type)}, ec",
+                "        )",
+            ]
+        )
+        return function_name
+
+
+async def compile_operation(
+    execution_context: "ExecutionContext",
+    operation: "OperationDefinitionNode",
+) -> Optional["CompiledOperation"]:
+    """
+    Generates & compiles the specialised Python code of an operation.
+    :param execution_context: instance of the query execution context
+    :param operation: the AST operation definition node to compile
+    :type execution_context: ExecutionContext
+    :type operation: OperationDefinitionNode
+    :return: the compiled operation if it can be specialised
+    :rtype: Optional[CompiledOperation]
+    """
+    return await _OperationCompiler(execution_context).compile_operation(
+        operation
+    )
+
+
+async def execute_jit_operation(
+    execution_context: "ExecutionContext",
+    operation: "OperationDefinitionNode",
+    root_value: Optional[Any],
+    threshold: int = 1,
+) -> Optional[Dict[str, Any]]:
+    """
+    Executes the operation through its compiled code once it has been
+    executed `threshold` times and falls back to the interpreter otherwise.
+    :param execution_context: instance of the query execution context
+    :param operation: AST operation definition node to execute
+    :param root_value: default value for root fields
+    :param threshold: number of executions after which the operation is
+    compiled
+    :type execution_context: ExecutionContext
+    :type operation: OperationDefinitionNode
+    :type root_value: Optional[Any]
+    :type threshold: int
+    :return: the computed value
+    :rtype: Optional[Dict[str, Any]]
+    """
+    plan = execution_context.plan
+    key = id(operation)
+
+    try:
+        compiled_operation = plan.compiled_operations[key]
+    except KeyError:
+        executions = plan.operation_executions.get(key, 0) + 1
+        plan.operation_executions[key] = executions
+        if executions < threshold:
+            return await execute_operation(
+                execution_context, operation, root_value
+            )
+
+        compiled_operation = await compile_operation(
+            execution_context, operation
+        )
+        plan.compiled_operations[key] = compiled_operation
+
+    if compiled_operation is None:
+        return await execute_operation(
+            execution_context, operation, root_value
+        )
+
+    if not compiled_operation.is_valid():
+        del plan.compiled_operations[key]
+        plan.operation_executions[key] = 0
+        return await execute_operation(
+            execution_context, operation, root_value
+        )
+
+    return await compiled_operation.executor(execution_context, root_value)
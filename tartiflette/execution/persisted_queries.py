@@ -0,0 +1,309 @@
+import abc
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from tartiflette.types.exceptions.tartiflette import PersistedQueryError
+
+__all__ = (
+    "compute_query_hash",
+    "PersistedQueryStore",
+    "InMemoryPersistedQueryStore",
+    "FilePersistedQueryStore",
+    "SQLitePersistedQueryStore",
+    "parse_and_validate_persisted_query",
+)
+
+
+def _query_to_str(query: Union[str, bytes]) -> str:
+    """
+    Returns the query as a string.
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :type query: Union[str, bytes]
+    :return: the query as a string
+    :rtype: str
+    """
+    return query if isinstance(query, str) else str(query, "UTF-8")
+
+
+def compute_query_hash(query: Union[str, bytes]) -> str:
+    """
+    Computes the hash identifying a persisted query, as expected by the
+    automatic persisted queries protocol.
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :type query: Union[str, bytes]
+    :return: the hexadecimal SHA-256 digest of the UTF-8 encoded query
+    :rtype: str
+    """
+    return hashlib.sha256(
+        query.encode("UTF-8") if isinstance(query, str) else query
+    ).hexdigest()
+
+
+class PersistedQueryStore(abc.ABC):
+    """
+    Base class of the stores of persisted queries, which map the SHA-256
+    hashes of the registered queries to their text.
+    """
+
+    @abc.abstractmethod
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """
+        Returns the query registered under a hash.
+        :param sha256_hash: the hash of the query
+        :type sha256_hash: str
+        :return: the registered query, or None if the hash is unknown
+        :rtype: Optional[str]
+        """
+
+    @abc.abstractmethod
+    def set(self, sha256_hash: str, query: str) -> None:
+        """
+        Registers a query under its hash.
+        :param sha256_hash: the hash of the query
+        :param query: the query to register
+        :type sha256_hash: str
+        :type query: str
+        """
+
+    def register(self, query: Union[str, bytes]) -> str:
+        """
+        Registers a query and returns its hash.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        bytes
+        :type query: Union[str, bytes]
+        :return: the hash of the query
+        :rtype: str
+        """
+        sha256_hash = compute_query_hash(query)
+        self.set(sha256_hash, _query_to_str(query))
+        return sha256_hash
+
+    def load(self, queries: Iterable[Union[str, bytes]]) -> List[str]:
+        """
+        Registers a list of queries, e.g. to preload the queries of known
+        clients.
+        :param queries: the queries to register
+        :type queries: Iterable[Union[str, bytes]]
+        :return: the hashes of the queries
+        :rtype: List[str]
+        """
+        return [self.register(query) for query in queries]
+
+
+class InMemoryPersistedQueryStore(PersistedQueryStore):
+    """
+    Store keeping the most recently used persisted queries in memory.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        """
+        :param maxsize: maximum number of stored queries (unbounded if None)
+        :type maxsize: Optional[int]
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._queries: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """
+        Returns the query registered under a hash.
+        :param sha256_hash: the hash of the query
+        :type sha256_hash: str
+        :return: the registered query, or None if the hash is unknown
+        :rtype: Optional[str]
+        """
+        with self._lock:
+            query = self._queries.get(sha256_hash)
+            if query is not None:
+                self._queries.move_to_end(sha256_hash)
+            return query
+
+    def set(self, sha256_hash: str, query: str) -> None:
+        """
+        Registers a query under its hash.
+        :param sha256_hash: the hash of the query
+        :param query: the query to register
+        :type sha256_hash: str
+        :type query: str
+        """
+        with self._lock:
+            self._queries[sha256_hash] = query
+            self._queries.move_to_end(sha256_hash)
+            if self.maxsize is not None and len(self._queries) > self.maxsize:
+                self._queries.popitem(last=False)
+
+
+class FilePersistedQueryStore(PersistedQueryStore):
+    """
+    Store saving each persisted query into a `<hash>.graphql` file of a
+    directory, so that registrations survive restarts.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        :param directory: path of the directory into which save the queries
+        :type directory: str
+        """
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, sha256_hash: str) -> Optional[str]:
+        """
+        Returns the path of the file of a query.
+        :param sha256_hash: the hash of the query
+        :type sha256_hash: str
+        :return: the path of the file, or None if the hash isn't valid
+        :rtype: Optional[str]
+        """
+        if len(sha256_hash) != 64 or not all(
+            character in "0123456789abcdef" for character in sha256_hash
+        ):
+            return None
+        return os.path.join(self.directory, f"{sha256_hash}.graphql")
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """
+        Returns the query registered under a hash.
+        :param sha256_hash: the hash of the query
+        :type sha256_hash: str
+        :return: the registered query, or None if the hash is unknown
+        :rtype: Optional[str]
+        """
+        path = self._path(sha256_hash)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="UTF-8", newline="") as query_file:
+                return query_file.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, sha256_hash: str, query: str) -> None:
+        """
+        Registers a query under its hash.
+        :param sha256_hash: the hash of the query
+        :param query: the query to register
+        :type sha256_hash: str
+        :type query: str
+        """
+        path = self._path(sha256_hash)
+        if path is None:
+            raise PersistedQueryError(
+                f"< {sha256_hash} > isn't a valid SHA-256 hash."
+            )
+
+        # written into a temporary file first so that concurrent readers
+        # never read a partially written query
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(
+                tmp_fd, "w", encoding="UTF-8", newline=""
+            ) as query_file:
+                query_file.write(query)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class SQLitePersistedQueryStore(PersistedQueryStore):
+    """
+    Store saving the persisted queries into a SQLite database, so that
+    registrations survive restarts.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path of the SQLite database
+        :type path: str
+        """
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS persisted_queries "
+                "(sha256_hash TEXT PRIMARY KEY, query TEXT NOT NULL)"
+            )
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        """
+        Returns the query registered under a hash.
+        :param sha256_hash: the hash of the query
+        :type sha256_hash: str
+        :return: the registered query, or None if the hash is unknown
+        :rtype: Optional[str]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT query FROM persisted_queries WHERE sha256_hash = ?",
+                (sha256_hash,),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, sha256_hash: str, query: str) -> None:
+        """
+        Registers a query under its hash.
+        :param sha256_hash: the hash of the query
+        :param query: the query to register
+        :type sha256_hash: str
+        :type query: str
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO persisted_queries "
+                "(sha256_hash, query) VALUES (?, ?)",
+                (sha256_hash, query),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+def parse_and_validate_persisted_query(
+    store: PersistedQueryStore,
+    parse_and_validate_query: Callable,
+    sha256_hash: str,
+    schema: "GraphQLSchema",
+) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+    """
+    Retrieves a persisted query from its hash then analyzes & validates it.
+    Intended to be cached by the query cache under the hash of the query so
+    that executing a persisted query doesn't require to load, hash nor parse
+    the query once cached.
+    :param store: the store of the persisted queries
+    :param parse_and_validate_query: function parsing & validating queries
+    :param sha256_hash: the hash of the query
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type store: PersistedQueryStore
+    :type parse_and_validate_query: Callable
+    :type sha256_hash: str
+    :type schema: GraphQLSchema
+    :return: a DocumentNode representing the query
+    :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+    :raises PersistedQueryError: when the hash is unknown (raised rather than
+    returned so that the miss isn't cached)
+    """
+    query = store.get(sha256_hash)
+    if query is None:
+        raise PersistedQueryError(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+    return parse_and_validate_query(query, schema)
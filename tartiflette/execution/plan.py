@@ -0,0 +1,480 @@
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from tartiflette.coercers.arguments import coerce_arguments
+from tartiflette.execution.nodes.variable_definition import (
+    variable_definition_node_to_executable,
+)
+from tartiflette.language.ast import (
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+)
+from tartiflette.types.helpers.get_directive_instances import (
+    compute_directive_nodes,
+)
+from tartiflette.utils.directives import wraps_with_directives
+
+__all__ = ("ExecutionPlan", "build_execution_plan")
+
+
+def _has_variables(value_node: Optional["ValueNode"]) -> bool:
+    """
+    Determines whether or not a value AST node contains a variable.
+    :param value_node: the value AST node to inspect
+    :type value_node: Optional[ValueNode]
+    :return: whether or not the value AST node contains a variable
+    :rtype: bool
+    """
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any(_has_variables(value) for value in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return any(_has_variables(field.value) for field in value_node.fields)
+    return False
+
+
+def _arguments_have_variables(arguments: Optional[List["ArgumentNode"]]):
+    """
+    Determines whether or not a list of argument AST nodes uses variables.
+    :param arguments: the argument AST nodes to inspect
+    :type arguments: Optional[List[ArgumentNode]]
+    :return: whether or not a variable is used
+    :rtype: bool
+    """
+    return any(_has_variables(argument.value) for argument in arguments or [])
+
+
+def _is_directive_free_input_type(
+    graphql_type: "GraphQLInputType", visited: Set[str]
+) -> bool:
+    """
+    Determines whether or not an input type (and all its inner types) is free
+    of any directive, meaning that its literal coercion only depends on the
+    literal value.
+    :param graphql_type: the input type to inspect
+    :param visited: names of input object types already inspected
+    :type graphql_type: GraphQLInputType
+    :type visited: Set[str]
+    :return: whether or not the input type is free of any directive
+    :rtype: bool
+    """
+    inner_type = graphql_type
+    while inner_type.is_wrapping_type:
+        inner_type = inner_type.wrapped_type
+
+    if inner_type.directives:
+        return False
+
+    if inner_type.kind == "ENUM":
+        return not any(value.directives for value in inner_type.values)
+
+    if inner_type.kind == "INPUT_OBJECT":
+        if inner_type.name in visited:
+            return True
+        visited.add(inner_type.name)
+        return all(
+            not input_field.directives
+            and _is_directive_free_input_type(
+                input_field.graphql_type, visited
+            )
+            for input_field in inner_type.input_fields.values()
+        )
+    return True
+
+
+def _copy_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a copy of coerced arguments which can safely be handed to a
+    resolver which may mutate it.
+    :param arguments: the coerced arguments to copy
+    :type arguments: Dict[str, Any]
+    :return: a copy of the coerced arguments
+    :rtype: Dict[str, Any]
+    """
+    return {
+        name: deepcopy(value) if isinstance(value, (dict, list)) else value
+        for name, value in arguments.items()
+    }
+
+
+class ExecutionPlan:
+    """
+    Request-independent execution data of a validated document. A plan is
+    computed once per document, cached alongside it, and lazily filled with
+    every piece of execution work which doesn't depend on request values
+    (collected fields, wrapped directive chains, literal arguments...). It
+    also holds the operations compiled by the JIT executor.
+    """
+
+    __slots__ = (
+        "schema",
+        "operations",
+        "fragments",
+        "_executable_variable_definitions",
+        "_static_selection_sets",
+        "_collected_fields",
+        "_static_field_arguments",
+        "_coerced_arguments",
+        "_field_resolvers",
+        "_operation_costs",
+        "compiled_operations",
+        "operation_executions",
+    )
+
+    def __init__(
+        self,
+        schema: "GraphQLSchema",
+        operations: Dict[Optional[str], "OperationDefinitionNode"],
+        fragments: Dict[str, "FragmentDefinitionNode"],
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param operations: the operation definition AST nodes of the document
+        indexed by name
+        :param fragments: the fragment definition AST nodes of the document
+        indexed by name
+        :type schema: GraphQLSchema
+        :type operations: Dict[Optional[str], OperationDefinitionNode]
+        :type fragments: Dict[str, FragmentDefinitionNode]
+        """
+        self.schema = schema
+        self.operations = operations
+        self.fragments = fragments
+        self._executable_variable_definitions: Dict[
+            int, List["ExecutableVariableDefinition"]
+        ] = {}
+        self._static_selection_sets: Dict[int, bool] = {}
+        self._collected_fields: Dict[
+            Tuple[str, Tuple[int, ...]], Dict[str, List["FieldNode"]]
+        ] = {}
+        self._static_field_arguments: Dict[int, bool] = {}
+        self._coerced_arguments: Dict[
+            Tuple[int, int], Tuple["GraphQLField", Dict[str, Any]]
+        ] = {}
+        self._field_resolvers: Dict[
+            Tuple[int, ...], Tuple["GraphQLField", Callable, Callable]
+        ] = {}
+        self._operation_costs: Dict[int, int] = {}
+        self.compiled_operations: Dict[int, Optional["CompiledOperation"]] = {}
+        self.operation_executions: Dict[int, int] = {}
+
+    def get_operation(
+        self, operation_name: Optional[str]
+    ) -> Optional["OperationDefinitionNode"]:
+        """
+        Returns the operation to execute.
+        :param operation_name: the operation name to execute
+        :type operation_name: Optional[str]
+        :return: the operation definition AST node to execute
+        :rtype: Optional[OperationDefinitionNode]
+        """
+        if operation_name:
+            return self.operations.get(operation_name)
+        if len(self.operations) == 1:
+            return next(iter(self.operations.values()))
+        return None
+
+    def get_operation_cost(
+        self,
+        operation: "OperationDefinitionNode",
+        variable_values: Optional[Dict[str, Any]],
+    ) -> int:
+        """
+        Returns the cost of an operation computed by the static cost analysis
+        of the schema. The cost of an operation which doesn't depend on the
+        variables of the request is only computed once.
+        :param operation: the operation definition AST node
+        :param variable_values: the coerced variables of the request
+        :type operation: OperationDefinitionNode
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the cost of the operation
+        :rtype: int
+        """
+        try:
+            return self._operation_costs[id(operation)]
+        except KeyError:
+            pass
+
+        cost, uses_variables = self.schema.query_cost.compute(
+            self.schema, operation, self.fragments, variable_values
+        )
+        if not uses_variables:
+            self._operation_costs[id(operation)] = cost
+        return cost
+
+    def get_executable_variable_definitions(
+        self, operation: "OperationDefinitionNode"
+    ) -> List["ExecutableVariableDefinition"]:
+        """
+        Returns the executable variable definitions of an operation.
+        :param operation: the operation definition AST node
+        :type operation: OperationDefinitionNode
+        :return: the executable variable definitions of the operation
+        :rtype: List[ExecutableVariableDefinition]
+        """
+        try:
+            return self._executable_variable_definitions[id(operation)]
+        except KeyError:
+            pass
+
+        definitions = [
+            variable_definition_node_to_executable(
+                self.schema, variable_definition_node
+            )
+            for variable_definition_node in operation.variable_definitions
+            or []
+        ]
+        self._executable_variable_definitions[id(operation)] = definitions
+        return definitions
+
+    def is_static_selection_set(
+        self, selection_set: Optional["SelectionSetNode"]
+    ) -> bool:
+        """
+        Determines whether or not the fields collected from a selection set
+        only depend on the runtime type, which is the case when neither the
+        selection set nor its fragments use any directive.
+        :param selection_set: the selection set AST node to inspect
+        :type selection_set: Optional[SelectionSetNode]
+        :return: whether or not the selection set is static
+        :rtype: bool
+        """
+        if selection_set is None:
+            return True
+
+        try:
+            return self._static_selection_sets[id(selection_set)]
+        except KeyError:
+            pass
+
+        # Fragment cycles are rejected at validation time, the placeholder
+        # only protects against a document which wasn't validated.
+        self._static_selection_sets[id(selection_set)] = False
+
+        is_static = True
+        for selection in selection_set.selections:
+            if selection.directives:
+                is_static = False
+            elif isinstance(selection, InlineFragmentNode):
+                is_static = self.is_static_selection_set(
+                    selection.selection_set
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                is_static = fragment is not None and (
+                    self.is_static_selection_set(fragment.selection_set)
+                )
+            if not is_static:
+                break
+
+        self._static_selection_sets[id(selection_set)] = is_static
+        return is_static
+
+    def get_collected_fields(
+        self, runtime_type: "GraphQLObjectType", nodes: List["Node"]
+    ) -> Optional[Dict[str, List["FieldNode"]]]:
+        """
+        Returns the fields previously collected for the runtime type from the
+        selection sets of the filled in nodes.
+        :param runtime_type: current runtime type of the selection sets
+        :param nodes: the nodes owning the collected selection sets
+        :type runtime_type: GraphQLObjectType
+        :type nodes: List[Node]
+        :return: the cached collected fields if any
+        :rtype: Optional[Dict[str, List[FieldNode]]]
+        """
+        return self._collected_fields.get(
+            (runtime_type.name, tuple(id(node) for node in nodes))
+        )
+
+    def set_collected_fields(
+        self,
+        runtime_type: "GraphQLObjectType",
+        nodes: List["Node"],
+        fields: Dict[str, List["FieldNode"]],
+    ) -> None:
+        """
+        Caches the fields collected for the runtime type from the selection
+        sets of the filled in nodes when they don't depend on request values.
+        :param runtime_type: current runtime type of the selection sets
+        :param nodes: the nodes owning the collected selection sets
+        :param fields: the collected fields
+        :type runtime_type: GraphQLObjectType
+        :type nodes: List[Node]
+        :type fields: Dict[str, List[FieldNode]]
+        """
+        if all(
+            self.is_static_selection_set(node.selection_set) for node in nodes
+        ):
+            self._collected_fields[
+                (runtime_type.name, tuple(id(node) for node in nodes))
+            ] = fields
+
+    def get_field_resolver(
+        self,
+        field_definition: "GraphQLField",
+        field_nodes: List["FieldNode"],
+        resolver: Callable,
+        variable_values: Optional[Dict[str, Any]],
+    ) -> Callable:
+        """
+        Returns the resolver wrapped with the `on_field_execution` directives
+        used on the field nodes. The wrapped resolver is cached when the
+        directive arguments doesn't use any variable.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param field_nodes: AST nodes related to the resolved field
+        :param resolver: callable to use to resolve the field
+        :param variable_values: the variables provided in the GraphQL request
+        :type field_definition: GraphQLField
+        :type field_nodes: List[FieldNode]
+        :type resolver: Callable
+        :type variable_values: Optional[Dict[str, Any]]
+        :return: the wrapped resolver
+        :rtype: Callable
+        """
+        key = (id(field_definition), *(id(node) for node in field_nodes))
+        cached = self._field_resolvers.get(key)
+        # The schema could have been re-baked with other resolvers
+        if (
+            cached is not None
+            and cached[0] is field_definition
+            and cached[1] is resolver
+        ):
+            return cached[2]
+
+        wrapped_resolver = resolver
+
+        directive_nodes = [
+            directive_node
+            for field_node in field_nodes
+            for directive_node in field_node.directives or []
+        ]
+
+        computed_directives = compute_directive_nodes(
+            self.schema, directive_nodes, variable_values
+        )
+
+        if computed_directives:
+            wrapped_resolver = wraps_with_directives(
+                directives_definition=computed_directives,
+                directive_hook="on_field_execution",
+                func=resolver,
+                is_resolver=True,
+                with_default=True,
+            )
+
+        if not any(
+            _arguments_have_variables(directive_node.arguments)
+            for directive_node in directive_nodes
+        ):
+            self._field_resolvers[key] = (
+                field_definition,
+                resolver,
+                wrapped_resolver,
+            )
+        return wrapped_resolver
+
+    def _has_static_arguments(
+        self, field_definition: "GraphQLField", field_node: "FieldNode"
+    ) -> bool:
+        """
+        Determines whether or not the coerced arguments of a field node only
+        depend on its literal values.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param field_node: AST node related to the resolved field
+        :type field_definition: GraphQLField
+        :type field_node: FieldNode
+        :return: whether or not the arguments can be coerced once
+        :rtype: bool
+        """
+        if _arguments_have_variables(field_node.arguments):
+            return False
+
+        try:
+            return self._static_field_arguments[id(field_definition)]
+        except KeyError:
+            pass
+
+        visited: Set[str] = set()
+        is_static = all(
+            not argument_definition.directives
+            and _is_directive_free_input_type(
+                argument_definition.graphql_type, visited
+            )
+            for argument_definition in field_definition.arguments.values()
+        )
+        self._static_field_arguments[id(field_definition)] = is_static
+        return is_static
+
+    async def coerce_arguments(
+        self,
+        field_definition: "GraphQLField",
+        field_node: "FieldNode",
+        variable_values: Dict[str, Any],
+        ctx: Optional[Any],
+    ) -> Dict[str, Any]:
+        """
+        Returns the computed values of the field arguments. Arguments only
+        made of literal values are coerced once and then copied.
+        :param field_definition: GraphQLField instance of the resolved field
+        :param field_node: AST node related to the resolved field
+        :param variable_values: the variables provided in the GraphQL request
+        :param ctx: context passed to the query execution
+        :type field_definition: GraphQLField
+        :type field_node: FieldNode
+        :type variable_values: Dict[str, Any]
+        :type ctx: Optional[Any]
+        :return: the computed values of the arguments
+        :rtype: Dict[str, Any]
+        """
+        if not field_definition.arguments:
+            return {}
+
+        key = (id(field_definition), id(field_node))
+        cached = self._coerced_arguments.get(key)
+        if cached is not None and cached[0] is field_definition:
+            return _copy_arguments(cached[1])
+
+        arguments = await coerce_arguments(
+            field_definition.arguments,
+            field_node,
+            variable_values,
+            ctx,
+            coercer=field_definition.arguments_coercer,
+        )
+
+        if self._has_static_arguments(field_definition, field_node):
+            self._coerced_arguments[key] = (
+                field_definition,
+                _copy_arguments(arguments),
+            )
+        return arguments
+
+
+def build_execution_plan(
+    document: "DocumentNode", schema: "GraphQLSchema"
+) -> "ExecutionPlan":
+    """
+    Builds the execution plan of a validated document.
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type document: DocumentNode
+    :type schema: GraphQLSchema
+    :return: the execution plan of the document
+    :rtype: ExecutionPlan
+    """
+    operations: Dict[Optional[str], "OperationDefinitionNode"] = {}
+    fragments: Dict[str, "FragmentDefinitionNode"] = {}
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            operations[
+                definition.name.value if definition.name else None
+            ] = definition
+        else:
+            fragments[definition.name.value] = definition
+    return ExecutionPlan(schema, operations, fragments)
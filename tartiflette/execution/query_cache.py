@@ -0,0 +1,518 @@
+import asyncio
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from tartiflette.language.normalize import query_signature
+
+__all__ = ("QueryCache", "QueryCacheInfo", "CachedQueryFunction")
+
+
+class QueryCacheInfo(NamedTuple):
+    """
+    Statistics of a QueryCache instance.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+    max_weight: Optional[int]
+    currweight: int
+
+
+def _default_weigher(query: Hashable, _result: Any) -> int:
+    """
+    Computes the approximate memory weight of a cached query, the size of the
+    parsed document being roughly proportional to the length of the query.
+    :param query: the cached query
+    :param _result: the cached result of the parsing & validation
+    :type query: Hashable
+    :type _result: Any
+    :return: the approximate memory weight of the query
+    :rtype: int
+    """
+    try:
+        return len(query)
+    except TypeError:
+        return 1
+
+
+def _is_error_result(result: Any) -> bool:
+    """
+    Determines whether or not a result is the errors of a query which
+    couldn't be parsed or validated.
+    :param result: the result of the parsing & validation
+    :type result: Any
+    :return: whether or not the result holds errors instead of a document
+    :rtype: bool
+    """
+    return isinstance(result, tuple) and result[0] is None
+
+
+class _Entry:
+    """
+    Cached result along with the query from which it has been computed, its
+    weight and its expiration time.
+    """
+
+    __slots__ = ("query", "result", "weight", "expires_at")
+
+    def __init__(
+        self,
+        query: Hashable,
+        result: Any,
+        weight: int,
+        expires_at: Optional[float],
+    ) -> None:
+        """
+        :param query: the query from which the result has been computed
+        :param result: the cached result
+        :param weight: the approximate memory weight of the entry
+        :param expires_at: time at which the entry expires
+        :type query: Hashable
+        :type result: Any
+        :type weight: int
+        :type expires_at: Optional[float]
+        """
+        self.query = query
+        self.result = result
+        self.weight = weight
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """
+    Thread-safe & asyncio aware LRU cache of parsed & validated queries
+    which can be used as a `query_cache_decorator`. Concurrent misses on the
+    same query wait for a single in-flight parsing instead of each parsing
+    the query on their own.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 512,
+        max_weight: Optional[int] = None,
+        ttl: Optional[float] = None,
+        weigher: Optional[Callable[[Hashable, Any], int]] = None,
+        normalize: bool = False,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param maxsize: maximum number of cached queries (unbounded if None)
+        :param max_weight: maximum total weight of the cached queries
+        (unbounded if None)
+        :param ttl: number of seconds after which a cached query expires
+        (never if None)
+        :param weigher: callable computing the approximate memory weight of a
+        cached query from the query and its result (defaults to the length of
+        the query)
+        :param normalize: whether or not queries which only differ by their
+        formatting should share the same cache entry
+        :param timer: callable returning the current time in seconds
+        :type maxsize: Optional[int]
+        :type max_weight: Optional[int]
+        :type ttl: Optional[float]
+        :type weigher: Optional[Callable[[Hashable, Any], int]]
+        :type normalize: bool
+        :type timer: Callable[[], float]
+        """
+        # pylint: disable=too-many-arguments
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.ttl = ttl
+        self._weigher = weigher or _default_weigher
+        self.normalize = normalize
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, func: Callable) -> "CachedQueryFunction":
+        """
+        Decorates the function parsing & validating queries.
+        :param func: function parsing & validating queries
+        :type func: Callable
+        :return: the cached function
+        :rtype: CachedQueryFunction
+        """
+        return CachedQueryFunction(self, func)
+
+    def cache_info(self) -> QueryCacheInfo:
+        """
+        Returns the statistics of the cache.
+        :return: the statistics of the cache
+        :rtype: QueryCacheInfo
+        """
+        with self._lock:
+            return QueryCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                max_weight=self.max_weight,
+                currweight=self._weight,
+            )
+
+    def cache_clear(self) -> None:
+        """
+        Clears the cache and its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def queries(self, func: Optional[Callable] = None) -> List[Hashable]:
+        """
+        Returns the queries which have been successfully parsed & validated
+        and are still cached, from the least to the most recently used, e.g.
+        to warm up the cache of another engine with the current hot set.
+        :param func: only returns the queries cached for this function
+        :type func: Optional[Callable]
+        :return: the cached queries
+        :rtype: List[Hashable]
+        """
+        with self._lock:
+            return [
+                entry.query
+                for (entry_func, _, _), entry in self._entries.items()
+                if (func is None or entry_func is func)
+                and not _is_error_result(entry.result)
+            ]
+
+    def _evict(self, key: Hashable) -> None:
+        """
+        Removes an entry from the cache. Must be called with the lock held.
+        :param key: key of the entry to remove
+        :type key: Hashable
+        """
+        self._weight -= self._entries.pop(key).weight
+        self._evictions += 1
+
+    def _key(self, func: Callable, query: Hashable, schema: Any) -> Hashable:
+        """
+        Computes the cache key of a query.
+        :param func: function parsing & validating queries
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type func: Callable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :return: the cache key of the query
+        :rtype: Hashable
+        """
+        if self.normalize:
+            try:
+                return func, query_signature(query), schema
+            except (TypeError, UnicodeDecodeError):
+                pass
+        return func, query, schema
+
+    def _lookup(
+        self, key: Hashable
+    ) -> Tuple[Optional[_Entry], Optional[Future]]:
+        """
+        Looks up a key in the cache. On a miss, returns the future of the
+        in-flight computation of the key, or None if the caller is in charge
+        of computing it.
+        :param key: key to look up
+        :type key: Hashable
+        :return: the cached entry and the future of the in-flight computation
+        :rtype: Tuple[Optional[_Entry], Optional[Future]]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at = entry.expires_at
+                if expires_at is None or expires_at > self._timer():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry, None
+                self._evict(key)
+
+            self._misses += 1
+            future = self._in_flight.get(key)
+            if future is None:
+                self._in_flight[key] = Future()
+            return None, future
+
+    def _store(self, key: Hashable, query: Hashable, result: Any) -> _Entry:
+        """
+        Stores a result in the cache and evicts the least recently used
+        entries exceeding the capacity of the cache.
+        :param key: key of the result
+        :param query: the query from which the result has been computed
+        :param result: result to store
+        :type key: Hashable
+        :type query: Hashable
+        :type result: Any
+        :return: the entry of the result
+        :rtype: _Entry
+        """
+        entry = _Entry(
+            query,
+            result,
+            self._weigher(query, result),
+            self._timer() + self.ttl if self.ttl is not None else None,
+        )
+        if self.max_weight is not None and entry.weight > self.max_weight:
+            return entry
+
+        with self._lock:
+            if key in self._entries:
+                self._weight -= self._entries.pop(key).weight
+            self._entries[key] = entry
+            self._weight += entry.weight
+            while (
+                self.maxsize is not None and len(self._entries) > self.maxsize
+            ) or (
+                self.max_weight is not None and self._weight > self.max_weight
+            ):
+                self._evict(next(iter(self._entries)))
+        return entry
+
+    def _compute(
+        self, func: Callable, key: Hashable, query: Hashable, schema: Any
+    ) -> None:
+        """
+        Computes the result of an in-flight key, stores it & resolves the
+        future on which concurrent callers are waiting with its entry.
+        :param func: function parsing & validating queries
+        :param key: key of the result
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type func: Callable
+        :type key: Hashable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        """
+        future = self._in_flight[key]
+        try:
+            entry = self._store(key, query, func(query, schema))
+        except Exception as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+        else:
+            future.set_result(entry)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _result(
+        self, func: Callable, query: Hashable, schema: Any, entry: _Entry
+    ) -> Any:
+        """
+        Returns the result of a query from the entry computed for its cache
+        key. When queries are normalized, a query which couldn't be parsed or
+        validated is computed again if it isn't formatted as the query of
+        the entry, so that the locations of its errors refer to its own
+        formatting.
+        :param func: function parsing & validating queries
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param entry: the entry computed for the cache key of the query
+        :type func: Callable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :type entry: _Entry
+        :return: the result of the function
+        :rtype: Any
+        """
+        result = entry.result
+        if (
+            self.normalize
+            and _is_error_result(result)
+            and entry.query != query
+        ):
+            return func(query, schema)
+        return result
+
+    def set(
+        self, func: Callable, query: Hashable, schema: Any, result: Any
+    ) -> None:
+        """
+        Caches a result computed elsewhere for a query, e.g. a document
+        loaded from its serialised form.
+        :param func: function parsing & validating queries
+        :param query: the query from which the result has been computed
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param result: result of the function for the query
+        :type func: Callable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :type result: Any
+        """
+        self._store(self._key(func, query, schema), query, result)
+
+    def get(self, func: Callable, query: Hashable, schema: Any) -> Any:
+        """
+        Returns the cached result of a query, computing it if necessary. When
+        the query is already being computed by another thread, waits for
+        its result.
+        :param func: function parsing & validating queries
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type func: Callable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :return: the result of the function
+        :rtype: Any
+        """
+        key = self._key(func, query, schema)
+        entry, future = self._lookup(key)
+        if entry is None:
+            if future is None:
+                future = self._in_flight[key]
+                self._compute(func, key, query, schema)
+            entry = future.result()
+        return self._result(func, query, schema, entry)
+
+    async def get_async(
+        self,
+        func: Callable,
+        query: Hashable,
+        schema: Any,
+        runner: Optional[Callable] = None,
+    ) -> Any:
+        """
+        Returns the cached result of a query, computing it if necessary. When
+        the query is already being computed, waits for its result without
+        blocking the event loop.
+        :param func: function parsing & validating queries
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param runner: callable used to schedule the computation (e.g.
+        `partial(loop.run_in_executor, executor)`) instead of computing it
+        synchronously
+        :type func: Callable
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :type runner: Optional[Callable]
+        :return: the result of the function
+        :rtype: Any
+        """
+        # pylint: disable=too-many-arguments
+        key = self._key(func, query, schema)
+        entry, future = self._lookup(key)
+        if entry is None:
+            if future is None:
+                future = self._in_flight[key]
+                if runner is not None:
+                    runner(self._compute, func, key, query, schema)
+                else:
+                    self._compute(func, key, query, schema)
+
+            # the computation isn't bound to any caller so that cancelling
+            # one of them doesn't cancel the computation awaited by the others
+            entry = (
+                future.result()
+                if future.done()
+                else await asyncio.shield(asyncio.wrap_future(future))
+            )
+        return self._result(func, query, schema, entry)
+
+
+class CachedQueryFunction:
+    """
+    Function parsing & validating queries decorated by a QueryCache.
+    """
+
+    __slots__ = ("cache", "func")
+
+    def __init__(self, cache: QueryCache, func: Callable) -> None:
+        """
+        :param cache: the cache of the function
+        :param func: function parsing & validating queries
+        :type cache: QueryCache
+        :type func: Callable
+        """
+        self.cache = cache
+        self.func = func
+
+    def __call__(self, query: Hashable, schema: Any) -> Any:
+        """
+        Returns the cached result of a query, computing it if necessary.
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :return: the result of the function
+        :rtype: Any
+        """
+        return self.cache.get(self.func, query, schema)
+
+    async def call_async(
+        self, query: Hashable, schema: Any, runner: Optional[Callable] = None
+    ) -> Any:
+        """
+        Returns the cached result of a query, computing it if necessary,
+        concurrent misses on the same query waiting for a single computation.
+        :param query: the query to parse & validate
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param runner: callable used to schedule the computation instead of
+        computing it synchronously
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :type runner: Optional[Callable]
+        :return: the result of the function
+        :rtype: Any
+        """
+        return await self.cache.get_async(self.func, query, schema, runner)
+
+    def cache_info(self) -> QueryCacheInfo:
+        """
+        Returns the statistics of the cache.
+        :return: the statistics of the cache
+        :rtype: QueryCacheInfo
+        """
+        return self.cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """
+        Clears the cache and its statistics.
+        """
+        self.cache.cache_clear()
+
+    def cache_set(self, query: Hashable, schema: Any, result: Any) -> None:
+        """
+        Caches a result computed elsewhere for a query.
+        :param query: the query from which the result has been computed
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param result: result of the function for the query
+        :type query: Hashable
+        :type schema: GraphQLSchema
+        :type result: Any
+        """
+        self.cache.set(self.func, query, schema, result)
+
+    def queries(self) -> List[Hashable]:
+        """
+        Returns the queries which have been successfully parsed & validated
+        by the function and are still cached, from the least to the most
+        recently used.
+        :return: the cached queries
+        :rtype: List[Hashable]
+        """
+        return self.cache.queries(self.func)
@@ -1,14 +1,24 @@
 import asyncio
+import json
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
-__all__ = ("build_response",)
+__all__ = ("build_response", "encode_response", "iterencode_response")
+
+# Encoder used when no custom JSON dumper is provided
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Number of list items encoded at once by the streaming encoder
+_STREAMING_SLICE_SIZE = 64
+
+_DEFAULT_CHUNK_SIZE = 65536
 
 
 async def build_response(
     error_coercer: Callable,
     data: Optional[Dict[str, Any]] = None,
     errors: Optional[List["TartifletteError"]] = None,
+    extensions: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Returns and formats the data and errors into a proper GraphQL response.
@@ -16,9 +26,11 @@ async def build_response(
     Exception/error into an error dictionary
     :param data: the data from fields execution
     :param errors: the errors encountered during the request execution
+    :param extensions: the extensions of the response
     :type error_coercer: Callable
     :type data: Optional[Dict[str, Any]]
     :type errors: Optional[List[TartifletteError]]
+    :type extensions: Optional[Dict[str, Any]]
     :return: a GraphQL response
     :rtype: Dict[str, Any]
     """
@@ -27,6 +39,103 @@ async def build_response(
         if errors
         else None
     )
-    if coerced_errors:
-        return {"data": data, "errors": coerced_errors}
-    return {"data": data}
+    response = (
+        {"data": data, "errors": coerced_errors}
+        if coerced_errors
+        else {"data": data}
+    )
+    if extensions:
+        response["extensions"] = extensions
+    return response
+
+
+def encode_response(
+    response: Dict[str, Any],
+    json_dumper: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]],
+) -> bytes:
+    """
+    Encodes a GraphQL response into UTF-8 encoded JSON bytes.
+    :param response: the GraphQL response to encode
+    :param json_dumper: callable to use to encode the response instead of the
+    built-in JSON encoder
+    :type response: Dict[str, Any]
+    :type json_dumper: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]]
+    :return: the encoded response
+    :rtype: bytes
+    """
+    encoded = (
+        json_dumper(response)
+        if json_dumper is not None
+        else _JSON_ENCODER.encode(response)
+    )
+    return encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+
+
+def _iterencode(value: Any) -> Iterator[str]:
+    """
+    Encodes a value into JSON piece by piece. Objects are walked key by key
+    while lists are encoded slice by slice, each slice of items being encoded
+    at once by the C implementation of the encoder.
+    :param value: the value to encode
+    :type value: Any
+    :return: an iterator over the JSON pieces
+    :rtype: Iterator[str]
+    """
+    if value and isinstance(value, dict):
+        separator = "{"
+        for key, item in value.items():
+            yield separator + _JSON_ENCODER.encode(key) + ":"
+            yield from _iterencode(item)
+            separator = ","
+        yield "}"
+    elif value and isinstance(value, list):
+        separator = "["
+        for start in range(0, len(value), _STREAMING_SLICE_SIZE):
+            yield separator + _JSON_ENCODER.encode(
+                value[start : start + _STREAMING_SLICE_SIZE]
+            )[1:-1]
+            separator = ","
+        yield "]"
+    else:
+        yield _JSON_ENCODER.encode(value)
+
+
+def iterencode_response(
+    response: Dict[str, Any],
+    json_dumper: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]],
+    chunk_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Encodes a GraphQL response into chunks of UTF-8 encoded JSON bytes, so
+    that the whole encoded response doesn't have to be held in memory when
+    it's written chunk by chunk.
+    :param response: the GraphQL response to encode
+    :param json_dumper: callable to use to encode the response instead of the
+    built-in JSON encoder
+    :param chunk_size: approximate size of the chunks in bytes
+    :type response: Dict[str, Any]
+    :type json_dumper: Optional[Callable[[Dict[str, Any]], Union[str, bytes]]]
+    :type chunk_size: Optional[int]
+    :return: an iterator over the encoded chunks
+    :rtype: Iterator[bytes]
+    """
+    chunk_size = chunk_size or _DEFAULT_CHUNK_SIZE
+    if json_dumper is not None:
+        # Custom dumpers encode the whole response at once
+        encoded = encode_response(response, json_dumper)
+        for start in range(0, len(encoded), chunk_size):
+            yield encoded[start : start + chunk_size]
+        return
+
+    pieces = []
+    size = 0
+    for piece in _iterencode(response):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(pieces).encode("utf-8")
+            pieces = []
+            size = 0
+
+    if pieces:
+        yield "".join(pieces).encode("utf-8")
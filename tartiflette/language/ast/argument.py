@@ -10,7 +10,7 @@ class ArgumentNode(Node):
     AST node representing a GraphQL argument.
     """
 
-    __slots__ = ("name", "value", "location")
+    __slots__ = ("name", "value")
 
     def __init__(
         self,
@@ -28,7 +28,7 @@ class ArgumentNode(Node):
         """
         self.name = name
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
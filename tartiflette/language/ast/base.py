@@ -1,3 +1,7 @@
+from typing import Any, List, Optional, Tuple, Union
+
+from tartiflette.language.ast.location import unpack_location
+
 __all__ = (
     "Node",
     "DefinitionNode",
@@ -9,11 +13,66 @@ __all__ = (
     "SelectionNode",
     "ValueNode",
     "TypeNode",
+    "children_equal",
 )
 
 
+def children_equal(
+    children: Optional[Union[List[Any], Tuple[Any, ...]]],
+    other_children: Optional[Union[List[Any], Tuple[Any, ...]]],
+) -> bool:
+    """
+    Returns True if both lists of child nodes are identical, the empty tuple
+    shared by the nodes of compact documents being identical to an empty
+    list.
+    :param children: list of child nodes to compare
+    :param other_children: list of child nodes to compare to `children`
+    :type children: Optional[Union[List[Any], Tuple[Any, ...]]]
+    :type other_children: Optional[Union[List[Any], Tuple[Any, ...]]]
+    :return: whether or not both lists of child nodes are identical
+    :rtype: bool
+    """
+    if children == other_children:
+        return True
+    return (
+        children is not None
+        and other_children is not None
+        and not children
+        and not other_children
+    )
+
+
 class Node:
-    __slots__ = ()
+    """
+    Base class of the AST nodes. The location of a node is stored into the
+    `_location` slot either as a Location instance or packed into an integer
+    (see `pack_location`), in which case the Location instance is only
+    created when accessed (e.g. to report an error). The nodes of the SDL
+    store their Location instance into a `location` slot of their own.
+    """
+
+    __slots__ = ("_location",)
+
+    @property
+    def location(self) -> Optional["Location"]:
+        """
+        Returns the location of the node in the query/SDL.
+        :return: the location of the node
+        :rtype: Optional[Location]
+        """
+        location = self._location
+        if location.__class__ is int:
+            return unpack_location(location)
+        return location
+
+    @location.setter
+    def location(self, location: Optional[Union["Location", int]]) -> None:
+        """
+        Sets the location of the node in the query/SDL.
+        :param location: the location or the packed location of the node
+        :type location: Optional[Union[Location, int]]
+        """
+        self._location = location
 
 
 class DefinitionNode(Node):
@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import Node
+from tartiflette.language.ast.base import Node, children_equal
 
 __all__ = ("DirectiveNode",)
 
@@ -10,7 +10,7 @@ class DirectiveNode(Node):
     AST node representing a GraphQL directive.
     """
 
-    __slots__ = ("name", "arguments", "location")
+    __slots__ = ("name", "arguments")
 
     def __init__(
         self,
@@ -28,7 +28,7 @@ class DirectiveNode(Node):
         """
         self.name = name
         self.arguments = arguments
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -41,7 +41,7 @@ class DirectiveNode(Node):
         return self is other or (
             isinstance(other, DirectiveNode)
             and self.name == other.name
-            and self.arguments == other.arguments
+            and children_equal(self.arguments, other.arguments)
             and self.location == other.location
         )
 
@@ -10,7 +10,7 @@ class DocumentNode(Node):
     AST node representing a GraphQL document.
     """
 
-    __slots__ = ("definitions", "location", "_hash_id", "validators")
+    __slots__ = ("definitions", "_hash_id", "validators", "plan")
 
     def __init__(
         self,
@@ -18,21 +18,25 @@ class DocumentNode(Node):
         validators: Optional["Validators"] = None,
         location: Optional["Location"] = None,
         hash_id: Optional[int] = None,
+        plan: Optional["ExecutionPlan"] = None,
     ) -> None:
         """
         :param definitions: definitions of the document
         :param location: location of the document in the query/SDL
         :param hash_id: hash of the DocumentNode
         :param validators: a validators object that will be used to validate the document
+        :param plan: the execution plan computed once the document is validated
         :type definitions: List[DefinitionNode]
         :type location: Optional[Location]
         :type hash_id: Optional[int]
         :type validators: Optional["Validators"]
+        :type plan: Optional["ExecutionPlan"]
         """
         self.definitions = definitions
-        self.location = location
+        self._location = location
         self._hash_id = hash_id
         self.validators = validators
+        self.plan = plan
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import SelectionNode
+from tartiflette.language.ast.base import SelectionNode, children_equal
 
 __all__ = ("FieldNode",)
 
@@ -16,7 +16,6 @@ class FieldNode(SelectionNode):
         "arguments",
         "directives",
         "selection_set",
-        "location",
     )
 
     def __init__(
@@ -47,7 +46,7 @@ class FieldNode(SelectionNode):
         self.arguments = arguments
         self.directives = directives
         self.selection_set = selection_set
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -61,8 +60,8 @@ class FieldNode(SelectionNode):
             isinstance(other, FieldNode)
             and self.alias == other.alias
             and self.name == other.name
-            and self.arguments == other.arguments
-            and self.directives == other.directives
+            and children_equal(self.arguments, other.arguments)
+            and children_equal(self.directives, other.directives)
             and self.selection_set == other.selection_set
             and self.location == other.location
         )
@@ -1,6 +1,9 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import ExecutableDefinitionNode
+from tartiflette.language.ast.base import (
+    ExecutableDefinitionNode,
+    children_equal,
+)
 
 __all__ = ("FragmentDefinitionNode",)
 
@@ -15,7 +18,6 @@ class FragmentDefinitionNode(ExecutableDefinitionNode):
         "type_condition",
         "directives",
         "selection_set",
-        "location",
     )
 
     def __init__(
@@ -42,7 +44,7 @@ class FragmentDefinitionNode(ExecutableDefinitionNode):
         self.type_condition = type_condition
         self.selection_set = selection_set
         self.directives = directives
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -56,7 +58,7 @@ class FragmentDefinitionNode(ExecutableDefinitionNode):
             isinstance(other, FragmentDefinitionNode)
             and self.name == other.name
             and self.type_condition == other.type_condition
-            and self.directives == other.directives
+            and children_equal(self.directives, other.directives)
             and self.selection_set == other.selection_set
             and self.location == other.location
         )
@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import SelectionNode
+from tartiflette.language.ast.base import SelectionNode, children_equal
 
 __all__ = ("FragmentSpreadNode",)
 
@@ -10,7 +10,7 @@ class FragmentSpreadNode(SelectionNode):
     AST node representing a GraphQL fragment spread.
     """
 
-    __slots__ = ("name", "directives", "location")
+    __slots__ = ("name", "directives")
 
     def __init__(
         self,
@@ -28,7 +28,7 @@ class FragmentSpreadNode(SelectionNode):
         """
         self.name = name
         self.directives = directives
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -41,7 +41,7 @@ class FragmentSpreadNode(SelectionNode):
         return self is other or (
             isinstance(other, FragmentSpreadNode)
             and self.name == other.name
-            and self.directives == other.directives
+            and children_equal(self.directives, other.directives)
             and self.location == other.location
         )
 
@@ -1,6 +1,6 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import SelectionNode
+from tartiflette.language.ast.base import SelectionNode, children_equal
 
 __all__ = ("InlineFragmentNode",)
 
@@ -10,7 +10,7 @@ class InlineFragmentNode(SelectionNode):
     AST node representing a GraphQL inline fragment.
     """
 
-    __slots__ = ("type_condition", "directives", "selection_set", "location")
+    __slots__ = ("type_condition", "directives", "selection_set")
 
     def __init__(
         self,
@@ -32,7 +32,7 @@ class InlineFragmentNode(SelectionNode):
         self.selection_set = selection_set
         self.type_condition = type_condition
         self.directives = directives
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -45,7 +45,7 @@ class InlineFragmentNode(SelectionNode):
         return self is other or (
             isinstance(other, InlineFragmentNode)
             and self.type_condition == other.type_condition
-            and self.directives == other.directives
+            and children_equal(self.directives, other.directives)
             and self.selection_set == other.selection_set
             and self.location == other.location
         )
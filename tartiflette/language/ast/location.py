@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-__all__ = ("Location",)
+__all__ = ("Location", "pack_location", "unpack_location")
 
 
 class Location:
@@ -76,3 +76,40 @@ class Location:
         :rtype: Dict[str, int]
         """
         return {"line": self.line, "column": self.column}
+
+
+def pack_location(
+    line: int, column: int, line_end: int, column_end: int
+) -> int:
+    """
+    Packs the positions of a location into a single integer, which is much
+    lighter than a Location instance and isn't tracked by the garbage
+    collector. Each position has to fit in 32 bits.
+    :param line: start line number of the location
+    :param column: start column number of the location
+    :param line_end: end line number of the location
+    :param column_end: end column number of the location
+    :type line: int
+    :type column: int
+    :type line_end: int
+    :type column_end: int
+    :return: the packed location
+    :rtype: int
+    """
+    return line << 96 | column << 64 | line_end << 32 | column_end
+
+
+def unpack_location(packed_location: int) -> "Location":
+    """
+    Creates a Location instance from a location packed by `pack_location`.
+    :param packed_location: the packed location
+    :type packed_location: int
+    :return: the unpacked location
+    :rtype: Location
+    """
+    return Location(
+        line=packed_location >> 96,
+        column=packed_location >> 64 & 0xFFFFFFFF,
+        line_end=packed_location >> 32 & 0xFFFFFFFF,
+        column_end=packed_location & 0xFFFFFFFF,
+    )
@@ -10,7 +10,7 @@ class NameNode(Node):
     AST node representing a GraphQL name.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: str, location: Optional["Location"] = None
@@ -22,7 +22,7 @@ class NameNode(Node):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -10,7 +10,7 @@ class NamedTypeNode(TypeNode):
     AST node representing a GraphQL named type.
     """
 
-    __slots__ = ("name", "location")
+    __slots__ = ("name",)
 
     def __init__(
         self, name: "NameNode", location: Optional["Location"] = None
@@ -22,7 +22,7 @@ class NamedTypeNode(TypeNode):
         :type location: Optional[Location]
         """
         self.name = name
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -1,6 +1,9 @@
 from typing import Any, List, Optional
 
-from tartiflette.language.ast.base import ExecutableDefinitionNode
+from tartiflette.language.ast.base import (
+    ExecutableDefinitionNode,
+    children_equal,
+)
 
 __all__ = ("OperationDefinitionNode",)
 
@@ -16,7 +19,6 @@ class OperationDefinitionNode(ExecutableDefinitionNode):
         "variable_definitions",
         "directives",
         "selection_set",
-        "location",
     )
 
     def __init__(
@@ -48,7 +50,7 @@ class OperationDefinitionNode(ExecutableDefinitionNode):
         self.name = name
         self.variable_definitions = variable_definitions
         self.directives = directives
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -62,8 +64,10 @@ class OperationDefinitionNode(ExecutableDefinitionNode):
             isinstance(other, OperationDefinitionNode)
             and self.operation_type == other.operation_type
             and self.name == other.name
-            and self.variable_definitions == other.variable_definitions
-            and self.directives == other.directives
+            and children_equal(
+                self.variable_definitions, other.variable_definitions
+            )
+            and children_equal(self.directives, other.directives)
             and self.selection_set == other.selection_set
             and self.location == other.location
         )
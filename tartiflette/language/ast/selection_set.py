@@ -10,7 +10,7 @@ class SelectionSetNode(Node):
     AST node representing a GraphQL selection set.
     """
 
-    __slots__ = ("selections", "location")
+    __slots__ = ("selections",)
 
     def __init__(
         self,
@@ -24,7 +24,7 @@ class SelectionSetNode(Node):
         :type location: Optional[Location]
         """
         self.selections = selections
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -10,7 +10,7 @@ class ListTypeNode(TypeNode):
     AST node representing a GraphQL list type.
     """
 
-    __slots__ = ("type", "location")
+    __slots__ = ("type",)
 
     def __init__(
         self,
@@ -26,7 +26,7 @@ class ListTypeNode(TypeNode):
         :type location: Optional[Location]
         """
         self.type = type
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -67,7 +67,7 @@ class NonNullTypeNode(TypeNode):
     AST node representing a GraphQL non null type.
     """
 
-    __slots__ = ("type", "location")
+    __slots__ = ("type",)
 
     def __init__(
         self,
@@ -83,7 +83,7 @@ class NonNullTypeNode(TypeNode):
         :type location: Optional[Location]
         """
         self.type = type
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -20,7 +20,7 @@ class BooleanValueNode(ValueNode):
     AST node representing a GraphQL boolean value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: bool, location: Optional["Location"] = None
@@ -32,7 +32,7 @@ class BooleanValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -73,7 +73,7 @@ class EnumValueNode(ValueNode):
     AST node representing a GraphQL enum value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: str, location: Optional["Location"] = None
@@ -85,7 +85,7 @@ class EnumValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -126,7 +126,7 @@ class FloatValueNode(ValueNode):
     AST node representing a GraphQL float value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: float, location: Optional["Location"] = None
@@ -138,7 +138,7 @@ class FloatValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -179,7 +179,7 @@ class IntValueNode(ValueNode):
     AST node representing a GraphQL integer value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: int, location: Optional["Location"] = None
@@ -191,7 +191,7 @@ class IntValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -232,7 +232,7 @@ class NullValueNode(ValueNode):
     AST node representing a GraphQL null value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(self, location: Optional["Location"] = None) -> None:
         """
@@ -240,7 +240,7 @@ class NullValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value: None = None
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -278,7 +278,7 @@ class StringValueNode(ValueNode):
     AST node representing a GraphQL string value.
     """
 
-    __slots__ = ("value", "location")
+    __slots__ = ("value",)
 
     def __init__(
         self, value: str, location: Optional["Location"] = None
@@ -290,7 +290,7 @@ class StringValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -331,7 +331,7 @@ class ListValueNode(ValueNode):
     AST node representing a GraphQL list value.
     """
 
-    __slots__ = ("values", "location")
+    __slots__ = ("values",)
 
     def __init__(
         self, values: List["ValueNode"], location: Optional["Location"] = None
@@ -343,7 +343,7 @@ class ListValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.values = values
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -384,7 +384,7 @@ class ObjectFieldNode(Node):
     AST node representing a GraphQL object field.
     """
 
-    __slots__ = ("name", "value", "location")
+    __slots__ = ("name", "value")
 
     def __init__(
         self,
@@ -402,7 +402,7 @@ class ObjectFieldNode(Node):
         """
         self.name = name
         self.value = value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -445,7 +445,7 @@ class ObjectValueNode(ValueNode):
     AST node representing a GraphQL object value.
     """
 
-    __slots__ = ("fields", "location")
+    __slots__ = ("fields",)
 
     def __init__(
         self,
@@ -459,7 +459,7 @@ class ObjectValueNode(ValueNode):
         :type location: Optional[Location]
         """
         self.fields = fields
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -10,7 +10,7 @@ class VariableNode(ValueNode):
     AST node representing a GraphQL variable.
     """
 
-    __slots__ = ("name", "location")
+    __slots__ = ("name",)
 
     def __init__(
         self, name: "NameNode", location: Optional["Location"] = None
@@ -22,7 +22,7 @@ class VariableNode(ValueNode):
         :type location: Optional[Location]
         """
         self.name = name
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
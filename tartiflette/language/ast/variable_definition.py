@@ -10,7 +10,7 @@ class VariableDefinitionNode(Node):
     AST node representing a GraphQL variable definition.
     """
 
-    __slots__ = ("variable", "type", "default_value", "location")
+    __slots__ = ("variable", "type", "default_value")
 
     def __init__(
         self,
@@ -32,7 +32,7 @@ class VariableDefinitionNode(Node):
         self.variable = variable
         self.type = type
         self.default_value = default_value
-        self.location = location
+        self._location = location
 
     def __eq__(self, other: Any) -> bool:
         """
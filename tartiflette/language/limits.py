@@ -0,0 +1,294 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from tartiflette.language.normalize import count_tokens
+from tartiflette.types.exceptions.tartiflette import QueryLimitError
+
+__all__ = ("QueryLimits", "QueryLimitsCounter")
+
+
+class QueryLimits:
+    """
+    Limits enforced on the queries as early as possible, to protect the
+    engine against oversized or abusive queries: the size & the number of
+    tokens of a query are checked before it's parsed, its depth and its
+    number of fields & aliases while its document is built.
+    """
+
+    __slots__ = (
+        "max_bytes",
+        "max_tokens",
+        "max_depth",
+        "max_fields",
+        "max_aliases",
+    )
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_fields: Optional[int] = None,
+        max_aliases: Optional[int] = None,
+    ) -> None:
+        """
+        :param max_bytes: maximum size of a query in UTF-8 encoded bytes
+        :param max_tokens: maximum number of significant tokens of a query
+        :param max_depth: maximum nesting depth of the fields of an
+        operation, once its fragment spreads are expanded
+        :param max_fields: maximum number of fields selected by an operation,
+        once its fragment spreads are expanded
+        :param max_aliases: maximum number of aliased fields selected by an
+        operation, once its fragment spreads are expanded
+        :type max_bytes: Optional[int]
+        :type max_tokens: Optional[int]
+        :type max_depth: Optional[int]
+        :type max_fields: Optional[int]
+        :type max_aliases: Optional[int]
+        """
+        # pylint: disable=too-many-arguments
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.max_fields = max_fields
+        self.max_aliases = max_aliases
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a QueryLimits instance.
+        :return: the representation of a QueryLimits instance
+        :rtype: str
+        """
+        return (
+            "QueryLimits(max_bytes=%r, max_tokens=%r, max_depth=%r, "
+            "max_fields=%r, max_aliases=%r)"
+            % (
+                self.max_bytes,
+                self.max_tokens,
+                self.max_depth,
+                self.max_fields,
+                self.max_aliases,
+            )
+        )
+
+    def check_query(self, query: Union[str, bytes]) -> None:
+        """
+        Checks the size & the number of tokens of a query before parsing it.
+        :param query: the GraphQL request / query as string or UTF8-encoded
+        bytes
+        :type query: Union[str, bytes]
+        :raises QueryLimitError: when the query exceeds a limit
+        """
+        max_bytes = self.max_bytes
+        if max_bytes is not None:
+            # the size of a string is only computed when it can't be
+            # deduced from its length (an UTF-8 character taking up to 4
+            # bytes)
+            size = len(query)
+            if isinstance(query, str) and size <= max_bytes < size * 4:
+                size = len(query.encode("UTF-8"))
+            if size > max_bytes:
+                raise QueryLimitError(
+                    f"Query exceeds the maximum size of < {max_bytes} > "
+                    "bytes."
+                )
+
+        max_tokens = self.max_tokens
+        if (
+            max_tokens is not None
+            and count_tokens(query, maximum=max_tokens) > max_tokens
+        ):
+            raise QueryLimitError(
+                f"Query exceeds the maximum number of < {max_tokens} > "
+                "tokens."
+            )
+
+    def counter(self) -> "QueryLimitsCounter":
+        """
+        Returns a counter enforcing the limits on a document being built.
+        :return: a counter enforcing the limits on a document being built
+        :rtype: QueryLimitsCounter
+        """
+        return QueryLimitsCounter(self)
+
+
+class _Scope:
+    """
+    Fields, aliases, depth & fragment spreads of an operation or a fragment.
+    """
+
+    __slots__ = ("fields", "aliases", "depth", "spreads")
+
+    def __init__(self) -> None:
+        self.fields: int = 0
+        self.aliases: int = 0
+        self.depth: int = 0
+        self.spreads: List[Tuple[str, int]] = []
+
+
+class QueryLimitsCounter:
+    """
+    Counts the fields & aliases of a document and measures its depth while
+    the document is built, raising as soon as a limit is exceeded so that
+    the rest of the document is neither built nor validated.
+    """
+
+    __slots__ = (
+        "limits",
+        "_fields",
+        "_aliases",
+        "_depth",
+        "_scope",
+        "_scopes",
+    )
+
+    def __init__(self, limits: "QueryLimits") -> None:
+        """
+        :param limits: limits to enforce
+        :type limits: QueryLimits
+        """
+        self.limits = limits
+        self._fields = 0
+        self._aliases = 0
+        self._depth = 0
+        self._scope: Optional["_Scope"] = None
+        self._scopes: Dict[Tuple[bool, Optional[str]], "_Scope"] = {}
+
+    def enter_definition(self, name: Optional[str], is_fragment: bool) -> None:
+        """
+        Starts counting the fields of an operation or a fragment definition.
+        :param name: name of the operation or the fragment
+        :param is_fragment: whether or not the definition is a fragment
+        :type name: Optional[str]
+        :type is_fragment: bool
+        """
+        self._depth = 0
+        self._scope = self._scopes.setdefault((is_fragment, name), _Scope())
+
+    def enter_field(self, has_alias: bool) -> None:
+        """
+        Counts a field whose selection set is about to be visited.
+        :param has_alias: whether or not the field is aliased
+        :type has_alias: bool
+        :raises QueryLimitError: when the document exceeds a limit
+        """
+        scope = self._scope
+
+        self._depth += 1
+        if self._depth > scope.depth:
+            scope.depth = self._depth
+            self._check_depth(self._depth)
+
+        self._fields += 1
+        scope.fields += 1
+        self._check_fields(self._fields)
+
+        if has_alias:
+            self._aliases += 1
+            scope.aliases += 1
+            self._check_aliases(self._aliases)
+
+    def exit_field(self) -> None:
+        """
+        Marks the end of the visit of a field.
+        """
+        self._depth -= 1
+
+    def add_fragment_spread(self, name: str) -> None:
+        """
+        Records a fragment spread, expanded once the document is built.
+        :param name: name of the spread fragment
+        :type name: str
+        """
+        self._scope.spreads.append((name, self._depth))
+
+    def check_document(self) -> None:
+        """
+        Checks the limits on each operation of the document once its
+        fragment spreads are expanded.
+        :raises QueryLimitError: when an operation exceeds a limit
+        """
+        scopes = self._scopes
+        expanded: Dict[
+            Tuple[bool, Optional[str]], Optional[Tuple[int, int, int]]
+        ] = {}
+
+        # fragments are expanded depth first without recursion, the spreads
+        # of unknown fragments & cycles (reported by the validators) being
+        # ignored
+        for root_key in scopes:
+            stack = [(root_key, False)]
+            while stack:
+                key, children_expanded = stack.pop()
+                scope = scopes[key]
+                if not children_expanded:
+                    if key in expanded:
+                        continue
+                    expanded[key] = None
+                    stack.append((key, True))
+                    stack.extend(
+                        ((True, name), False)
+                        for name, _ in scope.spreads
+                        if (True, name) in scopes
+                        and (True, name) not in expanded
+                    )
+                    continue
+
+                fields, aliases, depth = (
+                    scope.fields,
+                    scope.aliases,
+                    scope.depth,
+                )
+                for name, spread_depth in scope.spreads:
+                    fragment_counts = expanded.get((True, name))
+                    if fragment_counts is not None:
+                        fields += fragment_counts[0]
+                        aliases += fragment_counts[1]
+                        depth = max(depth, spread_depth + fragment_counts[2])
+                expanded[key] = (fields, aliases, depth)
+
+        for key, (fields, aliases, depth) in expanded.items():
+            if not key[0]:
+                self._check_depth(depth)
+                self._check_fields(fields)
+                self._check_aliases(aliases)
+
+    def _check_depth(self, depth: int) -> None:
+        """
+        Checks the depth of an operation or a fragment.
+        :param depth: the depth to check
+        :type depth: int
+        :raises QueryLimitError: when the depth exceeds the limit
+        """
+        max_depth = self.limits.max_depth
+        if max_depth is not None and depth > max_depth:
+            raise QueryLimitError(
+                f"Query exceeds the maximum depth of < {max_depth} >."
+            )
+
+    def _check_fields(self, fields: int) -> None:
+        """
+        Checks a number of fields.
+        :param fields: the number of fields to check
+        :type fields: int
+        :raises QueryLimitError: when the number exceeds the limit
+        """
+        max_fields = self.limits.max_fields
+        if max_fields is not None and fields > max_fields:
+            raise QueryLimitError(
+                f"Query exceeds the maximum number of < {max_fields} > "
+                "fields."
+            )
+
+    def _check_aliases(self, aliases: int) -> None:
+        """
+        Checks a number of aliases.
+        :param aliases: the number of aliases to check
+        :type aliases: int
+        :raises QueryLimitError: when the number exceeds the limit
+        """
+        max_aliases = self.limits.max_aliases
+        if max_aliases is not None and aliases > max_aliases:
+            raise QueryLimitError(
+                f"Query exceeds the maximum number of < {max_aliases} > "
+                "aliases."
+            )
@@ -0,0 +1,218 @@
+import hashlib
+import math
+import re
+
+from typing import Optional, Union
+
+__all__ = ("normalize_query", "query_signature", "count_tokens")
+
+# Significant tokens of a GraphQL document along with comments (which are
+# filtered out), commas & white spaces being skipped by the pattern
+_TOKEN_RE = re.compile(
+    r"#[^\n\r]*"
+    r'|"""(?:\\"""|(?!""")[\s\S])*"""'
+    r'|"(?:\\.|[^"\\\n\r])*"'
+    r"|\.\.\."
+    r"|[_A-Za-z][_0-9A-Za-z]*"
+    r"|-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"
+    r"|[^\s,\ufeff]"
+)
+
+# First characters of the tokens which have to be separated from each other
+_WORD_FIRST_CHARACTERS = frozenset(
+    "_-0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+# First characters of the number & string literals
+_LITERAL_FIRST_CHARACTERS = frozenset('-0123456789"')
+
+_INT_RE = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLOAT_RE = re.compile(
+    r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+)"
+)
+
+# Escape sequences of the string literals along with the characters which
+# aren't allowed as-is in a string literal
+_STRING_PART_RE = re.compile(r'\\u[0-9A-Fa-f]{4}|\\["\\/bfnrt]|[\\\x00-\x1f]')
+_ESCAPED_CHARACTERS = {
+    '\\"': '"',
+    "\\\\": "\\",
+    "\\/": "/",
+    "\\b": "\b",
+    "\\f": "\f",
+    "\\n": "\n",
+    "\\r": "\r",
+    "\\t": "\t",
+}
+_CANONICAL_ESCAPES = {
+    '"': '\\"',
+    "\\": "\\\\",
+    "\b": "\\b",
+    "\f": "\\f",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+}
+_CANONICAL_ESCAPE_RE = re.compile(r'["\\\x00-\x1f\x7f]')
+
+_BLOCK_STRING_LINE_RE = re.compile(r"\r\n|[\n\r]")
+_BLOCK_STRING_INVALID_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _unescape_string_part(match: "Match") -> str:
+    """
+    Returns the character of an escape sequence of a string literal.
+    :param match: matched escape sequence or character
+    :type match: Match
+    :return: the character of the escape sequence
+    :rtype: str
+    :raises ValueError: when the character can't be canonicalized
+    """
+    part = match.group(0)
+    character = _ESCAPED_CHARACTERS.get(part)
+    if character is not None:
+        return character
+    # Only the ASCII unicode escape sequences are decoded as-is by the
+    # parser, raw control characters being rejected
+    code = int(part[2:], 16) if len(part) == 6 else 0
+    if not 0 < code < 0x80:
+        raise ValueError(part)
+    return chr(code)
+
+
+def _block_string_value(raw_value: str) -> str:
+    """
+    Computes the value of a block string literal: its common indentation
+    and its leading & trailing blank lines are removed.
+    :param raw_value: the text of the literal between its triple quotes
+    :type raw_value: str
+    :return: the value of the block string
+    :rtype: str
+    :raises ValueError: when the literal can't be canonicalized
+    """
+    # A trailing backslash escapes the closing quotes for the parser
+    if raw_value.endswith("\\") or _BLOCK_STRING_INVALID_RE.search(raw_value):
+        raise ValueError(raw_value)
+
+    lines = _BLOCK_STRING_LINE_RE.split(raw_value.replace('\\"""', '"""'))
+    indents = [
+        len(line) - len(line.lstrip(" \t"))
+        for line in lines[1:]
+        if line.strip(" \t")
+    ]
+    if indents:
+        common_indent = min(indents)
+        lines[1:] = [line[common_indent:] for line in lines[1:]]
+
+    while lines and not lines[0].strip(" \t"):
+        del lines[0]
+    while lines and not lines[-1].strip(" \t"):
+        del lines[-1]
+    return "\n".join(lines)
+
+
+def _canonical_literal(token: str) -> str:
+    """
+    Returns the canonical text of a number or string literal, so that
+    literals with the same value (e.g. `1.0` & `1e0`, or a block string & a
+    string with escape sequences) share the same text. Literals whose value
+    the parser could decode differently are kept as-is.
+    :param token: the literal
+    :type token: str
+    :return: the canonical text of the literal
+    :rtype: str
+    """
+    try:
+        if token.startswith('"""'):
+            value = _block_string_value(token[3:-3])
+        elif token[0] == '"':
+            value = _STRING_PART_RE.sub(_unescape_string_part, token[1:-1])
+        elif _INT_RE.fullmatch(token):
+            return str(int(token))
+        elif _FLOAT_RE.fullmatch(token) and math.isfinite(float(token)):
+            return repr(float(token))
+        else:
+            return token
+    except ValueError:
+        return token
+
+    return '"%s"' % _CANONICAL_ESCAPE_RE.sub(
+        lambda match: _CANONICAL_ESCAPES.get(
+            match.group(0), "\\u%04x" % ord(match.group(0))
+        ),
+        value,
+    )
+
+
+def normalize_query(query: Union[str, bytes]) -> str:
+    """
+    Computes the canonical text of a GraphQL query by removing its ignored
+    tokens (white spaces, line terminators, commas & comments), significant
+    tokens being separated by a single space only where required, and by
+    canonicalizing the text of its number & string literals. Queries which
+    only differ by their formatting share the same canonical text.
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :type query: Union[str, bytes]
+    :return: the canonical text of the query
+    :rtype: str
+    """
+    if not isinstance(query, str):
+        query = str(query, "UTF-8")
+
+    parts = []
+    previous_is_word = False
+    for token in _TOKEN_RE.findall(query):
+        first_character = token[0]
+        if first_character == "#":
+            continue
+        is_word = first_character in _WORD_FIRST_CHARACTERS
+        if is_word and previous_is_word:
+            parts.append(" ")
+        if first_character in _LITERAL_FIRST_CHARACTERS:
+            token = _canonical_literal(token)
+        parts.append(token)
+        previous_is_word = is_word
+    return "".join(parts)
+
+
+def count_tokens(
+    query: Union[str, bytes], maximum: Optional[int] = None
+) -> int:
+    """
+    Counts the significant tokens of a GraphQL query (ignored tokens such as
+    white spaces, commas & comments being excluded).
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :param maximum: number of tokens after which the counting stops
+    :type query: Union[str, bytes]
+    :type maximum: Optional[int]
+    :return: the number of tokens, or `maximum + 1` if the query contains
+    more than `maximum` tokens
+    :rtype: int
+    """
+    if not isinstance(query, str):
+        query = str(query, "UTF-8")
+
+    count = 0
+    for match in _TOKEN_RE.finditer(query):
+        if query[match.start()] == "#":
+            continue
+        count += 1
+        if maximum is not None and count > maximum:
+            break
+    return count
+
+
+def query_signature(query: Union[str, bytes]) -> str:
+    """
+    Computes a stable signature of a GraphQL query, which is the same for
+    queries which only differ by their formatting and across processes.
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :type query: Union[str, bytes]
+    :return: the hexadecimal SHA-256 digest of the canonical text of the
+    query
+    :rtype: str
+    """
+    return hashlib.sha256(normalize_query(query).encode("UTF-8")).hexdigest()
@@ -0,0 +1,143 @@
+import os
+
+import cffi
+
+__all__ = ("FFI", "LIB", "LIBC")
+
+# Concrete node types of the libgraphqlparser AST, in the order in which
+# their visit callbacks are declared in the "GraphQLAstVisitorCallbacks"
+# structure (cf. "c/GraphQLAstVisitor.h" & "GraphQLAstForEachConcreteType.h")
+_CONCRETE_TYPES = (
+    ("Document", "document"),
+    ("OperationDefinition", "operation_definition"),
+    ("VariableDefinition", "variable_definition"),
+    ("SelectionSet", "selection_set"),
+    ("Field", "field"),
+    ("Argument", "argument"),
+    ("FragmentSpread", "fragment_spread"),
+    ("InlineFragment", "inline_fragment"),
+    ("FragmentDefinition", "fragment_definition"),
+    ("Variable", "variable"),
+    ("IntValue", "int_value"),
+    ("FloatValue", "float_value"),
+    ("StringValue", "string_value"),
+    ("BooleanValue", "boolean_value"),
+    ("NullValue", "null_value"),
+    ("EnumValue", "enum_value"),
+    ("ListValue", "list_value"),
+    ("ObjectValue", "object_value"),
+    ("ObjectField", "object_field"),
+    ("Directive", "directive"),
+    ("NamedType", "named_type"),
+    ("ListType", "list_type"),
+    ("NonNullType", "non_null_type"),
+    ("Name", "name"),
+    ("SchemaDefinition", "schema_definition"),
+    ("OperationTypeDefinition", "operation_type_definition"),
+    ("ScalarTypeDefinition", "scalar_type_definition"),
+    ("ObjectTypeDefinition", "object_type_definition"),
+    ("FieldDefinition", "field_definition"),
+    ("InputValueDefinition", "input_value_definition"),
+    ("InterfaceTypeDefinition", "interface_type_definition"),
+    ("UnionTypeDefinition", "union_type_definition"),
+    ("EnumTypeDefinition", "enum_type_definition"),
+    ("EnumValueDefinition", "enum_value_definition"),
+    ("InputObjectTypeDefinition", "input_object_type_definition"),
+    ("TypeExtensionDefinition", "type_extension_definition"),
+    ("DirectiveDefinition", "directive_definition"),
+)
+
+# TODO: automatize read from headers files
+FFI = cffi.FFI()
+FFI.cdef(
+    """
+struct GraphQLAstNode *graphql_parse_string(
+    const char *text, const char **error);
+
+void graphql_error_free(const char *error);
+
+void graphql_node_free(struct GraphQLAstNode *node);
+
+const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
+
+struct GraphQLAstLocation {
+  unsigned int beginLine;
+  unsigned int beginColumn;
+  unsigned int endLine;
+  unsigned int endColumn;
+};
+
+/* declared with a `void *` node so that any typed node could be passed */
+void graphql_node_get_location(
+    const void *node, struct GraphQLAstLocation *location);
+
+struct GraphQLAstVisitorCallbacks {
+%s
+};
+
+void graphql_node_visit(
+    const struct GraphQLAstNode *node,
+    const struct GraphQLAstVisitorCallbacks *callbacks,
+    void *userData);
+
+const char *GraphQLAstName_get_value(const struct GraphQLAstName *node);
+
+const char *GraphQLAstOperationDefinition_get_operation(
+    const struct GraphQLAstOperationDefinition *node);
+const struct GraphQLAstName *GraphQLAstOperationDefinition_get_name(
+    const struct GraphQLAstOperationDefinition *node);
+const struct GraphQLAstName *GraphQLAstFragmentDefinition_get_name(
+    const struct GraphQLAstFragmentDefinition *node);
+const struct GraphQLAstNamedType *
+GraphQLAstFragmentDefinition_get_type_condition(
+    const struct GraphQLAstFragmentDefinition *node);
+const struct GraphQLAstNamedType *GraphQLAstInlineFragment_get_type_condition(
+    const struct GraphQLAstInlineFragment *node);
+const struct GraphQLAstName *GraphQLAstFragmentSpread_get_name(
+    const struct GraphQLAstFragmentSpread *node);
+const struct GraphQLAstName *GraphQLAstField_get_alias(
+    const struct GraphQLAstField *node);
+const struct GraphQLAstName *GraphQLAstField_get_name(
+    const struct GraphQLAstField *node);
+const struct GraphQLAstName *GraphQLAstArgument_get_name(
+    const struct GraphQLAstArgument *node);
+const struct GraphQLAstName *GraphQLAstDirective_get_name(
+    const struct GraphQLAstDirective *node);
+const struct GraphQLAstName *GraphQLAstObjectField_get_name(
+    const struct GraphQLAstObjectField *node);
+const struct GraphQLAstName *GraphQLAstVariable_get_name(
+    const struct GraphQLAstVariable *node);
+const struct GraphQLAstName *GraphQLAstNamedType_get_name(
+    const struct GraphQLAstNamedType *node);
+
+const char *GraphQLAstIntValue_get_value(const struct GraphQLAstIntValue *node);
+const char *GraphQLAstFloatValue_get_value(
+    const struct GraphQLAstFloatValue *node);
+const char *GraphQLAstStringValue_get_value(
+    const struct GraphQLAstStringValue *node);
+int GraphQLAstBooleanValue_get_value(const struct GraphQLAstBooleanValue *node);
+const char *GraphQLAstEnumValue_get_value(
+    const struct GraphQLAstEnumValue *node);
+
+void free(void *ptr);
+"""
+    % "\n".join(
+        f"  int (*visit_{snake_name})(\n"
+        f"      const struct GraphQLAst{name} *node, void *userData);\n"
+        f"  void (*end_visit_{snake_name})(\n"
+        f"      const struct GraphQLAst{name} *node, void *userData);"
+        for name, snake_name in _CONCRETE_TYPES
+    )
+)
+
+# TODO: use importlib.resource in Python 3.7
+_LIBGRAPHQLPARSER_DIR = os.environ.get(
+    "LIBGRAPHQLPARSER_DIR", os.path.join(os.path.dirname(__file__), "cffi")
+)
+try:
+    LIB = FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.so")
+except OSError:
+    LIB = FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
+
+# Standard C library, used to free the memory allocated by libgraphqlparser
+LIBC = FFI.dlopen(None)
@@ -0,0 +1,621 @@
+import sys
+
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from tartiflette.language.ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumValueNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListTypeNode,
+    ListValueNode,
+    Location,
+    NamedTypeNode,
+    NameNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.language.ast.location import pack_location
+from tartiflette.language.parsers.libgraphqlparser.bindings import FFI, LIB
+
+__all__ = ("document_from_c_ast",)
+
+# Shared by the nodes of compact documents without any argument, directive
+# or variable definition, hence immutable
+_EMPTY_CHILDREN: Tuple[Any, ...] = ()
+
+
+def _to_str(c_string: "CData") -> str:
+    """
+    Decodes a C string returned by libgraphqlparser.
+    :param c_string: const char *
+    :type c_string: CData
+    :return: the decoded string
+    :rtype: str
+    """
+    return FFI.string(c_string).decode("UTF-8")
+
+
+class _Frame:
+    """
+    Collects the children of a libgraphqlparser AST node being visited until
+    its end visit.
+    """
+
+    __slots__ = (
+        "nodes",
+        "arguments",
+        "variable_definitions",
+        "directives",
+        "selection_set",
+        "type",
+        "name",
+        "alias",
+    )
+
+    def __init__(self) -> None:
+        self.nodes: List[Any] = []
+        self.arguments: List["ArgumentNode"] = []
+        self.variable_definitions: List["VariableDefinitionNode"] = []
+        self.directives: List["DirectiveNode"] = []
+        self.selection_set: Optional["SelectionSetNode"] = None
+        self.type: Optional[
+            Union["ListTypeNode", "NonNullTypeNode", "NamedTypeNode"]
+        ] = None
+        self.name: Optional["NameNode"] = None
+        self.alias: Optional["NameNode"] = None
+
+
+class _NodeBuilder:
+    """
+    Holds the state of the traversal of the libgraphqlparser C AST and builds
+    the value & type nodes, the other nodes being built by the
+    _DocumentBuilder.
+    """
+
+    __slots__ = (
+        "document",
+        "error",
+        "_query",
+        "_compact",
+        "_limits",
+        "_location",
+        "_location_fields",
+        "_frames",
+    )
+
+    def __init__(
+        self, schema: "GraphQLSchema", query: Union[str, bytes]
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param query: query which has been parsed
+        :type schema: GraphQLSchema
+        :type query: Union[str, bytes]
+        """
+        self.document: Optional["DocumentNode"] = None
+        self.error: Optional[Exception] = None
+        self._query = query
+        self._compact = bool(getattr(schema, "compact_ast", False))
+        query_limits = getattr(schema, "query_limits", None)
+        self._limits: Optional["QueryLimitsCounter"] = (
+            query_limits.counter() if query_limits is not None else None
+        )
+        self._location = FFI.new("struct GraphQLAstLocation *")
+        # the four fields of the structure, read at once
+        self._location_fields = FFI.cast("unsigned int *", self._location)
+        self._frames: List["_Frame"] = []
+
+    def _parse_location(self, c_node: "CData") -> Union["Location", int]:
+        """
+        Creates and returns a Location instance from a C AST node, or the
+        location packed into an integer when building a compact document.
+        :param c_node: any libgraphqlparser C AST node
+        :type c_node: CData
+        :return: a Location instance equivalent to the C AST node location
+        :rtype: Union[Location, int]
+        """
+        LIB.graphql_node_get_location(c_node, self._location)
+        line, column, line_end, column_end = self._location_fields[0:4]
+        if self._compact:
+            return pack_location(line, column, line_end, column_end)
+        return Location(
+            line=line, column=column, line_end=line_end, column_end=column_end
+        )
+
+    def _parse_name(self, c_name: "CData") -> Optional["NameNode"]:
+        """
+        Creates and returns a NameNode instance from a C AST name node.
+        :param c_name: const struct GraphQLAstName *
+        :type c_name: CData
+        :return: a NameNode instance or None if the name is NULL
+        :rtype: Optional[NameNode]
+        """
+        if c_name == FFI.NULL:
+            return None
+        value = _to_str(LIB.GraphQLAstName_get_value(c_name))
+        return NameNode(
+            value=sys.intern(value) if self._compact else value,
+            location=self._parse_location(c_name),
+        )
+
+    def _children(self, nodes: List[Any]) -> Union[List[Any], Tuple[Any, ...]]:
+        """
+        Returns the list of children of a node, empty lists being replaced by
+        a shared empty tuple when building a compact document.
+        :param nodes: the children of the node
+        :type nodes: List[Any]
+        :return: the list of children of the node
+        :rtype: Union[List[Any], Tuple[Any, ...]]
+        """
+        if not nodes and self._compact:
+            return _EMPTY_CHILDREN
+        return nodes
+
+    def _push(self) -> "_Frame":
+        """
+        Pushes and returns the frame of the node being visited.
+        :return: the frame of the node being visited
+        :rtype: _Frame
+        """
+        frame = _Frame()
+        self._frames.append(frame)
+        return frame
+
+    def fail(self, error: Exception) -> None:
+        """
+        Stores the error which stops the traversal, to be raised once the C
+        visitor returned.
+        :param error: the error raised by a visit method
+        :type error: Exception
+        """
+        self.error = error
+
+    # Values
+
+    def visit_variable(self, c_node: "CData") -> int:
+        variable = VariableNode(
+            name=self._parse_name(LIB.GraphQLAstVariable_get_name(c_node)),
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].nodes.append(variable)
+        return 0
+
+    def visit_boolean_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            BooleanValueNode(
+                value=bool(LIB.GraphQLAstBooleanValue_get_value(c_node)),
+                location=self._parse_location(c_node),
+            )
+        )
+        return 0
+
+    def visit_enum_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            EnumValueNode(
+                value=_to_str(LIB.GraphQLAstEnumValue_get_value(c_node)),
+                location=self._parse_location(c_node),
+            )
+        )
+        return 0
+
+    def visit_float_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            FloatValueNode(
+                value=_to_str(LIB.GraphQLAstFloatValue_get_value(c_node)),
+                location=self._parse_location(c_node),
+            )
+        )
+        return 0
+
+    def visit_int_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            IntValueNode(
+                value=_to_str(LIB.GraphQLAstIntValue_get_value(c_node)),
+                location=self._parse_location(c_node),
+            )
+        )
+        return 0
+
+    def visit_null_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            NullValueNode(location=self._parse_location(c_node))
+        )
+        return 0
+
+    def visit_string_value(self, c_node: "CData") -> int:
+        self._frames[-1].nodes.append(
+            StringValueNode(
+                value=_to_str(LIB.GraphQLAstStringValue_get_value(c_node)),
+                location=self._parse_location(c_node),
+            )
+        )
+        return 0
+
+    def visit_list_value(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_list_value(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].nodes.append(
+            ListValueNode(
+                values=frame.nodes, location=self._parse_location(c_node)
+            )
+        )
+
+    def visit_object_value(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_object_value(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].nodes.append(
+            ObjectValueNode(
+                fields=frame.nodes, location=self._parse_location(c_node)
+            )
+        )
+
+    def visit_object_field(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_object_field(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].nodes.append(
+            ObjectFieldNode(
+                name=self._parse_name(
+                    LIB.GraphQLAstObjectField_get_name(c_node)
+                ),
+                value=frame.nodes[0] if frame.nodes else None,
+                location=self._parse_location(c_node),
+            )
+        )
+
+    # Types
+
+    def visit_named_type(self, c_node: "CData") -> int:
+        self._frames[-1].type = NamedTypeNode(
+            name=self._parse_name(LIB.GraphQLAstNamedType_get_name(c_node)),
+            location=self._parse_location(c_node),
+        )
+        return 0
+
+    def visit_list_type(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_list_type(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].type = ListTypeNode(
+            type=frame.type, location=self._parse_location(c_node)
+        )
+
+    def visit_non_null_type(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_non_null_type(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].type = NonNullTypeNode(
+            type=frame.type, location=self._parse_location(c_node)
+        )
+
+
+class _DocumentBuilder(_NodeBuilder):
+    """
+    Builds a DocumentNode while the libgraphqlparser C AST is traversed by
+    the C visitor, without any intermediate representation.
+    """
+
+    __slots__ = ()
+
+    # Arguments & directives
+
+    def visit_argument(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_argument(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        argument = ArgumentNode(
+            name=self._parse_name(LIB.GraphQLAstArgument_get_name(c_node)),
+            value=frame.nodes[0] if frame.nodes else None,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].arguments.append(argument)
+
+    def visit_directive(self, c_node: "CData") -> int:
+        frame = self._push()
+        frame.name = self._parse_name(LIB.GraphQLAstDirective_get_name(c_node))
+        return 1
+
+    def end_visit_directive(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        directive = DirectiveNode(
+            name=frame.name,
+            arguments=self._children(frame.arguments),
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].directives.append(directive)
+
+    # Selections
+
+    def visit_field(self, c_node: "CData") -> int:
+        frame = self._push()
+        frame.name = self._parse_name(LIB.GraphQLAstField_get_name(c_node))
+        frame.alias = self._parse_name(LIB.GraphQLAstField_get_alias(c_node))
+        if self._limits is not None:
+            self._limits.enter_field(frame.alias is not None)
+        return 1
+
+    def end_visit_field(self, c_node: "CData") -> None:
+        if self._limits is not None:
+            self._limits.exit_field()
+
+        frame = self._frames.pop()
+        field = FieldNode(
+            alias=frame.alias,
+            name=frame.name,
+            arguments=self._children(frame.arguments),
+            directives=self._children(frame.directives),
+            selection_set=frame.selection_set,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].nodes.append(field)
+
+    def visit_fragment_spread(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_fragment_spread(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        fragment_spread = FragmentSpreadNode(
+            name=self._parse_name(
+                LIB.GraphQLAstFragmentSpread_get_name(c_node)
+            ),
+            directives=self._children(frame.directives),
+            location=self._parse_location(c_node),
+        )
+
+        if self._limits is not None:
+            self._limits.add_fragment_spread(fragment_spread.name.value)
+
+        self._frames[-1].nodes.append(fragment_spread)
+
+    def visit_inline_fragment(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_inline_fragment(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        inline_fragment = InlineFragmentNode(
+            directives=self._children(frame.directives),
+            type_condition=frame.type,
+            selection_set=frame.selection_set,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].nodes.append(inline_fragment)
+
+    def visit_selection_set(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_selection_set(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        self._frames[-1].selection_set = SelectionSetNode(
+            selections=frame.nodes, location=self._parse_location(c_node)
+        )
+
+    # Definitions
+
+    def visit_variable_definition(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_variable_definition(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        variable_definition = VariableDefinitionNode(
+            variable=frame.nodes[0],
+            type=frame.type,
+            default_value=frame.nodes[1] if len(frame.nodes) > 1 else None,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].variable_definitions.append(variable_definition)
+
+    def visit_operation_definition(self, c_node: "CData") -> int:
+        frame = self._push()
+        name = self._parse_name(
+            LIB.GraphQLAstOperationDefinition_get_name(c_node)
+        )
+        frame.name = name
+        if self._limits is not None:
+            self._limits.enter_definition(name.value if name else None, False)
+        return 1
+
+    def end_visit_operation_definition(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        operation = OperationDefinitionNode(
+            operation_type=sys.intern(
+                _to_str(
+                    LIB.GraphQLAstOperationDefinition_get_operation(c_node)
+                )
+            ),
+            name=frame.name,
+            variable_definitions=self._children(frame.variable_definitions),
+            directives=self._children(frame.directives),
+            selection_set=frame.selection_set,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].nodes.append(operation)
+
+    def visit_fragment_definition(self, c_node: "CData") -> int:
+        frame = self._push()
+        name = self._parse_name(
+            LIB.GraphQLAstFragmentDefinition_get_name(c_node)
+        )
+        frame.name = name
+        if self._limits is not None:
+            self._limits.enter_definition(name.value, True)
+        return 1
+
+    def end_visit_fragment_definition(self, c_node: "CData") -> None:
+        frame = self._frames.pop()
+        fragment = FragmentDefinitionNode(
+            name=frame.name,
+            type_condition=frame.type,
+            directives=self._children(frame.directives),
+            selection_set=frame.selection_set,
+            location=self._parse_location(c_node),
+        )
+
+        self._frames[-1].nodes.append(fragment)
+
+    def visit_document(self, _c_node: "CData") -> int:
+        self._push()
+        return 1
+
+    def end_visit_document(self, c_node: "CData") -> None:
+        if self._limits is not None:
+            self._limits.check_document()
+
+        frame = self._frames.pop()
+        fragments = [
+            definition
+            for definition in frame.nodes
+            if isinstance(definition, FragmentDefinitionNode)
+        ]
+        operations = [
+            definition
+            for definition in frame.nodes
+            if isinstance(definition, OperationDefinitionNode)
+        ]
+        self.document = DocumentNode(
+            definitions=fragments + operations,
+            hash_id=hash(self._query),
+            location=self._parse_location(c_node),
+        )
+
+
+def _visit_callback(method: Callable) -> Callable:
+    """
+    Wraps a visit method of the _DocumentBuilder into a function to be called
+    by the libgraphqlparser C visitor. Since exceptions can't be raised
+    through C code, the first one is stored on the builder (to be raised
+    once the visit is over) and stops the traversal.
+    :param method: the _DocumentBuilder method to wrap
+    :type method: Callable
+    :return: a function to be called by the libgraphqlparser C visitor
+    :rtype: Callable
+    """
+
+    def _callback(c_node: "CData", user_data: "CData") -> int:
+        builder = FFI.from_handle(user_data)
+        if builder.error is not None:
+            return 0
+        try:
+            return method(builder, c_node)
+        except Exception as e:  # pylint: disable=broad-except
+            builder.fail(e)
+            return 0
+
+    return _callback
+
+
+def _end_visit_callback(method: Callable) -> Callable:
+    """
+    Wraps an end visit method of the _DocumentBuilder into a function to be
+    called by the libgraphqlparser C visitor.
+    :param method: the _DocumentBuilder method to wrap
+    :type method: Callable
+    :return: a function to be called by the libgraphqlparser C visitor
+    :rtype: Callable
+    """
+
+    def _callback(c_node: "CData", user_data: "CData") -> None:
+        builder = FFI.from_handle(user_data)
+        if builder.error is not None:
+            return
+        try:
+            method(builder, c_node)
+        except Exception as e:  # pylint: disable=broad-except
+            builder.fail(e)
+
+    return _callback
+
+
+def _build_visitor_callbacks() -> Tuple["CData", List["CData"]]:
+    """
+    Fills the callbacks structure given to the libgraphqlparser C visitor with
+    the _DocumentBuilder methods. Nodes without visit method (e.g. names) are
+    traversed by the C visitor without calling back Python.
+    :return: struct GraphQLAstVisitorCallbacks * & the C callbacks which has
+    to be kept alive as long as the structure is used
+    :rtype: Tuple[CData, List[CData]]
+    """
+    c_callbacks = FFI.new("struct GraphQLAstVisitorCallbacks *")
+    keep_alive = []
+    for attribute in dir(_DocumentBuilder):
+        if attribute.startswith("visit_"):
+            wrapper = _visit_callback
+        elif attribute.startswith("end_visit_"):
+            wrapper = _end_visit_callback
+        else:
+            continue
+
+        c_callback = FFI.callback(
+            FFI.typeof(getattr(c_callbacks, attribute)),
+            wrapper(getattr(_DocumentBuilder, attribute)),
+        )
+        setattr(c_callbacks, attribute, c_callback)
+        keep_alive.append(c_callback)
+    return c_callbacks, keep_alive
+
+
+_VISITOR_CALLBACKS, _C_CALLBACKS = _build_visitor_callbacks()
+
+
+def document_from_c_ast(
+    c_document: "CData", query: Union[str, bytes], schema: "GraphQLSchema"
+) -> "DocumentNode":
+    """
+    Creates and returns a DocumentNode instance from the libgraphqlparser C
+    AST of a query by visiting it directly.
+    :param c_document: struct GraphQLAstNode *
+    :param query: query which has been parsed
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type c_document: CData
+    :type query: Union[str, bytes]
+    :type schema: GraphQLSchema
+    :return: a DocumentNode instance equivalent to the C AST
+    :rtype: DocumentNode
+    """
+    builder = _DocumentBuilder(schema, query)
+    c_builder = FFI.new_handle(builder)
+
+    LIB.graphql_node_visit(c_document, _VISITOR_CALLBACKS, c_builder)
+
+    if builder.error is not None:
+        raise builder.error
+    return builder.document
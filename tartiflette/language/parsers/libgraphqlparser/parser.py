@@ -1,10 +1,16 @@
-import os
+import json
 
 from types import TracebackType
 from typing import Optional, Type, Union
 
-from cffi import FFI
-
+from tartiflette.language.parsers.libgraphqlparser.bindings import (
+    FFI,
+    LIB,
+    LIBC,
+)
+from tartiflette.language.parsers.libgraphqlparser.builder import (
+    document_from_c_ast,
+)
 from tartiflette.language.parsers.libgraphqlparser.transformers import (
     document_from_ast_json,
 )
@@ -12,30 +18,6 @@ from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
 __all__ = ("parse_to_document",)
 
-# TODO: automatize read from headers files
-_FFI = FFI()
-_FFI.cdef(
-    """
-struct GraphQLAstNode *graphql_parse_string(
-    const char *text, const char **error);
-
-void graphql_error_free(const char *error);
-
-void graphql_node_free(struct GraphQLAstNode *node);
-
-const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
-"""
-)
-
-# TODO: use importlib.resource in Python 3.7
-_LIBGRAPHQLPARSER_DIR = os.environ.get(
-    "LIBGRAPHQLPARSER_DIR", os.path.join(os.path.dirname(__file__), "cffi")
-)
-try:
-    _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.so")
-except OSError:
-    _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
-
 
 class ParsedData:
     """
@@ -81,33 +63,64 @@ class ParsedData:
         self._destroy_cb(self._c_parsed)
 
 
-def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
+def _query_buffer(
+    query: Union[str, bytes, bytearray, memoryview]
+) -> Union[bytes, bytearray]:
+    """
+    Returns the UTF-8 encoded buffer of the query which can be given as-is to
+    libgraphqlparser. `bytes` & `bytearray` instances are returned as-is,
+    memoryviews spanning an entire `bytes` or `bytearray` instance are
+    returned as this instance and other memoryviews are copied.
+    :param query: query to parse with libgraphqlparser
+    :type query: Union[str, bytes, bytearray, memoryview]
+    :return: the UTF-8 encoded buffer of the query
+    :rtype: Union[bytes, bytearray]
+    """
+    if isinstance(query, str):
+        return query.encode("UTF-8")
+
+    if isinstance(query, memoryview):
+        if (
+            isinstance(query.obj, (bytes, bytearray))
+            and query.contiguous
+            and query.nbytes == len(query.obj)
+        ):
+            return query.obj
+        return query.tobytes()
+
+    return query
+
+
+def _parse_context_manager(
+    query: Union[str, bytes, bytearray, memoryview]
+) -> ParsedData:
     """
     Parses the query with the libgraphqlparser library and returns a ParsedData
     instance.
     :param query: query to parse with libgraphqlparser
-    :type query: Union[str, bytes]
+    :type query: Union[str, bytes, bytearray, memoryview]
     :return: a ParsedData instance which is a context manager
     :rtype: ParsedData
     :raises GraphQLSyntaxError: raised when the libgraphqlparser library
     couldn't parse the query due to a syntax error.
     """
-    if isinstance(query, str):
-        query = query.encode("UTF-8")
+    # `bytes` & `bytearray` buffers are always followed by a NUL byte, so
+    # they can be given to libgraphqlparser as C strings without any copy
+    c_query = FFI.from_buffer("char[]", _query_buffer(query))
 
-    errors = _FFI.new("char **")
+    errors = FFI.new("char **")
 
     parsed_data = ParsedData(
-        _LIB.graphql_parse_string(_FFI.new("char[]", query), errors),
-        _LIB.graphql_node_free,
+        LIB.graphql_parse_string(c_query, errors),
+        LIB.graphql_node_free,
     )
 
-    if errors[0] != _FFI.NULL:
+    if errors[0] != FFI.NULL:
         # TODO: parse libgraphqlparser error string and fill location
         e = GraphQLSyntaxError(
-            _FFI.string(errors[0]).decode("UTF-8", "replace")
+            FFI.string(errors[0]).decode("UTF-8", "replace")
         )
-        _LIB.graphql_error_free(errors[0])
+        LIB.graphql_error_free(errors[0])
         raise e
 
     return parsed_data
@@ -122,7 +135,11 @@ def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
     with _parse_context_manager(query) as parsed:
-        return _FFI.string(_LIB.graphql_ast_to_json(parsed))
+        json_ast = LIB.graphql_ast_to_json(parsed)
+        try:
+            return FFI.string(json_ast)
+        finally:
+            LIBC.free(json_ast)
 
 
 def parse_to_document(
@@ -130,7 +147,9 @@ def parse_to_document(
 ) -> "DocumentNode":
     """
     Returns a DocumentNode instance which represents the query after being
-    parsed.
+    parsed. The DocumentNode is built while walking the libgraphqlparser C
+    AST, unless a custom `json_loader` has been provided to the engine, in
+    which case it is built from the JSON representation of the C AST.
     :param query: query to parse and transform into a DocumentNode
     :type query: Union[str, bytes]
     :param schema: the GraphQLSchema instance linked to the engine
@@ -152,6 +171,10 @@ def parse_to_document(
     >>>   }
     >>> }''')
     """
+    if schema.json_loader is None or schema.json_loader is json.loads:
+        with _parse_context_manager(query) as parsed:
+            return document_from_c_ast(parsed, query, schema)
+
     return document_from_ast_json(
         schema.json_loader(_parse_to_json_ast(query)), query, schema
     )
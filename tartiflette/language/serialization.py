@@ -0,0 +1,237 @@
+import marshal
+
+from typing import Any, Union
+
+from tartiflette.execution.persisted_queries import compute_query_hash
+from tartiflette.execution.plan import build_execution_plan
+from tartiflette.language.ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumValueNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListTypeNode,
+    ListValueNode,
+    Location,
+    NamedTypeNode,
+    NameNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.types.exceptions.tartiflette import DocumentSerializationError
+
+__all__ = ("dump_document", "load_document")
+
+_MAGIC = b"TTFD"
+
+# Version of the format, to be increased whenever the list of the
+# serialisable nodes or their slots change
+_FORMAT_VERSION = 3
+
+# Serialisable nodes, identified by their index: new nodes must be appended
+_NODE_CLASSES = (
+    DocumentNode,
+    OperationDefinitionNode,
+    FragmentDefinitionNode,
+    VariableDefinitionNode,
+    SelectionSetNode,
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ArgumentNode,
+    DirectiveNode,
+    NameNode,
+    NamedTypeNode,
+    ListTypeNode,
+    NonNullTypeNode,
+    VariableNode,
+    IntValueNode,
+    FloatValueNode,
+    StringValueNode,
+    BooleanValueNode,
+    NullValueNode,
+    EnumValueNode,
+    ListValueNode,
+    ObjectValueNode,
+    ObjectFieldNode,
+    Location,
+)
+
+_NODE_CLASS_IDS = {
+    node_class: class_id for class_id, node_class in enumerate(_NODE_CLASSES)
+}
+
+# Serialised slots of each node (packed locations being serialised as-is),
+# the other slots of a DocumentNode being recomputed once loaded
+_NODE_SLOTS = tuple(
+    ("definitions", "_location")
+    if node_class is DocumentNode
+    else node_class.__slots__
+    if node_class is Location
+    else node_class.__slots__ + ("_location",)
+    for node_class in _NODE_CLASSES
+)
+
+
+def _header(schema: "GraphQLSchema") -> bytes:
+    """
+    Computes the header of the documents serialised for a schema, which
+    identifies the format, its version and the schema.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :type schema: GraphQLSchema
+    :return: the header of the serialised documents
+    :rtype: bytes
+    """
+    if schema.sdl_hash is None:
+        raise DocumentSerializationError(
+            "Documents can only be serialised for a baked schema."
+        )
+    return b"%s%s%s" % (
+        _MAGIC,
+        bytes((_FORMAT_VERSION, marshal.version)),
+        bytes.fromhex(schema.sdl_hash),
+    )
+
+
+def _query_digest(query: Union[str, bytes]) -> bytes:
+    """
+    Computes the digest of the query from which a document has been parsed,
+    which follows the header of the serialised document.
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes
+    :type query: Union[str, bytes]
+    :return: the SHA-256 digest of the query
+    :rtype: bytes
+    """
+    return bytes.fromhex(compute_query_hash(query))
+
+
+def _encode(value: Any) -> Any:
+    """
+    Converts a node into nested tuples & lists of marshallable values.
+    :param value: the node or value to convert
+    :type value: Any
+    :return: the converted value
+    :rtype: Any
+    """
+    class_id = _NODE_CLASS_IDS.get(value.__class__)
+    if class_id is not None:
+        return (class_id,) + tuple(
+            _encode(getattr(value, slot, None))
+            for slot in _NODE_SLOTS[class_id]
+        )
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise DocumentSerializationError(
+        f"Can't serialise < {value.__class__.__name__} > instances."
+    )
+
+
+def _decode(value: Any) -> Any:
+    """
+    Converts nested tuples & lists of marshallable values back into a node.
+    :param value: the value to convert
+    :type value: Any
+    :return: the converted node or value
+    :rtype: Any
+    """
+    if value.__class__ is tuple:
+        class_id = value[0]
+        node = _NODE_CLASSES[class_id].__new__(_NODE_CLASSES[class_id])
+        for slot, slot_value in zip(_NODE_SLOTS[class_id], value[1:]):
+            setattr(node, slot, _decode(slot_value))
+        return node
+    if value.__class__ is list:
+        return [_decode(item) for item in value]
+    return value
+
+
+def dump_document(
+    document: "DocumentNode",
+    schema: "GraphQLSchema",
+    query: Union[str, bytes],
+) -> bytes:
+    """
+    Serialises a validated DocumentNode into a compact binary format which
+    can be loaded without parsing nor validating the query again.
+    :param document: the validated DocumentNode to serialise
+    :param schema: the GraphQLSchema instance against which the document has
+    been validated
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes from which the document has been parsed
+    :type document: DocumentNode
+    :type schema: GraphQLSchema
+    :type query: Union[str, bytes]
+    :return: the serialised document
+    :rtype: bytes
+    """
+    return (
+        _header(schema)
+        + _query_digest(query)
+        + marshal.dumps(_encode(document))
+    )
+
+
+def load_document(
+    data: bytes, schema: "GraphQLSchema", query: Union[str, bytes]
+) -> "DocumentNode":
+    """
+    Loads a DocumentNode serialised by `dump_document` and computes its
+    execution plan.
+    :param data: the serialised document
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param query: the GraphQL request / query as string or UTF8-encoded
+    bytes from which the document has been parsed
+    :type data: bytes
+    :type schema: GraphQLSchema
+    :type query: Union[str, bytes]
+    :return: the loaded DocumentNode
+    :rtype: DocumentNode
+    :raises DocumentSerializationError: when the data hasn't been serialised
+    with the same format, for the same schema or from the same query
+    """
+    header = _header(schema)
+    if data[: len(header)] != header:
+        raise DocumentSerializationError(
+            "The document has been serialised with another format or for "
+            "another schema."
+        )
+
+    query_digest = _query_digest(query)
+    offset = len(header) + len(query_digest)
+    if data[len(header) : offset] != query_digest:
+        raise DocumentSerializationError(
+            "The document has been serialised from another query."
+        )
+
+    try:
+        document = _decode(marshal.loads(memoryview(data)[offset:]))
+    except (EOFError, ValueError, TypeError, IndexError) as e:
+        raise DocumentSerializationError(
+            "The serialised document is corrupted.", original_error=e
+        )
+
+    if not isinstance(document, DocumentNode):
+        raise DocumentSerializationError(
+            "The serialised data isn't a document."
+        )
+
+    document._hash_id = hash(data)  # pylint: disable=protected-access
+    document.validators = None
+    document.plan = build_execution_plan(document, schema)
+    return document
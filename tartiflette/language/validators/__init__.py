@@ -1,50 +1,451 @@
-from typing import Any, Dict, List
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from tartiflette.coercers.common import Path
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+)
+from tartiflette.language.validators.context import (
+    DefinitionUsages,
+    ValidationContext,
+)
+from tartiflette.language.validators.index import ValidationIndex
+from tartiflette.language.validators.query import RULE_SET
+from tartiflette.language.validators.rules import ValidationRules
 
-class Validators:
+__all__ = ("Validators", "ValidationRules", "validate_document")
+
+DEFAULT_VALIDATION_RULES = ValidationRules(RULE_SET)
+
+_Stack = List[Tuple[Callable[[Any, "_Stack"], None], Any]]
+
+
+def _source_order(definition: "DefinitionNode") -> Tuple[int, int]:
+    """
+    Returns the position of a definition in the query, used to visit the
+    definitions of a document in the order they've been written.
+    :param definition: the definition node
+    :type definition: DefinitionNode
+    :return: the line & column of the definition
+    :rtype: Tuple[int, int]
     """
-    Prove a single point of entry for rule validation.
+    location = definition.location
+    return (location.line, location.column) if location else (0, 0)
 
-    Calling validate('rule-name') on this will try to validate the rule with the current context.
 
-    The errors field will contain every errors found, so they can all be returned at once.
-    BUT if a rule set the internal abort flag at "true", then no other rules are executed.
-    Some rules do so, because if invalid, other errors are meaning less.
+class Validators:
+    """
+    Validates a DocumentNode in a single visit once it has been built.
 
+    The rules register for the kinds of node they validate (e.g. "Field",
+    "Directive" or "Document" for the whole document, see `ValidationRule`)
+    and are called with the node & a typed `ValidationContext` once the node
+    and its children have been visited. "Arguments", "Directives" &
+    "VariableDefinitions" rules are called with the owner of the arguments,
+    directives or variable definitions once they have been visited.
+
+    The errors field will contain every errors found, so they can all be
+    returned at once. BUT if a rule returns errors and its abort flag is set,
+    then no other rules are executed. Some rules do so, because if invalid,
+    other errors are meaning less.
     """
 
-    __slots__ = ("ctx", "schema", "errors", "rules", "_abort")
+    __slots__ = (
+        "ctx",
+        "schema",
+        "errors",
+        "rules",
+        "index",
+        "timings",
+        "_abort",
+        "_usages",
+        "_current_field",
+        "_directive_name",
+        "_in_variable_definitions",
+    )
 
     def __init__(
-        self, schema: "GraphqlSchema", rules: Dict[str, "ValidationRule"]
-    ):
-        self.ctx: Dict[str, Any] = {}
-        self.schema: "GraphqlSchema" = schema
+        self,
+        schema: "GraphQLSchema",
+        rules: Optional["ValidationRules"] = None,
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param rules: the compiled validation rules (all of the rules when
+        not provided)
+        :type schema: GraphQLSchema
+        :type rules: Optional[ValidationRules]
+        """
+        self.schema = schema
+        self.rules = rules or DEFAULT_VALIDATION_RULES
+        self.ctx = ValidationContext(schema)
+        self.index = ValidationIndex(schema, self.ctx)
+        self.ctx.index = self.index
         self.errors: List["TartifletteError"] = []
-        self.rules: Dict[str, "ValidationRule"] = rules
+        self.timings: Dict[str, Tuple[int, float]] = {}
         self._abort = False
+        self._usages: Optional["DefinitionUsages"] = None
+        self._current_field: Optional[Tuple[Optional[str], str]] = None
+        self._directive_name: Optional[str] = None
+        self._in_variable_definitions = False
 
-    def validate(self, rule: str, path: "Path", **kwargs) -> None:
+    def _run_rules(self, kind: str, node: "Node") -> None:
+        """
+        Runs the rules registered for a kind of node on the node.
+        :param kind: the kind of node
+        :param node: the node to validate
+        :type kind: str
+        :type node: Node
         """
-        Will execute the rule referenced by `rule`. It'll look in the ruleset
-        and calls validate giving it **kwargs and **self.ctx so the validator
-        has all the needed data to work.
+        timed = self.rules.timed
+        timings = self.timings
+        for rule in self.rules.get(kind):
+            if self._abort:
+                return
 
-        Will fill self.errors with errors if any.
+            if not timed:
+                rule_errors = rule.validate(node, self.ctx)
+            else:
+                start = perf_counter()
+                rule_errors = rule.validate(node, self.ctx)
+                calls, seconds = timings.get(rule.RULE_NAME, (0, 0.0))
+                timings[rule.RULE_NAME] = (
+                    calls + 1,
+                    seconds + perf_counter() - start,
+                )
 
-        :param rule: The rule name to validate
-        :type rule: str
-        :param kwargs: Any parameters
-        :param path: The current Query Path were the validation is taking place.
-        :type: path: Path
+            if rule_errors:
+                if rule.abort:
+                    self._abort = True
+                self.errors.extend(rule_errors)
+
+    def validate(self, document: "DocumentNode") -> List["TartifletteError"]:
+        """
+        Visits the definitions of a document in the order they've been
+        written, depth first & without recursion, and runs the rules
+        registered for each visited node.
+        :param document: the DocumentNode to validate
+        :type document: DocumentNode
+        :return: the validation errors
+        :rtype: List[TartifletteError]
         """
+        ctx = self.ctx
+        ctx.fragments = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        ]
+        ctx.operations = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, OperationDefinitionNode)
+        ]
+
+        stack: _Stack = [(self._leave_document, document)]
+        stack.extend(
+            (self._enter_definition, definition)
+            for definition in sorted(
+                document.definitions, key=_source_order, reverse=True
+            )
+        )
+        while stack:
+            handler, node = stack.pop()
+            handler(node, stack)
+
+        if self.timings:
+            self.rules.add_timings(self.timings)
+        return self.errors
+
+    # Groups of children
+
+    def _push_selection_set(
+        self, selection_set: Optional["SelectionSetNode"], stack: "_Stack"
+    ) -> None:
+        if selection_set is not None:
+            stack.extend(
+                (self._enter_selection, selection)
+                for selection in reversed(selection_set.selections)
+            )
+
+    def _push_directives(self, node: "Node", stack: "_Stack") -> None:
+        if node.directives:
+            stack.append((self._leave_directives, node))
+            stack.extend(
+                (self._enter_directive, directive)
+                for directive in reversed(node.directives)
+            )
+
+    def _leave_directives(self, node: "Node", _stack: "_Stack") -> None:
+        self._run_rules("Directives", node)
+
+    def _push_arguments(self, node: "Node", stack: "_Stack") -> None:
+        if node.arguments:
+            stack.append((self._leave_arguments, node))
+            for argument in reversed(node.arguments):
+                stack.append((self._leave_argument, argument))
+                stack.append((self._enter_value, argument.value))
+
+    def _leave_arguments(self, node: "Node", _stack: "_Stack") -> None:
+        self._run_rules("Arguments", node)
+
+    # Values
+
+    def _enter_value(
+        self, value: Optional["ValueNode"], stack: "_Stack"
+    ) -> None:
+        value_class = value.__class__
+        if value_class is VariableNode:
+            if not self._in_variable_definitions:
+                self._usages.used_variables.append(value)
+        elif value_class is ListValueNode:
+            stack.extend(
+                (self._enter_value, item) for item in reversed(value.values)
+            )
+        elif value_class is ObjectValueNode:
+            stack.append((self._leave_object_value, value))
+            stack.extend(
+                (self._enter_value, field.value)
+                for field in reversed(value.fields)
+            )
+
+    def _leave_object_value(
+        self, value: "ObjectValueNode", _stack: "_Stack"
+    ) -> None:
+        if value.fields:
+            self._run_rules("ObjectValue", value)
 
-        if not self._abort:
-            rule_errors = self.rules[rule].validate(
-                path=path, schema=self.schema, **kwargs, **self.ctx
+    def _leave_argument(
+        self, argument: "ArgumentNode", _stack: "_Stack"
+    ) -> None:
+        if isinstance(argument.value, VariableNode):
+            in_directive = self._directive_name is not None
+            self._usages.arguments_using_variables.append(
+                {
+                    "arg": argument,
+                    "node_location": (
+                        self._directive_name
+                        if in_directive
+                        else self._current_field
+                    ),
+                    "is_directive": in_directive,
+                    "path": self.ctx.path,
+                }
             )
 
-            if self.rules[rule].abort and rule_errors:
-                self._abort = True
+    # Directives
 
-            self.errors.extend(rule_errors)
+    def _enter_directive(
+        self, directive: "DirectiveNode", stack: "_Stack"
+    ) -> None:
+        self._directive_name = directive.name.value
+        stack.append((self._leave_directive, directive))
+        self._push_arguments(directive, stack)
+
+    def _leave_directive(
+        self, directive: "DirectiveNode", _stack: "_Stack"
+    ) -> None:
+        self._directive_name = None
+        self._run_rules("Directive", directive)
+
+    # Selections
+
+    def _enter_selection(
+        self, selection: "SelectionNode", stack: "_Stack"
+    ) -> None:
+        selection_class = selection.__class__
+        if selection_class is FieldNode:
+            self._enter_field(selection, stack)
+        elif selection_class is FragmentSpreadNode:
+            self._enter_fragment_spread(selection, stack)
+        elif selection_class is InlineFragmentNode:
+            self._enter_inline_fragment(selection, stack)
+
+    def _enter_field(self, field: "FieldNode", stack: "_Stack") -> None:
+        ctx = self.ctx
+        parent_type_name = ctx.parent_type_name
+        stack.append((self._leave_field, (field, parent_type_name, ctx.path)))
+
+        field_name = field.name.value
+        ctx.path = Path(prev=ctx.path, key=field_name)
+        ctx.parent_type_name = self.index.get_field_type_name(
+            parent_type_name, field_name
+        )
+        self._directive_name = None
+        self._current_field = (parent_type_name, field_name)
+
+        self._push_selection_set(field.selection_set, stack)
+        self._push_directives(field, stack)
+        self._push_arguments(field, stack)
+
+    def _leave_field(
+        self,
+        visited: Tuple["FieldNode", Optional[str], Optional["Path"]],
+        _stack: "_Stack",
+    ) -> None:
+        field, parent_type_name, path = visited
+        self.ctx.parent_type_name = parent_type_name
+        self._run_rules("Field", field)
+        self.ctx.path = path
+
+    def _enter_fragment_spread(
+        self, fragment_spread: "FragmentSpreadNode", stack: "_Stack"
+    ) -> None:
+        stack.append((self._leave_fragment_spread, fragment_spread))
+        self._push_directives(fragment_spread, stack)
+
+    def _leave_fragment_spread(
+        self, fragment_spread: "FragmentSpreadNode", _stack: "_Stack"
+    ) -> None:
+        self._run_rules("FragmentSpread", fragment_spread)
+
+        ctx = self.ctx
+        ctx.fragment_spreads.append(fragment_spread)
+        ctx.spreaded_in.setdefault(ctx.parent_type_name, []).append(
+            {"spread": fragment_spread, "path": ctx.path}
+        )
+        self._usages.spreads.append(fragment_spread)
+
+    def _enter_inline_fragment(
+        self, inline_fragment: "InlineFragmentNode", stack: "_Stack"
+    ) -> None:
+        ctx = self.ctx
+        stack.append(
+            (
+                self._leave_inline_fragment,
+                (inline_fragment, ctx.parent_type_name),
+            )
+        )
+        if inline_fragment.type_condition is not None:
+            ctx.parent_type_name = inline_fragment.type_condition.name.value
+
+        self._push_selection_set(inline_fragment.selection_set, stack)
+        self._push_directives(inline_fragment, stack)
+
+    def _leave_inline_fragment(
+        self,
+        visited: Tuple["InlineFragmentNode", Optional[str]],
+        _stack: "_Stack",
+    ) -> None:
+        inline_fragment, parent_type_name = visited
+        self._run_rules("InlineFragment", inline_fragment)
+
+        ctx = self.ctx
+        ctx.inlined_in.setdefault(ctx.parent_type_name, []).append(
+            inline_fragment
+        )
+        ctx.parent_type_name = parent_type_name
+
+    # Definitions
+
+    def _enter_definition(
+        self, definition: "DefinitionNode", stack: "_Stack"
+    ) -> None:
+        ctx = self.ctx
+        ctx.path = None
+        if isinstance(definition, OperationDefinitionNode):
+            self._enter_operation_definition(definition, stack)
+        elif isinstance(definition, FragmentDefinitionNode):
+            self._enter_fragment_definition(definition, stack)
+
+    def _enter_operation_definition(
+        self, operation: "OperationDefinitionNode", stack: "_Stack"
+    ) -> None:
+        ctx = self.ctx
+        ctx.parent_type_name = getattr(
+            self.schema, f"{operation.operation_type.lower()}_operation_name"
+        )
+        self._usages = ctx.per_operation.setdefault(
+            operation.name.value if operation.name else "None",
+            DefinitionUsages(),
+        )
+
+        stack.append((self._leave_operation_definition, operation))
+        self._push_selection_set(operation.selection_set, stack)
+        self._push_directives(operation, stack)
+        if operation.variable_definitions:
+            self._in_variable_definitions = True
+            stack.append((self._leave_variable_definitions, operation))
+            for variable_definition in reversed(
+                operation.variable_definitions
+            ):
+                stack.append(
+                    (self._leave_variable_definition, variable_definition)
+                )
+                stack.append(
+                    (self._enter_value, variable_definition.default_value)
+                )
+
+    def _leave_variable_definition(
+        self, variable_definition: "VariableDefinitionNode", _stack: "_Stack"
+    ) -> None:
+        self._run_rules("VariableDefinition", variable_definition)
+
+    def _leave_variable_definitions(
+        self, operation: "OperationDefinitionNode", _stack: "_Stack"
+    ) -> None:
+        self._in_variable_definitions = False
+        self._run_rules("VariableDefinitions", operation)
+
+    def _leave_operation_definition(
+        self, operation: "OperationDefinitionNode", _stack: "_Stack"
+    ) -> None:
+        self._run_rules("OperationDefinition", operation)
+
+    def _enter_fragment_definition(
+        self, fragment: "FragmentDefinitionNode", stack: "_Stack"
+    ) -> None:
+        ctx = self.ctx
+        ctx.parent_type_name = fragment.type_condition.name.value
+        self._usages = ctx.per_fragment.setdefault(
+            fragment.name.value, DefinitionUsages()
+        )
+
+        stack.append((self._leave_fragment_definition, fragment))
+        self._push_selection_set(fragment.selection_set, stack)
+        self._push_directives(fragment, stack)
+
+    def _leave_fragment_definition(
+        self, fragment: "FragmentDefinitionNode", _stack: "_Stack"
+    ) -> None:
+        self._run_rules("FragmentDefinition", fragment)
+
+    def _leave_document(
+        self, document: "DocumentNode", _stack: "_Stack"
+    ) -> None:
+        ctx = self.ctx
+        ctx.path = None
+        ctx.parent_type_name = None
+        self.index.index_fragments(ctx.fragments)
+        self._run_rules("Document", document)
+
+
+def validate_document(
+    document: "DocumentNode",
+    schema: "GraphQLSchema",
+    rules: Optional["ValidationRules"] = None,
+) -> List["TartifletteError"]:
+    """
+    Validates a DocumentNode against a schema, independently of the way it
+    has been built, and attaches the validators (holding the errors) to it.
+    :param document: the DocumentNode to validate
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param rules: the compiled validation rules (the ones of the engine
+    linked to the schema when not provided)
+    :type document: DocumentNode
+    :type schema: GraphQLSchema
+    :type rules: Optional[ValidationRules]
+    :return: the validation errors
+    :rtype: List[TartifletteError]
+    """
+    validators = Validators(
+        schema, rules or getattr(schema, "validation_rules", None)
+    )
+    document.validators = validators
+    return validators.validate(document)
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Optional
+
+__all__ = ("DefinitionUsages", "ValidationContext")
+
+
+class DefinitionUsages:
+    """
+    Fragment spreads, variables & arguments using variables found in an
+    operation or a fragment definition.
+    """
+
+    __slots__ = ("spreads", "used_variables", "arguments_using_variables")
+
+    def __init__(self) -> None:
+        self.spreads: List["FragmentSpreadNode"] = []
+        self.used_variables: List["VariableNode"] = []
+        self.arguments_using_variables: List[Dict[str, Any]] = []
+
+
+class ValidationContext:
+    """
+    State of the validation of a document given to the validation rules
+    along with the node to validate: the schema, the indexes of the
+    document, the path & parent type of the node being visited and what has
+    been collected on the document so far.
+    """
+
+    __slots__ = (
+        "schema",
+        "index",
+        "path",
+        "parent_type_name",
+        "operations",
+        "fragments",
+        "fragment_spreads",
+        "spreaded_in",
+        "inlined_in",
+        "per_operation",
+        "per_fragment",
+    )
+
+    def __init__(self, schema: "GraphQLSchema") -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        """
+        self.schema = schema
+        self.index: Optional["ValidationIndex"] = None
+        self.path: Optional["Path"] = None
+        self.parent_type_name: Optional[str] = None
+        self.operations: List["OperationDefinitionNode"] = []
+        self.fragments: List["FragmentDefinitionNode"] = []
+        self.fragment_spreads: List["FragmentSpreadNode"] = []
+        self.spreaded_in: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self.inlined_in: Dict[Optional[str], List["InlineFragmentNode"]] = {}
+        self.per_operation: Dict[str, "DefinitionUsages"] = {}
+        self.per_fragment: Dict[str, "DefinitionUsages"] = {}
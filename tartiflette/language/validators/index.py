@@ -0,0 +1,249 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from tartiflette.types.helpers.reduce_type import reduce_type
+
+__all__ = ("ValidationIndex",)
+
+
+class ValidationIndex:
+    """
+    Indexes of a document shared by the query validation rules, so that
+    they don't scan the document nor the schema over & over: fragments by
+    name, the spread graph, the variable usages of each operation (including
+    the ones of the fragments it spreads) and the fields by parent type &
+    name. Indexes are built lazily, at most once per document.
+    """
+
+    __slots__ = (
+        "schema",
+        "ctx",
+        "_fragments",
+        "_spread_fragment_names",
+        "_operation_fragment_names",
+        "_fields",
+    )
+
+    def __init__(
+        self, schema: "GraphQLSchema", ctx: "ValidationContext"
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param ctx: the validation context filled while the document is
+        visited
+        :type schema: GraphQLSchema
+        :type ctx: ValidationContext
+        """
+        self.schema = schema
+        self.ctx = ctx
+        self._fragments: Dict[str, "FragmentDefinitionNode"] = {}
+        self._spread_fragment_names: Optional[set] = None
+        self._operation_fragment_names: Dict[str, List[str]] = {}
+        self._fields: Dict[
+            Tuple[Optional[str], str], Optional["GraphQLField"]
+        ] = {}
+
+    def index_fragments(
+        self, fragments: List["FragmentDefinitionNode"]
+    ) -> None:
+        """
+        Indexes the fragment definitions of the document by name, the first
+        definition of a name winning (duplicates being reported by another
+        rule).
+        :param fragments: the fragment definitions of the document
+        :type fragments: List[FragmentDefinitionNode]
+        """
+        for fragment in fragments:
+            self._fragments.setdefault(fragment.name.value, fragment)
+
+    def find_fragment(self, name: str) -> Optional["FragmentDefinitionNode"]:
+        """
+        Returns the fragment definition named `name` if it exists.
+        :param name: the name of the fragment
+        :type name: str
+        :return: the fragment definition if it exists
+        :rtype: Optional[FragmentDefinitionNode]
+        """
+        return self._fragments.get(name)
+
+    def is_fragment_spread(self, name: str) -> bool:
+        """
+        Determines whether or not the fragment named `name` is spread
+        somewhere in the document.
+        :param name: the name of the fragment
+        :type name: str
+        :return: whether or not the fragment is spread
+        :rtype: bool
+        """
+        if self._spread_fragment_names is None:
+            self._spread_fragment_names = {
+                spread.name.value for spread in self.ctx.fragment_spreads
+            }
+        return name in self._spread_fragment_names
+
+    def get_fragment_spreads(self, name: str) -> List["FragmentSpreadNode"]:
+        """
+        Returns the fragment spreads directly contained by the fragment
+        named `name`, which are the edges of the spread graph.
+        :param name: the name of the fragment
+        :type name: str
+        :return: the fragment spreads of the fragment
+        :rtype: List[FragmentSpreadNode]
+        """
+        usages = self.ctx.per_fragment.get(name)
+        return usages.spreads if usages is not None else []
+
+    def get_operation_fragment_names(
+        self, operation: "OperationDefinitionNode"
+    ) -> List[str]:
+        """
+        Returns the names of the known fragments spread by an operation,
+        directly or not. Each fragment appears once, after the fragments it
+        spreads, and cycles are ignored.
+        :param operation: the operation definition
+        :type operation: OperationDefinitionNode
+        :return: the names of the fragments spread by the operation
+        :rtype: List[str]
+        """
+        operation_key = operation.name.value if operation.name else "None"
+        fragment_names = self._operation_fragment_names.get(operation_key)
+        if fragment_names is not None:
+            return fragment_names
+
+        fragment_names = []
+        visited = set()
+        usages = self.ctx.per_operation.get(operation_key)
+        stack = [
+            (spread.name.value, False)
+            for spread in reversed(usages.spreads if usages else [])
+        ]
+        while stack:
+            name, children_visited = stack.pop()
+            if children_visited:
+                fragment_names.append(name)
+                continue
+            if name in visited or name not in self._fragments:
+                continue
+            visited.add(name)
+            stack.append((name, True))
+            stack.extend(
+                (spread.name.value, False)
+                for spread in reversed(self.get_fragment_spreads(name))
+            )
+
+        self._operation_fragment_names[operation_key] = fragment_names
+        return fragment_names
+
+    def _get_operation_usages(
+        self, operation: "OperationDefinitionNode", kind: str
+    ) -> List[Any]:
+        """
+        Returns the usages of a kind recorded for an operation and for the
+        fragments it spreads.
+        :param operation: the operation definition
+        :param kind: the DefinitionUsages attribute holding the usages
+        :type operation: OperationDefinitionNode
+        :type kind: str
+        :return: the usages of the operation
+        :rtype: List[Any]
+        """
+        operation_key = operation.name.value if operation.name else "None"
+        per_fragment = self.ctx.per_fragment
+        operation_usages = self.ctx.per_operation.get(operation_key)
+        usages = list(
+            getattr(operation_usages, kind) if operation_usages else []
+        )
+        for name in self.get_operation_fragment_names(operation):
+            fragment_usages = per_fragment.get(name)
+            if fragment_usages is not None:
+                usages.extend(getattr(fragment_usages, kind))
+        return usages
+
+    def get_used_variables(
+        self, operation: "OperationDefinitionNode"
+    ) -> List["VariableNode"]:
+        """
+        Returns the variables used by an operation and by the fragments it
+        spreads.
+        :param operation: the operation definition
+        :type operation: OperationDefinitionNode
+        :return: the variables used by the operation
+        :rtype: List[VariableNode]
+        """
+        return self._get_operation_usages(operation, "used_variables")
+
+    def get_arguments_using_variables(
+        self, operation: "OperationDefinitionNode"
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the arguments whose value is a variable used by an operation
+        and by the fragments it spreads.
+        :param operation: the operation definition
+        :type operation: OperationDefinitionNode
+        :return: the arguments using variables in the operation
+        :rtype: List[Dict[str, Any]]
+        """
+        return self._get_operation_usages(
+            operation, "arguments_using_variables"
+        )
+
+    def find_field(
+        self, parent_type_name: Optional[str], field_name: str
+    ) -> Optional["GraphQLField"]:
+        """
+        Returns the schema field named `field_name` of the type named
+        `parent_type_name` if it exists.
+        :param parent_type_name: the name of the parent type
+        :param field_name: the name of the field
+        :type parent_type_name: Optional[str]
+        :type field_name: str
+        :return: the schema field if it exists
+        :rtype: Optional[GraphQLField]
+        """
+        key = (parent_type_name, field_name)
+        try:
+            return self._fields[key]
+        except KeyError:
+            pass
+
+        try:
+            field = self.schema.type_definitions[parent_type_name].find_field(
+                field_name
+            )
+        except (AttributeError, KeyError):
+            field = None
+        self._fields[key] = field
+        return field
+
+    def get_field_type_name(
+        self, parent_type_name: Optional[str], field_name: str
+    ) -> Optional[str]:
+        """
+        Returns the name of the reduced type (completely unwrapped) of a
+        schema field if it exists.
+        :param parent_type_name: the name of the parent type
+        :param field_name: the name of the field
+        :type parent_type_name: Optional[str]
+        :type field_name: str
+        :return: the name of the reduced type of the field if it exists
+        :rtype: Optional[str]
+        """
+        field = self.find_field(parent_type_name, field_name)
+        return reduce_type(field.gql_type) if field is not None else None
+
+    def find_field_reduced_type(
+        self, parent_type_name: Optional[str], field_name: str
+    ) -> Optional["GraphQLType"]:
+        """
+        Returns the reduced type (completely unwrapped) of a schema field if
+        it exists.
+        :param parent_type_name: the name of the parent type
+        :param field_name: the name of the field
+        :type parent_type_name: Optional[str]
+        :type field_name: str
+        :return: the reduced type of the field if it exists
+        :rtype: Optional[GraphQLType]
+        """
+        type_name = self.get_field_type_name(parent_type_name, field_name)
+        if type_name is None:
+            return None
+        return self.schema.type_definitions[type_name]
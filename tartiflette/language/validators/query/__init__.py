@@ -23,41 +23,44 @@ from .input_object_field_uniqueness import InputObjectFieldUniqueness
 from .leaf_field_selections import LeafFieldSelections
 from .lone_anonymous_operation import LoneAnonymousOperation
 from .operation_name_uniqueness import OperationNameUniqueness
+from .overlapping_fields_can_be_merged import OverlappingFieldsCanBeMerged
 from .required_arguments import RequiredArguments
 from .single_root_field import SingleRootField
 from .values_of_correct_type import ValuesOfCorrectType
 from .variable_uniqueness import VariableUniqueness
 from .variables_are_input_types import VariablesAreInputTypes
 
-# TODO make this automatically via reflection
+# Rules are run in this order on a same node (and on the document, once it
+# has been visited)
 
 RULE_SET = {
-    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
-    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
-    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
-    ArgumentNames.RULE_NAME: ArgumentNames(),
-    ArgumentUniqueness.RULE_NAME: ArgumentUniqueness(),
-    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
     DirectivesAreInValidLocations.RULE_NAME: DirectivesAreInValidLocations(),
-    DirectivesAreUniquePerLocation.RULE_NAME: DirectivesAreUniquePerLocation(),
-    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
     FieldSelectionsOnObjectsInterfacesAndUnionsTypes.RULE_NAME: FieldSelectionsOnObjectsInterfacesAndUnionsTypes(),
-    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
-    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
+    ArgumentNames.RULE_NAME: ArgumentNames(),
+    RequiredArguments.RULE_NAME: RequiredArguments(),
+    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
+    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
     FragmentsOnCompositeTypes.RULE_NAME: FragmentsOnCompositeTypes(),
-    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
+    ArgumentUniqueness.RULE_NAME: ArgumentUniqueness(),
+    DirectivesAreUniquePerLocation.RULE_NAME: DirectivesAreUniquePerLocation(),
+    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
+    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
+    VariableUniqueness.RULE_NAME: VariableUniqueness(),
     FragmentSpreadsMustNotFormCycles.RULE_NAME: FragmentSpreadsMustNotFormCycles(
         True
     ),
-    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
-    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
-    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
-    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
     LoneAnonymousOperation.RULE_NAME: LoneAnonymousOperation(),
-    RequiredArguments.RULE_NAME: RequiredArguments(),
     SingleRootField.RULE_NAME: SingleRootField(),
-    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
-    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
-    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
-    VariableUniqueness.RULE_NAME: VariableUniqueness(),
+    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
+    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
+    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
+    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
+    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
+    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
+    OverlappingFieldsCanBeMerged.RULE_NAME: OverlappingFieldsCanBeMerged(),
+    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
 }
@@ -6,69 +6,25 @@ from tartiflette.language.ast import (
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_field_by_name
 from tartiflette.types.list import GraphQLList
 from tartiflette.types.non_null import GraphQLNonNull
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
-def _find_args_using_var_in_spread(spreads, per_fragment, args_using_var=None):
-    if not args_using_var:
-        args_using_var = []
-
-    for spread in spreads:
-        args_using_var = _find_args_using_var_in_spread(
-            per_fragment.get(spread.name.value, {}).get("spreads", []),
-            per_fragment,
-            args_using_var,
-        )
-        args_using_var.extend(
-            per_fragment.get(spread.name.value, {}).get("args_using_var", [])
-        )
-
-    return args_using_var
-
-
-def _get_args_using_var(operation, per_operation, per_fragment):
-    operation_key = operation.name.value if operation.name else "None"
-
-    args_using_var = per_operation.get(operation_key, {}).get(
-        "args_using_var", []
-    )
-
-    args_using_var.extend(
-        _find_args_using_var_in_spread(
-            per_operation.get(operation_key, {}).get("spreads", []),
-            per_fragment,
-        )
-    )
-    return args_using_var
-
-
-def _find_schema_object(arg_info, schema):
+def _find_schema_object(arg_info, schema, index):
     if arg_info["is_directive"]:
         if not schema.has_directive(arg_info["node_location"]):
             return None
         return schema.find_directive(arg_info["node_location"])
-    return find_field_by_name(arg_info["node_location"], schema)
+    return index.find_field(*arg_info["node_location"])
 
 
-def _find_schema_argument(used_arg, schema):
-    schema_object = _find_schema_object(used_arg, schema)
+def _find_schema_argument(used_arg, schema, index):
+    schema_object = _find_schema_object(used_arg, schema, index)
     if not schema_object:  # handled by another validator
         return None
 
-    for arg_name, arg in schema_object.arguments.items():
-        if used_arg["arg"].name.value == arg_name:
-            return arg
-    return None
-
-
-def _find_variable_by_name(variables, name):
-    for variable in variables:
-        if variable.variable.name.value == name:
-            return variable
-    return None
+    return schema_object.arguments.get(used_arg["arg"].name.value)
 
 
 def _validate_type_compatibility(var_type, schema_type):
@@ -125,19 +81,17 @@ class AllVariableUsagesAreAllowed(June2018ReleaseValidationRule):
     RULE_NAME = "all-variable-usages-are-allowed"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-All-Variable-Usages-are-Allowed"
     RULE_NUMBER = "5.8.5"
+    NODE_KINDS = ("Document",)
 
-    def _validate_operation(
-        self, operation, per_operation, per_fragment, schema
-    ):
+    def _validate_operation(self, operation, index, schema):
         errors = []
-        for used_arg in _get_args_using_var(
-            operation, per_operation, per_fragment
-        ):
-            schema_argument = _find_schema_argument(used_arg, schema)
-            variable_used = _find_variable_by_name(
-                operation.variable_definitions,
-                used_arg["arg"].value.name.value,
-            )
+        variables = {}
+        for variable in operation.variable_definitions:
+            variables.setdefault(variable.variable.name.value, variable)
+
+        for used_arg in index.get_arguments_using_variables(operation):
+            schema_argument = _find_schema_argument(used_arg, schema, index)
+            variable_used = variables.get(used_arg["arg"].value.name.value)
 
             if not schema_argument or not variable_used:
                 continue  # Handled by another validators
@@ -154,31 +108,15 @@ class AllVariableUsagesAreAllowed(June2018ReleaseValidationRule):
 
         return errors
 
-    def validate(
-        self,
-        schema,
-        operations=None,
-        per_operation=None,
-        per_fragment=None,
-        **_,
-    ):
-
+    def validate(self, node, ctx):
         errors = []
 
-        if not operations:
+        if not ctx.operations:
             return []  # No operation
 
-        if not per_operation:
-            per_operation = {}
-
-        if not per_fragment:
-            per_fragment = {}
-
-        for operation in operations:
+        for operation in ctx.operations:
             errors.extend(
-                self._validate_operation(
-                    operation, per_operation, per_fragment, schema
-                )
+                self._validate_operation(operation, ctx.index, ctx.schema)
             )
 
         return errors
@@ -1,11 +1,7 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import (
-    find_nodes_by_name,
-    get_defined_vars,
-    get_used_vars,
-)
+from tartiflette.language.validators.query.utils import get_defined_vars
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -18,12 +14,14 @@ def _get_message(operation, varname):
     return f"Unused Varibable < {varname} > in {operation_message}."
 
 
-def _validate_operation(operation, per_operation, per_fragment):
+def _validate_operation(operation, index):
     error_per_var = {}
-    used_vars = get_used_vars(operation, per_operation, per_fragment)
+    used_var_names = {
+        a_var.name.value for a_var in index.get_used_variables(operation)
+    }
 
     for a_var in get_defined_vars(operation):
-        if not find_nodes_by_name(used_vars, a_var.name.value):
+        if a_var.name.value not in used_var_names:
             error_per_var.setdefault(a_var.name.value, []).append(a_var)
 
     return error_per_var
@@ -40,23 +38,15 @@ class AllVariablesUsed(June2018ReleaseValidationRule):
     RULE_NAME = "all-variables-used"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-All-Variables-Used"
     RULE_NUMBER = "5.8.4"
+    NODE_KINDS = ("Document",)
 
-    def validate(
-        self, operations=None, per_operation=None, per_fragment=None, **_
-    ):
-
+    def validate(self, node, ctx):
         errors = []
 
-        if not operations:
+        if not ctx.operations:
             return []  # No operation
 
-        if not per_operation:
-            per_operation = {}
-
-        if not per_fragment:
-            per_fragment = {}
-
-        for operation in operations:
+        for operation in ctx.operations:
             errors.extend(
                 [
                     graphql_error_from_nodes(
@@ -66,7 +56,7 @@ class AllVariablesUsed(June2018ReleaseValidationRule):
                         extensions=self._extensions,
                     )
                     for k, v in _validate_operation(
-                        operation, per_operation, per_fragment
+                        operation, ctx.index
                     ).items()
                 ]
             )
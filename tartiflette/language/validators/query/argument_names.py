@@ -2,7 +2,6 @@ from tartiflette.language.ast import DirectiveNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_field
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -19,6 +18,7 @@ class ArgumentNames(June2018ReleaseValidationRule):
         "https://graphql.github.io/graphql-spec/June2018/#sec-Argument-Names"
     )
     RULE_NUMBER = "5.4.1"
+    NODE_KINDS = ("Field", "Directive")
 
     def _validate_directive_arguments(self, query_node, path, schema):
         errors = []
@@ -41,12 +41,12 @@ class ArgumentNames(June2018ReleaseValidationRule):
         return errors
 
     def _validate_field_arguments(
-        self, query_field, path, schema, parent_type_name
+        self, query_field, path, index, parent_type_name
     ):
         errors = []
 
-        schema_field = find_field(
-            parent_type_name, query_field.name.value, schema
+        schema_field = index.find_field(
+            parent_type_name, query_field.name.value
         )
 
         if not schema_field:
@@ -65,9 +65,11 @@ class ArgumentNames(June2018ReleaseValidationRule):
 
         return errors
 
-    def validate(self, node, path, schema, parent_type_name=None, **__):
+    def validate(self, node, ctx):
         if isinstance(node, DirectiveNode):
-            return self._validate_directive_arguments(node, path, schema)
+            return self._validate_directive_arguments(
+                node, ctx.path, ctx.schema
+            )
         return self._validate_field_arguments(
-            node, path, schema, parent_type_name
+            node, ctx.path, ctx.index, ctx.parent_type_name
         )
@@ -16,8 +16,11 @@ class ArgumentUniqueness(June2018ReleaseValidationRule):
     RULE_NAME = "argument-uniqueness"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Argument-Uniqueness"
     RULE_NUMBER = "5.4.2"
+    NODE_KINDS = ("Arguments",)
 
-    def validate(self, arguments, path, **__):
+    def validate(self, node, ctx):
+        arguments = node.arguments
+        path = ctx.path
         errors = []
         already_tested = []
 
@@ -14,14 +14,15 @@ class DirectivesAreDefined(June2018ReleaseValidationRule):
     RULE_NAME = "directives-are-defined"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-Defined"
     RULE_NUMBER = "5.7.1"
+    NODE_KINDS = ("Directive",)
 
-    def validate(self, directive, schema, path, **_):
-        if not schema.has_directive(directive.name.value):
+    def validate(self, node, ctx):
+        if not ctx.schema.has_directive(node.name.value):
             return [
                 graphql_error_from_nodes(
-                    message=f"Unknow Directive < @{directive.name.value} >.",
-                    nodes=directive,
-                    path=path,
+                    message=f"Unknow Directive < @{node.name.value} >.",
+                    nodes=node,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             ]
@@ -32,9 +32,17 @@ class DirectivesAreInValidLocations(June2018ReleaseValidationRule):
     RULE_NAME = "directives-are-in-valid-locations"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-In-Valid-Locations"
     RULE_NUMBER = "5.7.2"
+    NODE_KINDS = (
+        "OperationDefinition",
+        "FragmentDefinition",
+        "Field",
+        "FragmentSpread",
+        "InlineFragment",
+    )
 
-    def validate(self, node, path, schema, **_):
+    def validate(self, node, ctx):
         errors = []
+        schema = ctx.schema
 
         node_type = type(node)
         if isinstance(node, OperationDefinitionNode):
@@ -53,7 +61,7 @@ class DirectivesAreInValidLocations(June2018ReleaseValidationRule):
                     graphql_error_from_nodes(
                         message=f"Directive < @{directive.name.value} > is not used in a valid location.",
                         nodes=[node, directive],
-                        path=path,
+                        path=ctx.path,
                         extensions=self._extensions,
                     )
                 )
@@ -15,8 +15,10 @@ class DirectivesAreUniquePerLocation(June2018ReleaseValidationRule):
     RULE_NAME = "directives-are-unique-per-location"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-Unique-Per-Location"
     RULE_NUMBER = "5.7.3"
+    NODE_KINDS = ("Directives",)
 
-    def validate(self, directives, path, **_):
+    def validate(self, node, ctx):
+        directives = node.directives
         errors = []
         already_tested = []
 
@@ -32,7 +34,7 @@ class DirectivesAreUniquePerLocation(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple directives named < {directive.name.value} > in the same location.",
-                        path=path,
+                        path=ctx.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -17,18 +17,19 @@ class ExecutableDefinition(June2018ReleaseValidationRule):
     RULE_NAME = "executable-definitions"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Executable-Definitions"
     RULE_NUMBER = "5.1.1"
+    NODE_KINDS = ("Document",)
 
-    def validate(self, definitions, path, **__):
+    def validate(self, node, ctx):
         bad_nodes = [
             x
-            for x in definitions
+            for x in node.definitions
             if not isinstance(x, ExecutableDefinitionNode)
         ]
         if bad_nodes:
             return [
                 graphql_error_from_nodes(
                     message="Theses definitions are not executable.",
-                    path=path,
+                    path=ctx.path,
                     nodes=bad_nodes,
                     extensions=self._extensions,
                 )
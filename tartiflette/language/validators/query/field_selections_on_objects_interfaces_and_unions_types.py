@@ -1,7 +1,6 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_field_reduced_type
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -18,10 +17,13 @@ class FieldSelectionsOnObjectsInterfacesAndUnionsTypes(
     RULE_NAME = "field-selections-on-objects-interfaces-and-unions-types"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selections-on-Objects-Interfaces-and-Unions-Types"
     RULE_NUMBER = "5.3.1"
+    NODE_KINDS = ("Field",)
 
-    def validate(self, path, schema, field, parent_type_name, **__):
-        graphql_type = find_field_reduced_type(
-            parent_type_name, field.name.value, schema
+    def validate(self, node, ctx):
+        field = node
+        parent_type_name = ctx.parent_type_name
+        graphql_type = ctx.index.find_field_reduced_type(
+            parent_type_name, field.name.value
         )
 
         if field.name.value.startswith("__"):
@@ -32,7 +34,7 @@ class FieldSelectionsOnObjectsInterfacesAndUnionsTypes(
                 graphql_error_from_nodes(
                     message=f"Field {field.name.value} doesn't exist on {parent_type_name or 'Root'}",
                     nodes=field,
-                    path=path,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             ]
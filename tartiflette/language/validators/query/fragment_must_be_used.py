@@ -1,7 +1,6 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -15,20 +14,18 @@ class FragmentMustBeUsed(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-must-be-used"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragments-Must-Be-Used"
     RULE_NUMBER = "5.5.1.4"
+    NODE_KINDS = ("Document",)
 
-    def validate(self, path, fragments, fragment_spreads=None, **__):
+    def validate(self, node, ctx):
         errors = []
 
-        if not fragment_spreads:
-            fragment_spreads = []
-
-        for fragment in fragments:
-            if not find_nodes_by_name(fragment_spreads, fragment.name.value):
+        for fragment in ctx.fragments:
+            if not ctx.index.is_fragment_spread(fragment.name.value):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Fragment < {fragment.name.value} > is never used.",
                         nodes=fragment,
-                        path=path,
+                        path=ctx.path,
                         extensions=self._extensions,
                     )
                 )
@@ -16,9 +16,11 @@ class FragmentNameUniqueness(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-name-uniqueness"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-Name-Uniqueness"
     RULE_NUMBER = "5.5.1.1"
+    NODE_KINDS = ("Document",)
 
-    def validate(self, path, fragments, **__):
+    def validate(self, node, ctx):
         errors = []
+        fragments = ctx.fragments
         already_tested = []
 
         for fragment in fragments:
@@ -31,7 +33,7 @@ class FragmentNameUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple fragments named < {fragment.name.value} >.",
-                        path=path,
+                        path=ctx.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
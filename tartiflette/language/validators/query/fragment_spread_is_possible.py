@@ -1,17 +1,16 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.types.type import GraphQLCompositeType
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
-def _get_spreaded_fragment(fragments, spreads):
+def _get_spreaded_fragment(index, spreads):
     spreaded_fragments = []
     for spread in spreads:
-        nodes = find_nodes_by_name(fragments, spread["spread"].name.value)
-        if nodes:
-            spreaded_fragments.append(nodes[0])
+        fragment = index.find_fragment(spread["spread"].name.value)
+        if fragment is not None:
+            spreaded_fragments.append(fragment)
     return spreaded_fragments
 
 
@@ -44,6 +43,7 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-spread-is-possible"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-spread-is-possible"
     RULE_NUMBER = "5.5.2.3"
+    NODE_KINDS = ("Document",)
 
     def _validate_is_possible(
         self, type_name, nodes, message, path, schema, locations=None
@@ -94,11 +94,11 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
 
         return errors
 
-    def _validate_spreads(self, fragments, spreaded_in, path, schema):
+    def _validate_spreads(self, index, spreaded_in, path, schema):
         errors = []
 
         for type_name, spreads in spreaded_in.items():
-            spreaded_fragments = _get_spreaded_fragment(fragments, spreads)
+            spreaded_fragments = _get_spreaded_fragment(index, spreads)
             errors.extend(
                 self._validate_is_possible(
                     type_name=type_name,
@@ -112,15 +112,9 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
 
         return errors
 
-    def validate(
-        self, path, schema, fragments, inlined_in=None, spreaded_in=None, **__
-    ):
-        if not inlined_in:
-            inlined_in = {}
-
-        if not spreaded_in:
-            spreaded_in = {}
-
+    def validate(self, node, ctx):
         return self._validate_inlines(
-            inlined_in, path, schema
-        ) + self._validate_spreads(fragments, spreaded_in, path, schema)
+            ctx.inlined_in, ctx.path, ctx.schema
+        ) + self._validate_spreads(
+            ctx.index, ctx.spreaded_in, ctx.path, ctx.schema
+        )
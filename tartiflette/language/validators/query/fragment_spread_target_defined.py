@@ -1,7 +1,6 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -17,6 +16,7 @@ class FragmentSpreadTargetDefined(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-spread-target-defined"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-spread-target-defined"
     RULE_NUMBER = "5.5.2.1"
+    NODE_KINDS = ("Document",)
 
     def _to_errors(self, erronous_speads, path):
         errors = []
@@ -31,16 +31,13 @@ class FragmentSpreadTargetDefined(June2018ReleaseValidationRule):
             )
         return errors
 
-    def validate(self, path, fragments, fragment_spreads=None, **__):
+    def validate(self, node, ctx):
         erronous_speads = {}
 
-        if not fragment_spreads:
-            fragment_spreads = []
-
-        for spread in fragment_spreads:
-            if not find_nodes_by_name(fragments, spread.name.value):
+        for spread in ctx.fragment_spreads:
+            if ctx.index.find_fragment(spread.name.value) is None:
                 erronous_speads.setdefault(spread.name.value, []).append(
                     spread
                 )
 
-        return self._to_errors(erronous_speads, path)
+        return self._to_errors(erronous_speads, ctx.path)
@@ -15,18 +15,20 @@ class FragmentSpreadTypeExistence(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-spread-type-existence"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-Spread-Type-Existence"
     RULE_NUMBER = "5.5.1.2"
+    NODE_KINDS = ("FragmentDefinition", "InlineFragment")
 
-    def validate(self, path, schema, fragment, **__):
+    def validate(self, node, ctx):
         errors = []
+        fragment = node
 
-        if fragment.type_condition and not schema.has_type(
+        if fragment.type_condition and not ctx.schema.has_type(
             fragment.type_condition.name.value
         ):
             errors.append(
                 graphql_error_from_nodes(
                     message=f"Unknown type {fragment.type_condition.name.value}.",
                     nodes=fragment,
-                    path=path,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             )
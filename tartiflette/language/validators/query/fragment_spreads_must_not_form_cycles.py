@@ -1,24 +1,9 @@
-from tartiflette.language.ast import FragmentSpreadNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
-class CycleException(Exception):
-    def __init__(self, fragments, extensions):
-        super().__init__()
-        self.tartiflette_errors = [
-            graphql_error_from_nodes(
-                message="Fragment Cylcle Detected",
-                path=None,
-                nodes=fragments,
-                extensions=extensions,
-            )
-        ]
-
-
 class FragmentSpreadsMustNotFormCycles(June2018ReleaseValidationRule):
     """
     This validator validates that a Fragment doesnt spread itself.
@@ -32,30 +17,47 @@ class FragmentSpreadsMustNotFormCycles(June2018ReleaseValidationRule):
     RULE_NAME = "fragment-spreads-must-not-form-cycles"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-spreads-must-not-form-cycles"
     RULE_NUMBER = "5.5.2.2"
+    NODE_KINDS = ("Document",)
+
+    @staticmethod
+    def _has_cycle(index, fragment, walked):
+        # Depth first walk of the spread graph: a spread targeting a fragment
+        # currently being walked closes a cycle. Fragments entirely walked
+        # without cycle are remembered so that they're walked only once.
+        stack = [(fragment.name.value, False)]
+        in_progress = set()
+        while stack:
+            name, children_walked = stack.pop()
+            if children_walked:
+                in_progress.discard(name)
+                walked.add(name)
+                continue
+
+            if name in in_progress:
+                return True
+            if name in walked or index.find_fragment(name) is None:
+                continue  # Unknown fragments are handled by another validator
+
+            in_progress.add(name)
+            stack.append((name, True))
+            stack.extend(
+                (spread.name.value, False)
+                for spread in reversed(index.get_fragment_spreads(name))
+            )
+        return False
 
-    def _validate_fragment(self, fragments, fragment, spreaded):
-        for selected in fragment.selection_set.selections:
-            if isinstance(selected, FragmentSpreadNode):
-                if selected.name.value not in spreaded:
-                    spreaded.append(selected.name.value)
-
-                    fragment = find_nodes_by_name(
-                        fragments, selected.name.value
-                    )
-                    if not fragment:
-                        continue  # Handled by another validator
-                    fragment = fragment[0]
-
-                    self._validate_fragment(fragments, fragment, spreaded)
-                else:
-                    raise CycleException(fragments, self._extensions)
-        return
-
-    def validate(self, fragments, **_):
+    def validate(self, node, ctx):
+        fragments = ctx.fragments
+        walked = set()
         for fragment in fragments:
-            try:
-                self._validate_fragment(fragments, fragment, [])
-            except CycleException as e:
-                return e.tartiflette_errors
+            if self._has_cycle(ctx.index, fragment, walked):
+                return [
+                    graphql_error_from_nodes(
+                        message="Fragment Cylcle Detected",
+                        path=None,
+                        nodes=fragments,
+                        extensions=self._extensions,
+                    )
+                ]
 
         return []
@@ -17,9 +17,12 @@ class FragmentsOnCompositeTypes(June2018ReleaseValidationRule):
     RULE_NAME = "fragments-on-composite-types"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragments-On-Composite-Types"
     RULE_NUMBER = "5.5.1.3"
+    NODE_KINDS = ("FragmentDefinition", "InlineFragment")
 
-    def validate(self, path, schema, fragment, **__):
+    def validate(self, node, ctx):
         errors = []
+        schema = ctx.schema
+        fragment = node
         if (
             fragment.type_condition
             and schema.has_type(fragment.type_condition.name.value)
@@ -37,7 +40,7 @@ class FragmentsOnCompositeTypes(June2018ReleaseValidationRule):
                 graphql_error_from_nodes(
                     message=f"{message} cannot condition on non composite type {fragment.type_condition.name.value}.",
                     nodes=fragment,
-                    path=path,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             )
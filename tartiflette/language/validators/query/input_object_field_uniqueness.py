@@ -17,8 +17,10 @@ class InputObjectFieldUniqueness(June2018ReleaseValidationRule):
     RULE_NAME = "input-object-field-uniqueness"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Input-Object-Field-Uniqueness"
     RULE_NUMBER = "5.6.3"
+    NODE_KINDS = ("ObjectValue",)
 
-    def validate(self, path, input_fields, **__):
+    def validate(self, node, ctx):
+        input_fields = node.fields
         errors = []
         already_tested = []
 
@@ -34,7 +36,7 @@ class InputObjectFieldUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple Input Field named < {ifield.name.value} >.",
-                        path=path,
+                        path=ctx.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -1,7 +1,6 @@
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_field_reduced_type
 from tartiflette.types.type import GraphQLCompositeType
 from tartiflette.utils.errors import graphql_error_from_nodes
 
@@ -17,10 +16,12 @@ class LeafFieldSelections(June2018ReleaseValidationRule):
     RULE_NAME = "leaf-field-selections"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Leaf-Field-Selections"
     RULE_NUMBER = "5.3.3"
+    NODE_KINDS = ("Field",)
 
-    def validate(self, path, schema, field, parent_type_name, **__):
-        rtype = find_field_reduced_type(
-            parent_type_name, field.name.value, schema
+    def validate(self, node, ctx):
+        field = node
+        rtype = ctx.index.find_field_reduced_type(
+            ctx.parent_type_name, field.name.value
         )
 
         if not rtype:
@@ -36,7 +37,7 @@ class LeafFieldSelections(June2018ReleaseValidationRule):
                 graphql_error_from_nodes(
                     message=f"Field {field.name.value} of type {rtype.name} must have a selection of subfields.",
                     nodes=field,
-                    path=path,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             ]
@@ -46,7 +47,7 @@ class LeafFieldSelections(June2018ReleaseValidationRule):
                 graphql_error_from_nodes(
                     message=f"Field {field.name.value} must not have a selection since type {rtype.name} has no subfields.",
                     nodes=field,
-                    path=path,
+                    path=ctx.path,
                     extensions=self._extensions,
                 )
             ]
@@ -15,10 +15,12 @@ class LoneAnonymousOperation(June2018ReleaseValidationRule):
     RULE_NAME = "lone-anonymous-operation"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Lone-Anonymous-Operation"
     RULE_NUMBER = "5.2.2.1"
+    NODE_KINDS = ("Document",)
 
-    def validate(self, path, operations, **__):
+    def validate(self, node, ctx):
         bad_nodes = []
         errors = []
+        operations = ctx.operations
 
         if len(operations) > 1:
             for operation in operations:
@@ -29,7 +31,7 @@ class LoneAnonymousOperation(June2018ReleaseValidationRule):
             errors.append(
                 graphql_error_from_nodes(
                     message="Anonymous operation must be the only defined operation.",
-                    path=path,
+                    path=ctx.path,
                     nodes=bad_nodes,
                     extensions=self._extensions,
                 )
@@ -15,9 +15,11 @@ class OperationNameUniqueness(June2018ReleaseValidationRule):
     RULE_NAME = "operation-name-uniqueness"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Operation-Name-Uniqueness"
     RULE_NUMBER = "5.2.1.1"
+    NODE_KINDS = ("Document",)
 
-    def validate(self, path, operations, **__):
+    def validate(self, node, ctx):
         errors = []
+        operations = ctx.operations
         already_tested = []
 
         for operation in operations:
@@ -32,7 +34,7 @@ class OperationNameUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple operations named < {operation.name.value} >.",
-                        path=path,
+                        path=ctx.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -0,0 +1,873 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    NullValueNode,
+    ObjectValueNode,
+    VariableNode,
+)
+from tartiflette.language.validators.query.rule import (
+    June2018ReleaseValidationRule,
+)
+from tartiflette.types.helpers.reduce_type import reduce_type
+from tartiflette.types.type import GraphQLCompositeType
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+# A field of a selection set: its parent type, its node & its definition
+_Field = Tuple[Optional["GraphQLType"], "FieldNode", Optional["GraphQLField"]]
+
+# Fields of a selection set grouped by response name & the names of the
+# fragments it spreads
+_FieldsAndFragmentNames = Tuple[Dict[str, List[_Field]], List[str]]
+
+# The response name & the reason of a conflict (a message or the list of
+# the conflicts of the subfields) & the nodes involved on each side
+_Conflict = Tuple[Tuple[str, Any], List["FieldNode"], List["FieldNode"]]
+
+
+def _value_key(value: "ValueNode") -> Tuple:
+    """
+    Computes a hashable key identifying a value regardless of its location,
+    so that two arguments can be compared.
+    :param value: the value node to identify
+    :type value: ValueNode
+    :return: a key identifying the value
+    :rtype: Tuple
+    """
+    if isinstance(value, VariableNode):
+        return ("$", value.name.value)
+    if isinstance(value, ListValueNode):
+        return ("[", tuple(_value_key(item) for item in value.values))
+    if isinstance(value, ObjectValueNode):
+        return (
+            "{",
+            tuple(
+                (field.name.value, _value_key(field.value))
+                for field in value.fields
+            ),
+        )
+    if isinstance(value, NullValueNode):
+        return ("null",)
+    return (value.__class__.__name__, value.value)
+
+
+def _arguments_key(arguments: Optional[List["ArgumentNode"]]) -> frozenset:
+    """
+    Computes a hashable key identifying a list of arguments regardless of
+    their order.
+    :param arguments: the arguments to identify
+    :type arguments: Optional[List[ArgumentNode]]
+    :return: a key identifying the arguments
+    :rtype: frozenset
+    """
+    return frozenset(
+        (argument.name.value, _value_key(argument.value))
+        for argument in arguments or []
+    )
+
+
+def _is_object_type(gql_type: Optional["GraphQLType"]) -> bool:
+    """
+    Determines whether or not a type is an object type.
+    :param gql_type: the type to check
+    :type gql_type: Optional[GraphQLType]
+    :return: whether or not the type is an object type
+    :rtype: bool
+    """
+    return (
+        isinstance(gql_type, GraphQLCompositeType)
+        and not gql_type.is_abstract_type
+    )
+
+
+class _PairSet:
+    """
+    Pairs of keys already compared, remembering whether they were compared
+    as mutually exclusive or not: a comparison of non mutually exclusive
+    pairs covering the mutually exclusive one.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self) -> None:
+        self._data: Dict[Tuple[Any, Any], bool] = {}
+
+    def add(self, key: Tuple[Any, Any], are_mutually_exclusive: bool) -> bool:
+        """
+        Records a pair of keys unless it has already been compared.
+        :param key: the (ordered) pair of keys
+        :param are_mutually_exclusive: whether or not the pair is compared as
+        mutually exclusive
+        :type key: Tuple[Any, Any]
+        :type are_mutually_exclusive: bool
+        :return: whether or not the pair still has to be compared
+        :rtype: bool
+        """
+        compared = self._data.get(key)
+        if compared is not None and (are_mutually_exclusive or not compared):
+            return False
+        self._data[key] = are_mutually_exclusive
+        return True
+
+
+class _ConflictsFinder:
+    """
+    Finds the conflicting fields of a document. Fields & fragment names of
+    each selection set are collected once and the pairs of fragments (and
+    of selection set & fragment) are compared once, which keeps documents
+    spreading the same fragments over & over from taking quadratic time.
+    """
+
+    __slots__ = (
+        "_schema",
+        "_index",
+        "_structure_ids",
+        "_selection_set_structure_ids",
+        "_cached_fields_and_fragment_names",
+        "_compared_fragment_pairs",
+        "_compared_fields_and_fragment_pairs",
+    )
+
+    def __init__(
+        self, schema: "GraphQLSchema", index: "ValidationIndex"
+    ) -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param index: the indexes of the document
+        :type schema: GraphQLSchema
+        :type index: ValidationIndex
+        """
+        self._schema = schema
+        self._index = index
+        self._structure_ids: Dict[Tuple, int] = {}
+        self._selection_set_structure_ids: Dict[int, int] = {}
+        self._cached_fields_and_fragment_names: Dict[
+            int, _FieldsAndFragmentNames
+        ] = {}
+        self._compared_fragment_pairs = _PairSet()
+        self._compared_fields_and_fragment_pairs = _PairSet()
+
+    def _find_type(self, name: str) -> Optional["GraphQLType"]:
+        """
+        Returns the schema type named `name` if it exists.
+        :param name: the name of the type
+        :type name: str
+        :return: the schema type if it exists
+        :rtype: Optional[GraphQLType]
+        """
+        return self._schema.type_definitions.get(name)
+
+    def _selection_key(self, selection: "SelectionNode") -> Tuple:
+        """
+        Computes a hashable key identifying the structure of a selection
+        regardless of its location & of its directives.
+        :param selection: the selection to identify
+        :type selection: SelectionNode
+        :return: a key identifying the structure of the selection
+        :rtype: Tuple
+        """
+        if isinstance(selection, FieldNode):
+            return (
+                selection.alias.value if selection.alias else None,
+                selection.name.value,
+                _arguments_key(selection.arguments),
+                self.structure_id(selection.selection_set)
+                if selection.selection_set
+                else None,
+            )
+        if isinstance(selection, FragmentSpreadNode):
+            return ("...", selection.name.value)
+        return (
+            "on",
+            selection.type_condition.name.value
+            if selection.type_condition
+            else None,
+            self.structure_id(selection.selection_set),
+        )
+
+    def structure_id(self, selection_set: "SelectionSetNode") -> int:
+        """
+        Returns an identifier shared by the selection sets having the same
+        structure, so that duplicated subtrees are only checked once.
+        :param selection_set: the selection set to identify
+        :type selection_set: SelectionSetNode
+        :return: an identifier of the structure of the selection set
+        :rtype: int
+        """
+        structure_id = self._selection_set_structure_ids.get(id(selection_set))
+        if structure_id is None:
+            structure_id = self._structure_ids.setdefault(
+                tuple(
+                    self._selection_key(selection)
+                    for selection in selection_set.selections
+                ),
+                len(self._structure_ids),
+            )
+            self._selection_set_structure_ids[id(selection_set)] = structure_id
+        return structure_id
+
+    def _is_leaf_type(self, name: str) -> bool:
+        """
+        Determines whether or not the type named `name` is a leaf type.
+        :param name: the name of the type
+        :type name: str
+        :return: whether or not the type is a leaf type
+        :rtype: bool
+        """
+        return not isinstance(self._find_type(name), GraphQLCompositeType)
+
+    def _do_types_conflict(self, type1: Any, type2: Any) -> bool:
+        """
+        Determines whether or not two field types can't be merged into the
+        same response: they must have the same shape & the same leaf types.
+        :param type1: the type of the first field
+        :param type2: the type of the second field
+        :type type1: Union[str, GraphQLList, GraphQLNonNull]
+        :type type2: Union[str, GraphQLList, GraphQLNonNull]
+        :return: whether or not the types conflict
+        :rtype: bool
+        """
+        while True:
+            is_list1 = getattr(type1, "is_list_type", False)
+            is_list2 = getattr(type2, "is_list_type", False)
+            is_non_null1 = getattr(type1, "is_non_null_type", False)
+            is_non_null2 = getattr(type2, "is_non_null_type", False)
+            if is_list1 or is_list2:
+                if not (is_list1 and is_list2):
+                    return True
+            elif is_non_null1 or is_non_null2:
+                if not (is_non_null1 and is_non_null2):
+                    return True
+            elif self._is_leaf_type(type1) or self._is_leaf_type(type2):
+                return type1 != type2
+            else:
+                return False
+            type1, type2 = type1.gql_type, type2.gql_type
+
+    def _collect_fields_and_fragment_names(
+        self,
+        parent_type: Optional["GraphQLType"],
+        selection_set: "SelectionSetNode",
+        field_map: Dict[str, List[_Field]],
+        fragment_names: Dict[str, None],
+        collected_fields: set,
+    ) -> None:
+        """
+        Collects the fields of a selection set (including the ones of its
+        inline fragments) & the names of the fragments it spreads. Fields
+        identical to an already collected one are skipped since they can't
+        conflict with each other nor differently with the other fields.
+        :param parent_type: the type of the selection set
+        :param selection_set: the selection set to collect
+        :param field_map: the fields collected by response name
+        :param fragment_names: the names of the spread fragments
+        :param collected_fields: keys of the already collected fields
+        :type parent_type: Optional[GraphQLType]
+        :type selection_set: SelectionSetNode
+        :type field_map: Dict[str, List[_Field]]
+        :type fragment_names: Dict[str, None]
+        :type collected_fields: set
+        """
+        # pylint: disable=too-many-arguments
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                key = (id(parent_type), self._selection_key(selection))
+                if key in collected_fields:
+                    continue
+                collected_fields.add(key)
+
+                field_name = selection.name.value
+
+                try:
+                    field_definition = parent_type.find_field(field_name)
+                except (AttributeError, KeyError):
+                    field_definition = None
+
+                field_map.setdefault(
+                    selection.alias.value if selection.alias else field_name,
+                    [],
+                ).append((parent_type, selection, field_definition))
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_names[selection.name.value] = None
+            elif isinstance(selection, InlineFragmentNode):
+                self._collect_fields_and_fragment_names(
+                    self._find_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type,
+                    selection.selection_set,
+                    field_map,
+                    fragment_names,
+                    collected_fields,
+                )
+
+    def _get_fields_and_fragment_names(
+        self,
+        parent_type: Optional["GraphQLType"],
+        selection_set: "SelectionSetNode",
+    ) -> _FieldsAndFragmentNames:
+        """
+        Returns the fields & fragment names of a selection set, which are
+        only collected once per selection set.
+        :param parent_type: the type of the selection set
+        :param selection_set: the selection set to collect
+        :type parent_type: Optional[GraphQLType]
+        :type selection_set: SelectionSetNode
+        :return: the fields & the fragment names of the selection set
+        :rtype: _FieldsAndFragmentNames
+        """
+        cached = self._cached_fields_and_fragment_names.get(id(selection_set))
+        if cached is None:
+            field_map: Dict[str, List[_Field]] = {}
+            fragment_names: Dict[str, None] = {}
+            self._collect_fields_and_fragment_names(
+                parent_type, selection_set, field_map, fragment_names, set()
+            )
+            cached = (field_map, list(fragment_names))
+            self._cached_fields_and_fragment_names[id(selection_set)] = cached
+        return cached
+
+    def _get_referenced_fields_and_fragment_names(
+        self, fragment: "FragmentDefinitionNode"
+    ) -> _FieldsAndFragmentNames:
+        """
+        Returns the fields & fragment names of a fragment definition.
+        :param fragment: the fragment definition to collect
+        :type fragment: FragmentDefinitionNode
+        :return: the fields & the fragment names of the fragment
+        :rtype: _FieldsAndFragmentNames
+        """
+        return self._get_fields_and_fragment_names(
+            self._find_type(fragment.type_condition.name.value),
+            fragment.selection_set,
+        )
+
+    def find_conflicts_within_selection_set(
+        self,
+        parent_type: Optional["GraphQLType"],
+        selection_set: "SelectionSetNode",
+    ) -> List[_Conflict]:
+        """
+        Finds the conflicts between the fields of a selection set, including
+        the ones of the fragments it spreads.
+        :param parent_type: the type of the selection set
+        :param selection_set: the selection set to check
+        :type parent_type: Optional[GraphQLType]
+        :type selection_set: SelectionSetNode
+        :return: the conflicts found
+        :rtype: List[_Conflict]
+        """
+        conflicts: List[_Conflict] = []
+        field_map, fragment_names = self._get_fields_and_fragment_names(
+            parent_type, selection_set
+        )
+
+        self._collect_conflicts_within(conflicts, field_map)
+        for index, fragment_name in enumerate(fragment_names):
+            self._collect_conflicts_between_fields_and_fragment(
+                conflicts, False, field_map, fragment_name
+            )
+            for other_fragment_name in fragment_names[index + 1 :]:
+                self._collect_conflicts_between_fragments(
+                    conflicts, False, fragment_name, other_fragment_name
+                )
+        return conflicts
+
+    def _collect_conflicts_between_fields_and_fragment(
+        self,
+        conflicts: List[_Conflict],
+        are_mutually_exclusive: bool,
+        field_map: Dict[str, List[_Field]],
+        fragment_name: str,
+    ) -> None:
+        """
+        Collects the conflicts between a set of fields & the fields of a
+        fragment (and of the fragments it spreads), each fragment being
+        compared only once to the set of fields.
+        :param conflicts: the list to fill with the conflicts found
+        :param are_mutually_exclusive: whether or not the fields are
+        mutually exclusive
+        :param field_map: the fields to compare
+        :param fragment_name: the name of the fragment to compare
+        :type conflicts: List[_Conflict]
+        :type are_mutually_exclusive: bool
+        :type field_map: Dict[str, List[_Field]]
+        :type fragment_name: str
+        """
+        compared_pairs = self._compared_fields_and_fragment_pairs
+        fragment_names = [fragment_name]
+        while fragment_names:
+            fragment = self._index.find_fragment(fragment_names.pop())
+            if fragment is None or not compared_pairs.add(
+                (id(field_map), fragment.name.value), are_mutually_exclusive
+            ):
+                continue
+
+            (
+                referenced_field_map,
+                referenced_fragment_names,
+            ) = self._get_referenced_fields_and_fragment_names(fragment)
+            if field_map is referenced_field_map:
+                continue
+
+            self._collect_conflicts_between(
+                conflicts,
+                are_mutually_exclusive,
+                field_map,
+                referenced_field_map,
+            )
+            fragment_names.extend(reversed(referenced_fragment_names))
+
+    def _collect_conflicts_between_fragments(
+        self,
+        conflicts: List[_Conflict],
+        are_mutually_exclusive: bool,
+        fragment_name1: str,
+        fragment_name2: str,
+    ) -> None:
+        """
+        Collects the conflicts between the fields of two fragments (and of
+        the fragments they spread), each pair of fragments being compared
+        only once.
+        :param conflicts: the list to fill with the conflicts found
+        :param are_mutually_exclusive: whether or not the fields are
+        mutually exclusive
+        :param fragment_name1: the name of the first fragment
+        :param fragment_name2: the name of the second fragment
+        :type conflicts: List[_Conflict]
+        :type are_mutually_exclusive: bool
+        :type fragment_name1: str
+        :type fragment_name2: str
+        """
+        pairs = [(fragment_name1, fragment_name2)]
+        while pairs:
+            fragment_name1, fragment_name2 = pairs.pop()
+            if fragment_name1 == fragment_name2:
+                continue
+
+            if not self._compared_fragment_pairs.add(
+                (
+                    min(fragment_name1, fragment_name2),
+                    max(fragment_name1, fragment_name2),
+                ),
+                are_mutually_exclusive,
+            ):
+                continue
+
+            fragment1 = self._index.find_fragment(fragment_name1)
+            fragment2 = self._index.find_fragment(fragment_name2)
+            if fragment1 is None or fragment2 is None:
+                continue
+
+            (
+                field_map1,
+                fragment_names1,
+            ) = self._get_referenced_fields_and_fragment_names(fragment1)
+            (
+                field_map2,
+                fragment_names2,
+            ) = self._get_referenced_fields_and_fragment_names(fragment2)
+
+            self._collect_conflicts_between(
+                conflicts, are_mutually_exclusive, field_map1, field_map2
+            )
+            pairs.extend(
+                (fragment_name1, name) for name in reversed(fragment_names2)
+            )
+            pairs.extend(
+                (name, fragment_name2) for name in reversed(fragment_names1)
+            )
+
+    def _find_conflicts_between_sub_selection_sets(
+        self,
+        are_mutually_exclusive: bool,
+        parent_type1: Optional["GraphQLType"],
+        selection_set1: "SelectionSetNode",
+        parent_type2: Optional["GraphQLType"],
+        selection_set2: "SelectionSetNode",
+    ) -> List[_Conflict]:
+        """
+        Finds the conflicts between the selection sets of two fields sharing
+        the same response name.
+        :param are_mutually_exclusive: whether or not the fields are
+        mutually exclusive
+        :param parent_type1: the type of the first selection set
+        :param selection_set1: the first selection set
+        :param parent_type2: the type of the second selection set
+        :param selection_set2: the second selection set
+        :type are_mutually_exclusive: bool
+        :type parent_type1: Optional[GraphQLType]
+        :type selection_set1: SelectionSetNode
+        :type parent_type2: Optional[GraphQLType]
+        :type selection_set2: SelectionSetNode
+        :return: the conflicts found
+        :rtype: List[_Conflict]
+        """
+        # pylint: disable=too-many-arguments
+        conflicts: List[_Conflict] = []
+        field_map1, fragment_names1 = self._get_fields_and_fragment_names(
+            parent_type1, selection_set1
+        )
+        field_map2, fragment_names2 = self._get_fields_and_fragment_names(
+            parent_type2, selection_set2
+        )
+
+        self._collect_conflicts_between(
+            conflicts, are_mutually_exclusive, field_map1, field_map2
+        )
+        for fragment_name2 in fragment_names2:
+            self._collect_conflicts_between_fields_and_fragment(
+                conflicts, are_mutually_exclusive, field_map1, fragment_name2
+            )
+        for fragment_name1 in fragment_names1:
+            self._collect_conflicts_between_fields_and_fragment(
+                conflicts, are_mutually_exclusive, field_map2, fragment_name1
+            )
+        for fragment_name1 in fragment_names1:
+            for fragment_name2 in fragment_names2:
+                self._collect_conflicts_between_fragments(
+                    conflicts,
+                    are_mutually_exclusive,
+                    fragment_name1,
+                    fragment_name2,
+                )
+        return conflicts
+
+    def _collect_conflicts_within(
+        self, conflicts: List[_Conflict], field_map: Dict[str, List[_Field]]
+    ) -> None:
+        """
+        Collects the conflicts between the fields sharing the same response
+        name within a set of fields.
+        :param conflicts: the list to fill with the conflicts found
+        :param field_map: the fields to compare
+        :type conflicts: List[_Conflict]
+        :type field_map: Dict[str, List[_Field]]
+        """
+        for response_name, fields in field_map.items():
+            for index, field1 in enumerate(fields):
+                for field2 in fields[index + 1 :]:
+                    conflict = self._find_conflict(
+                        False, response_name, field1, field2
+                    )
+                    if conflict:
+                        conflicts.append(conflict)
+
+    def _collect_conflicts_between(
+        self,
+        conflicts: List[_Conflict],
+        parent_fields_are_mutually_exclusive: bool,
+        field_map1: Dict[str, List[_Field]],
+        field_map2: Dict[str, List[_Field]],
+    ) -> None:
+        """
+        Collects the conflicts between the fields sharing the same response
+        name of two distinct sets of fields.
+        :param conflicts: the list to fill with the conflicts found
+        :param parent_fields_are_mutually_exclusive: whether or not the
+        parent fields are mutually exclusive
+        :param field_map1: the first set of fields
+        :param field_map2: the second set of fields
+        :type conflicts: List[_Conflict]
+        :type parent_fields_are_mutually_exclusive: bool
+        :type field_map1: Dict[str, List[_Field]]
+        :type field_map2: Dict[str, List[_Field]]
+        """
+        for response_name, fields1 in field_map1.items():
+            fields2 = field_map2.get(response_name)
+            if not fields2:
+                continue
+            for field1 in fields1:
+                for field2 in fields2:
+                    conflict = self._find_conflict(
+                        parent_fields_are_mutually_exclusive,
+                        response_name,
+                        field1,
+                        field2,
+                    )
+                    if conflict:
+                        conflicts.append(conflict)
+
+    def _find_conflict(
+        self,
+        parent_fields_are_mutually_exclusive: bool,
+        response_name: str,
+        field1: _Field,
+        field2: _Field,
+    ) -> Optional[_Conflict]:
+        """
+        Determines whether or not two fields sharing the same response name
+        conflict.
+        :param parent_fields_are_mutually_exclusive: whether or not the
+        parent fields are mutually exclusive
+        :param response_name: the response name of the fields
+        :param field1: the first field
+        :param field2: the second field
+        :type parent_fields_are_mutually_exclusive: bool
+        :type response_name: str
+        :type field1: _Field
+        :type field2: _Field
+        :return: the conflict if any
+        :rtype: Optional[_Conflict]
+        """
+        parent_type1, node1, definition1 = field1
+        parent_type2, node2, definition2 = field2
+
+        # fields of two distinct object types can't be selected at the same
+        # time and can thus select different fields or arguments
+        are_mutually_exclusive = parent_fields_are_mutually_exclusive or (
+            parent_type1 is not parent_type2
+            and _is_object_type(parent_type1)
+            and _is_object_type(parent_type2)
+        )
+
+        if not are_mutually_exclusive:
+            conflict = _find_selection_conflict(response_name, node1, node2)
+            if conflict:
+                return conflict
+
+        type1 = definition1.gql_type if definition1 else None
+        type2 = definition2.gql_type if definition2 else None
+        if type1 and type2 and self._do_types_conflict(type1, type2):
+            return (
+                (
+                    response_name,
+                    f"they return conflicting types < {type1} > and "
+                    f"< {type2} >",
+                ),
+                [node1],
+                [node2],
+            )
+
+        if node1.selection_set and node2.selection_set:
+            return _merge_sub_conflicts(
+                response_name,
+                node1,
+                node2,
+                self._find_conflicts_between_sub_selection_sets(
+                    are_mutually_exclusive,
+                    self._find_type(reduce_type(type1)) if type1 else None,
+                    node1.selection_set,
+                    self._find_type(reduce_type(type2)) if type2 else None,
+                    node2.selection_set,
+                ),
+            )
+        return None
+
+
+def _find_selection_conflict(
+    response_name: str, node1: "FieldNode", node2: "FieldNode"
+) -> Optional[_Conflict]:
+    """
+    Determines whether or not two fields which aren't mutually exclusive
+    select different fields or arguments.
+    :param response_name: the response name of the fields
+    :param node1: the AST node of the first field
+    :param node2: the AST node of the second field
+    :type response_name: str
+    :type node1: FieldNode
+    :type node2: FieldNode
+    :return: the conflict if any
+    :rtype: Optional[_Conflict]
+    """
+    name1 = node1.name.value
+    name2 = node2.name.value
+    if name1 != name2:
+        return (
+            (
+                response_name,
+                f"< {name1} > and < {name2} > are different fields",
+            ),
+            [node1],
+            [node2],
+        )
+
+    if _arguments_key(node1.arguments) != _arguments_key(node2.arguments):
+        return (
+            (response_name, "they have differing arguments"),
+            [node1],
+            [node2],
+        )
+    return None
+
+
+def _merge_sub_conflicts(
+    response_name: str,
+    node1: "FieldNode",
+    node2: "FieldNode",
+    conflicts: List[_Conflict],
+) -> Optional[_Conflict]:
+    """
+    Merges the conflicts between the subfields of two fields into a conflict
+    of the fields.
+    :param response_name: the response name of the fields
+    :param node1: the AST node of the first field
+    :param node2: the AST node of the second field
+    :param conflicts: the conflicts between the subfields
+    :type response_name: str
+    :type node1: FieldNode
+    :type node2: FieldNode
+    :type conflicts: List[_Conflict]
+    :return: the conflict if any
+    :rtype: Optional[_Conflict]
+    """
+    if not conflicts:
+        return None
+    return (
+        (response_name, [conflict[0] for conflict in conflicts]),
+        [node1] + [node for conflict in conflicts for node in conflict[1]],
+        [node2] + [node for conflict in conflicts for node in conflict[2]],
+    )
+
+
+def _sub_selection_sets(
+    schema: "GraphQLSchema",
+    parent_type: Optional["GraphQLType"],
+    selection_set: "SelectionSetNode",
+) -> List[Tuple[Optional["GraphQLType"], "SelectionSetNode"]]:
+    """
+    Returns the selection sets of the fields & inline fragments of a
+    selection set along with their parent type.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param parent_type: the parent type of the selection set
+    :param selection_set: the selection set
+    :type schema: GraphQLSchema
+    :type parent_type: Optional[GraphQLType]
+    :type selection_set: SelectionSetNode
+    :return: the sub selection sets along with their parent type
+    :rtype: List[Tuple[Optional[GraphQLType], SelectionSetNode]]
+    """
+    sub_selection_sets = []
+    for selection in selection_set.selections:
+        if getattr(selection, "selection_set", None) is None:
+            continue
+        if isinstance(selection, FieldNode):
+            try:
+                field_type = schema.type_definitions.get(
+                    reduce_type(
+                        parent_type.find_field(selection.name.value).gql_type
+                    )
+                )
+            except (AttributeError, KeyError):
+                field_type = None
+            sub_selection_sets.append((field_type, selection.selection_set))
+        else:
+            sub_selection_sets.append(
+                (
+                    schema.type_definitions.get(
+                        selection.type_condition.name.value
+                    )
+                    if selection.type_condition
+                    else parent_type,
+                    selection.selection_set,
+                )
+            )
+    return sub_selection_sets
+
+
+def _reason_message(reason: Any) -> str:
+    """
+    Formats the reason of a conflict.
+    :param reason: a message or the list of the conflicts of the subfields
+    :type reason: Any
+    :return: the formatted reason
+    :rtype: str
+    """
+    if isinstance(reason, list):
+        return " and ".join(
+            f"subfields < {response_name} > conflict because "
+            f"{_reason_message(sub_reason)}"
+            for response_name, sub_reason in reason
+        )
+    return reason
+
+
+class OverlappingFieldsCanBeMerged(June2018ReleaseValidationRule):
+    """
+    This validator validates that the fields (including the ones of the
+    spread fragments) sharing the same response name in a selection set can
+    be merged without ambiguity.
+
+    Fields & fragment names of each selection set are collected once and
+    each pair of fragments is compared once, so that the cost of the
+    validation doesn't explode on documents spreading the same fragments
+    over & over.
+
+    More details @ https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selection-Merging
+    """
+
+    RULE_NAME = "overlapping-fields-can-be-merged"
+    RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selection-Merging"
+    RULE_NUMBER = "5.3.2"
+    NODE_KINDS = ("Document",)
+
+    def _to_error(self, conflict: _Conflict, path: Any) -> "TartifletteError":
+        """
+        Creates the error reporting a conflict.
+        :param conflict: the conflict to report
+        :param path: the path of the validated node
+        :type conflict: _Conflict
+        :type path: Any
+        :return: the error reporting the conflict
+        :rtype: TartifletteError
+        """
+        (response_name, reason), nodes1, nodes2 = conflict
+        return graphql_error_from_nodes(
+            message=f"Fields < {response_name} > conflict because "
+            f"{_reason_message(reason)}. Use different aliases on the fields "
+            "to fetch both if this was intentional.",
+            nodes=nodes1 + nodes2,
+            path=path,
+            extensions=self._extensions,
+        )
+
+    def validate(self, node, ctx):
+        path, schema = ctx.path, ctx.schema
+        finder = _ConflictsFinder(schema, ctx.index)
+
+        selection_sets = [
+            (
+                schema.type_definitions.get(
+                    getattr(
+                        schema, f"{operation.operation_type}_operation_name"
+                    )
+                ),
+                operation.selection_set,
+            )
+            for operation in ctx.operations
+        ] + [
+            (
+                schema.type_definitions.get(
+                    fragment.type_condition.name.value
+                ),
+                fragment.selection_set,
+            )
+            for fragment in ctx.fragments
+        ]
+
+        errors = []
+        checked_structures = set()
+        while selection_sets:
+            parent_type, selection_set = selection_sets.pop()
+
+            # identical selection sets of the same type have the same
+            # conflicts, which are only reported once
+            structure = (id(parent_type), finder.structure_id(selection_set))
+            if structure in checked_structures:
+                continue
+            checked_structures.add(structure)
+
+            errors.extend(
+                self._to_error(conflict, path)
+                for conflict in finder.find_conflicts_within_selection_set(
+                    parent_type, selection_set
+                )
+            )
+
+            selection_sets.extend(
+                _sub_selection_sets(schema, parent_type, selection_set)
+            )
+
+        return errors
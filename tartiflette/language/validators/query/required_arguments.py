@@ -2,10 +2,7 @@ from tartiflette.language.ast import DirectiveNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import (
-    find_field,
-    find_nodes_by_name,
-)
+from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.types.non_null import GraphQLNonNull
 from tartiflette.utils.errors import graphql_error_from_nodes
 
@@ -21,6 +18,7 @@ class RequiredArguments(June2018ReleaseValidationRule):
     RULE_NAME = "required-arguments"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Required-Arguments"
     RULE_NUMBER = "5.4.2.1"
+    NODE_KINDS = ("Field", "Directive")
 
     def _validate_arguments(
         self, parent_node, schema_definition, path, message_suffix
@@ -56,8 +54,8 @@ class RequiredArguments(June2018ReleaseValidationRule):
             f"in directive < @{directive_node.name.value} >.",
         )
 
-    def _validate_field(self, path, schema, field, parent_type_name):
-        schema_field = find_field(parent_type_name, field.name.value, schema)
+    def _validate_field(self, path, index, field, parent_type_name):
+        schema_field = index.find_field(parent_type_name, field.name.value)
 
         if schema_field is None:
             return []  # Handled by anoter validator
@@ -69,7 +67,9 @@ class RequiredArguments(June2018ReleaseValidationRule):
             f"in field < {parent_type_name}.{field.name.value} >.",
         )
 
-    def validate(self, path, schema, node, parent_type_name=None, **__):
+    def validate(self, node, ctx):
         if isinstance(node, DirectiveNode):
-            return self._validate_directive(path, schema, node)
-        return self._validate_field(path, schema, node, parent_type_name)
+            return self._validate_directive(ctx.path, ctx.schema, node)
+        return self._validate_field(
+            ctx.path, ctx.index, node, ctx.parent_type_name
+        )
@@ -1,15 +1,23 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class ValidationRule:
     """
     Base class for a Validation Rule.
+
+    A rule is called on each node of the kinds listed in `NODE_KINDS` once
+    the node has been visited: "OperationDefinition", "FragmentDefinition",
+    "VariableDefinition", "Field", "FragmentSpread", "InlineFragment",
+    "Directive", "ObjectValue" & "Document" (once the whole document has been
+    visited), or "Arguments", "Directives" & "VariableDefinitions" to be
+    called with the owner of these children once they have been visited.
     """
 
     RULE_NAME: Optional[str] = None
     RULE_LINK: Optional[str] = None
     RULE_RELEASE: Optional[str] = None
     RULE_NUMBER: Optional[str] = None
+    NODE_KINDS: Tuple[str, ...] = ()
 
     def __init__(self, abort: bool = False):
         """
@@ -26,6 +34,20 @@ class ValidationRule:
         }
         self.abort = abort
 
+    def validate(
+        self, node: "Node", ctx: "ValidationContext"
+    ) -> List["TartifletteError"]:
+        """
+        Validates a node of one of the `NODE_KINDS`.
+        :param node: the node to validate
+        :param ctx: the validation context of the document
+        :type node: Node
+        :type ctx: ValidationContext
+        :return: the errors found on the node
+        :rtype: List[TartifletteError]
+        """
+        raise NotImplementedError
+
 
 class June2018ReleaseValidationRule(ValidationRule):
     """
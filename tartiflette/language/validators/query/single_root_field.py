@@ -23,6 +23,7 @@ class SingleRootField(June2018ReleaseValidationRule):
     RULE_NAME = "single-root-field"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Single-root-field"
     RULE_NUMBER = "5.2.3.1"
+    NODE_KINDS = ("Document",)
 
     def _validate_selection_set(
         self, operation, selection_set, fragments, path
@@ -58,14 +59,11 @@ class SingleRootField(June2018ReleaseValidationRule):
 
         return []
 
-    def validate(self, path, definitions, **__):
-        for operation in definitions["OperationDefinition"]:
+    def validate(self, node, ctx):
+        for operation in ctx.operations:
             if operation.operation_type == "subscription":
                 return self._validate_selection_set(
-                    operation,
-                    operation.selection_set,
-                    definitions["FragmentDefinition"],
-                    path,
+                    operation, operation.selection_set, ctx.fragments, ctx.path
                 )
 
         return []
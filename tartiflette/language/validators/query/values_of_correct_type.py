@@ -9,7 +9,6 @@ from tartiflette.language.ast import (
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_field
 from tartiflette.types.enum import GraphQLEnumType
 from tartiflette.types.helpers.reduce_type import reduce_type
 from tartiflette.types.input_object import GraphQLInputObjectType
@@ -30,6 +29,7 @@ class ValuesOfCorrectType(June2018ReleaseValidationRule):
     RULE_NAME = "values-of-correct-type"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Values-of-Correct-Type"
     RULE_NUMBER = "5.6.1"
+    NODE_KINDS = ("Field", "Directive")
 
     def _validate_input_fields(
         self,
@@ -268,9 +268,13 @@ class ValuesOfCorrectType(June2018ReleaseValidationRule):
             )
         return errors
 
-    def _validate_field_arguments(self, path, schema, field, parent_type_name):
-        schema_field = find_field(parent_type_name, field.name.value, schema)
-        return self._validate_arguments(schema_field, field, [], path, schema)
+    def _validate_field_arguments(self, ctx, field):
+        schema_field = ctx.index.find_field(
+            ctx.parent_type_name, field.name.value
+        )
+        return self._validate_arguments(
+            schema_field, field, [], ctx.path, ctx.schema
+        )
 
     def _validate_directive_arguments(self, path, schema, directive):
         if not schema.has_directive(directive.name.value):
@@ -283,9 +287,9 @@ class ValuesOfCorrectType(June2018ReleaseValidationRule):
             directive_schema_definition, directive, [], path, schema
         )
 
-    def validate(self, path, schema, node, parent_type_name=None, **__):
+    def validate(self, node, ctx):
         if isinstance(node, DirectiveNode):
-            return self._validate_directive_arguments(path, schema, node)
-        return self._validate_field_arguments(
-            path, schema, node, parent_type_name
-        )
+            return self._validate_directive_arguments(
+                ctx.path, ctx.schema, node
+            )
+        return self._validate_field_arguments(ctx, node)
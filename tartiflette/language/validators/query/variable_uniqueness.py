@@ -17,12 +17,13 @@ class VariableUniqueness(June2018ReleaseValidationRule):
     RULE_NAME = "variable-uniqueness"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Variable-Uniqueness"
     RULE_NUMBER = "5.8.1"
+    NODE_KINDS = ("VariableDefinitions",)
 
-    def validate(self, path, variable_definitions, **__):
+    def validate(self, node, ctx):
         errors = []
         already_tested = []
 
-        variables = [x.variable for x in variable_definitions]
+        variables = [x.variable for x in node.variable_definitions]
 
         for variable in variables:
             if variable.name.value in already_tested:
@@ -34,7 +35,7 @@ class VariableUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple variables named < {variable.name.value} >.",
-                        path=path,
+                        path=ctx.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -16,8 +16,11 @@ class VariablesAreInputTypes(June2018ReleaseValidationRule):
     RULE_NAME = "variables-are-input-types"
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Variables-Are-Input-Types"
     RULE_NUMBER = "5.8.2"
+    NODE_KINDS = ("VariableDefinition",)
 
-    def validate(self, variable, path, schema, **__):
+    def validate(self, node, ctx):
+        variable = node
+        schema = ctx.schema
         var_type = get_wrapped_named_type(variable.type)
 
         if schema.has_type(var_type.name.value) and not isinstance(
@@ -26,7 +29,7 @@ class VariablesAreInputTypes(June2018ReleaseValidationRule):
             return [
                 graphql_error_from_nodes(
                     message=f"Variable {variable.variable.name.value} cannot be non-input type {var_type.name.value}.",
-                    path=path,
+                    path=ctx.path,
                     nodes=variable,
                     extensions=self._extensions,
                 )
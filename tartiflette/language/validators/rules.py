@@ -0,0 +1,105 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+__all__ = ("ValidationRules",)
+
+
+class ValidationRules:
+    """
+    Validation rules compiled once per engine into a table of the rules to
+    run on each kind of node, in the order of the rule set. Rules can be
+    switched off by name and the time spent in each rule can be recorded.
+    """
+
+    __slots__ = ("rules", "timed", "_dispatch", "_timings", "_lock")
+
+    def __init__(
+        self,
+        rules: Dict[str, "ValidationRule"],
+        disabled_rules: Optional[Iterable[str]] = None,
+        timed: bool = False,
+    ) -> None:
+        """
+        :param rules: the validation rules by name, in the order they have to
+        be run on a same node
+        :param disabled_rules: names of the rules to switch off
+        :param timed: whether or not the time spent in each rule should be
+        recorded
+        :type rules: Dict[str, ValidationRule]
+        :type disabled_rules: Optional[Iterable[str]]
+        :type timed: bool
+        :raises ImproperlyConfigured: when a disabled rule doesn't exist
+        """
+        disabled_rules = set(disabled_rules or [])
+        unknown_rules = disabled_rules - set(rules)
+        if unknown_rules:
+            raise ImproperlyConfigured(
+                "Unknown validation rules: "
+                + ", ".join(f"< {name} >" for name in sorted(unknown_rules))
+                + "."
+            )
+
+        self.rules: Dict[str, "ValidationRule"] = {
+            name: rule
+            for name, rule in rules.items()
+            if name not in disabled_rules
+        }
+        self.timed = timed
+
+        dispatch: Dict[str, list] = {}
+        for rule in self.rules.values():
+            for kind in rule.NODE_KINDS:
+                dispatch.setdefault(kind, []).append(rule)
+        self._dispatch: Dict[str, Tuple["ValidationRule", ...]] = {
+            kind: tuple(kind_rules) for kind, kind_rules in dispatch.items()
+        }
+
+        self._timings: Dict[str, Dict[str, Union[int, float]]] = {}
+        self._lock = Lock()
+
+    def get(self, kind: str) -> Tuple["ValidationRule", ...]:
+        """
+        Returns the rules to run on a kind of node.
+        :param kind: the kind of node
+        :type kind: str
+        :return: the rules to run on the kind of node
+        :rtype: Tuple[ValidationRule, ...]
+        """
+        return self._dispatch.get(kind, ())
+
+    def add_timings(self, timings: Dict[str, Tuple[int, float]]) -> None:
+        """
+        Adds the number of calls & the time spent in each rule while
+        validating a document to the recorded timings.
+        :param timings: number of calls & seconds spent by rule name
+        :type timings: Dict[str, Tuple[int, float]]
+        """
+        with self._lock:
+            for name, (calls, seconds) in timings.items():
+                rule_timings = self._timings.setdefault(
+                    name, {"calls": 0, "time": 0.0}
+                )
+                rule_timings["calls"] += calls
+                rule_timings["time"] += seconds
+
+    def timings(
+        self, reset: bool = False
+    ) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Returns the number of calls (`calls`) & the total time in seconds
+        (`time`) spent in each rule since the timings have been reset.
+        :param reset: whether or not the timings should be reset
+        :type reset: bool
+        :return: the number of calls & the time spent by rule name
+        :rtype: Dict[str, Dict[str, Union[int, float]]]
+        """
+        with self._lock:
+            timings = {
+                name: dict(rule_timings)
+                for name, rule_timings in self._timings.items()
+            }
+            if reset:
+                self._timings = {}
+        return timings
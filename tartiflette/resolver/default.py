@@ -3,6 +3,7 @@ import asyncio
 from typing import Any, Coroutine, Dict, List, Optional, Union
 
 __all__ = (
+    "get_default_field_value",
     "default_field_resolver",
     "default_type_resolver",
     "gather_arguments_coercer",
@@ -10,6 +11,29 @@ __all__ = (
 )
 
 
+def get_default_field_value(parent: Optional[Any], field_name: str) -> Any:
+    """
+    Returns the value of the field from its parent, either through attribute
+    or key access.
+    :param parent: default root value or field parent value
+    :param field_name: name of the resolved field
+    :type parent: Optional[Any]
+    :type field_name: str
+    :return: the computed field value
+    :rtype: Any
+    """
+    try:
+        return getattr(parent, field_name)
+    except AttributeError:
+        pass
+
+    try:
+        return parent[field_name]
+    except (KeyError, TypeError):
+        pass
+    return None
+
+
 async def default_field_resolver(
     parent: Optional[Any],
     args: Dict[str, Any],
@@ -31,16 +55,7 @@ async def default_field_resolver(
     :rtype: Any
     """
     # pylint: disable=unused-argument
-    try:
-        return getattr(parent, info.field_name)
-    except AttributeError:
-        pass
-
-    try:
-        return parent[info.field_name]
-    except (KeyError, TypeError):
-        pass
-    return None
+    return get_default_field_value(parent, info.field_name)
 
 
 def default_type_resolver(
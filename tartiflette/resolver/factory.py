@@ -1,8 +1,13 @@
 from typing import Any, Callable, List, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
-from tartiflette.coercers.outputs.common import complete_value_catching_error
+from tartiflette.coercers.outputs.common import (
+    complete_value_catching_error,
+    handle_field_error,
+)
+from tartiflette.execution.batch import resolve_batched_field
 from tartiflette.execution.types import build_resolve_info
+from tartiflette.resolver.default import get_default_field_value
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
@@ -11,7 +16,7 @@ from tartiflette.utils.directives import (
     wraps_with_directives,
 )
 
-__all__ = ("resolve_field",)
+__all__ = ("resolve_field", "resolve_field_synchronously")
 
 
 async def resolve_field_value_or_error(
@@ -41,38 +46,66 @@ async def resolve_field_value_or_error(
     """
     # pylint: disable=too-many-locals
     try:
-        computed_directives = []
-        for field_node in field_nodes:
-            computed_directives.extend(
-                compute_directive_nodes(
-                    execution_context.schema,
-                    field_node.directives,
-                    execution_context.variable_values,
-                )
+        plan = execution_context.plan
+        if plan is not None:
+            resolver = plan.get_field_resolver(
+                field_definition,
+                field_nodes,
+                resolver,
+                execution_context.variable_values,
             )
-
-        if computed_directives:
-            resolver = wraps_with_directives(
-                directives_definition=computed_directives,
-                directive_hook="on_field_execution",
-                func=resolver,
-                is_resolver=True,
-                with_default=True,
+            arguments = await plan.coerce_arguments(
+                field_definition,
+                field_nodes[0],
+                execution_context.variable_values,
+                execution_context.context,
             )
+        else:
+            computed_directives = []
+            for field_node in field_nodes:
+                computed_directives.extend(
+                    compute_directive_nodes(
+                        execution_context.schema,
+                        field_node.directives,
+                        execution_context.variable_values,
+                    )
+                )
 
-        result = await resolver(
-            source,
-            await coerce_arguments(
+            if computed_directives:
+                resolver = wraps_with_directives(
+                    directives_definition=computed_directives,
+                    directive_hook="on_field_execution",
+                    func=resolver,
+                    is_resolver=True,
+                    with_default=True,
+                )
+
+            arguments = await coerce_arguments(
                 field_definition.arguments,
                 field_nodes[0],
                 execution_context.variable_values,
                 execution_context.context,
                 coercer=field_definition.arguments_coercer,
-            ),
-            execution_context.context,
-            info,
-            context_coercer=execution_context.context,
-        )
+            )
+
+        if field_definition.batch:
+            result = await resolve_batched_field(
+                execution_context,
+                field_definition,
+                resolver,
+                source,
+                arguments,
+                info,
+            )
+        else:
+            result = await resolver(
+                source,
+                arguments,
+                execution_context.context,
+                info,
+                context_coercer=execution_context.context,
+            )
+
         if info.is_introspection:
             return await introspection_directives_executor(
                 result,
@@ -146,3 +179,50 @@ async def resolve_field(
         field_definition.graphql_type,
         output_coercer,
     )
+
+
+def resolve_field_synchronously(
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    source: Any,
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    field_definition: "GraphQLField",
+    output_coercer: Callable,
+) -> Any:
+    """
+    Resolves & coerces synchronously the value of a leaf field resolved by the
+    default resolver, without building any `ResolveInfo` nor coroutine.
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param source: default root value or field parent value
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param field_definition: GraphQLField instance of the resolved field
+    :param output_coercer: synchronous callable to use to coerce the resolved
+    field value
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type source: Any
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type field_definition: GraphQLField
+    :type output_coercer: Callable
+    :return: the coerced resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        return output_coercer(
+            get_default_field_value(source, field_definition.name),
+            parent_type,
+            field_definition.name,
+        )
+    except Exception as raw_exception:  # pylint: disable=broad-except
+        return handle_field_error(
+            raw_exception,
+            field_nodes,
+            path,
+            field_definition.graphql_type,
+            execution_context,
+        )
@@ -30,6 +30,15 @@ class Resolver:
         async def field_resolver(parent, args, ctx, info):
             # do your stuff
             return 42
+
+    Use `batch=True` to resolve the field for all the items of a list at
+    once, the resolver then receives the list of parents and has to return
+    one result per parent, in the same order:
+
+        @Resolver("SomeObject.field", batch=True)
+        async def field_batch_resolver(parents, args, ctx, info):
+            # do your stuff
+            return [42 for _ in parents]
     """
 
     def __init__(
@@ -39,6 +48,8 @@ class Resolver:
         type_resolver: Optional[Callable] = None,
         arguments_coercer: Optional[Callable] = None,
         concurrently: Optional[bool] = None,
+        batch: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """
         :param name: name of the field to wrap
@@ -47,11 +58,17 @@ class Resolver:
         abstract type
         :param arguments_coercer: the callable to use to coerce field arguments
         :param concurrently: whether or not list will be coerced concurrently
+        :param batch: whether or not the resolver resolves the field for a
+        list of parents at once
+        :param max_concurrency: maximum number of items of the output list
+        coerced at the same time
         :type name: str
         :type schema_name: str
         :type type_resolver: Optional[Callable]
         :type arguments_coercer: Optional[Callable]
         :type concurrently: Optional[bool]
+        :type batch: bool
+        :type max_concurrency: Optional[int]
         """
         self.name = name
         self._type_resolver = type_resolver
@@ -59,6 +76,8 @@ class Resolver:
         self._schema_name = schema_name
         self._arguments_coercer = arguments_coercer
         self._concurrently = concurrently
+        self._batch = batch
+        self._max_concurrency = max_concurrency
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -76,6 +95,10 @@ class Resolver:
             field.raw_resolver = self._implementation
             field.query_arguments_coercer = self._arguments_coercer
             field.query_concurrently = self._concurrently
+            field.query_max_concurrency = self._max_concurrency
+            field.batch = self._batch
+            if self._batch:
+                schema.has_batch_resolvers = True
 
             field_wrapped_type = get_wrapped_type(
                 get_graphql_type(schema, field.gql_type)
@@ -1,5 +1,5 @@
 from math import isfinite
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -32,6 +32,20 @@ class ScalarBoolean:
             f"Boolean cannot represent a non boolean value: < {value} >."
         )
 
+    def coerce_output_many(self, values: List[Any]) -> List[bool]:
+        """
+        Coerce a list of non-null resolved values for output at once.
+        :param values: values to coerce
+        :type values: List[Any]
+        :return: the coerced values
+        :rtype: List[bool]
+        """
+        coerce_output = self.coerce_output
+        return [
+            value if value.__class__ is bool else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> bool:
         """
         Coerce the user input from variable value.
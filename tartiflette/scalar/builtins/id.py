@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -28,6 +28,20 @@ class ScalarID:
 
         raise TypeError(f"ID cannot represent value: < {value} >.")
 
+    def coerce_output_many(self, values: List[Any]) -> List[str]:
+        """
+        Coerce a list of non-null resolved values for output at once.
+        :param values: values to coerce
+        :type values: List[Any]
+        :return: the coerced values
+        :rtype: List[str]
+        """
+        coerce_output = self.coerce_output
+        return [
+            value if value.__class__ is str else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> str:
         """
         Coerce the user input from variable value.
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from tartiflette import Scalar
 from tartiflette.constants import UNDEFINED_VALUE
@@ -48,6 +48,22 @@ class ScalarInt:
             )
         return result
 
+    def coerce_output_many(self, values: List[Any]) -> List[int]:
+        """
+        Coerce a list of non-null resolved values for output at once.
+        :param values: values to coerce
+        :type values: List[Any]
+        :return: the coerced values
+        :rtype: List[int]
+        """
+        coerce_output = self.coerce_output
+        return [
+            value
+            if value.__class__ is int and _MIN_INT <= value <= _MAX_INT
+            else coerce_output(value)
+            for value in values
+        ]
+
     def coerce_input(self, value: Any) -> int:
         """
         Coerce the user input from variable value.
@@ -1,3 +1,5 @@
+import hashlib
+
 from typing import Callable, Optional
 
 from tartiflette.schema.registry import SchemaRegistry
@@ -24,6 +26,7 @@ class SchemaBakery:
         schema_info = SchemaRegistry.find_schema_info(schema_name)
         sdl = schema_info["sdl"]
         schema = schema_from_sdl(sdl, schema_name=schema_name)
+        schema.sdl_hash = hashlib.sha256(sdl.encode("UTF-8")).hexdigest()
         schema_info["inst"] = schema
         return schema
 
@@ -34,6 +37,7 @@ class SchemaBakery:
         custom_default_type_resolver: Optional[Callable] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
+        coerce_list_max_concurrency: Optional[int] = None,
     ) -> "GraphQLSchema":
         """
         Bakes and returns a GraphQLSchema instance.
@@ -47,11 +51,14 @@ class SchemaBakery:
         tartiflette `default_arguments_coercer`
         :param coerce_list_concurrently: whether or not list will be coerced
         concurrently
+        :param coerce_list_max_concurrency: maximum number of list items
+        coerced at the same time
         :type schema_name: str
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
+        :type coerce_list_max_concurrency: Optional[int]
         :return: a baked GraphQLSchema instance
         :rtype: GraphQLSchema
         """
@@ -61,5 +68,6 @@ class SchemaBakery:
             custom_default_type_resolver,
             custom_default_arguments_coercer,
             coerce_list_concurrently,
+            coerce_list_max_concurrency,
         )
         return schema
@@ -220,6 +220,15 @@ class SchemaRegistry:
         """
         return SchemaRegistry.find_schema_info(schema_name)["inst"]
 
+    @staticmethod
+    def unregister(schema_name: str) -> None:
+        """
+        Erases all information related to a registered schema.
+        :param schema_name: name of the schema to erase
+        :type schema_name: str
+        """
+        SchemaRegistry._schemas.pop(schema_name, None)
+
     @staticmethod
     def bake_registered_objects(schema: "GraphQLSchema"):
         schema_info = SchemaRegistry._schemas[schema.name]
@@ -180,6 +180,23 @@ class GraphQLSchema:
         self.default_type_resolver: Optional[Callable] = None
         self.default_arguments_coercer: Optional[Callable] = None
         self.coerce_list_concurrently: Optional[bool] = None
+        self.coerce_list_max_concurrency: Optional[int] = None
+        self.has_batch_resolvers: bool = False
+
+        # SHA-256 digest of the SDL, set once the schema has been loaded
+        self.sdl_hash: Optional[str] = None
+
+        # Whether or not parsed queries are built as compact documents
+        self.compact_ast: bool = False
+
+        # Limits enforced on the queries before & while they're parsed
+        self.query_limits: Optional["QueryLimits"] = None
+
+        # Validation rules run on the parsed queries
+        self.validation_rules: Optional["ValidationRules"] = None
+
+        # Static cost analysis of the queries
+        self.query_cost: Optional["QueryCost"] = None
 
         # Operation type names
         self.query_operation_name: str = _DEFAULT_QUERY_OPERATION_NAME
@@ -220,6 +237,7 @@ class GraphQLSchema:
         self.extensions: List["GraphQLExtension"] = []
         self._schema_directives: List["DirectiveNode"] = []
         self._json_loader = None
+        self._json_dumper = None
         self.is_introspectable = True
 
     @property
@@ -230,6 +248,14 @@ class GraphQLSchema:
     def json_loader(self, loader):
         self._json_loader = loader
 
+    @property
+    def json_dumper(self):
+        return self._json_dumper
+
+    @json_dumper.setter
+    def json_dumper(self, dumper):
+        self._json_dumper = dumper
+
     def add_schema_directives(
         self, directives_instances: List["DirectiveNode"]
     ) -> None:
@@ -707,6 +733,35 @@ class GraphQLSchema:
 
         return errors
 
+    def _validate_max_concurrency(self) -> List[str]:
+        """
+        Validates that the maximum numbers of list items coerced at the same
+        time are greater than 0.
+        :return: a list of errors
+        :rtype: List[str]
+        """
+        errors = []
+        if (
+            self.coerce_list_max_concurrency is not None
+            and self.coerce_list_max_concurrency < 1
+        ):
+            errors.append(
+                "< coerce_list_max_concurrency > has to be greater than 0."
+            )
+
+        for gqltype in self.type_definitions.values():
+            for field in getattr(gqltype, "implemented_fields", {}).values():
+                for max_concurrency in (
+                    field.query_max_concurrency,
+                    field.subscription_max_concurrency,
+                ):
+                    if max_concurrency is not None and max_concurrency < 1:
+                        errors.append(
+                            f"< max_concurrency > of Field < {gqltype}."
+                            f"{field.name} > has to be greater than 0."
+                        )
+        return errors
+
     def _validate_type_is_an_input_types(
         self, obj: "GraphQLType", message_prefix: str
     ) -> List[str]:
@@ -1008,6 +1063,7 @@ class GraphQLSchema:
             self._validate_arguments_have_valid_type,
             self._validate_input_type_composed_of_input_type,
             self._validate_directive_implementation,
+            self._validate_max_concurrency,
             # TODO: Validate Field: default value must be of given type
             # TODO: Check all objects have resolvers (at least in parent)
         ]
@@ -1118,6 +1174,7 @@ class GraphQLSchema:
         custom_default_type_resolver: Optional[Callable] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
         coerce_list_concurrently: Optional[bool] = None,
+        coerce_list_max_concurrency: Optional[int] = None,
     ) -> None:
         """
         Bake the final schema (it should not change after this) used for
@@ -1131,10 +1188,13 @@ class GraphQLSchema:
         tartiflette `default_arguments_coercer`
         :param coerce_list_concurrently: whether or not list will be coerced
         concurrently
+        :param coerce_list_max_concurrency: maximum number of list items
+        coerced at the same time
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type coerce_list_concurrently: Optional[bool]
+        :type coerce_list_max_concurrency: Optional[int]
         """
         self.default_type_resolver = (
             custom_default_type_resolver or default_type_resolver
@@ -1147,6 +1207,7 @@ class GraphQLSchema:
             if coerce_list_concurrently is not None
             else True
         )
+        self.coerce_list_max_concurrency = coerce_list_max_concurrency
         self._inject_introspection_fields()
 
         self._validate_extensions()  # Validate this before bake
@@ -1158,6 +1219,8 @@ class GraphQLSchema:
             # Exceptions should be collected at validation time
             pass
 
+        # Flagged by the batch resolvers while being baked
+        self.has_batch_resolvers = False
         SchemaRegistry.bake_registered_objects(self)
 
         try:
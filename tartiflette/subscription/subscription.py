@@ -41,22 +41,27 @@ class Subscription:
         schema_name: str = "default",
         arguments_coercer: Optional[Callable] = None,
         concurrently: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """
         :param name: name of the subscription field
         :param schema_name: name of the schema to which link the subscription
         :param arguments_coercer: callable to use to coerce field arguments
         :param concurrently: whether list should be coerced concurrently
+        :param max_concurrency: maximum number of items of the output list
+        coerced at the same time
         :type name: str
         :type schema_name: str
         :type arguments_coercer: Optional[Callable]
         :type concurrently: Optional[bool]
+        :type max_concurrency: Optional[int]
         """
         self.name = name
         self._implementation = None
         self._schema_name = schema_name
         self._arguments_coercer = arguments_coercer
         self._concurrently = concurrently
+        self._max_concurrency = max_concurrency
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -86,6 +91,7 @@ class Subscription:
         field.subscribe = self._implementation
         field.subscription_arguments_coercer = self._arguments_coercer
         field.subscription_concurrently = self._concurrently
+        field.subscription_max_concurrency = self._max_concurrency
 
     def __call__(self, implementation: Callable) -> Callable:
         """
@@ -194,3 +194,19 @@ class RedefinedImplementation(TartifletteError):
 
 class CoercionError(TartifletteError):
     pass
+
+
+class PersistedQueryError(TartifletteError):
+    pass
+
+
+class DocumentSerializationError(TartifletteError):
+    pass
+
+
+class QueryLimitError(TartifletteError):
+    pass
+
+
+class QueryCostError(TartifletteError):
+    pass
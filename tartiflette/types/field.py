@@ -1,9 +1,15 @@
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from tartiflette.coercers.outputs.compute import get_output_coercer
+from tartiflette.coercers.outputs.compute import (
+    get_output_coercer,
+    get_sync_output_coercer,
+)
 from tartiflette.resolver.default import default_field_resolver
-from tartiflette.resolver.factory import resolve_field
+from tartiflette.resolver.factory import (
+    resolve_field,
+    resolve_field_synchronously,
+)
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
@@ -54,9 +60,14 @@ class GraphQLField:
         self.on_post_bake: Optional[Callable] = None
         self.introspection_directives: Optional[Callable] = None
 
+        # Weight & multiplier arguments set by the @cost directive
+        self.cost: Optional[Tuple[Optional[int], Optional[List[str]]]] = None
+
         # Resolvers
         self.raw_resolver = resolver
         self.resolver: Optional[Callable] = None
+        self.sync_resolver: Optional[Callable] = None
+        self.batch: bool = False
         self.subscribe: Optional[Callable] = None
 
         # Arguments coercer
@@ -69,6 +80,11 @@ class GraphQLField:
         self.query_concurrently: Optional[bool] = None
         self.subscription_concurrently: Optional[bool] = None
 
+        # Max concurrency
+        self.max_concurrency: Optional[int] = None
+        self.query_max_concurrency: Optional[int] = None
+        self.subscription_max_concurrency: Optional[int] = None
+
         # Introspection attributes
         self.isDeprecated: bool = False  # pylint: disable=invalid-name
         self.args: List["GraphQLArgument"] = []
@@ -172,6 +188,13 @@ class GraphQLField:
         else:
             self.concurrently = schema.coerce_list_concurrently
 
+        if self.subscription_max_concurrency is not None:
+            self.max_concurrency = self.subscription_max_concurrency
+        elif self.query_max_concurrency is not None:
+            self.max_concurrency = self.query_max_concurrency
+        else:
+            self.max_concurrency = schema.coerce_list_max_concurrency
+
         # Directives
         directives_definition = compute_directive_nodes(
             schema, self.directives
@@ -205,10 +228,30 @@ class GraphQLField:
                 with_default=True,
             ),
             output_coercer=get_output_coercer(
-                self.graphql_type, self.concurrently
+                self.graphql_type, self.concurrently, self.max_concurrency
             ),
         )
 
+        # Leaf fields resolved by the default resolver, without arguments nor
+        # directives on field execution, are resolved inline on execution
+        self.sync_resolver = None
+        if (
+            not self.raw_resolver
+            and not custom_default_resolver
+            and not self.arguments
+            and not any(
+                "on_field_execution" in directive["callables"]
+                for directive in directives_definition
+            )
+        ):
+            sync_output_coercer = get_sync_output_coercer(self.graphql_type)
+            if sync_output_coercer is not None:
+                self.sync_resolver = partial(
+                    resolve_field_synchronously,
+                    field_definition=self,
+                    output_coercer=sync_output_coercer,
+                )
+
         for argument in self.arguments.values():
             argument.bake(schema)
             self.args.append(argument)
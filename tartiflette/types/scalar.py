@@ -61,6 +61,7 @@ class GraphQLScalarType(GraphQLInputType, GraphQLType):
 
         # Coercers
         self.coerce_output: Optional[Callable] = None
+        self.coerce_output_many: Optional[Callable] = None
         self.coerce_input: Optional[Callable] = None
         self.parse_literal: Optional[Callable] = None
         self.input_coercer: Optional[Callable] = None
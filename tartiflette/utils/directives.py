@@ -163,18 +163,20 @@ async def directive_executor(
     :param context_coercer: context passed to the query execution to use on
     argument coercion process
     :param wrapped_func: the inner callable to call after the directive
+    :param kwargs: keyword arguments of the engine, handed over to the inner
+    callable rather than to the directive
     :type directive_func: Callable
     :type directive_args: Callable
     :type wrapped_func: Callable
     :type context_coercer: Optional[Any]
+    :type kwargs: Dict[str, Any]
     :return: the computed value
     :rtype: Any
     """
     return await directive_func(
         await directive_arguments_coercer(ctx=context_coercer),
-        partial(wrapped_func, context_coercer=context_coercer),
+        partial(wrapped_func, context_coercer=context_coercer, **kwargs),
         *args,
-        **kwargs,
     )
 
 
@@ -0,0 +1,347 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import NonAwaitableResolver
+
+_SDL = """
+interface Named {
+  name: String
+}
+
+type Owner implements Named {
+  name: String
+}
+
+type Dog implements Named {
+  id: Int!
+  name: String
+  owner(suffix: String): Owner
+  friends: [Dog]
+  score: Int!
+}
+
+type Cat implements Named {
+  name: String
+}
+
+type Query {
+  dogs: [Dog]
+  chunkedDogs: [Dog]
+  sequentialDogs: [Dog]
+  dog: Dog
+  pets: [Named]
+}
+"""
+
+_DOGS = [{"id": index, "name": f"Dog {index}"} for index in range(4)]
+
+
+@pytest.fixture
+async def engine_and_calls(random_schema_name):
+    calls = []
+
+    @Resolver("Query.dogs", schema_name=random_schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return _DOGS
+
+    @Resolver(
+        "Query.chunkedDogs", schema_name=random_schema_name, max_concurrency=2
+    )
+    async def resolve_query_chunked_dogs(parent, args, ctx, info):
+        return _DOGS
+
+    @Resolver(
+        "Query.sequentialDogs",
+        schema_name=random_schema_name,
+        concurrently=False,
+    )
+    async def resolve_query_sequential_dogs(parent, args, ctx, info):
+        return _DOGS[:2]
+
+    @Resolver("Query.dog", schema_name=random_schema_name)
+    async def resolve_query_dog(parent, args, ctx, info):
+        return _DOGS[0]
+
+    @Resolver("Query.pets", schema_name=random_schema_name)
+    async def resolve_query_pets(parent, args, ctx, info):
+        return [
+            {**_DOGS[0], "_typename": "Dog"},
+            {"name": "Cat", "_typename": "Cat"},
+            {**_DOGS[1], "_typename": "Dog"},
+            None,
+        ]
+
+    @Resolver("Dog.owner", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_owner(parents, args, ctx, info):
+        calls.append(("owner", [parent["id"] for parent in parents]))
+        return [
+            {"name": f"Owner of {parent['name']}{args.get('suffix', '')}"}
+            for parent in parents
+        ]
+
+    @Resolver("Dog.friends", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_friends(parents, args, ctx, info):
+        calls.append(("friends", [parent["id"] for parent in parents]))
+        return [[_DOGS[(parent["id"] + 1) % len(_DOGS)]] for parent in parents]
+
+    @Resolver("Dog.score", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_score(parents, args, ctx, info):
+        calls.append(("score", [parent["id"] for parent in parents]))
+        return [
+            ValueError(f"No score for {parent['name']}.")
+            if parent["id"] % 2
+            else parent["id"] * 10
+            for parent in parents
+        ]
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_flags(engine_and_calls):
+    engine, _ = engine_and_calls
+    assert engine._schema.has_batch_resolvers
+    assert engine._schema.find_type("Dog").find_field("owner").batch
+    assert not engine._schema.find_type("Dog").find_field("name").batch
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_single_call_per_list(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert (
+        await engine.execute(
+            """
+        {
+          dogs {
+            id
+            owner { name }
+            other: owner(suffix: "!") { name }
+          }
+        }
+        """
+        )
+        == {
+            "data": {
+                "dogs": [
+                    {
+                        "id": index,
+                        "owner": {"name": f"Owner of Dog {index}"},
+                        "other": {"name": f"Owner of Dog {index}!"},
+                    }
+                    for index in range(4)
+                ]
+            }
+        }
+    )
+    assert sorted(calls) == [
+        ("owner", [0, 1, 2, 3]),
+        ("owner", [0, 1, 2, 3]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_nested_lists(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute(
+        "{ dogs { id friends { id owner { name } } } }"
+    ) == {
+        "data": {
+            "dogs": [
+                {
+                    "id": index,
+                    "friends": [
+                        {
+                            "id": (index + 1) % 4,
+                            "owner": {
+                                "name": f"Owner of Dog {(index + 1) % 4}"
+                            },
+                        }
+                    ],
+                }
+                for index in range(4)
+            ]
+        }
+    }
+    # The items of every friends list are at the same depth
+    assert calls == [("friends", [0, 1, 2, 3]), ("owner", [1, 2, 3, 0])]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_per_item_errors(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute("{ dogs { id score } }") == {
+        "data": {
+            "dogs": [{"id": 0, "score": 0}, None, {"id": 2, "score": 20}, None]
+        },
+        "errors": [
+            {
+                "message": "No score for Dog 1.",
+                "path": ["dogs", 1, "score"],
+                "locations": [{"line": 1, "column": 13}],
+            },
+            {
+                "message": "No score for Dog 3.",
+                "path": ["dogs", 3, "score"],
+                "locations": [{"line": 1, "column": 13}],
+            },
+        ],
+    }
+    assert calls == [("score", [0, 1, 2, 3])]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_abstract_list(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute(
+        "{ pets { name ... on Dog { owner { name } } } }"
+    ) == {
+        "data": {
+            "pets": [
+                {"name": "Dog 0", "owner": {"name": "Owner of Dog 0"}},
+                {"name": "Cat"},
+                {"name": "Dog 1", "owner": {"name": "Owner of Dog 1"}},
+                None,
+            ]
+        }
+    }
+    assert calls == [("owner", [0, 1])]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_without_list(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute(
+        "{ dog { owner { name } } sequentialDogs { owner { name } } }"
+    ) == {
+        "data": {
+            "dog": {"owner": {"name": "Owner of Dog 0"}},
+            "sequentialDogs": [
+                {"owner": {"name": "Owner of Dog 0"}},
+                {"owner": {"name": "Owner of Dog 1"}},
+            ],
+        }
+    }
+    assert sorted(calls) == [("owner", [0]), ("owner", [0]), ("owner", [1])]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_chunked_list(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute("{ chunkedDogs { owner { name } } }") == {
+        "data": {
+            "chunkedDogs": [
+                {"owner": {"name": f"Owner of Dog {index}"}}
+                for index in range(4)
+            ]
+        }
+    }
+    # Items are completed chunk by chunk
+    assert calls == [("owner", [0, 1]), ("owner", [2, 3])]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_invalid_result(random_schema_name):
+    @Resolver("Query.dogs", schema_name=random_schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return _DOGS[:2]
+
+    @Resolver("Dog.name", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_name(parents, args, ctx, info):
+        return ["Only one"]
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    assert await engine.execute("{ dogs { name } }") == {
+        "data": {"dogs": [{"name": None}, {"name": None}]},
+        "errors": [
+            {
+                "message": "Batch resolver < Dog.name > has to return a list "
+                "with one result per parent, expected 2 results.",
+                "path": ["dogs", index, "name"],
+                "locations": [{"line": 1, "column": 10}],
+            }
+            for index in range(2)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_with_jit(random_schema_name):
+    @Resolver("Query.dogs", schema_name=random_schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return _DOGS
+
+    calls = []
+
+    @Resolver("Dog.owner", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_owner(parents, args, ctx, info):
+        calls.append([parent["id"] for parent in parents])
+        return [{"name": parent["name"]} for parent in parents]
+
+    engine = await create_engine(
+        _SDL, schema_name=random_schema_name, jit=True, jit_threshold=1
+    )
+    for _ in range(2):
+        assert await engine.execute("{ dogs { id owner { name } } }") == {
+            "data": {
+                "dogs": [
+                    {"id": index, "owner": {"name": f"Dog {index}"}}
+                    for index in range(4)
+                ]
+            }
+        }
+    assert calls == [[0, 1, 2, 3], [0, 1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_resolvers_breadth_first(random_schema_name):
+    @Resolver("Query.dogs", schema_name=random_schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return _DOGS
+
+    calls = []
+
+    @Resolver("Dog.friends", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_friends(parents, args, ctx, info):
+        calls.append(("friends", [parent["id"] for parent in parents]))
+        return [_DOGS[: parent["id"]] for parent in parents]
+
+    @Resolver("Dog.owner", schema_name=random_schema_name, batch=True)
+    async def resolve_dog_owner(parents, args, ctx, info):
+        calls.append(("owner", [parent["id"] for parent in parents]))
+        return [{"name": parent["name"]} for parent in parents]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        execution_strategy="breadth_first",
+    )
+    assert await engine.execute(
+        "{ dogs { friends { id owner { name } } owner { name } } }"
+    ) == {
+        "data": {
+            "dogs": [
+                {
+                    "friends": [
+                        {"id": friend, "owner": {"name": f"Dog {friend}"}}
+                        for friend in range(index)
+                    ],
+                    "owner": {"name": f"Dog {index}"},
+                }
+                for index in range(4)
+            ]
+        }
+    }
+    assert sorted(calls) == [
+        ("friends", [0, 1, 2, 3]),
+        ("owner", [0, 0, 1, 0, 1, 2]),
+        ("owner", [0, 1, 2, 3]),
+    ]
+
+
+def test_batch_resolvers_must_be_awaitable():
+    with pytest.raises(NonAwaitableResolver):
+
+        @Resolver("Dog.owner", schema_name="unused", batch=True)
+        def resolve_dog_owner(parents, args, ctx, info):
+            return []
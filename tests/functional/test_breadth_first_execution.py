@@ -0,0 +1,229 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Leaf {
+  name: String
+  required: String!
+}
+
+type Node {
+  id: Int
+  name: String!
+  children: [Node]
+  strictChildren: [Node!]
+  leaf: Leaf
+  strictLeaf: Leaf!
+}
+
+type Query {
+  nodes: [Node]
+  sequentialNodes: [Node]
+  node: Node
+}
+
+type Mutation {
+  createNode: Node
+}
+"""
+
+
+async def _create_engine(schema_name, calls, execution_strategy, **kwargs):
+    @Resolver("Query.nodes", schema_name=schema_name)
+    async def resolve_query_nodes(parent, args, ctx, info):
+        calls.append(("nodes", None))
+        return [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
+
+    @Resolver(
+        "Query.sequentialNodes", schema_name=schema_name, concurrently=False
+    )
+    async def resolve_query_sequential_nodes(parent, args, ctx, info):
+        calls.append(("sequentialNodes", None))
+        return [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
+
+    @Resolver("Query.node", schema_name=schema_name)
+    async def resolve_query_node(parent, args, ctx, info):
+        calls.append(("node", None))
+        return {"id": 0, "name": "zero"}
+
+    @Resolver("Mutation.createNode", schema_name=schema_name)
+    async def resolve_mutation_create_node(parent, args, ctx, info):
+        calls.append(("createNode", None))
+        return {"id": 0, "name": "zero"}
+
+    @Resolver("Node.children", schema_name=schema_name)
+    async def resolve_node_children(parent, args, ctx, info):
+        # A slow sibling lets a depth-first execution descend into the other
+        # siblings before it's resolved
+        await asyncio.sleep(0.01 if parent["id"] == 1 else 0)
+        calls.append(("children", parent["id"]))
+        if parent["id"] >= 10:
+            return [{"id": parent["id"] * 10, "name": None}]
+        return [
+            {
+                "id": parent["id"] * 10 + index,
+                "name": f"{parent['name']}.{index}",
+            }
+            for index in range(2)
+        ]
+
+    @Resolver("Node.strictChildren", schema_name=schema_name)
+    async def resolve_node_strict_children(parent, args, ctx, info):
+        calls.append(("strictChildren", parent["id"]))
+        return [{"id": parent["id"] * 10, "name": None}]
+
+    @Resolver("Node.leaf", schema_name=schema_name)
+    async def resolve_node_leaf(parent, args, ctx, info):
+        calls.append(("leaf", parent["id"]))
+        if parent["id"] % 2:
+            raise ValueError(f"No leaf for {parent['id']}.")
+        return {"name": f"leaf {parent['id']}", "required": None}
+
+    @Resolver("Node.strictLeaf", schema_name=schema_name)
+    async def resolve_node_strict_leaf(parent, args, ctx, info):
+        calls.append(("strictLeaf", parent["id"]))
+        return {"name": f"leaf {parent['id']}", "required": "yes"}
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        execution_strategy=execution_strategy,
+        **kwargs,
+    )
+
+
+def _sort_errors(result):
+    result["errors"] = sorted(
+        result.get("errors", []), key=lambda error: str(error["path"])
+    )
+    return result
+
+
+@pytest.fixture
+async def engines(random_schema_name):
+    calls = []
+    depth_first = await _create_engine(random_schema_name, calls, None)
+    breadth_first = await _create_engine(
+        f"{random_schema_name}_breadth_first", calls, "breadth_first"
+    )
+    return depth_first, breadth_first, calls
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_resolves_level_by_level(engines):
+    _, engine, calls = engines
+    result = await engine.execute(
+        "{ nodes { id children { id children { id } } } }"
+    )
+    assert result == {
+        "data": {
+            "nodes": [
+                {
+                    "id": node_id,
+                    "children": [
+                        {
+                            "id": node_id * 10 + index,
+                            "children": [{"id": (node_id * 10 + index) * 10}],
+                        }
+                        for index in range(2)
+                    ],
+                }
+                for node_id in (1, 2)
+            ]
+        }
+    }
+    depths = [1 if parent_id < 10 else 2 for _, parent_id in calls[1:]]
+    assert calls[0] == ("nodes", None)
+    assert depths == sorted(depths)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ nodes { id children { id name } } }",
+        "{ nodes { id leaf { name } } }",
+        "{ nodes { id leaf { required } } }",
+        "{ nodes { id children { id children { id name } } } }",
+        "{ nodes { id strictChildren { id name } } }",
+        "{ node { id strictChildren { id leaf { name } } } }",
+        "{ sequentialNodes { id children { id leaf { name } } } }",
+        "{ node { strictLeaf { name } children { strictLeaf { required } } } }",  # noqa: E501
+        "mutation { createNode { id children { id children { id name } } } }",
+    ],
+)
+@pytest.mark.asyncio
+async def test_breadth_first_matches_depth_first(engines, query):
+    depth_first, breadth_first, _ = engines
+    assert _sort_errors(await breadth_first.execute(query)) == _sort_errors(
+        await depth_first.execute(query)
+    )
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_unknown_strategy(random_schema_name):
+    with pytest.raises(
+        ImproperlyConfigured,
+        match="Unknown execution strategy < unknown >",
+    ):
+        await create_engine(
+            "type Query { a: String }",
+            schema_name=random_schema_name,
+            execution_strategy="unknown",
+        )
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_with_jit(random_schema_name):
+    with pytest.raises(ImproperlyConfigured):
+        await create_engine(
+            "type Query { a: String }",
+            schema_name=random_schema_name,
+            execution_strategy="breadth_first",
+            jit=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_max_concurrency(engines, random_schema_name):
+    depth_first, breadth_first, calls = engines
+    bounded = await _create_engine(
+        f"{random_schema_name}_bounded",
+        calls,
+        "breadth_first",
+        breadth_first_max_concurrency=1,
+    )
+    query = "{ nodes { id children { id leaf { name } } } }"
+
+    result = await breadth_first.execute(query)
+    assert [call for call in calls if call[0] == "children"] == [
+        ("children", 2),
+        ("children", 1),
+    ]
+
+    calls.clear()
+    assert _sort_errors(await bounded.execute(query)) == _sort_errors(result)
+    assert [call for call in calls if call[0] == "children"] == [
+        ("children", 1),
+        ("children", 2),
+    ]
+    assert _sort_errors(result) == _sort_errors(
+        await depth_first.execute(query)
+    )
+
+
+@pytest.mark.asyncio
+async def test_breadth_first_invalid_max_concurrency(random_schema_name):
+    with pytest.raises(
+        ImproperlyConfigured,
+        match="< breadth_first_max_concurrency > has to be greater than 0.",
+    ):
+        await create_engine(
+            "type Query { a: String }",
+            schema_name=random_schema_name,
+            execution_strategy="breadth_first",
+            breadth_first_max_concurrency=0,
+        )
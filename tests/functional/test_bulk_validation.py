@@ -0,0 +1,158 @@
+import multiprocessing
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.bulk_validation import (
+    QueryValidationResult,
+    validate_queries,
+    validate_queries_async,
+)
+from tartiflette.language.limits import QueryLimits
+
+_SDL = """
+type Query {
+  hello(name: String): String
+  user: User
+}
+
+type User {
+  name: String
+}
+"""
+
+_QUERIES = [
+    "{ hello }",
+    "{ unknown }",
+    'query Hello { hello(name: "Foo") user { name } }',
+    "{ user }",
+    "query { user { name } }",
+] * 7
+
+
+def _tags(result):
+    return [error["extensions"]["tag"] for error in result.errors]
+
+
+def _expected_tags():
+    return [
+        [],
+        ["field-selections-on-objects-interfaces-and-unions-types"],
+        [],
+        ["leaf-field-selections"],
+        [],
+    ] * 7
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_validate_queries(processes):
+    results = list(
+        validate_queries(
+            _QUERIES,
+            _SDL,
+            processes=processes,
+            chunksize=3,
+        )
+    )
+
+    assert all(isinstance(result, QueryValidationResult) for result in results)
+    assert [result.index for result in results] == list(range(len(_QUERIES)))
+    assert [_tags(result) for result in results] == _expected_tags()
+    assert [result.valid for result in results] == [
+        not tags for tags in _expected_tags()
+    ]
+    assert all(result.document is None for result in results)
+
+
+@pytest.mark.skipif(
+    "spawn" not in multiprocessing.get_all_start_methods(),
+    reason="spawn start method unavailable",
+)
+def test_validate_queries_spawn():
+    results = validate_queries(
+        _QUERIES[:5],
+        _SDL,
+        processes=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert [_tags(result) for result in results] == _expected_tags()[:5]
+
+
+def test_validate_queries_repeated():
+    # Each call bakes its schema under a private schema name
+    for _ in range(2):
+        assert [
+            _tags(result)
+            for result in validate_queries(_QUERIES[:5], _SDL, processes=0)
+        ] == _expected_tags()[:5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("processes", [0, 2])
+async def test_validate_queries_async(processes):
+    results = [
+        result
+        async for result in validate_queries_async(
+            _QUERIES, _SDL, processes=processes, chunksize=3
+        )
+    ]
+
+    assert [result.index for result in results] == list(range(len(_QUERIES)))
+    assert [_tags(result) for result in results] == _expected_tags()
+
+
+def test_validate_queries_engine_options():
+    results = list(
+        validate_queries(
+            _QUERIES[:5],
+            _SDL,
+            processes=0,
+            query_limits=QueryLimits(max_fields=2),
+            disabled_validation_rules=["leaf-field-selections"],
+        )
+    )
+
+    assert [result.valid for result in results] == [
+        True,
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert "fields" in results[2].errors[0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_validate_queries_dump_documents(random_schema_name):
+    results = [
+        result
+        async for result in validate_queries_async(
+            _QUERIES[:5], _SDL, processes=0, dump_documents=True
+        )
+    ]
+    assert [result.document is not None for result in results] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args.get('name')}"
+
+    @Resolver("Query.user", schema_name=random_schema_name)
+    async def resolve_query_user(parent, args, ctx, info):
+        return {"name": "Bar"}
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    query = _QUERIES[2]
+    engine.load_query(query, results[2].document)
+    # pylint: disable=protected-access
+    assert engine._cached_parse_and_validate_query.cache_info().currsize == 1
+
+    assert await engine.execute(query) == {
+        "data": {"hello": "Hello Foo", "user": {"name": "Bar"}}
+    }
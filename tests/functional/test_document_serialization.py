@@ -0,0 +1,113 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.language.serialization import dump_document, load_document
+from tartiflette.types.exceptions.tartiflette import DocumentSerializationError
+
+_SDL = """
+type Query {
+  hello(name: String): String
+  names(filter: NameFilter): [String]
+}
+
+input NameFilter {
+  prefixes: [String!]
+  limit: Int
+  exact: Boolean
+  ratio: Float
+}
+"""
+
+_QUERY = """
+query Hello($name: String = "World", $filter: NameFilter!) {
+  greeting: hello(name: $name)
+  ...NamesFragment @include(if: true)
+  ... on Query {
+    other: hello(name: null)
+  }
+}
+
+fragment NamesFragment on Query {
+  names(filter: {prefixes: ["a", "b"], limit: 2, exact: false, ratio: 1.5})
+  filtered: names(filter: $filter)
+}
+"""
+
+
+async def _create_engine(schema_name, sdl=_SDL):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name']}"
+
+    @Resolver("Query.names", schema_name=schema_name)
+    async def resolve_query_names(parent, args, ctx, info):
+        return args["filter"]["prefixes"][: args["filter"].get("limit")]
+
+    return await create_engine(sdl, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_document_serialization(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+    # pylint: disable=protected-access
+    schema = engine._schema
+    document, errors = engine._cached_parse_and_validate_query(_QUERY, schema)
+    assert errors is None
+
+    data = dump_document(document, schema, _QUERY)
+    loaded_document = load_document(data, schema, _QUERY)
+    assert loaded_document == document
+    assert loaded_document.plan is not None
+    assert dump_document(loaded_document, schema, _QUERY) == data
+    assert load_document(data, schema, _QUERY.encode("UTF-8")) == document
+
+
+@pytest.mark.asyncio
+async def test_engine_load_query(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+    data = await engine.dump_query(_QUERY)
+
+    other_engine = await _create_engine(f"{random_schema_name}_other")
+    other_engine.load_query(_QUERY, data)
+    assert await other_engine.execute(
+        _QUERY, variables={"filter": {"prefixes": ["c"]}}
+    ) == {
+        "data": {
+            "greeting": "Hello World",
+            "names": ["a", "b"],
+            "filtered": ["c"],
+            "other": "Hello None",
+        }
+    }
+    # pylint: disable=protected-access
+    assert other_engine._cached_parse_and_validate_query.cache_info()[:2] == (
+        1,
+        0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_document_serialization_errors(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+    data = await engine.dump_query(_QUERY)
+
+    with pytest.raises(DocumentSerializationError, match="Only valid"):
+        await engine.dump_query("{ unknown }")
+
+    with pytest.raises(DocumentSerializationError, match="corrupted"):
+        engine.load_query(_QUERY, data[:-10])
+
+    with pytest.raises(DocumentSerializationError, match="another schema"):
+        engine.load_query(_QUERY, b"XXXX" + data[4:])
+
+    # documents are bound to the query they've been parsed from
+    with pytest.raises(DocumentSerializationError, match="another query"):
+        engine.load_query("{ hello }", data)
+
+    # documents are invalidated once the schema changes
+    other_engine = await _create_engine(
+        f"{random_schema_name}_other",
+        sdl=_SDL + "\nextend type Query { other: String }",
+    )
+    with pytest.raises(DocumentSerializationError, match="another schema"):
+        other_engine.load_query(_QUERY, data)
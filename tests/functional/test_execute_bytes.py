@@ -0,0 +1,130 @@
+import io
+import json
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  tags: [String]
+}
+
+type Query {
+  items(count: Int!): [Item]
+  failing: String
+}
+"""
+
+_QUERY = "query ($count: Int!) { items(count: $count) { id name tags } }"
+
+
+@pytest.fixture
+async def engine(random_schema_name):
+    @Resolver("Query.items", schema_name=random_schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [
+            {
+                "id": item_id,
+                "name": f'Ĩtem "#{item_id}"' if item_id % 3 else None,
+                "tags": ["a", "é"] if item_id % 2 else [],
+            }
+            for item_id in range(args["count"])
+        ]
+
+    @Resolver("Query.failing", schema_name=random_schema_name)
+    async def resolve_query_failing(parent, args, ctx, info):
+        raise ValueError("Failing.")
+
+    return await create_engine(_SDL, schema_name=random_schema_name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 1, 1000])
+async def test_execute_bytes(engine, count):
+    encoded = await engine.execute_bytes(_QUERY, variables={"count": count})
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == await engine.execute(
+        _QUERY, variables={"count": count}
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_bytes_errors(engine):
+    encoded = await engine.execute_bytes("{ failing }")
+    assert json.loads(encoded) == {
+        "data": {"failing": None},
+        "errors": [
+            {
+                "message": "Failing.",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("buffer", [io.BytesIO(), bytearray()])
+async def test_execute_bytes_into_buffer(engine, buffer):
+    assert (
+        await engine.execute_bytes(
+            _QUERY, variables={"count": 5000}, buffer=buffer
+        )
+        is None
+    )
+    content = buffer.getvalue() if isinstance(buffer, io.BytesIO) else buffer
+    assert json.loads(content) == await engine.execute(
+        _QUERY, variables={"count": 5000}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [None, 1024, 4096])
+async def test_execute_stream(engine, chunk_size):
+    chunks = [
+        chunk
+        async for chunk in engine.execute_stream(
+            _QUERY, variables={"count": 500}, chunk_size=chunk_size
+        )
+    ]
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    if chunk_size:
+        assert len(chunks) > 1
+        # Chunks exceed the requested size by at most a slice of list items
+        assert all(len(chunk) < chunk_size + 4096 for chunk in chunks)
+    assert b"".join(chunks) == await engine.execute_bytes(
+        _QUERY, variables={"count": 500}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "json_dumper",
+    [json.dumps, lambda response: json.dumps(response).encode("utf-8")],
+)
+async def test_execute_bytes_json_dumper(random_schema_name, json_dumper):
+    calls = []
+
+    def dumper(response):
+        calls.append(response)
+        return json_dumper(response)
+
+    @Resolver("Query.failing", schema_name=random_schema_name)
+    async def resolve_query_failing(parent, args, ctx, info):
+        return "Not failing"
+
+    engine = await create_engine(
+        _SDL, schema_name=random_schema_name, json_dumper=dumper
+    )
+    assert engine._schema.json_dumper is dumper
+
+    expected = json.dumps({"data": {"failing": "Not failing"}}).encode()
+    assert await engine.execute_bytes("{ failing }") == expected
+    assert [
+        chunk
+        async for chunk in engine.execute_stream("{ failing }", chunk_size=8)
+    ] == [expected[start : start + 8] for start in range(0, len(expected), 8)]
+    assert len(calls) == 2
@@ -0,0 +1,90 @@
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+directive @upper on FIELD
+
+type Dog {
+  name(prefix: String = ""): String!
+  nickname: String
+}
+
+type Query {
+  dog(id: Int!): Dog
+}
+"""
+
+
+@pytest.fixture
+async def engine(random_schema_name):
+    @Directive("upper", schema_name=random_schema_name)
+    class UpperDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return (await next_resolver(parent, args, ctx, info)).upper()
+
+    @Resolver("Query.dog", schema_name=random_schema_name)
+    async def resolve_query_dog(parent, args, ctx, info):
+        return {"name": f"Dog #{args['id']}", "nickname": "Doggo"}
+
+    @Resolver("Dog.name", schema_name=random_schema_name)
+    async def resolve_dog_name(parent, args, ctx, info):
+        return f"{args['prefix']}{parent['name']}"
+
+    return await create_engine(_SDL, schema_name=random_schema_name)
+
+
+@pytest.mark.asyncio
+async def test_execution_plan_is_cached_with_the_document(engine):
+    query = '{ dog(id: 1) { name(prefix: "Mr. ") nickname @upper } }'
+
+    document, errors = engine._cached_parse_and_validate_query(
+        query, engine._schema
+    )
+    assert not errors
+    assert document.plan is not None
+
+    for _ in range(3):
+        assert await engine.execute(query) == {
+            "data": {"dog": {"name": "Mr. Dog #1", "nickname": "DOGGO"}}
+        }
+
+    assert (
+        engine._cached_parse_and_validate_query(query, engine._schema)[0]
+        is document
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "variables,expected",
+    [
+        (
+            {"id": 1, "withName": True},
+            {"data": {"dog": {"name": "Dog #1", "nickname": "Doggo"}}},
+        ),
+        (
+            {"id": 2, "withName": False},
+            {"data": {"dog": {"nickname": "Doggo"}}},
+        ),
+        (
+            {"id": 3, "withName": True},
+            {"data": {"dog": {"name": "Dog #3", "nickname": "Doggo"}}},
+        ),
+    ],
+)
+async def test_execution_plan_with_variables(engine, variables, expected):
+    query = """
+    query Dog($id: Int!, $withName: Boolean!) {
+      dog(id: $id) {
+        ... on Dog @include(if: $withName) { name }
+        nickname
+      }
+    }
+    """
+
+    for _ in range(2):
+        assert await engine.execute(query, variables=variables) == expected
@@ -0,0 +1,494 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+type Author {
+  name: String
+  bio: String
+}
+
+type Book {
+  id: Int!
+  title: String
+  author: Author!
+}
+
+type Query {
+  hello: String
+  slow: String
+  books(kind: String = "list"): [Book]
+  sequentialBooks: [Book]
+  ids: [Int!]
+  tags: [String]
+}
+
+type Mutation {
+  addBook: Book
+}
+"""
+
+_BOOKS = [
+    {"id": book_id, "title": f"Book #{book_id}", "author": {"name": "Name"}}
+    for book_id in range(3)
+]
+
+
+async def _async_generator(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+@pytest.fixture
+async def engine(random_schema_name):
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello"
+
+    @Resolver("Query.slow", schema_name=random_schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        await asyncio.sleep(0.01)
+        if ctx is not None:
+            ctx["slow_resolved"] = True
+        return "Slow"
+
+    @Resolver("Query.books", schema_name=random_schema_name)
+    async def resolve_query_books(parent, args, ctx, info):
+        if args["kind"] == "async_generator":
+            return _async_generator(_BOOKS)
+        if args["kind"] == "generator":
+            return (book for book in _BOOKS)
+        return _BOOKS
+
+    @Resolver(
+        "Query.sequentialBooks",
+        schema_name=random_schema_name,
+        concurrently=False,
+    )
+    async def resolve_query_sequential_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Query.ids", schema_name=random_schema_name)
+    async def resolve_query_ids(parent, args, ctx, info):
+        return [1, 2, None, 4]
+
+    @Resolver("Query.tags", schema_name=random_schema_name)
+    async def resolve_query_tags(parent, args, ctx, info):
+        return ["a", "b", "c"]
+
+    @Resolver("Author.bio", schema_name=random_schema_name)
+    async def resolve_author_bio(parent, args, ctx, info):
+        if ctx and ctx.get("fail_bio"):
+            raise ValueError("No bio.")
+        return "Bio"
+
+    @Resolver("Book.author", schema_name=random_schema_name)
+    async def resolve_book_author(parent, args, ctx, info):
+        if ctx and ctx.get("null_author") == parent["id"]:
+            return None
+        return parent["author"]
+
+    @Resolver("Mutation.addBook", schema_name=random_schema_name)
+    async def resolve_mutation_add_book(parent, args, ctx, info):
+        return _BOOKS[0]
+
+    return await create_engine(
+        _SDL, schema_name=random_schema_name, incremental_delivery=True
+    )
+
+
+async def _collect(engine, query, **kwargs):
+    payloads = [
+        payload
+        async for payload in engine.execute_incremental(query, **kwargs)
+    ]
+    initial, subsequents = payloads[0], payloads[1:]
+    if subsequents:
+        assert initial.pop("hasNext") is True
+        assert [payload["hasNext"] for payload in subsequents] == [True] * (
+            len(subsequents) - 1
+        ) + [False]
+    incremental = [
+        result
+        for payload in subsequents
+        for result in payload.get("incremental", [])
+    ]
+    return initial, incremental
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_without_directives(engine):
+    payloads = [
+        payload
+        async for payload in engine.execute_incremental("{ hello slow }")
+    ]
+    assert payloads == [{"data": {"hello": "Hello", "slow": "Slow"}}]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_defer(engine):
+    initial, incremental = await _collect(
+        engine,
+        """
+        {
+          hello
+          ... @defer(label: "slowFragment") { slow }
+          ...SlowFragment @defer
+        }
+
+        fragment SlowFragment on Query { slow }
+        """,
+    )
+    assert initial == {"data": {"hello": "Hello"}}
+    assert sorted(incremental, key=lambda result: "label" in result) == [
+        {"data": {"slow": "Slow"}, "path": []},
+        {"data": {"slow": "Slow"}, "path": [], "label": "slowFragment"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_defer_disabled(engine):
+    assert [
+        payload
+        async for payload in engine.execute_incremental(
+            "query ($defer: Boolean!) "
+            "{ hello ... @defer(if: $defer) { slow } }",
+            variables={"defer": False},
+        )
+    ] == [{"data": {"hello": "Hello", "slow": "Slow"}}]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_nested_defer(engine):
+    initial, incremental = await _collect(
+        engine,
+        """
+        {
+          books {
+            id
+            ... @defer(label: "author") {
+              author { name ... @defer(label: "bio") { bio } }
+            }
+          }
+        }
+        """,
+    )
+    assert initial == {"data": {"books": [{"id": 0}, {"id": 1}, {"id": 2}]}}
+    assert len(incremental) == 6
+    for book_id in range(3):
+        author_index = incremental.index(
+            {
+                "data": {"author": {"name": "Name"}},
+                "path": ["books", book_id],
+                "label": "author",
+            }
+        )
+        # Nested fragments are delivered after their parent
+        assert (
+            incremental.index(
+                {
+                    "data": {"bio": "Bio"},
+                    "path": ["books", book_id, "author"],
+                    "label": "bio",
+                }
+            )
+            > author_index
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_defer_errors(engine):
+    initial, incremental = await _collect(
+        engine,
+        "{ books { id author { ... @defer { bio } } } }",
+        context={"fail_bio": True},
+    )
+    assert initial == {
+        "data": {
+            "books": [{"id": book_id, "author": {}} for book_id in range(3)]
+        }
+    }
+    assert sorted(incremental, key=lambda result: result["path"]) == [
+        {
+            "data": {"bio": None},
+            "errors": [
+                {
+                    "message": "No bio.",
+                    "path": ["books", book_id, "author", "bio"],
+                    "locations": [{"line": 1, "column": 36}],
+                }
+            ],
+            "path": ["books", book_id, "author"],
+        }
+        for book_id in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_defer_dropped_on_null_parent(engine):
+    initial, incremental = await _collect(
+        engine,
+        "{ books { id ... @defer { title } author { name } } }",
+        context={"null_author": 1},
+    )
+    assert initial == {
+        "data": {
+            "books": [
+                {"id": 0, "author": {"name": "Name"}},
+                None,
+                {"id": 2, "author": {"name": "Name"}},
+            ]
+        },
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field "
+                "Book.author.",
+                "path": ["books", 1, "author"],
+                "locations": [{"line": 1, "column": 35}],
+            }
+        ],
+    }
+    # The fragment deferred on the nulled book isn't delivered
+    assert sorted(incremental, key=lambda result: result["path"]) == [
+        {"data": {"title": f"Book #{book_id}"}, "path": ["books", book_id]}
+        for book_id in (0, 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_defer_on_mutation(engine):
+    assert [
+        payload
+        async for payload in engine.execute_incremental(
+            "mutation { ... @defer { addBook { id } } }"
+        )
+    ] == [{"data": {"addBook": {"id": 0}}}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["list", "generator", "async_generator"])
+async def test_incremental_delivery_stream(engine, kind):
+    initial, incremental = await _collect(
+        engine,
+        "query ($kind: String) "
+        '{ books(kind: $kind) @stream(initialCount: 1, label: "books") '
+        "{ id title } }",
+        variables={"kind": kind},
+    )
+    assert initial == {"data": {"books": [{"id": 0, "title": "Book #0"}]}}
+    # Streamed items are delivered in order
+    assert incremental == [
+        {
+            "items": [{"id": book_id, "title": f"Book #{book_id}"}],
+            "path": ["books", book_id],
+            "label": "books",
+        }
+        for book_id in (1, 2)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("field_name", ["sequentialBooks", "tags"])
+async def test_incremental_delivery_stream_coercers(engine, field_name):
+    selection = " { id }" if field_name == "sequentialBooks" else ""
+    expected = (
+        [{"id": book["id"]} for book in _BOOKS]
+        if selection
+        else ["a", "b", "c"]
+    )
+    initial, incremental = await _collect(
+        engine, f"{{ {field_name} @stream(initialCount: 2){selection} }}"
+    )
+    assert initial == {"data": {field_name: expected[:2]}}
+    assert incremental == [{"items": [expected[2]], "path": [field_name, 2]}]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_stream_stops_on_null_item(engine):
+    initial, incremental = await _collect(
+        engine, "{ ids @stream(initialCount: 1) }"
+    )
+    assert initial == {"data": {"ids": [1]}}
+    assert incremental == [
+        {"items": [2], "path": ["ids", 1]},
+        {
+            "items": None,
+            "errors": [
+                {
+                    "message": "Cannot return null for non-nullable field "
+                    "Query.ids.",
+                    "path": ["ids", 2],
+                    "locations": [{"line": 1, "column": 3}],
+                }
+            ],
+            "path": ["ids", 2],
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_stream_invalid_initial_count(engine):
+    assert [
+        payload
+        async for payload in engine.execute_incremental(
+            "{ tags @stream(initialCount: -1) }"
+        )
+    ] == [
+        {
+            "data": {"tags": None},
+            "errors": [
+                {
+                    "message": "initialCount must be a positive integer.",
+                    "path": ["tags"],
+                    "locations": [{"line": 1, "column": 3}],
+                }
+            ],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_closed_early(engine):
+    context = {}
+    payloads = engine.execute_incremental(
+        "{ hello ... @defer { slow } }", context=context
+    )
+
+    assert await payloads.__anext__() == {
+        "data": {"hello": "Hello"},
+        "hasNext": True,
+    }
+    # e.g. the client disconnected before the subsequent payloads
+    await payloads.aclose()
+    await asyncio.sleep(0.05)
+    assert "slow_resolved" not in context
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_schema_directive(random_schema_name):
+    @Directive("extended", schema_name=random_schema_name)
+    class ExtendedDirective:
+        @staticmethod
+        async def on_schema_execution(
+            directive_args,
+            next_directive,
+            schema,
+            document,
+            parsing_errors,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+        ):
+            result = await next_directive(
+                schema,
+                document,
+                parsing_errors,
+                operation_name,
+                context,
+                variables,
+                initial_value,
+            )
+            result["extensions"] = {"extended": True}
+            return result
+
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello"
+
+    engine = await create_engine(
+        """
+        directive @extended on SCHEMA
+
+        type Query {
+          hello: String
+        }
+
+        schema @extended {
+          query: Query
+        }
+        """,
+        schema_name=random_schema_name,
+        incremental_delivery=True,
+    )
+
+    for _ in range(2):
+        assert [
+            payload
+            async for payload in engine.execute_incremental(
+                "{ ... @defer { hello } }"
+            )
+        ] == [
+            {"data": {}, "hasNext": True, "extensions": {"extended": True}},
+            {
+                "incremental": [{"data": {"hello": "Hello"}, "path": []}],
+                "hasNext": False,
+            },
+        ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_ignored_by_execute(engine):
+    assert await engine.execute(
+        "{ hello ... @defer { slow } books @stream { id } }"
+    ) == {
+        "data": {
+            "hello": "Hello",
+            "slow": "Slow",
+            "books": [{"id": book["id"]} for book in _BOOKS],
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_disabled(random_schema_name):
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello"
+
+    engine = await create_engine(
+        """
+        directive @defer(reason: String) on FIELD
+
+        type Query {
+          hello: String
+        }
+        """,
+        schema_name=random_schema_name,
+    )
+
+    assert [
+        payload
+        async for payload in engine.execute_incremental(
+            '{ hello @defer(reason: "custom") }'
+        )
+    ] == [{"data": {"hello": "Hello"}}]
+    assert [
+        payload
+        async for payload in engine.execute_incremental(
+            "{ ... @defer { hello } }"
+        )
+    ] == [
+        {
+            "data": None,
+            "errors": [
+                {
+                    "message": "Directive < @defer > is not used in a valid location.",
+                    "path": None,
+                    "locations": [
+                        {"line": 1, "column": 3},
+                        {"line": 1, "column": 7},
+                    ],
+                    "extensions": {
+                        "spec": "June 2018",
+                        "rule": "5.7.2",
+                        "tag": "directives-are-in-valid-locations",
+                        "details": "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-In-Valid-Locations",
+                    },
+                }
+            ],
+        }
+    ]
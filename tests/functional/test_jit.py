@@ -0,0 +1,156 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+enum Color {
+  RED
+  BLUE
+}
+
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String!
+  nickname(prefix: String = ""): String
+  color: Color
+  tags: [String!]
+  friends: [Dog]
+}
+
+type Query {
+  dog(id: Int!): Dog
+  named: Named
+}
+
+type Mutation {
+  renameDog(name: String!): Dog
+}
+"""
+
+_QUERIES = [
+    """
+    query Dog($id: Int!) {
+      dog(id: $id) {
+        name
+        nickname(prefix: "Mr. ")
+        color
+        tags
+        friends { name __typename }
+      }
+    }
+    """,
+    """
+    query Dog($id: Int!, $withColor: Boolean!) {
+      dog(id: $id) {
+        name
+        color @include(if: $withColor)
+      }
+    }
+    """,
+    """
+    query Named {
+      named { name ... on Dog { color } }
+    }
+    """,
+    """
+    mutation RenameDog {
+      renameDog(name: "Snoopy") { name }
+    }
+    """,
+]
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.dog", schema_name=schema_name)
+    async def resolve_query_dog(parent, args, ctx, info):
+        if args["id"] == 2:
+            raise ValueError("Unknown dog.")
+        return {
+            "name": f"Dog #{args['id']}",
+            "nickname": "Doggo",
+            "color": "RED",
+            "tags": ["good", None] if args["id"] == 3 else ["good"],
+            "friends": [{"name": "Scooby"}, {"name": None}],
+        }
+
+    @Resolver("Query.named", schema_name=schema_name)
+    async def resolve_query_named(parent, args, ctx, info):
+        return {"_typename": "Dog", "name": "Named", "color": "BLUE"}
+
+    @Resolver("Mutation.renameDog", schema_name=schema_name)
+    async def resolve_mutation_rename_dog(parent, args, ctx, info):
+        return {"name": args["name"]}
+
+    @Resolver("Dog.nickname", schema_name=schema_name)
+    async def resolve_dog_nickname(parent, args, ctx, info):
+        return f"{args['prefix']}{parent['nickname']}"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", _QUERIES)
+@pytest.mark.parametrize(
+    "variables",
+    [
+        {"id": 1, "withColor": True},
+        {"id": 2, "withColor": True},
+        {"id": 3, "withColor": False},
+    ],
+)
+async def test_jit_results_match_interpreter(
+    random_schema_name, query, variables
+):
+    interpreted_engine = await _create_engine(random_schema_name)
+    jit_engine = await _create_engine(
+        f"{random_schema_name}_jit", jit=True, jit_threshold=1
+    )
+
+    expected = await interpreted_engine.execute(query, variables=variables)
+    for _ in range(3):
+        assert await jit_engine.execute(query, variables=variables) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,is_compiled",
+    [
+        (_QUERIES[0], True),
+        # Only the `dog` field relies on the interpreter
+        (_QUERIES[1], True),
+        (_QUERIES[3], False),
+    ],
+)
+async def test_jit_compiles_hot_operations(
+    random_schema_name, query, is_compiled
+):
+    engine = await _create_engine(
+        random_schema_name, jit=True, jit_threshold=2
+    )
+    variables = {"id": 1, "withColor": True}
+
+    document, _ = engine._cached_parse_and_validate_query(
+        query, engine._schema
+    )
+
+    await engine.execute(query, variables=variables)
+    assert not document.plan.compiled_operations
+
+    await engine.execute(query, variables=variables)
+    (compiled_operation,) = document.plan.compiled_operations.values()
+    assert (compiled_operation is not None) is is_compiled
+
+
+@pytest.mark.asyncio
+async def test_jit_disabled_by_default(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    document, _ = engine._cached_parse_and_validate_query(
+        _QUERIES[0], engine._schema
+    )
+    for _ in range(20):
+        await engine.execute(_QUERIES[0], variables={"id": 1})
+    assert not document.plan.compiled_operations
@@ -0,0 +1,210 @@
+import asyncio
+
+from array import array
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+}
+
+type Query {
+  ints(kind: String!): [Int!]
+  floats(kind: String!): [Float]
+  items(kind: String!): [Item!]
+  sequentialItems(kind: String!): [Item]
+  boundedItems(kind: String!): [Item]
+  matrix: [[Int]]
+}
+"""
+
+_IDS = list(range(5))
+
+
+def _items():
+    return [{"id": item_id, "name": f"Item #{item_id}"} for item_id in _IDS]
+
+
+async def _async_generator(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class _AsyncIterable:
+    def __init__(self, items):
+        self.items = items
+        self.read = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read >= len(self.items):
+            raise StopAsyncIteration
+        self.read += 1
+        return self.items[self.read - 1]
+
+
+def _build(kind, items):
+    if kind == "tuple":
+        return tuple(items)
+    if kind == "generator":
+        return (item for item in items)
+    if kind == "async_generator":
+        return _async_generator(items)
+    if kind == "string":
+        return "123"
+    if kind == "mapping":
+        return {"a": 1}
+    return items
+
+
+@pytest.fixture
+async def engine(random_schema_name):
+    @Resolver("Query.ints", schema_name=random_schema_name)
+    async def resolve_query_ints(parent, args, ctx, info):
+        if args["kind"] == "array":
+            return array("i", _IDS)
+        if args["kind"] == "memoryview":
+            return memoryview(array("q", _IDS))
+        if args["kind"] == "range":
+            return range(len(_IDS))
+        return _build(args["kind"], _IDS)
+
+    @Resolver("Query.floats", schema_name=random_schema_name)
+    async def resolve_query_floats(parent, args, ctx, info):
+        if args["kind"] == "array":
+            return array("d", [0.5, 1.5])
+        return _build(args["kind"], [0.5, None, 1.5])
+
+    for field_name, options in (
+        ("items", {}),
+        ("sequentialItems", {"concurrently": False}),
+        ("boundedItems", {"max_concurrency": 2}),
+    ):
+
+        @Resolver(
+            f"Query.{field_name}", schema_name=random_schema_name, **options
+        )
+        async def resolve_query_items(parent, args, ctx, info):
+            return _build(args["kind"], _items())
+
+    @Resolver("Query.matrix", schema_name=random_schema_name)
+    async def resolve_query_matrix(parent, args, ctx, info):
+        return ((1, None), (item_id for item_id in _IDS), None, range(0))
+
+    return await create_engine(_SDL, schema_name=random_schema_name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kind",
+    ["list", "tuple", "generator", "async_generator", "array", "memoryview"],
+)
+async def test_list_iterables_leaves(engine, kind):
+    assert (
+        await engine.execute(
+            'query ($kind: String!) { ints(kind: $kind) floats(kind: "list") }',
+            variables={"kind": kind},
+        )
+        == {"data": {"ints": _IDS, "floats": [0.5, None, 1.5]}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_buffers(engine):
+    assert await engine.execute(
+        '{ ints(kind: "range") floats(kind: "array") }'
+    ) == {"data": {"ints": _IDS, "floats": [0.5, 1.5]}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kind", ["list", "tuple", "generator", "async_generator"]
+)
+@pytest.mark.parametrize(
+    "field_name", ["items", "sequentialItems", "boundedItems"]
+)
+async def test_list_iterables_objects(engine, kind, field_name):
+    assert await engine.execute(
+        f'{{ {field_name}(kind: "{kind}") {{ id name }} }}'
+    ) == {"data": {field_name: _items()}}
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_nested(engine):
+    assert await engine.execute("{ matrix }") == {
+        "data": {"matrix": [[1, None], _IDS, None, []]}
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["string", "mapping"])
+@pytest.mark.parametrize("field_name", ["ints", "items", "sequentialItems"])
+async def test_list_iterables_not_iterable(engine, kind, field_name):
+    selection = " { id }" if "tems" in field_name else ""
+    assert await engine.execute(
+        f'{{ {field_name}(kind: "{kind}"){selection} }}'
+    ) == {
+        "data": {field_name: None},
+        "errors": [
+            {
+                "message": "Expected Iterable, but did not find one for "
+                f"field Query.{field_name}.",
+                "path": [field_name],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_async_iterable_is_read_incrementally(
+    random_schema_name,
+):
+    iterable = _AsyncIterable(_items() * 30)
+    reads = []
+
+    @Resolver("Query.items", schema_name=random_schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return iterable
+
+    @Resolver("Item.name", schema_name=random_schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        reads.append(iterable.read)
+        return parent["name"]
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    result = await engine.execute('{ items(kind: "custom") { id name } }')
+    assert result == {"data": {"items": _items() * 30}}
+    # Items are buffered & completed 100 at a time
+    assert max(reads[:100]) == 100
+    assert min(reads[100:]) == 150
+
+
+@pytest.mark.asyncio
+async def test_list_iterables_with_jit(random_schema_name):
+    @Resolver("Query.items", schema_name=random_schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return _build(args["kind"], _items())
+
+    engine = await create_engine(
+        _SDL, schema_name=random_schema_name, jit=True, jit_threshold=1
+    )
+    for kind in ("list", "tuple", "async_generator", "list", "string"):
+        result = await engine.execute(
+            f'{{ items(kind: "{kind}") {{ id name }} }}'
+        )
+        if kind == "string":
+            assert result["data"] == {"items": None}
+            assert result["errors"][0]["message"] == (
+                "Expected Iterable, but did not find one for field "
+                "Query.items."
+            )
+        else:
+            assert result == {"data": {"items": _items()}}
@@ -0,0 +1,235 @@
+import pytest
+
+from tartiflette import Directive, Resolver, Scalar, create_engine
+from tartiflette.coercers.outputs.list_coercer import list_coercer_leaves
+
+_SDL = """
+directive @upper on SCALAR
+
+enum Color {
+  RED
+  BLUE
+}
+
+scalar Counter
+scalar Loud @upper
+
+type Stats {
+  ints: [Int!]!
+  nullableInts: [Int]
+  strings: [String]
+  colors: [Color!]
+  counters: [Counter]
+  strictCounters: [Counter!]
+  louds: [Loud]
+  matrix: [[Int]]
+}
+
+type Query {
+  stats: Stats
+}
+"""
+
+
+@pytest.fixture
+async def engine_and_calls(random_schema_name):
+    calls = []
+
+    @Directive("upper", schema_name=random_schema_name)
+    class UpperDirective:
+        @staticmethod
+        async def on_pre_output_coercion(
+            directive_args, next_directive, value, ctx, info
+        ):
+            result = await next_directive(value, ctx, info)
+            return result.upper() if result is not None else None
+
+    @Scalar("Counter", schema_name=random_schema_name)
+    class CounterScalar:
+        @staticmethod
+        def coerce_output(value):
+            if value < 0:
+                raise ValueError(f"Negative counter < {value} >.")
+            return value
+
+        @staticmethod
+        def coerce_output_many(values):
+            calls.append(list(values))
+            if any(value < 0 for value in values):
+                raise ValueError("Negative counter.")
+            return [value for value in values]
+
+        @staticmethod
+        def coerce_input(value):
+            return value
+
+        @staticmethod
+        def parse_literal(ast):
+            return ast.value
+
+    @Scalar("Loud", schema_name=random_schema_name)
+    class LoudScalar:
+        @staticmethod
+        def coerce_output(value):
+            return value
+
+        @staticmethod
+        def coerce_input(value):
+            return value
+
+        @staticmethod
+        def parse_literal(ast):
+            return ast.value
+
+    @Resolver("Query.stats", schema_name=random_schema_name)
+    async def resolve_query_stats(parent, args, ctx, info):
+        return ctx
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    return engine, calls
+
+
+@pytest.mark.asyncio
+async def test_list_leaves_coercers_are_baked(engine_and_calls):
+    engine, _ = engine_and_calls
+    fields = engine._schema.find_type("Stats").implemented_fields
+    assert {
+        field_name
+        for field_name, field in fields.items()
+        if _find_list_leaves_coercer(field.resolver.keywords["output_coercer"])
+    } == {
+        "ints",
+        "nullableInts",
+        "strings",
+        "colors",
+        "counters",
+        "strictCounters",
+        "matrix",
+    }
+
+
+def _find_list_leaves_coercer(coercer):
+    while coercer is not None:
+        if getattr(coercer, "func", None) is list_coercer_leaves:
+            return True
+        coercer = getattr(coercer, "keywords", {}).get("inner_coercer")
+    return False
+
+
+@pytest.mark.asyncio
+async def test_list_leaves_coercion(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert (
+        await engine.execute(
+            """
+        {
+          stats {
+            ints
+            nullableInts
+            strings
+            colors
+            counters
+            strictCounters
+            louds
+            matrix
+          }
+        }
+        """,
+            context={
+                "ints": [1, 2, "3", True],
+                "nullableInts": [1, None, 2],
+                "strings": ["a", None, 1, False],
+                "colors": ["RED", "BLUE"],
+                "counters": [1, 2, None],
+                "strictCounters": [3, 4],
+                "louds": ["a", None, "b"],
+                "matrix": [[1, None], None, []],
+            },
+        )
+        == {
+            "data": {
+                "stats": {
+                    "ints": [1, 2, 3, 1],
+                    "nullableInts": [1, None, 2],
+                    "strings": ["a", None, "1", "false"],
+                    "colors": ["RED", "BLUE"],
+                    "counters": [1, 2, None],
+                    "strictCounters": [3, 4],
+                    "louds": ["A", None, "B"],
+                    "matrix": [[1, None], None, []],
+                }
+            }
+        }
+    )
+    # The hook isn't used for lists containing null values
+    assert calls == [[3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_list_leaves_coercion_errors(engine_and_calls):
+    engine, calls = engine_and_calls
+    assert await engine.execute(
+        "{ stats { nullableInts colors counters } }",
+        context={
+            "nullableInts": [1, "a", 2, 2_147_483_648],
+            "colors": ["RED", "GREEN"],
+            "counters": [1, -1],
+        },
+    ) == {
+        "data": {
+            "stats": {
+                "nullableInts": [1, None, 2, None],
+                "colors": None,
+                "counters": [1, None],
+            }
+        },
+        "errors": [
+            {
+                "message": "Int cannot represent non-integer value: < a >.",
+                "path": ["stats", "nullableInts", 1],
+                "locations": [{"line": 1, "column": 11}],
+            },
+            {
+                "message": "Int cannot represent non 32-bit signed integer "
+                "value: < 2147483648 >.",
+                "path": ["stats", "nullableInts", 3],
+                "locations": [{"line": 1, "column": 11}],
+            },
+            {
+                "message": "Expected value of type Color but received "
+                "<class 'str'>.",
+                "path": ["stats", "colors", 1],
+                "locations": [{"line": 1, "column": 24}],
+            },
+            {
+                "message": "Negative counter < -1 >.",
+                "path": ["stats", "counters", 1],
+                "locations": [{"line": 1, "column": 31}],
+            },
+        ],
+    }
+    # Items are coerced one by one once the hook failed
+    assert calls == [[1, -1]]
+
+
+@pytest.mark.asyncio
+async def test_list_leaves_coercion_non_null_bubbling(engine_and_calls):
+    engine, _ = engine_and_calls
+    assert await engine.execute(
+        "{ stats { ints } }", context={"ints": [1, None, "b"]}
+    ) == {
+        "data": {"stats": None},
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field "
+                "Stats.ints.",
+                "path": ["stats", "ints", 1],
+                "locations": [{"line": 1, "column": 11}],
+            },
+            {
+                "message": "Int cannot represent non-integer value: < b >.",
+                "path": ["stats", "ints", 2],
+                "locations": [{"line": 1, "column": 11}],
+            },
+        ],
+    }
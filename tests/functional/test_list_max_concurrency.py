@@ -0,0 +1,200 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, Subscription, create_engine
+from tartiflette.types.exceptions.tartiflette import GraphQLSchemaError
+
+_BOOKS = [{"id": i, "title": f"Book #{i}"} for i in range(25)]
+
+_SDL = """
+type Book {
+  id: Int!
+  title: String!
+  position: Int
+}
+
+type Query {
+  books: [Book!]
+  boundedBooks: [Book!]
+  unboundedBooks: [Book]
+}
+"""
+
+
+def _register_resolvers(schema_name, in_flight):
+    @Resolver("Query.books", schema_name=schema_name)
+    async def resolve_query_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Query.boundedBooks", schema_name=schema_name, max_concurrency=3)
+    async def resolve_query_bounded_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver(
+        "Query.unboundedBooks",
+        schema_name=schema_name,
+        max_concurrency=len(_BOOKS),
+    )
+    async def resolve_query_unbounded_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Book.id", schema_name=schema_name)
+    async def resolve_book_id(parent, args, ctx, info):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.001 * (parent["id"] % 3))
+        in_flight["current"] -= 1
+        return parent["id"]
+
+    @Resolver("Book.position", schema_name=schema_name)
+    async def resolve_book_position(parent, args, ctx, info):
+        if parent["id"] % 10 == 7:
+            raise ValueError(f"No position for {parent['id']}.")
+        return parent["id"]
+
+
+@pytest.fixture
+def in_flight():
+    return {"current": 0, "max": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "field_name,engine_max_concurrency,expected_max",
+    [
+        ("books", None, len(_BOOKS)),
+        ("books", 5, 5),
+        ("boundedBooks", None, 3),
+        ("boundedBooks", 5, 3),
+        ("unboundedBooks", 5, len(_BOOKS)),
+    ],
+)
+async def test_list_max_concurrency(
+    random_schema_name,
+    in_flight,
+    field_name,
+    engine_max_concurrency,
+    expected_max,
+):
+    _register_resolvers(random_schema_name, in_flight)
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        coerce_list_max_concurrency=engine_max_concurrency,
+    )
+    assert await engine.execute(f"{{ {field_name} {{ id title }} }}") == {
+        "data": {field_name: _BOOKS}
+    }
+    assert in_flight["max"] == expected_max
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_strategy", [None, "breadth_first"])
+async def test_list_max_concurrency_errors(
+    random_schema_name, in_flight, execution_strategy
+):
+    _register_resolvers(random_schema_name, in_flight)
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        coerce_list_max_concurrency=4,
+        execution_strategy=execution_strategy,
+    )
+    assert await engine.execute("{ books { id position } }") == {
+        "data": {
+            "books": [
+                {"id": book["id"], "position": book["id"]}
+                if book["id"] % 10 != 7
+                else {"id": book["id"], "position": None}
+                for book in _BOOKS
+            ]
+        },
+        "errors": [
+            {
+                "message": f"No position for {book_id}.",
+                "path": ["books", book_id, "position"],
+                "locations": [{"line": 1, "column": 14}],
+            }
+            for book_id in (7, 17)
+        ],
+    }
+    assert in_flight["max"] == 4
+
+
+@pytest.mark.asyncio
+async def test_list_max_concurrency_batch_resolvers(random_schema_name):
+    calls = []
+
+    @Resolver(
+        "Query.books", schema_name=random_schema_name, max_concurrency=10
+    )
+    async def resolve_query_books(parent, args, ctx, info):
+        return _BOOKS
+
+    @Resolver("Book.id", schema_name=random_schema_name, batch=True)
+    async def resolve_book_id(parents, args, ctx, info):
+        calls.append(len(parents))
+        return [parent["id"] for parent in parents]
+
+    engine = await create_engine(_SDL, schema_name=random_schema_name)
+    assert await engine.execute("{ books { id title } }") == {
+        "data": {"books": _BOOKS}
+    }
+    assert calls == [10, 10, 5]
+
+
+@pytest.mark.asyncio
+async def test_list_max_concurrency_subscription(
+    random_schema_name, in_flight
+):
+    _register_resolvers(random_schema_name, in_flight)
+
+    @Subscription(
+        "Subscription.books", schema_name=random_schema_name, max_concurrency=2
+    )
+    async def subscribe_books(parent, args, ctx, info):
+        yield {"books": _BOOKS}
+
+    engine = await create_engine(
+        _SDL + "type Subscription { books: [Book!] }",
+        schema_name=random_schema_name,
+        coerce_list_max_concurrency=5,
+    )
+    async for result in engine.subscribe("subscription { books { id } }"):
+        assert result == {
+            "data": {"books": [{"id": book["id"]} for book in _BOOKS]}
+        }
+    assert in_flight["max"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "resolver_max_concurrency,engine_max_concurrency,expected",
+    [
+        (0, None, "< max_concurrency > of Field < Query.books >"),
+        (-1, 5, "< max_concurrency > of Field < Query.books >"),
+        (None, 0, "< coerce_list_max_concurrency >"),
+    ],
+)
+async def test_list_max_concurrency_invalid(
+    random_schema_name,
+    resolver_max_concurrency,
+    engine_max_concurrency,
+    expected,
+):
+    @Resolver(
+        "Query.books",
+        schema_name=random_schema_name,
+        max_concurrency=resolver_max_concurrency,
+    )
+    async def resolve_query_books(parent, args, ctx, info):
+        return _BOOKS
+
+    with pytest.raises(GraphQLSchemaError) as excinfo:
+        await create_engine(
+            _SDL,
+            schema_name=random_schema_name,
+            coerce_list_max_concurrency=engine_max_concurrency,
+        )
+    assert f"{expected} has to be greater than 0." in str(excinfo.value)
@@ -0,0 +1,123 @@
+import threading
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from tartiflette import Resolver, Subscription, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+
+type Subscription {
+  countdown(from: Int!): Int
+}
+"""
+
+_SMALL_QUERY = '{ hello(name: "World") }'
+_LARGE_QUERY = '{ hello(name: "%s") }' % ("a" * 100)
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name'][:5]}"
+
+    @Subscription("Subscription.countdown", schema_name=schema_name)
+    async def subscribe_subscription_countdown(parent, args, ctx, info):
+        for value in range(args["from"], -1, -1):
+            yield value
+
+    @Resolver("Subscription.countdown", schema_name=schema_name)
+    async def resolve_subscription_countdown(parent, args, ctx, info):
+        return parent
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_parse_in_executor(random_schema_name):
+    executor = _RecordingExecutor()
+    engine = await _create_engine(
+        random_schema_name,
+        parse_in_executor_threshold=50,
+        parse_executor=executor,
+    )
+
+    assert await engine.execute(_SMALL_QUERY) == {
+        "data": {"hello": "Hello World"}
+    }
+    assert executor.submitted == 0
+
+    assert await engine.execute(_LARGE_QUERY.encode("UTF-8")) == {
+        "data": {"hello": "Hello aaaaa"}
+    }
+    assert executor.submitted == 1
+
+    result = await engine.execute("{ unknown%s }" % ("a" * 100))
+    assert result["data"] is None
+    assert [error["message"] for error in result["errors"]] == [
+        "Field unknown%s doesn't exist on Query" % ("a" * 100)
+    ]
+    assert executor.submitted == 2
+
+    subscription = "subscription { countdown(from: 2) } %s" % (" " * 50)
+    assert [payload async for payload in engine.subscribe(subscription)] == [
+        {"data": {"countdown": 2}},
+        {"data": {"countdown": 1}},
+        {"data": {"countdown": 0}},
+    ]
+    assert executor.submitted == 3
+
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_parse_in_executor_default_executor(random_schema_name):
+    thread_ids = []
+
+    def query_cache_decorator(func):
+        def wrapper(*args, **kwargs):
+            thread_ids.append(threading.get_ident())
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    engine = await _create_engine(
+        random_schema_name,
+        parse_in_executor_threshold=50,
+        query_cache_decorator=query_cache_decorator,
+    )
+
+    assert await engine.execute(_SMALL_QUERY) == {
+        "data": {"hello": "Hello World"}
+    }
+    assert await engine.execute(_LARGE_QUERY) == {
+        "data": {"hello": "Hello aaaaa"}
+    }
+    assert thread_ids[0] == threading.get_ident()
+    assert thread_ids[1] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_parse_in_executor_process_pool(random_schema_name):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ImproperlyConfigured):
+            await _create_engine(
+                random_schema_name,
+                parse_in_executor_threshold=50,
+                parse_executor=executor,
+            )
@@ -0,0 +1,231 @@
+import hashlib
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.persisted_queries import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    PersistedQueryStore,
+    SQLitePersistedQueryStore,
+    compute_query_hash,
+)
+from tartiflette.execution.query_cache import QueryCache
+from tartiflette.language.limits import QueryLimits
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+_QUERY = "query Hello($name: String) { hello(name: $name) }"
+_QUERY_HASH = hashlib.sha256(_QUERY.encode("UTF-8")).hexdigest()
+
+
+def _extensions(sha256_hash=_QUERY_HASH, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": sha256_hash}}
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name']}"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+def test_compute_query_hash():
+    assert compute_query_hash(_QUERY) == _QUERY_HASH
+    assert compute_query_hash(_QUERY.encode("UTF-8")) == _QUERY_HASH
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries(random_schema_name):
+    parsed_queries = []
+    query_cache = QueryCache()
+
+    def query_cache_decorator(func):
+        def parse_and_validate_query(query, schema):
+            parsed_queries.append(query)
+            return func(query, schema)
+
+        return query_cache(parse_and_validate_query)
+
+    engine = await _create_engine(
+        random_schema_name, query_cache_decorator=query_cache_decorator
+    )
+
+    assert await engine.execute(
+        variables={"name": "World"}, extensions=_extensions()
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+        ],
+    }
+
+    assert await engine.execute(
+        _QUERY, variables={"name": "World"}, extensions=_extensions()
+    ) == {"data": {"hello": "Hello World"}}
+
+    for name in ["Foo", "Bar"]:
+        assert await engine.execute(
+            variables={"name": name}, extensions=_extensions()
+        ) == {"data": {"hello": f"Hello {name}"}}
+
+    assert [
+        payload
+        async for payload in engine.execute_stream(
+            variables={"name": "Baz"}, extensions=_extensions()
+        )
+    ] == [b'{"data":{"hello":"Hello Baz"}}']
+
+    # the registered query is parsed once & cached under its hash
+    assert parsed_queries == [_QUERY_HASH, _QUERY]
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_errors(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    result = await engine.execute(
+        "{ hello }", extensions=_extensions(compute_query_hash("{ other }"))
+    )
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Provided sha256Hash does not match query."
+    )
+    assert result["errors"][0]["extensions"] == {
+        "code": "PERSISTED_QUERY_HASH_MISMATCH"
+    }
+
+    result = await engine.execute(_QUERY, extensions=_extensions(version=2))
+    assert result["errors"][0]["message"] == (
+        "Unsupported persisted query version."
+    )
+
+    result = await engine.execute(_QUERY, extensions=_extensions(None))
+    assert result["errors"][0]["message"] == (
+        "Invalid persisted query: < sha256Hash > should be a string."
+    )
+
+    result = await engine.execute()
+    assert result["errors"][0]["message"] == "Must provide query string."
+
+    result = await engine.execute(
+        "{ unknown }",
+        extensions=_extensions(compute_query_hash("{ unknown }")),
+    )
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Field unknown doesn't exist on Query"
+    )
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_not_registered(random_schema_name):
+    store = InMemoryPersistedQueryStore()
+    engine = await _create_engine(
+        random_schema_name,
+        persisted_query_store=store,
+        query_limits=QueryLimits(max_bytes=100),
+    )
+
+    oversized_query = "{ hello %s }" % (" " * 1000)
+    for query in [oversized_query, "{ unknown }", "{ hello"]:
+        result = await engine.execute(
+            query, extensions=_extensions(compute_query_hash(query))
+        )
+        assert result["data"] is None
+        assert store.get(compute_query_hash(query)) is None
+
+    query = b"{ hello } # \xff\n"
+    result = await engine.execute(
+        query, extensions=_extensions(compute_query_hash(query))
+    )
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Invalid persisted query: the query should be UTF-8 encoded."
+    )
+    assert store.get(compute_query_hash(query)) is None
+
+
+def test_persisted_query_store_abstract():
+    class IncompleteStore(PersistedQueryStore):
+        def get(self, sha256_hash):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_not_supported(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, persisted_query_store=None
+    )
+
+    assert await engine.execute(_QUERY, extensions=_extensions()) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotSupported",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+            }
+        ],
+    }
+    assert await engine.execute(_QUERY, variables={"name": "World"}) == {
+        "data": {"hello": "Hello World"}
+    }
+
+
+def test_in_memory_persisted_query_store():
+    store = InMemoryPersistedQueryStore(maxsize=2)
+
+    first, second = store.load(["{ a }", b"{ b }"])
+    assert store.get(first) == "{ a }"
+    assert store.get(second) == "{ b }"
+
+    third = store.register("{ c }")
+    assert store.get(first) is None
+    assert store.get(second) == "{ b }"
+    assert store.get(third) == "{ c }"
+
+
+@pytest.mark.parametrize(
+    "store_factory",
+    [
+        lambda tmp_path: FilePersistedQueryStore(str(tmp_path / "queries")),
+        lambda tmp_path: SQLitePersistedQueryStore(
+            str(tmp_path / "queries.db")
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_persisted_query_stores(
+    store_factory, tmp_path, random_schema_name
+):
+    query = '{\r\n  hello(name: "World")\r\n}'
+    store = store_factory(tmp_path)
+    assert store.get(compute_query_hash(query)) is None
+    assert store.get("../../etc/passwd") is None
+    assert store.load([query]) == [compute_query_hash(query)]
+
+    # registrations survive restarts
+    store = store_factory(tmp_path)
+    assert store.get(compute_query_hash(query)) == query
+
+    engine = await _create_engine(
+        random_schema_name, persisted_query_store=store
+    )
+    assert await engine.execute(
+        extensions=_extensions(compute_query_hash(query))
+    ) == {"data": {"hello": "Hello World"}}
@@ -0,0 +1,329 @@
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.query_cache import QueryCache, QueryCacheInfo
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_query_cache_lru():
+    calls = []
+
+    def func(query, schema):
+        calls.append(query)
+        return query.upper()
+
+    cache = QueryCache(maxsize=2)
+    cached_func = cache(func)
+
+    assert cached_func("a", None) == "A"
+    assert cached_func("b", None) == "B"
+    assert cached_func("a", None) == "A"
+    assert cached_func("c", None) == "C"
+    assert cached_func("a", None) == "A"
+    assert cached_func("b", None) == "B"
+    assert calls == ["a", "b", "c", "b"]
+    assert cached_func.cache_info() == QueryCacheInfo(
+        hits=2,
+        misses=4,
+        evictions=2,
+        maxsize=2,
+        currsize=2,
+        max_weight=None,
+        currweight=2,
+    )
+
+    cached_func.cache_clear()
+    assert cache.cache_info() == QueryCacheInfo(
+        hits=0,
+        misses=0,
+        evictions=0,
+        maxsize=2,
+        currsize=0,
+        max_weight=None,
+        currweight=0,
+    )
+
+
+def test_query_cache_max_weight():
+    calls = []
+
+    def func(query, schema):
+        calls.append(query)
+        return query
+
+    cached_func = QueryCache(maxsize=None, max_weight=10)(func)
+
+    cached_func("aaaa", None)
+    cached_func("bbbb", None)
+    assert cached_func.cache_info().currweight == 8
+    cached_func("cccc", None)
+    assert cached_func.cache_info().currsize == 2
+    assert cached_func.cache_info().currweight == 8
+    cached_func("bbbb", None)
+    assert calls == ["aaaa", "bbbb", "cccc"]
+
+    # entries heavier than the cache capacity aren't cached at all
+    cached_func("d" * 11, None)
+    cached_func("d" * 11, None)
+    assert calls[-2:] == ["d" * 11, "d" * 11]
+    assert cached_func.cache_info().currsize == 2
+
+
+def test_query_cache_weigher():
+    cached_func = QueryCache(
+        max_weight=10, weigher=lambda query, result: len(result)
+    )(lambda query, schema: query * 3)
+
+    cached_func("aa", None)
+    assert cached_func.cache_info().currweight == 6
+
+
+def test_query_cache_ttl():
+    calls = []
+    clock = _Clock()
+
+    def func(query, schema):
+        calls.append(query)
+        return query
+
+    cached_func = QueryCache(ttl=10, timer=clock)(func)
+
+    cached_func("a", None)
+    clock.now = 9.0
+    cached_func("a", None)
+    assert calls == ["a"]
+
+    clock.now = 10.0
+    cached_func("a", None)
+    assert calls == ["a", "a"]
+    assert cached_func.cache_info()[:3] == (1, 2, 1)
+
+
+def test_query_cache_exception():
+    calls = []
+
+    def func(query, schema):
+        calls.append(query)
+        raise ValueError(query)
+
+    cached_func = QueryCache()(func)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="a"):
+            cached_func("a", None)
+    assert calls == ["a", "a"]
+    assert cached_func.cache_info().currsize == 0
+
+
+def test_query_cache_single_flight_threads():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def func(query, schema):
+        calls.append(query)
+        started.set()
+        release.wait()
+        return query
+
+    cached_func = QueryCache()(func)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(cached_func, "a", None)
+        started.wait()
+        others = [executor.submit(cached_func, "a", None) for _ in range(3)]
+        release.set()
+        assert [f.result() for f in [first, *others]] == ["a"] * 4
+
+    assert calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_single_flight_async():
+    calls = []
+    release = threading.Event()
+
+    def func(query, schema):
+        calls.append(query)
+        release.wait()
+        return query
+
+    cached_func = QueryCache()(func)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        def runner(*args):
+            return loop.run_in_executor(executor, *args)
+
+        tasks = [
+            asyncio.ensure_future(cached_func.call_async("a", None, runner))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0.01)
+
+        # cancelling a caller doesn't cancel the shared computation
+        tasks[0].cancel()
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["a"] * 9
+    assert calls == ["a"]
+    assert await cached_func.call_async("a", None) == "a"
+    assert cached_func.cache_info()[:2] == (1, 10)
+
+
+@pytest.mark.asyncio
+async def test_query_cache_engine(random_schema_name):
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name']}"
+
+    parsed_queries = []
+
+    def query_cache_decorator(func):
+        def parse_and_validate_query(query, schema):
+            parsed_queries.append(query)
+            return func(query, schema)
+
+        return query_cache(parse_and_validate_query)
+
+    query_cache = QueryCache(maxsize=10)
+    executor = ThreadPoolExecutor(max_workers=2)
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        query_cache_decorator=query_cache_decorator,
+        parse_in_executor_threshold=0,
+        parse_executor=executor,
+    )
+
+    results = await asyncio.gather(
+        *[engine.execute('{ hello(name: "World") }') for _ in range(20)]
+    )
+    assert results == [{"data": {"hello": "Hello World"}}] * 20
+    assert parsed_queries == ['{ hello(name: "World") }']
+    assert query_cache.cache_info().currsize == 1
+
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_query_cache_normalize(random_schema_name):
+    @Resolver("Query.hello", schema_name=random_schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name']}"
+
+    query_cache = QueryCache(normalize=True)
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        query_cache_decorator=query_cache,
+    )
+
+    for query in [
+        '{ hello(name: "World") }',
+        '{\n  hello(name: "World")\n}',
+        b'# comment\n{ hello(name:"World"), }',
+    ]:
+        assert await engine.execute(query) == {
+            "data": {"hello": "Hello World"}
+        }
+    assert query_cache.cache_info()[:2] == (2, 1)
+    assert query_cache.cache_info().currsize == 1
+
+    # errors locations refer to the formatting of each query
+    for query, location in [
+        ("{ unknown }", {"line": 1, "column": 3}),
+        ("{\n  unknown\n}", {"line": 2, "column": 3}),
+    ]:
+        result = await engine.execute(query)
+        assert result["data"] is None
+        assert [error["locations"] for error in result["errors"]] == [
+            [location]
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("warm_queries_concurrently", [False, True])
+async def test_query_cache_warm_up(
+    random_schema_name, tmp_path, warm_queries_concurrently
+):
+    for schema_name in [random_schema_name, f"{random_schema_name}_other"]:
+
+        @Resolver("Query.hello", schema_name=schema_name)
+        async def resolve_query_hello(parent, args, ctx, info):
+            return f"Hello {args['name']}"
+
+    queries = [
+        '{ hello(name: "A") }',
+        '{ hello(name: "B") }',
+        b'{ hello(name: "C") }',
+    ]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=random_schema_name,
+        warm_queries=queries + ["{ unknown }"],
+        warm_queries_concurrently=warm_queries_concurrently,
+    )
+    # pylint: disable=protected-access
+    query_cache = engine._cached_parse_and_validate_query.cache
+    assert query_cache.cache_info()[:2] == (0, 4)
+
+    assert await engine.execute('{ hello(name: "A") }') == {
+        "data": {"hello": "Hello A"}
+    }
+    assert query_cache.cache_info()[:2] == (1, 4)
+
+    snapshot_path = str(tmp_path / "snapshot.json")
+    snapshot = engine.snapshot_query_cache(snapshot_path)
+    assert sorted(snapshot) == sorted(
+        [
+            '{ hello(name: "A") }',
+            '{ hello(name: "B") }',
+            '{ hello(name: "C") }',
+        ]
+    )
+    assert snapshot[-1] == '{ hello(name: "A") }'
+
+    other_engine = await create_engine(
+        _SDL,
+        schema_name=f"{random_schema_name}_other",
+        warm_queries=snapshot_path,
+    )
+    # pylint: disable=protected-access
+    other_query_cache = other_engine._cached_parse_and_validate_query.cache
+    assert other_engine.snapshot_query_cache() == snapshot
+    assert other_query_cache.cache_info()[:2] == (0, 3)
+
+
+@pytest.mark.asyncio
+async def test_query_cache_snapshot_unsupported(random_schema_name):
+    engine = await create_engine(
+        _SDL, schema_name=random_schema_name, query_cache_decorator=None
+    )
+
+    with pytest.raises(ImproperlyConfigured):
+        engine.snapshot_query_cache()
@@ -0,0 +1,170 @@
+import re
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.cost import QueryCost
+
+_SDL = """
+type Query {
+  users(first: Int = 10): [User] @cost(weight: 2, multipliers: ["first"])
+  me: User
+}
+
+type User {
+  name: String
+  friends(first: Int, ids: [Int]): [User] @cost(multipliers: ["first", "ids"])
+}
+"""
+
+
+async def _create_engine(schema_name, calls=None, sdl=_SDL, **kwargs):
+    @Resolver("Query.users", schema_name=schema_name)
+    @Resolver("User.friends", schema_name=schema_name)
+    async def resolve_users(parent, args, ctx, info):
+        if calls is not None:
+            calls.append(info.path)
+        return [{"name": "Foo"}]
+
+    @Resolver("Query.me", schema_name=schema_name)
+    async def resolve_me(parent, args, ctx, info):
+        return {"name": "Bar"}
+
+    return await create_engine(sdl, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,variables,expected",
+    [
+        ("{ me { name } }", None, 2),
+        ("{ __typename me { __typename } }", None, 1),
+        ("{ users { name } }", None, 30),
+        ("{ users(first: 3) { name friends(first: 2) { name } } }", None, 21),
+        ("{ users(first: 1) { friends(ids: [1, 2, 3]) { name } } }", None, 8),
+        (
+            "{ users(first: 1) { friends(first: 2, ids: [1, 2]) { name } } }",
+            None,
+            10,
+        ),
+        (
+            "query ($first: Int) { users(first: $first) { name } }",
+            {"first": 4},
+            12,
+        ),
+        (
+            """
+            {
+              users(first: 2) { ...UserFields }
+              me { ... on User { ...UserFields } }
+            }
+
+            fragment UserFields on User {
+              name
+              friends(first: 3) { name }
+            }
+            """,
+            None,
+            26,
+        ),
+    ],
+)
+async def test_query_cost(random_schema_name, query, variables, expected):
+    engine = await _create_engine(random_schema_name, query_cost=QueryCost())
+
+    result = await engine.execute(query, variables=variables)
+    assert "errors" not in result
+    assert result["extensions"] == {"cost": expected}
+
+
+@pytest.mark.asyncio
+async def test_query_cost_field_costs(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name,
+        query_cost=QueryCost(
+            default_weight=3,
+            field_costs={
+                "User.name": 0,
+                "Query.users": {"multipliers": []},
+                "User.friends": 5,
+            },
+        ),
+    )
+
+    assert (
+        await engine.execute("{ users(first: 10) { name friends { name } } }")
+    )["extensions"] == {"cost": 7}
+
+
+@pytest.mark.asyncio
+async def test_query_cost_max_cost(random_schema_name):
+    calls = []
+    engine = await _create_engine(
+        random_schema_name, calls, query_cost=QueryCost(max_cost=1000)
+    )
+
+    assert await engine.execute(
+        "query ($first: Int) { users(first: $first) { friends(first: $first) "
+        "{ name } } }",
+        variables={"first": 100},
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Query cost of < 20200 > exceeds the maximum cost "
+                "of < 1000 >.",
+                "path": None,
+                "locations": [],
+                "extensions": {"cost": 20200, "maxCost": 1000},
+            }
+        ],
+    }
+    assert calls == []
+
+    assert (
+        await engine.execute(
+            "query ($first: Int) { users(first: $first) { friends(first: "
+            "$first) { name } } }",
+            variables={"first": 10},
+        )
+    )["extensions"] == {"cost": 220}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cost_cached(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, query_cost=QueryCost(expose=False)
+    )
+    query = "query ($first: Int) { users(first: $first) { name } } "
+    static_query = "{ users(first: 2) { name } }"
+
+    for _ in range(2):
+        assert "extensions" not in await engine.execute(static_query)
+        assert "extensions" not in await engine.execute(
+            query, variables={"first": 2}
+        )
+
+    # pylint: disable=protected-access
+    static_document, _ = engine._cached_parse_and_validate_query(
+        static_query, engine._schema
+    )
+    document, _ = engine._cached_parse_and_validate_query(
+        query, engine._schema
+    )
+    assert list(static_document.plan._operation_costs.values()) == [6]
+    assert document.plan._operation_costs == {}
+
+
+@pytest.mark.asyncio
+async def test_query_cost_disabled(random_schema_name):
+    # The @cost directive is only added to the schema along with a QueryCost
+    engine = await _create_engine(
+        random_schema_name, sdl=re.sub(r"@cost\(.*\)", "", _SDL)
+    )
+    # pylint: disable=protected-access
+    assert not engine._schema.has_directive("cost")
+
+    assert await engine.execute("{ users(first: 1000) { name } }") == {
+        "data": {"users": [{"name": "Foo"}]}
+    }
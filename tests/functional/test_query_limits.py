@@ -0,0 +1,139 @@
+import json
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.language.limits import QueryLimits
+
+_SDL = """
+type Query {
+  hello(name: String): String
+  user: User
+}
+
+type User {
+  name: String
+  friend: User
+}
+"""
+
+
+async def _create_engine(schema_name, json_loader=None, **limits):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return f"Hello {args['name']}"
+
+    @Resolver("Query.user", schema_name=schema_name)
+    @Resolver("User.friend", schema_name=schema_name)
+    async def resolve_user(parent, args, ctx, info):
+        return {"name": "Foo"}
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        json_loader=json_loader,
+        query_limits=QueryLimits(**limits),
+    )
+
+
+def _message(result):
+    assert result["data"] is None
+    assert len(result["errors"]) == 1
+    return result["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_query_limits_bytes_and_tokens(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, max_bytes=30, max_tokens=10
+    )
+
+    assert await engine.execute('{ hello(name: "été") }') == {
+        "data": {"hello": "Hello été"}
+    }
+    assert _message(await engine.execute('{ hello(name: "ééééééé") }')) == (
+        "Query exceeds the maximum size of < 30 > bytes."
+    )
+    assert _message(await engine.execute(b"{ a b c d e f g h i j }")) == (
+        "Query exceeds the maximum number of < 10 > tokens."
+    )
+    # ignored tokens aren't counted
+    assert await engine.execute("#c\n{ ,,,, user { name } }") == {
+        "data": {"user": {"name": "Foo"}}
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("json_loader", [None, lambda data: json.loads(data)])
+async def test_query_limits_document(random_schema_name, json_loader):
+    engine = await _create_engine(
+        random_schema_name,
+        json_loader=json_loader,
+        max_depth=3,
+        max_fields=6,
+        max_aliases=2,
+    )
+
+    assert (
+        await engine.execute(
+            """
+        {
+          a: user { ...Friend }
+          b: user { name }
+        }
+        fragment Friend on User { friend { name } }
+        """
+        )
+        == {
+            "data": {
+                "a": {"friend": {"name": "Foo"}},
+                "b": {"name": "Foo"},
+            }
+        }
+    )
+
+    for query, message in [
+        (
+            "{ user { friend { friend { name } } } }",
+            "Query exceeds the maximum depth of < 3 >.",
+        ),
+        (
+            """
+            { user { ...Friend } }
+            fragment Friend on User { friend { friend { name } } }
+            """,
+            "Query exceeds the maximum depth of < 3 >.",
+        ),
+        (
+            "{ a: hello b: hello c: hello }",
+            "Query exceeds the maximum number of < 2 > aliases.",
+        ),
+        (
+            "{ user { name friend { name } } a: hello b: hello hello }",
+            "Query exceeds the maximum number of < 6 > fields.",
+        ),
+        (
+            """
+            { user { ...A ...A ...A } }
+            fragment A on User { ...B ...B }
+            fragment B on User { name }
+            """,
+            "Query exceeds the maximum number of < 6 > fields.",
+        ),
+        (
+            # limits are checked before validating the document
+            "{ unknown { friend { friend { name } } } }",
+            "Query exceeds the maximum depth of < 3 >.",
+        ),
+    ]:
+        assert _message(await engine.execute(query)) == message
+
+    # cycles & unknown fragments are left to the validators
+    result = await engine.execute(
+        "{ user { ...A ...Unknown } } fragment A on User { ...A }"
+    )
+    assert result["errors"]
+    assert not any(
+        error["message"].startswith("Query exceeds")
+        for error in result["errors"]
+    )
@@ -0,0 +1,136 @@
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+directive @lower on FIELD_DEFINITION
+
+enum Color {
+  RED
+  BLUE
+}
+
+type Dog {
+  name: String!
+  nickname: String
+  age: Int
+  color: Color
+  shout: String @lower
+  resolved: String
+  withArgs(prefix: String): String
+  tags: [String]
+}
+
+type Query {
+  dogs: [Dog]
+}
+"""
+
+
+class Dog:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+        self.color = "BLUE"
+
+
+@pytest.fixture
+async def engine(random_schema_name):
+    @Directive("lower", schema_name=random_schema_name)
+    class LowerDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            result = await next_resolver(parent, args, ctx, info)
+            return result.lower() if result is not None else None
+
+    @Resolver("Query.dogs", schema_name=random_schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return [
+            {
+                "name": "Dog",
+                "nickname": "Doggo",
+                "age": "12",
+                "color": "RED",
+                "shout": "WOOF",
+            },
+            Dog("Object", 3),
+            {"name": None, "age": "not an int", "color": "GREEN"},
+        ]
+
+    @Resolver("Dog.resolved", schema_name=random_schema_name)
+    async def resolve_dog_resolved(parent, args, ctx, info):
+        return "resolved"
+
+    return await create_engine(_SDL, schema_name=random_schema_name)
+
+
+@pytest.mark.asyncio
+async def test_sync_leaf_fields_are_marked_at_bake(engine):
+    fields = engine._schema.find_type("Dog").implemented_fields
+    assert {
+        field_name
+        for field_name, field in fields.items()
+        if field.sync_resolver is not None
+    } == {"name", "nickname", "age", "color"}
+
+
+@pytest.mark.asyncio
+async def test_sync_leaf_fields_execution(engine):
+    assert await engine.execute(
+        """
+        {
+          dogs {
+            name
+            alias: nickname
+            age
+            color
+            shout
+            resolved
+            withArgs
+          }
+        }
+        """
+    ) == {
+        "data": {
+            "dogs": [
+                {
+                    "name": "Dog",
+                    "alias": "Doggo",
+                    "age": 12,
+                    "color": "RED",
+                    "shout": "woof",
+                    "resolved": "resolved",
+                    "withArgs": None,
+                },
+                {
+                    "name": "Object",
+                    "alias": None,
+                    "age": 3,
+                    "color": "BLUE",
+                    "shout": None,
+                    "resolved": "resolved",
+                    "withArgs": None,
+                },
+                None,
+            ]
+        },
+        "errors": [
+            {
+                "message": "Int cannot represent non-integer value: < not an int >.",
+                "path": ["dogs", 2, "age"],
+                "locations": [{"line": 6, "column": 13}],
+            },
+            {
+                "message": "Expected value of type Color but received <class 'str'>.",
+                "path": ["dogs", 2, "color"],
+                "locations": [{"line": 7, "column": 13}],
+            },
+            {
+                "message": "Cannot return null for non-nullable field Dog.name.",
+                "path": ["dogs", 2, "name"],
+                "locations": [{"line": 4, "column": 13}],
+            },
+        ],
+    }
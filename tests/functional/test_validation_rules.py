@@ -0,0 +1,154 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import ValidationRules, validate_document
+from tartiflette.language.validators.query import RULE_SET
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Query {
+  user(id: Int): User
+}
+
+type User {
+  name: String
+  friend: User
+}
+"""
+
+_CONFLICTING_QUERY = """
+{
+  user(id: 1) { name }
+  user(id: 2) { name }
+}
+"""
+
+
+async def _create_engine(schema_name, **kwargs):
+    @Resolver("Query.user", schema_name=schema_name)
+    @Resolver("User.friend", schema_name=schema_name)
+    async def resolve_user(parent, args, ctx, info):
+        return {"name": "Foo"}
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+def _tags(result):
+    return [error["extensions"]["tag"] for error in result["errors"]]
+
+
+@pytest.mark.asyncio
+async def test_validation_rules_disabled(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name,
+        disabled_validation_rules=["overlapping-fields-can-be-merged"],
+    )
+
+    assert await engine.execute(_CONFLICTING_QUERY) == {
+        "data": {"user": {"name": "Foo"}}
+    }
+    assert _tags(await engine.execute("{ user { unknown } }")) == [
+        "field-selections-on-objects-interfaces-and-unions-types"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validation_rules_enabled(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    assert _tags(await engine.execute(_CONFLICTING_QUERY)) == [
+        "overlapping-fields-can-be-merged"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validation_rules_disabled_unknown(random_schema_name):
+    with pytest.raises(
+        ImproperlyConfigured,
+        match=r"Unknown validation rules: < unknown-a >, < unknown-b >\.",
+    ):
+        await _create_engine(
+            random_schema_name,
+            disabled_validation_rules=[
+                "unknown-b",
+                "unknown-a",
+                "argument-names",
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_validation_rules_timings(random_schema_name):
+    engine = await _create_engine(
+        random_schema_name, time_validation_rules=True
+    )
+
+    assert engine.validation_rules_timings() == {}
+    assert await engine.execute("{ user { name friend { name } } }") == {
+        "data": {"user": {"name": "Foo", "friend": {"name": "Foo"}}}
+    }
+
+    timings = engine.validation_rules_timings(reset=True)
+    assert timings["leaf-field-selections"]["calls"] == 4
+    assert timings["executable-definitions"]["calls"] == 1
+    assert "variable-uniqueness" not in timings
+    assert all(
+        rule_timings["time"] >= 0.0 for rule_timings in timings.values()
+    )
+    assert engine.validation_rules_timings() == {}
+
+
+@pytest.mark.asyncio
+async def test_validation_rules_timings_not_timed(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+
+    with pytest.raises(ImproperlyConfigured):
+        engine.validation_rules_timings()
+
+
+@pytest.mark.asyncio
+async def test_validate_document(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+    # pylint: disable=protected-access
+    schema = engine._schema
+
+    document = parse_to_document(_CONFLICTING_QUERY, schema)
+    assert document.validators is None
+
+    errors = validate_document(document, schema)
+    assert [error.extensions["tag"] for error in errors] == [
+        "overlapping-fields-can-be-merged"
+    ]
+    assert document.validators.errors == errors
+
+    rules = ValidationRules(
+        RULE_SET, disabled_rules=["overlapping-fields-can-be-merged"]
+    )
+    assert validate_document(document, schema, rules) == []
+
+
+@pytest.mark.asyncio
+async def test_validate_document_deep_query(random_schema_name):
+    engine = await _create_engine(random_schema_name)
+    # pylint: disable=protected-access
+    schema = engine._schema
+    depth = 2000
+
+    document = parse_to_document(
+        "{ user { " + "friend { " * depth + "unknown" + " }" * depth + " } }",
+        schema,
+    )
+
+    # the document is visited without recursion
+    errors = validate_document(
+        document,
+        schema,
+        ValidationRules(
+            RULE_SET, disabled_rules=["overlapping-fields-can-be-merged"]
+        ),
+    )
+    assert [error.extensions["tag"] for error in errors] == [
+        "field-selections-on-objects-interfaces-and-unions-types"
+    ]
+    assert errors[0].path == ["user"] + ["friend"] * depth + ["unknown"]
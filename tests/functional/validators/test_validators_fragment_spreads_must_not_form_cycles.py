@@ -265,3 +265,37 @@ async def test_validators_fragment_spreads_must_not_form_cycles(
     query, expected, engine
 ):
     assert await engine.execute(query) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.ttftt_engine()
+async def test_validators_fragment_spreads_must_not_form_cycles_diamond(
+    engine,
+):
+    result = await engine.execute(
+        """
+        fragment a on Dog {
+            ...b
+            ...c
+        }
+
+        fragment b on Dog {
+            ...c
+        }
+
+        fragment c on Dog {
+            name
+        }
+
+        query lol {
+            dog {
+                ...a
+            }
+        }
+        """
+    )
+    assert not [
+        error
+        for error in result.get("errors") or []
+        if error.get("extensions", {}).get("rule") == "5.5.2.2"
+    ]
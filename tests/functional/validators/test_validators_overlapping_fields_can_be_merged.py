@@ -0,0 +1,217 @@
+import pytest
+
+from tartiflette.language.validators.query.overlapping_fields_can_be_merged import (
+    _ConflictsFinder,
+)
+
+_EXTENSIONS = {
+    "rule": "5.3.2",
+    "spec": "June 2018",
+    "details": "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selection-Merging",
+    "tag": "overlapping-fields-can-be-merged",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.ttftt_engine()
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        (
+            """
+        query {
+            dog {
+                name: nickname
+                name
+            }
+        }
+        """,
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "Fields < name > conflict because < nickname > and < name > are different fields. Use different aliases on the fields to fetch both if this was intentional.",
+                        "path": None,
+                        "locations": [
+                            {"line": 4, "column": 17},
+                            {"line": 5, "column": 17},
+                        ],
+                        "extensions": _EXTENSIONS,
+                    }
+                ],
+            },
+        ),
+        (
+            """
+        query {
+            dog {
+                doesKnowCommand(dogCommand: SIT)
+                doesKnowCommand(dogCommand: HEEL)
+            }
+        }
+        """,
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "Fields < doesKnowCommand > conflict because they have differing arguments. Use different aliases on the fields to fetch both if this was intentional.",
+                        "path": None,
+                        "locations": [
+                            {"line": 4, "column": 17},
+                            {"line": 5, "column": 17},
+                        ],
+                        "extensions": _EXTENSIONS,
+                    }
+                ],
+            },
+        ),
+        (
+            """
+        query {
+            dog {
+                friends {
+                    ... on Dog { volume: barkVolume }
+                    ... on Cat { volume: nickname }
+                }
+            }
+        }
+        """,
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "Fields < volume > conflict because they return conflicting types < Int > and < String >. Use different aliases on the fields to fetch both if this was intentional.",
+                        "path": None,
+                        "locations": [
+                            {"line": 5, "column": 34},
+                            {"line": 6, "column": 34},
+                        ],
+                        "extensions": _EXTENSIONS,
+                    }
+                ],
+            },
+        ),
+        (
+            """
+        query {
+            dog {
+                ...OwnerFragment
+                owner { name: __typename }
+            }
+        }
+
+        fragment OwnerFragment on Dog {
+            owner { name }
+        }
+        """,
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "Fields < owner > conflict because subfields < name > conflict because < __typename > and < name > are different fields. Use different aliases on the fields to fetch both if this was intentional.",
+                        "path": None,
+                        "locations": [
+                            {"line": 5, "column": 17},
+                            {"line": 5, "column": 25},
+                            {"line": 10, "column": 13},
+                            {"line": 10, "column": 21},
+                        ],
+                        "extensions": _EXTENSIONS,
+                    }
+                ],
+            },
+        ),
+    ],
+)
+async def test_validators_overlapping_fields_can_be_merged(
+    query, expected, engine
+):
+    assert await engine.execute(query) == expected
+
+
+def _rule_errors(result):
+    return [
+        error
+        for error in result.get("errors", [])
+        if error.get("extensions", {}).get("rule") == "5.3.2"
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.ttftt_engine()
+async def test_validators_overlapping_fields_can_be_merged_valid(engine):
+    result = await engine.execute(
+        """
+        query {
+            dog {
+                name
+                ... on Pet { name }
+                ...DogFragment
+                friends {
+                    ... on Dog { volume: barkVolume }
+                    ... on Cat { volume: meowVolume }
+                }
+            }
+        }
+
+        fragment DogFragment on Dog {
+            name
+            doesKnowCommand(dogCommand: SIT)
+            again: doesKnowCommand(dogCommand: SIT)
+        }
+        """
+    )
+    assert _rule_errors(result) == []
+
+
+def _repeated_spreads(count):
+    fields = " ".join(f"f{index}: name" for index in range(20))
+    return (
+        "{ dog { %s ...A } }\n"
+        "fragment A on Dog { %s ...B }\n"
+        "fragment B on Dog { %s owner { ...C ...C } }\n"
+        "fragment C on Human { name }"
+        % (" ".join(["...A ...B"] * count), fields, fields)
+    )
+
+
+def _nested_aliases(count):
+    selection = "name"
+    for _ in range(4):
+        selection = (
+            "a: friends { ... on Dog { %s } } b: friends { ... on Dog { %s } }"
+            % (selection, selection)
+        )
+    return "{ dog { %s } }" % " ".join([selection] * count)
+
+
+@pytest.mark.asyncio
+@pytest.mark.ttftt_engine()
+@pytest.mark.parametrize("build_query", [_repeated_spreads, _nested_aliases])
+async def test_validators_overlapping_fields_can_be_merged_bounded_cost(
+    build_query, engine, monkeypatch
+):
+    # adversarial documents repeating the same spreads & selections over &
+    # over are validated with the same number of field comparisons whatever
+    # the number of repetitions
+    comparisons = []
+    find_conflict = (
+        _ConflictsFinder._find_conflict
+    )  # pylint: disable=protected-access
+
+    def _counting_find_conflict(self, *args):
+        comparisons.append(args[1])
+        return find_conflict(self, *args)
+
+    monkeypatch.setattr(
+        _ConflictsFinder, "_find_conflict", _counting_find_conflict
+    )
+
+    counts = []
+    for count in [2, 200]:
+        comparisons.clear()
+        result = await engine.execute(build_query(count))
+        assert _rule_errors(result) == []
+        counts.append(len(comparisons))
+
+    assert counts[0] == counts[1]
@@ -78,6 +78,32 @@ def test_directivenode__init__():
             ),
             True,
         ),
+        (
+            DirectiveNode(
+                name="directiveName",
+                arguments=(),
+                location="directiveLocation",
+            ),
+            DirectiveNode(
+                name="directiveName",
+                arguments=[],
+                location="directiveLocation",
+            ),
+            True,
+        ),
+        (
+            DirectiveNode(
+                name="directiveName",
+                arguments=None,
+                location="directiveLocation",
+            ),
+            DirectiveNode(
+                name="directiveName",
+                arguments=[],
+                location="directiveLocation",
+            ),
+            False,
+        ),
     ],
 )
 def test_directivenode__eq__(directive_node, other, expected):
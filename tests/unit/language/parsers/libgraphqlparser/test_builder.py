@@ -0,0 +1,155 @@
+import json
+
+import pytest
+
+from tartiflette import create_engine
+from tartiflette.language.ast import Location
+from tartiflette.language.ast.base import Node
+from tartiflette.language.parsers.libgraphqlparser import builder
+from tartiflette.language.parsers.libgraphqlparser.builder import (
+    document_from_c_ast,
+)
+from tartiflette.language.parsers.libgraphqlparser.parser import (
+    _parse_context_manager,
+    _parse_to_json_ast,
+)
+from tartiflette.language.parsers.libgraphqlparser.transformers import (
+    document_from_ast_json,
+)
+from tartiflette.language.validators import validate_document
+
+_SDL = """
+enum Color { RED GREEN }
+
+input Filter {
+  name: String
+  colors: [Color!]
+}
+
+interface Named { name: String }
+
+type Item implements Named {
+  id: ID!
+  name: String
+  color: Color
+  children(first: Int, filter: Filter): [Item]
+}
+
+type Query {
+  items(first: Int, filter: Filter): [Item]
+  item(id: ID!): Item
+  named: Named
+}
+"""
+
+
+@pytest.fixture(name="schema")
+async def schema_fixture(clean_registry):
+    engine = await create_engine(_SDL, schema_name="test_builder")
+    # pylint: disable=protected-access
+    return engine._schema
+
+
+def _document_from_c_ast(query, schema):
+    with _parse_context_manager(query) as parsed:
+        return document_from_c_ast(parsed, query, schema)
+
+
+def _errors(document, schema):
+    return [
+        (error.message, error.path, [str(loc) for loc in error.locations])
+        for error in validate_document(document, schema)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ items { id name } }",
+        """
+        query Items($first: Int = 10, $filter: Filter, $skip: Boolean!) {
+          list: items(first: $first, filter: $filter) {
+            ...ItemFields @skip(if: $skip)
+            children(
+              first: 3,
+              filter: {name: "a\\"b", colors: [RED, GREEN]}
+            ) {
+              ... on Item { id color }
+              ... @include(if: true) { name }
+            }
+          }
+          item(id: "1") { id }
+        }
+
+        fragment ItemFields on Item {
+          id
+          name
+          children(first: 1.5, filter: null) { id }
+        }
+        """,
+        """
+        query A($a: Int, $a: Int) @skip(if: true) {
+          items(first: $unknown, first: 1) @unknown @include(if: false) {
+            unknown
+            ...Unknown
+            ... on Unknown { id }
+            name { id }
+            children(filter: {name: 1, name: 2}) @skip(if: 1) @skip(if: 2)
+          }
+        }
+
+        query A { named { ...Unused } }
+
+        fragment Cycle on Item { ...Cycle }
+        fragment Unused on Named { name }
+        """,
+        """
+        mutation { items { id } }
+        subscription { items { id } }
+        """,
+    ],
+)
+@pytest.mark.parametrize("compact_ast", [False, True])
+async def test_document_from_c_ast(schema, query, compact_ast, monkeypatch):
+    expected = document_from_ast_json(
+        json.loads(_parse_to_json_ast(query)), query, schema
+    )
+    monkeypatch.setattr(schema, "compact_ast", compact_ast)
+    document = _document_from_c_ast(query, schema)
+
+    assert _errors(document, schema) == _errors(expected, schema)
+    assert hash(document) == hash(query)
+    assert document == expected
+
+
+@pytest.mark.asyncio
+async def test_document_from_c_ast_compact(schema, monkeypatch):
+    monkeypatch.setattr(schema, "compact_ast", True)
+    first = _document_from_c_ast("{ items { id name } }", schema)
+    second = _document_from_c_ast("{ item(id: 1) { id } }", schema)
+
+    items = first.definitions[0].selection_set.selections[0]
+    item = second.definitions[0].selection_set.selections[0]
+    item_id = item.selection_set.selections[0]
+
+    # pylint: disable=protected-access
+    assert isinstance(items._location, int)
+    assert items.location == Location(
+        line=1, column=3, line_end=1, column_end=20
+    )
+    assert items.arguments is item_id.arguments is item.directives
+    assert items.arguments == ()
+    assert first == _document_from_c_ast("{ items { id name } }", schema=None)
+    assert items.selection_set.selections[0].name.value is item_id.name.value
+
+
+@pytest.mark.asyncio
+async def test_document_from_c_ast_error(schema, monkeypatch):
+    def field_node(*_args, **_kwargs):
+        raise ValueError("Oops")
+
+    monkeypatch.setattr(builder, "FieldNode", field_node)
+
+    with pytest.raises(ValueError, match="Oops"):
+        _document_from_c_ast("{ items { id } item(id: 1) { id } }", schema)
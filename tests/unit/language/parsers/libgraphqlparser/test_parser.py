@@ -34,6 +34,7 @@ from tartiflette.language.parsers.libgraphqlparser.parser import (
     ParsedData,
     _parse_context_manager,
     _parse_to_json_ast,
+    _query_buffer,
 )
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
@@ -52,12 +53,42 @@ def test_parseddata__enter__():
     destroy_cb_mock.assert_called_once_with(c_parsed_mock)
 
 
-@pytest.mark.parametrize("query", [b"{ a }", "{ a }"])
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"{ a }",
+        "{ a }",
+        bytearray(b"{ a }"),
+        memoryview(b"{ a }"),
+        memoryview(bytearray(b"{ a }")),
+        memoryview(b"{ a }{ b").cast("c")[:5],
+    ],
+)
 def test_parse_context_manager(query):
     result = _parse_context_manager(query)
     assert isinstance(result, ParsedData)
 
 
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("{ a }", b"{ a }"),
+        ("{ é }", "{ é }".encode("UTF-8")),
+        (b"{ a }", b"{ a }"),
+        (bytearray(b"{ a }"), bytearray(b"{ a }")),
+        (memoryview(b"{ a }{ b")[:5], b"{ a }"),
+    ],
+)
+def test_query_buffer(query, expected):
+    assert _query_buffer(query) == expected
+
+
+@pytest.mark.parametrize("query", [b"{ a }", bytearray(b"{ a }")])
+def test_query_buffer_no_copy(query):
+    assert _query_buffer(query) is query
+    assert _query_buffer(memoryview(query)) is query
+
+
 def test_parse_context_manager_error():
     with pytest.raises(GraphQLSyntaxError):
         _parse_context_manager("{ a { }")
@@ -0,0 +1,83 @@
+import pytest
+
+from tartiflette.language.normalize import normalize_query, query_signature
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("{ hello }", "{hello}"),
+        (
+            """
+            # Fetches the user
+            query  GetUser($id: ID!, $first: Int = 10) {
+              user(id: $id) {
+                ...UserFields
+                ... on Admin { level }
+                friends(first: $first, filter: [1, -2, 3.5e3]) @skip(if: false)
+              }
+            }
+
+            fragment UserFields on User { id, name }
+            """,
+            "query GetUser($id:ID!$first:Int=10){user(id:$id){...UserFields"
+            "...on Admin{level}friends(first:$first filter:[1 -2 3500.0])"
+            "@skip(if:false)}}fragment UserFields on User{id name}",
+        ),
+        (
+            '{ a(b: "  x, # y  ", c: """ z \\""" # w """) }',
+            '{a(b:"  x, # y  "c:" z \\"\\"\\" # w ")}',
+        ),
+        (b"\xef\xbb\xbf{ \xc3\xa9 }", "{é}"),
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "first_literal,second_literal",
+    [
+        ("1.0", "1.00"),
+        ("1e2", "100.0"),
+        ("-1.5E-1", "-0.15"),
+        ("-0", "0"),
+        ('"b"', '"""b"""'),
+        ('"\\u0041"', '"A"'),
+        ('"\\u005C\\/"', '"\\\\/"'),
+        ('"""\n    a\n      b\n  """', '"a\\n  b"'),
+        ('"""a\r\n\tb"""', '"a\\nb"'),
+        ('"""x \\""" y"""', '"x \\"\\"\\" y"'),
+    ],
+)
+def test_normalize_query_literals(first_literal, second_literal):
+    assert query_signature(f"{{ a(b: {first_literal}) }}") == query_signature(
+        f"{{ a(b: {second_literal}) }}"
+    )
+
+
+@pytest.mark.parametrize(
+    "first_literal,second_literal",
+    [
+        ("1", "1.0"),
+        ("01", "1"),
+        ('"1"', "1"),
+        ('"\\u00e9"', '"é"'),
+        ('"""a\\"""', '"a\\\\"'),
+    ],
+)
+def test_normalize_query_distinct_literals(first_literal, second_literal):
+    assert query_signature(f"{{ a(b: {first_literal}) }}") != query_signature(
+        f"{{ a(b: {second_literal}) }}"
+    )
+
+
+def test_query_signature():
+    signature = query_signature("{ hello }")
+
+    assert len(signature) == 64
+    assert query_signature(b"{\n  hello,\n}  # comment") == signature
+    assert query_signature("{ hello world }") != signature
+    assert query_signature("{ helloworld }") != query_signature(
+        "{ hello world }"
+    )
@@ -291,3 +291,18 @@ def test_scalar_boolean_coerce_input(value, should_raise_exception, expected):
             ScalarBoolean().coerce_input(value)
     else:
         assert ScalarBoolean().coerce_input(value) == expected
+
+
+def test_scalar_boolean_coerce_output_many():
+    assert ScalarBoolean().coerce_output_many([True, False, 1, 0.0]) == [
+        True,
+        False,
+        True,
+        False,
+    ]
+
+    with pytest.raises(
+        TypeError,
+        match="Boolean cannot represent a non boolean value: < true >.",
+    ):
+        ScalarBoolean().coerce_output_many([True, "true"])
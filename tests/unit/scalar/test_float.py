@@ -163,3 +163,15 @@ def test_scalar_float_coerce_input(value, should_raise_exception, expected):
             ScalarFloat().coerce_input(value)
     else:
         assert ScalarFloat().coerce_input(value) == expected
+
+
+def test_scalar_float_coerce_output_many():
+    assert ScalarFloat().coerce_output_many(
+        [0.5, 1, True, "2.5", Decimal("1.5")]
+    ) == [0.5, 1.0, 1.0, 2.5, 1.5]
+
+    with pytest.raises(
+        TypeError,
+        match="Float cannot represent non numeric value: < inf >.",
+    ):
+        ScalarFloat().coerce_output_many([1.0, float("inf")])
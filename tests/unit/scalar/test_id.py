@@ -153,3 +153,13 @@ def test_scalar_id_coerce_input(value, should_raise_exception, expected):
             ScalarID().coerce_input(value)
     else:
         assert ScalarID().coerce_input(value) == expected
+
+
+def test_scalar_id_coerce_output_many():
+    assert ScalarID().coerce_output_many(["a", 1, 2.0]) == ["a", "1", "2"]
+
+    with pytest.raises(
+        TypeError,
+        match="ID cannot represent value: < 2.5 >.",
+    ):
+        ScalarID().coerce_output_many(["a", 2.5])
@@ -195,3 +195,15 @@ def test_scalar_int_coerce_input(value, should_raise_exception, expected):
             ScalarInt().coerce_input(value)
     else:
         assert ScalarInt().coerce_input(value) == expected
+
+
+def test_scalar_int_coerce_output_many():
+    assert ScalarInt().coerce_output_many(
+        [0, 1, -3, True, 3.0, "4", Decimal(5)]
+    ) == [0, 1, -3, 1, 3, 4, 5]
+
+    with pytest.raises(
+        TypeError,
+        match="Int cannot represent non 32-bit signed integer value: < 2147483648 >.",
+    ):
+        ScalarInt().coerce_output_many([1, 2_147_483_648])
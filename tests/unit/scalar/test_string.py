@@ -144,3 +144,12 @@ def test_scalar_string_coerce_input(value, should_raise_exception, expected):
             ScalarString().coerce_input(value)
     else:
         assert ScalarString().coerce_input(value) == expected
+
+
+def test_scalar_string_coerce_output_many():
+    assert ScalarString().coerce_output_many(["a", 1, True, 2.5]) == [
+        "a",
+        "1",
+        "true",
+        "2.5",
+    ]
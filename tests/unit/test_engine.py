@@ -3,6 +3,7 @@ import asyncio
 import pytest
 
 from tartiflette import create_engine
+from tartiflette.engine import _hashable_query
 
 
 @pytest.mark.asyncio
@@ -31,6 +32,43 @@ async def test_engine_execute(clean_registry):
     assert result == {"data": {"a": None}}
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"query aquery { a }",
+        bytearray(b"query aquery { a }"),
+        memoryview(b"query aquery { a }"),
+        memoryview(b"query aquery { a } { b }")[:18],
+    ],
+)
+async def test_engine_execute_buffer(clean_registry, query):
+    e = await create_engine("type Query { a:String }")
+    result = await e.execute(query, operation_name="aquery")
+    assert result == {"data": {"a": None}}
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("{ a }", "{ a }"),
+        (b"{ a }", b"{ a }"),
+        (bytearray(b"{ a }"), b"{ a }"),
+        (memoryview(b"{ a } { b }")[:5], b"{ a }"),
+    ],
+)
+def test_hashable_query(query, expected):
+    result = _hashable_query(query)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_hashable_query_no_copy():
+    query = b"{ a }"
+    assert _hashable_query(query) is query
+    assert _hashable_query(memoryview(query)) is query
+
+
 @pytest.mark.skip(reason="Waiting for the validation part to be merged.")
 @pytest.mark.asyncio
 async def test_engine_execute_parse_error(clean_registry):